@@ -44,6 +44,11 @@ using arrow::Type;
 using parquet::ParquetFileReader;
 using parquet::arrow::FileReader;
 
+#ifndef PQ_STRING_OFFSETS_OVERFLOW
+// returned by string readers when total size of strings doesn't fit 32-bit offsets of string array
+#define PQ_STRING_OFFSETS_OVERFLOW -2
+#endif
+
 extern "C"
 {
     int64_t pq_get_size_single_file(std::shared_ptr<FileReader> arrow_reader, int64_t column_idx);
@@ -529,7 +534,7 @@ int pq_read_string_parallel_single_file(std::shared_ptr<FileReader> arrow_reader
 
     // printf("first row group: %d skipped_rows: %lld nrows_in_group: %lld\n", row_group_index, skipped_rows, nrows_in_group);
 
-    uint32_t curr_offset = 0;
+    int64_t curr_offset = 0;
 
     /* ------- read offsets and data ------ */
     while (read_rows < count)
@@ -574,6 +579,20 @@ int pq_read_string_parallel_single_file(std::shared_ptr<FileReader> arrow_reader
             curr_offset += str_size;
         }
 
+        // offsets are 32-bit, stop instead of silent wraparound of offsets
+        if (curr_offset > UINT32_MAX)
+        {
+            if (offset_vec == NULL)
+            {
+                delete[] *out_offsets;
+                *out_offsets = NULL;
+                *out_data = NULL;
+                delete data_vec;
+                delete null_vec;
+            }
+            return PQ_STRING_OFFSETS_OVERFLOW;
+        }
+
         int data_size = offsets_buff[rows_to_skip + rows_to_read] - offsets_buff[rows_to_skip];
 
         data_vec->insert(data_vec->end(),
@@ -35,15 +35,21 @@ import sdc.set_ext
 import sdc.io
 import sdc.io.np_io
 import sdc.hiframes.pd_timestamp_ext
+import sdc.hiframes.split_impl
 import sdc.hiframes.boxing
 import sdc.timsort
 from sdc.decorators import jit
 
+import sdc.datatypes.hpat_pandas_dataframe_ewm_functions
+import sdc.datatypes.hpat_pandas_dataframe_expanding_functions
 import sdc.datatypes.hpat_pandas_dataframe_rolling_functions
 import sdc.datatypes.hpat_pandas_series_functions
+import sdc.datatypes.hpat_pandas_series_ewm_functions
+import sdc.datatypes.hpat_pandas_series_expanding_functions
 import sdc.datatypes.hpat_pandas_series_rolling_functions
 import sdc.datatypes.hpat_pandas_stringmethods_functions
 import sdc.datatypes.hpat_pandas_groupby_functions
+import sdc.datatypes.hpat_pandas_groupby_rolling_functions
 import sdc.datatypes.categorical.init
 import sdc.datatypes.series.init
 
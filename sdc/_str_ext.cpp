@@ -83,8 +83,12 @@ extern "C"
     int64_t std_str_to_int64(std::string* str);
     double str_to_float64(std::string* str);
     int64_t get_str_len(std::string* str);
-    void string_array_from_sequence(
-        PyObject* obj, int64_t* no_strings, uint32_t** offset_table, char** buffer, uint8_t** null_bitmap);
+    void string_array_from_sequence(PyObject* obj,
+                                    int64_t* no_strings,
+                                    uint32_t** offset_table,
+                                    char** buffer,
+                                    uint8_t** null_bitmap,
+                                    int64_t max_num_total_chars);
     void* np_array_from_string_array(int64_t no_strings,
                                      const uint32_t* offset_table,
                                      const char* buffer,
@@ -625,30 +629,42 @@ extern "C"
     /// @brief create a concatenated string and offset table from a pandas series of strings
     /// @note strings in returned buffer will not be 0-terminated.
     /// @param[out] buffer newly allocated buffer with concatenated strings, or NULL
-    /// @param[out] no_strings number of strings concatenated, value < 0 indicates an error
+    /// @param[out] no_strings number of strings concatenated, value < 0 indicates an error (Python error is set)
     /// @param[out] offset_table newly allocated array of no_strings+1 integers
     ///                          first no_strings entries denote offsets, last entry indicates size of output array
+    /// @param[out] null_bitmap newly allocated null bitmap, or NULL
     /// @param[in]  obj Python Sequence object, intended to be a pandas series of string
-    void string_array_from_sequence(
-        PyObject* obj, int64_t* no_strings, uint32_t** offset_table, char** buffer, uint8_t** null_bitmap)
+    /// @param[in]  max_num_total_chars maximum total size of strings, larger sequences raise OverflowError
+    void string_array_from_sequence(PyObject* obj,
+                                    int64_t* no_strings,
+                                    uint32_t** offset_table,
+                                    char** buffer,
+                                    uint8_t** null_bitmap,
+                                    int64_t max_num_total_chars)
     {
 #define CHECK(expr, msg)                                                                                               \
     if (!(expr))                                                                                                       \
     {                                                                                                                  \
-        std::cerr << msg << std::endl;                                                                                 \
-        PyGILState_Release(gilstate);                                                                                  \
-        if (offsets != NULL)                                                                                           \
+        if (!PyErr_Occurred())                                                                                         \
         {                                                                                                              \
-            delete[] offsets;                                                                                          \
+            PyErr_SetString(PyExc_RuntimeError, msg);                                                                  \
         }                                                                                                              \
+        Py_XDECREF(s);                                                                                                 \
+        Py_XDECREF(values);                                                                                            \
+        delete[] offsets;                                                                                              \
+        delete[](*null_bitmap);                                                                                        \
+        *null_bitmap = NULL;                                                                                           \
+        PyGILState_Release(gilstate);                                                                                  \
         return;                                                                                                        \
     }
 
         uint32_t* offsets = NULL;
+        PyObject* values = NULL;
+        PyObject* s = NULL;
 
         auto gilstate = PyGILState_Ensure();
 
-        if (no_strings == NULL || offset_table == NULL || buffer == NULL)
+        if (no_strings == NULL || offset_table == NULL || buffer == NULL || null_bitmap == NULL)
         {
             PyGILState_Release(gilstate);
             return;
@@ -657,11 +673,12 @@ extern "C"
         *no_strings = -1;
         *offset_table = NULL;
         *buffer = NULL;
+        *null_bitmap = NULL;
 
         CHECK(PySequence_Check(obj), "expecting a PySequence");
-        CHECK(no_strings && offset_table && buffer, "output arguments must not be NULL");
 
         Py_ssize_t n = PyObject_Size(obj);
+        CHECK(n >= 0, "getting size of sequence failed");
         if (n == 0)
         {
             // empty sequence, this is not an error, need to set size
@@ -683,7 +700,9 @@ extern "C"
         // TODO: check actual Series class
         if (PyObject_HasAttrString(obj, "values"))
         {
-            obj = PyObject_GetAttrString(obj, "values");
+            values = PyObject_GetAttrString(obj, "values");
+            CHECK(values, "getting values of series failed");
+            obj = values;
         }
 
         offsets = new uint32_t[n + 1];
@@ -692,7 +711,7 @@ extern "C"
         for (Py_ssize_t i = 0; i < n; ++i)
         {
             offsets[i] = len;
-            PyObject* s = PySequence_GetItem(obj, i);
+            s = PySequence_GetItem(obj, i);
             CHECK(s, "getting element failed");
             // Pandas stores NA as either None or nan
             if (s == Py_None || (PyFloat_Check(s) && std::isnan(PyFloat_AsDouble(s))))
@@ -711,8 +730,17 @@ extern "C"
                 tmp_store[i] = PyUnicode_AsUTF8AndSize(s, &size);
                 CHECK(tmp_store[i], "string conversion failed");
                 len += size;
+                // offsets are 32-bit, raise instead of silent wraparound of offsets
+                if (len > (size_t)max_num_total_chars)
+                {
+                    PyErr_Format(PyExc_OverflowError,
+                                 "string array supports up to %lld bytes of characters",
+                                 (long long)max_num_total_chars);
+                }
+                CHECK(len <= (size_t)max_num_total_chars, "total size of strings exceeds string array limit");
             }
             Py_DECREF(s);
+            s = NULL;
         }
         offsets[n] = len;
 
@@ -722,6 +750,8 @@ extern "C"
             memcpy(outbuf + offsets[i], tmp_store[i], offsets[i + 1] - offsets[i]);
         }
 
+        // UTF-8 buffers of strings are owned by the sequence, it is released after they are copied
+        Py_XDECREF(values);
         PyGILState_Release(gilstate);
 
         *offset_table = offsets;
@@ -837,9 +867,22 @@ extern "C"
 
         // std::cout << "num glob: " << globBuf.gl_pathc << std::endl;
 
+        // offsets are 32-bit, check the size instead of silent wraparound of offsets
+        size_t total_size = 0;
+        for (unsigned int i = 0; i < globBuf.gl_pathc; i++)
+        {
+            total_size += strlen(globBuf.gl_pathv[i]);
+        }
+        if (total_size > UINT32_MAX)
+        {
+            std::cerr << "glob error: string array supports up to 4294967295 bytes of characters" << '\n';
+            globfree(&globBuf);
+            return;
+        }
+
         *num_strings = globBuf.gl_pathc;
         *offsets = new uint32_t[globBuf.gl_pathc + 1];
-        size_t total_size = 0;
+        total_size = 0;
 
         for (unsigned int i = 0; i < globBuf.gl_pathc; i++)
         {
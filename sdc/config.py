@@ -71,6 +71,12 @@ config_inline_overloads = strtobool(os.getenv('SDC_AUTO_INLINE', 'False'))
 Default value used to select whether sdc functions would inline
 '''
 
+config_rolling_resync_period = int(os.getenv('SDC_ROLLING_RESYNC_PERIOD', '0'))
+'''
+Number of rows after which rolling var/std/skew/kurt recompute the window sums from the window values,
+0 disables resynchronization
+'''
+
 if not config_pipeline_hpat_default:
     # avoid using MPI transport if no SDC compiler pipeline used
     config_transport_mpi_default = False
@@ -714,6 +714,83 @@ def _sdc_take_overload(data, indexes):
     return None
 
 
+def _sdc_factorize(data, sort=False):
+    pass
+
+
+@sdc_overload(_sdc_factorize, jit_options={'parallel': True})
+def _sdc_factorize_overload(data, sort=False):
+    """
+    Encode array as codes of its unique values in order of appearance (sorted if sort is True) and the uniques.
+    Each chunk of data is encoded with its local dictionary in parallel, then local dictionaries are merged in
+    order of chunks, which keeps the order of appearance, and local codes are remapped in parallel.
+    NaN values are encoded as -1.
+    """
+
+    if not (isinstance(data, types.Array) or data == string_array_type):
+        return None
+
+    dtype = data.dtype
+    is_str_arr = data == string_array_type
+
+    def _sdc_factorize_impl(data, sort=False):
+        size = len(data)
+        chunks = parallel_chunks(size)
+        local_uniques = [Dict.empty(key_type=dtype, value_type=types.int64) for _ in range(len(chunks))]
+        local_codes = numpy.empty(size, dtype=numpy.int64)
+        for i in numba.prange(len(chunks)):
+            chunk = chunks[i]
+            chunk_uniques = local_uniques[i]
+            for j in range(chunk.start, chunk.stop):
+                if isna(data, j):
+                    local_codes[j] = -1
+                    continue
+
+                value = data[j]
+                code = chunk_uniques.get(value, -1)
+                if code < 0:
+                    code = len(chunk_uniques)
+                    chunk_uniques[value] = code
+                local_codes[j] = code
+
+        uniques_codes = Dict.empty(key_type=dtype, value_type=types.int64)
+        uniques = [data[0] for _ in range(0)]
+        local_to_global = [numpy.empty(len(local_uniques[i]), dtype=numpy.int64) for i in range(len(chunks))]
+        for i in range(len(chunks)):
+            for value, local_code in local_uniques[i].items():
+                code = uniques_codes.get(value, -1)
+                if code < 0:
+                    code = len(uniques)
+                    uniques_codes[value] = code
+                    uniques.append(value)
+                local_to_global[i][local_code] = code
+
+        if is_str_arr == True:  # noqa
+            uniques_arr = create_str_arr_from_list(uniques)
+        else:
+            uniques_arr = numpy.array(uniques, dtype=dtype)
+
+        num_uniques = len(uniques)
+        remap = numpy.arange(num_uniques)
+        if sort:
+            order = sdc_arrays_argsort(uniques_arr, kind='mergesort')
+            for k in numba.prange(num_uniques):
+                remap[order[k]] = k
+            uniques_arr = _sdc_take(uniques_arr, order)
+
+        codes = numpy.empty(size, dtype=numpy.int64)
+        for i in numba.prange(len(chunks)):
+            chunk = chunks[i]
+            chunk_to_global = local_to_global[i]
+            for j in range(chunk.start, chunk.stop):
+                local_code = local_codes[j]
+                codes[j] = -1 if local_code < 0 else remap[chunk_to_global[local_code]]
+
+        return codes, uniques_arr
+
+    return _sdc_factorize_impl
+
+
 def _almost_equal(x, y):
     """Check if floats are almost equal based on the float epsilon"""
     pass
@@ -0,0 +1,341 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+import numpy
+import pandas
+
+from numba import prange
+from numba.core.types import float64, Boolean, Number, Omitted, NoneType
+from sdc.utilities.sdc_typing_utils import TypeChecker, kwsparams2list
+from sdc.datatypes.hpat_pandas_dataframe_ewm_types import DataFrameEWMType
+from sdc.datatypes.hpat_pandas_series_ewm_functions import (ewm_corr_kernel, ewm_cov_kernel, ewm_mean_kernel,
+                                                            ewm_std_kernel, ewm_var_kernel)
+from sdc.hiframes.pd_dataframe_type import DataFrameType
+from sdc.utilities.utils import sdc_overload_method
+
+
+sdc_pandas_dataframe_ewm_docstring_tmpl = """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.core.window.EWM.{method_name}
+{limitations_block}
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/dataframe/ewm/dataframe_ewm_{method_name}.py
+       :language: python
+       :lines: 27-
+       :caption: {example_caption}
+       :name: ex_dataframe_ewm_{method_name}
+
+    .. command-output:: python ./dataframe/ewm/dataframe_ewm_{method_name}.py
+       :cwd: ../../../examples
+
+    .. seealso::
+        :ref:`DataFrame.ewm <pandas.DataFrame.ewm>`
+            Calling object with a DataFrame.
+        :ref:`DataFrame.rolling.{method_name} <pandas.core.window.Rolling.{method_name}>`
+            Similar method for rolling window.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas DataFrame method :meth:`pandas.DataFrame.ewm.{method_name}()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_ewm.TestEWM.test_dataframe_ewm_{method_name}
+
+    Parameters
+    ----------
+    self: :class:`pandas.DataFrame.ewm`
+        input arg{extra_params}
+
+    Returns
+    -------
+    :obj:`pandas.DataFrame`
+         returns :obj:`pandas.DataFrame` object
+"""
+
+
+df_ewm_kernels = {
+    'corr': ewm_corr_kernel,
+    'cov': ewm_cov_kernel,
+    'mean': ewm_mean_kernel,
+    'std': ewm_std_kernel,
+    'var': ewm_var_kernel,
+}
+
+
+def df_ewm_values_codegen(values, df, df_name, columns):
+    """Generate copying of the DataFrame columns into rows of 2D float array"""
+    length = f'len({df_name}._data[0][0])' if df.columns else '0'
+    func_lines = [f'  {values} = numpy.empty(({len(columns)}, {length}), dtype=float64)']
+    for idx, col in enumerate(columns):
+        col_loc = df.column_loc[col]
+        func_lines += [f'  {values}[{idx}] = {df_name}._data[{col_loc.type_id}][{col_loc.col_id}]']
+
+    return func_lines
+
+
+def df_ewm_method_codegen(method_name, self, other=None, kws=None):
+    """
+    Generate df.ewm method implementation, columns are processed in parallel.
+    Binary methods are applied to the columns with equal names in self and other DataFrames,
+    the other DataFrame is self one if it's not given.
+    """
+    kwargs = kws or {}
+    is_binary = 'other' in kwargs
+    impl_params = ['self'] + kwsparams2list(kwargs)
+    impl_params_as_str = ', '.join(impl_params)
+
+    data_columns = list(self.data.columns)
+    other_columns = list(other.columns) if other is not None else data_columns
+
+    # columns order matters
+    common_columns = [col for col in data_columns if col in other_columns]
+    all_columns = data_columns + [col for col in other_columns if col not in data_columns]
+
+    impl_name = f'_df_ewm_{method_name}_impl'
+    func_lines = [f'def {impl_name}({impl_params_as_str}):']
+
+    if is_binary:
+        default_pairwise = other is None
+        func_lines += [
+            '  if pairwise is None:',
+            f'    _pairwise = {default_pairwise}',
+            '  else:',
+            '    _pairwise = pairwise',
+            '  if _pairwise:',
+            f'    raise ValueError("Method ewm.{method_name}(). The object pairwise\\n expected: False")'
+        ]
+
+    func_lines += [
+        '  alpha = 1. / (1. + self._com)',
+        '  adjust = self._adjust',
+        '  ignore_na = self._ignore_na',
+        '  minp = max(self._min_periods, 1)',
+    ]
+    func_lines += df_ewm_values_codegen('values', self.data, 'self._data', common_columns)
+    kernel_params = ['alpha', 'adjust', 'ignore_na', 'minp']
+    if 'bias' in kwargs:
+        kernel_params.append('bias')
+
+    if is_binary and other is not None:
+        func_lines += df_ewm_values_codegen('other_values', other, 'other', common_columns)
+        func_lines += ['  length = max(values.shape[1], other_values.shape[1])']
+    else:
+        func_lines += ['  other_values = values', '  length = values.shape[1]']
+
+    input_params = ['values[i]', 'other_values[i]'] if is_binary else ['values[i]']
+    kernel_params_as_str = ', '.join(input_params + ['output[i]'] + kernel_params)
+    func_lines += [
+        f'  output = numpy.empty(({len(common_columns)}, length), dtype=float64)',
+        f'  for i in prange({len(common_columns)}):',
+        f'    kernel({kernel_params_as_str})',
+    ]
+
+    results = []
+    for idx, col in enumerate(all_columns):
+        if col in common_columns:
+            results.append((col, f'output[{common_columns.index(col)}]'))
+            continue
+
+        res_data = f'result_data_{idx}'
+        func_lines += [
+            f'  {res_data} = numpy.empty(length, dtype=float64)',
+            f'  {res_data}[:] = numpy.nan'
+        ]
+        results.append((col, res_data))
+
+    data = ', '.join(f'"{col}": {data}' for col, data in results)
+    func_lines += [f'  return pandas.DataFrame({{{data}}})']
+    func_text = '\n'.join(func_lines)
+
+    global_vars = {'numpy': numpy, 'pandas': pandas, 'float64': float64, 'prange': prange,
+                   'kernel': df_ewm_kernels[method_name]}
+
+    return func_text, global_vars
+
+
+def gen_df_ewm_method_impl(method_name, self, other=None, kws=None):
+    func_text, global_vars = df_ewm_method_codegen(method_name, self, other=other, kws=kws)
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    _impl = loc_vars[f'_df_ewm_{method_name}_impl']
+
+    return _impl
+
+
+def _sdc_pandas_dataframe_ewm_check_types(ty_checker, self, other=None):
+    """Check that columns of the DataFrames are numeric"""
+    for df, name in [(self.data, 'self'), (other, 'other')]:
+        if df is None:
+            continue
+        for col_type in df.data:
+            if not isinstance(col_type.dtype, Number):
+                ty_checker.raise_exc(df, 'DataFrame with numeric columns', name)
+
+
+def _sdc_pandas_dataframe_ewm_other_check_types(ty_checker, other, pairwise):
+    """Check types of other and pairwise parameters of df.ewm.corr()/cov()"""
+    accepted_other = (Omitted, NoneType, DataFrameType)
+    if not isinstance(other, accepted_other) and other is not None:
+        ty_checker.raise_exc(other, 'DataFrame', 'other')
+
+    accepted_pairwise = (bool, Boolean, Omitted, NoneType)
+    if not isinstance(pairwise, accepted_pairwise) and pairwise is not None:
+        ty_checker.raise_exc(pairwise, 'bool', 'pairwise')
+
+    if isinstance(other, DataFrameType):
+        return other
+
+    return None
+
+
+@sdc_overload_method(DataFrameEWMType, 'corr')
+def sdc_pandas_dataframe_ewm_corr(self, other=None, pairwise=None):
+
+    ty_checker = TypeChecker('Method ewm.corr().')
+    ty_checker.check(self, DataFrameEWMType)
+
+    other_df = _sdc_pandas_dataframe_ewm_other_check_types(ty_checker, other, pairwise)
+    _sdc_pandas_dataframe_ewm_check_types(ty_checker, self, other_df)
+
+    return gen_df_ewm_method_impl('corr', self, other=other_df, kws={'other': 'None', 'pairwise': 'None'})
+
+
+@sdc_overload_method(DataFrameEWMType, 'cov')
+def sdc_pandas_dataframe_ewm_cov(self, other=None, pairwise=None, bias=False):
+
+    ty_checker = TypeChecker('Method ewm.cov().')
+    ty_checker.check(self, DataFrameEWMType)
+
+    other_df = _sdc_pandas_dataframe_ewm_other_check_types(ty_checker, other, pairwise)
+    _sdc_pandas_dataframe_ewm_check_types(ty_checker, self, other_df)
+
+    if not isinstance(bias, (bool, Boolean, Omitted)):
+        ty_checker.raise_exc(bias, 'bool', 'bias')
+
+    return gen_df_ewm_method_impl('cov', self, other=other_df,
+                                  kws={'other': 'None', 'pairwise': 'None', 'bias': 'False'})
+
+
+@sdc_overload_method(DataFrameEWMType, 'mean')
+def sdc_pandas_dataframe_ewm_mean(self):
+
+    ty_checker = TypeChecker('Method ewm.mean().')
+    ty_checker.check(self, DataFrameEWMType)
+
+    _sdc_pandas_dataframe_ewm_check_types(ty_checker, self)
+
+    return gen_df_ewm_method_impl('mean', self)
+
+
+@sdc_overload_method(DataFrameEWMType, 'std')
+def sdc_pandas_dataframe_ewm_std(self, bias=False):
+
+    ty_checker = TypeChecker('Method ewm.std().')
+    ty_checker.check(self, DataFrameEWMType)
+
+    _sdc_pandas_dataframe_ewm_check_types(ty_checker, self)
+
+    if not isinstance(bias, (bool, Boolean, Omitted)):
+        ty_checker.raise_exc(bias, 'bool', 'bias')
+
+    return gen_df_ewm_method_impl('std', self, kws={'bias': 'False'})
+
+
+@sdc_overload_method(DataFrameEWMType, 'var')
+def sdc_pandas_dataframe_ewm_var(self, bias=False):
+
+    ty_checker = TypeChecker('Method ewm.var().')
+    ty_checker.check(self, DataFrameEWMType)
+
+    _sdc_pandas_dataframe_ewm_check_types(ty_checker, self)
+
+    if not isinstance(bias, (bool, Boolean, Omitted)):
+        ty_checker.raise_exc(bias, 'bool', 'bias')
+
+    return gen_df_ewm_method_impl('var', self, kws={'bias': 'False'})
+
+
+bias_param_doc = """
+    bias: :obj:`bool`
+        Use a standard estimation bias correction.
+"""
+
+other_params_doc = """
+    other: :obj:`DataFrame`
+        Other DataFrame.
+    pairwise: :obj:`bool`
+        Calculate pairwise combinations of columns within a DataFrame.
+        *unsupported*
+"""
+
+sdc_pandas_dataframe_ewm_corr.__doc__ = sdc_pandas_dataframe_ewm_docstring_tmpl.format(**{
+    'method_name': 'corr',
+    'example_caption': 'Calculate exponentially weighted correlation.',
+    'limitations_block':
+    """
+    Limitations
+    -----------
+    Parameter ``other`` is supported only as DataFrame, ``pairwise`` is supported only with value False.
+    """,
+    'extra_params': other_params_doc
+})
+
+sdc_pandas_dataframe_ewm_cov.__doc__ = sdc_pandas_dataframe_ewm_docstring_tmpl.format(**{
+    'method_name': 'cov',
+    'example_caption': 'Calculate exponentially weighted covariance.',
+    'limitations_block':
+    """
+    Limitations
+    -----------
+    Parameter ``other`` is supported only as DataFrame, ``pairwise`` is supported only with value False.
+    """,
+    'extra_params': other_params_doc + bias_param_doc
+})
+
+sdc_pandas_dataframe_ewm_mean.__doc__ = sdc_pandas_dataframe_ewm_docstring_tmpl.format(**{
+    'method_name': 'mean',
+    'example_caption': 'Calculate exponentially weighted mean.',
+    'limitations_block': '',
+    'extra_params': ''
+})
+
+sdc_pandas_dataframe_ewm_std.__doc__ = sdc_pandas_dataframe_ewm_docstring_tmpl.format(**{
+    'method_name': 'std',
+    'example_caption': 'Calculate exponentially weighted standard deviation.',
+    'limitations_block': '',
+    'extra_params': bias_param_doc
+})
+
+sdc_pandas_dataframe_ewm_var.__doc__ = sdc_pandas_dataframe_ewm_docstring_tmpl.format(**{
+    'method_name': 'var',
+    'example_caption': 'Calculate exponentially weighted variance.',
+    'limitations_block': '',
+    'extra_params': bias_param_doc
+})
@@ -0,0 +1,288 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+import pandas
+
+from numba.core.types import Integer, Omitted
+from sdc.datatypes.hpat_pandas_dataframe_expanding_types import DataFrameExpandingType
+from sdc.utilities.sdc_typing_utils import TypeChecker, kwsparams2list
+from sdc.utilities.utils import sdc_overload_method
+
+
+sdc_pandas_dataframe_expanding_docstring_tmpl = """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.core.window.Expanding.{method_name}
+{limitations_block}
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/dataframe/expanding/dataframe_expanding_{method_name}.py
+       :language: python
+       :lines: 27-
+       :caption: {example_caption}
+       :name: ex_dataframe_expanding_{method_name}
+
+    .. command-output:: python ./dataframe/expanding/dataframe_expanding_{method_name}.py
+       :cwd: ../../../examples
+
+    .. seealso::
+        :ref:`DataFrame.expanding <pandas.DataFrame.expanding>`
+            Calling object with a DataFrame.
+        :ref:`DataFrame.{method_name} <pandas.DataFrame.{method_name}>`
+            Similar method for DataFrame.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas DataFrame method :meth:`pandas.DataFrame.expanding.{method_name}()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_expanding.TestExpanding.test_dataframe_expanding_{method_name}
+
+    Parameters
+    ----------
+    self: :class:`pandas.DataFrame.expanding`
+        input arg{extra_params}
+
+    Returns
+    -------
+    :obj:`pandas.DataFrame`
+         returns :obj:`pandas.DataFrame` object
+"""
+
+
+def df_expanding_method_codegen(method_name, self, args=None, kws=None):
+    args = args or []
+    kwargs = kws or {}
+
+    impl_params = ['self'] + args + kwsparams2list(kwargs)
+    impl_params_as_str = ', '.join(impl_params)
+
+    impl_name = f'_df_expanding_{method_name}_impl'
+    func_lines = [f'def {impl_name}({impl_params_as_str}):']
+
+    method_params = args + ['{}={}'.format(k, k) for k in kwargs]
+    method_params_as_str = ', '.join(method_params)
+    expanding_params = 'self._min_periods, self._center, self._axis'
+
+    results = []
+    for idx, col in enumerate(self.data.columns):
+        col_loc = self.data.column_loc[col]
+        type_id, col_id = col_loc.type_id, col_loc.col_id
+        res_data = f'result_data_{idx}'
+        func_lines += [
+            f'  series_{idx} = pandas.Series(self._data._data[{type_id}][{col_id}])',
+            f'  expanding_{idx} = series_{idx}.expanding({expanding_params})',
+            f'  {res_data} = expanding_{idx}.{method_name}({method_params_as_str})._data'
+        ]
+        results.append((col, res_data))
+
+    data = ', '.join(f'"{col}": {data}' for col, data in results)
+    func_lines += [f'  return pandas.DataFrame({{{data}}})']
+    func_text = '\n'.join(func_lines)
+
+    global_vars = {'pandas': pandas}
+
+    return func_text, global_vars
+
+
+def gen_df_expanding_method_impl(method_name, self, args=None, kws=None):
+    func_text, global_vars = df_expanding_method_codegen(method_name, self,
+                                                         args=args, kws=kws)
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    _impl = loc_vars[f'_df_expanding_{method_name}_impl']
+
+    return _impl
+
+
+@sdc_overload_method(DataFrameExpandingType, 'count')
+def sdc_pandas_dataframe_expanding_count(self):
+
+    ty_checker = TypeChecker('Method expanding.count().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    return gen_df_expanding_method_impl('count', self)
+
+
+@sdc_overload_method(DataFrameExpandingType, 'kurt')
+def sdc_pandas_dataframe_expanding_kurt(self):
+
+    ty_checker = TypeChecker('Method expanding.kurt().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    return gen_df_expanding_method_impl('kurt', self)
+
+
+@sdc_overload_method(DataFrameExpandingType, 'max')
+def sdc_pandas_dataframe_expanding_max(self):
+
+    ty_checker = TypeChecker('Method expanding.max().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    return gen_df_expanding_method_impl('max', self)
+
+
+@sdc_overload_method(DataFrameExpandingType, 'mean')
+def sdc_pandas_dataframe_expanding_mean(self):
+
+    ty_checker = TypeChecker('Method expanding.mean().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    return gen_df_expanding_method_impl('mean', self)
+
+
+@sdc_overload_method(DataFrameExpandingType, 'min')
+def sdc_pandas_dataframe_expanding_min(self):
+
+    ty_checker = TypeChecker('Method expanding.min().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    return gen_df_expanding_method_impl('min', self)
+
+
+@sdc_overload_method(DataFrameExpandingType, 'skew')
+def sdc_pandas_dataframe_expanding_skew(self):
+
+    ty_checker = TypeChecker('Method expanding.skew().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    return gen_df_expanding_method_impl('skew', self)
+
+
+@sdc_overload_method(DataFrameExpandingType, 'std')
+def sdc_pandas_dataframe_expanding_std(self, ddof=1):
+
+    ty_checker = TypeChecker('Method expanding.std().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    if not isinstance(ddof, (int, Integer, Omitted)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    return gen_df_expanding_method_impl('std', self, kws={'ddof': '1'})
+
+
+@sdc_overload_method(DataFrameExpandingType, 'sum')
+def sdc_pandas_dataframe_expanding_sum(self):
+
+    ty_checker = TypeChecker('Method expanding.sum().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    return gen_df_expanding_method_impl('sum', self)
+
+
+@sdc_overload_method(DataFrameExpandingType, 'var')
+def sdc_pandas_dataframe_expanding_var(self, ddof=1):
+
+    ty_checker = TypeChecker('Method expanding.var().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    if not isinstance(ddof, (int, Integer, Omitted)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    return gen_df_expanding_method_impl('var', self, kws={'ddof': '1'})
+
+
+extremum_limitations = """
+    Limitations
+    -----------
+    Infinite values are ignored.
+"""
+
+sums_limitations = """
+    Limitations
+    -----------
+    DataFrame elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
+"""
+
+ddof_param_doc = """
+    ddof: :obj:`int`
+        Delta Degrees of Freedom.
+"""
+
+sdc_pandas_dataframe_expanding_count.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'count',
+    'example_caption': 'Count of any non-NaN observations inside the window.',
+    'limitations_block': '',
+    'extra_params': ''
+})
+
+sdc_pandas_dataframe_expanding_kurt.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'kurt',
+    'example_caption': 'Calculate unbiased expanding kurtosis.',
+    'limitations_block': sums_limitations,
+    'extra_params': ''
+})
+
+sdc_pandas_dataframe_expanding_max.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'max',
+    'example_caption': 'Calculate the expanding maximum.',
+    'limitations_block': extremum_limitations,
+    'extra_params': ''
+})
+
+sdc_pandas_dataframe_expanding_mean.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'mean',
+    'example_caption': 'Calculate the expanding mean of the values.',
+    'limitations_block': sums_limitations,
+    'extra_params': ''
+})
+
+sdc_pandas_dataframe_expanding_min.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'min',
+    'example_caption': 'Calculate the expanding minimum.',
+    'limitations_block': extremum_limitations,
+    'extra_params': ''
+})
+
+sdc_pandas_dataframe_expanding_skew.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'skew',
+    'example_caption': 'Unbiased expanding skewness.',
+    'limitations_block': sums_limitations,
+    'extra_params': ''
+})
+
+sdc_pandas_dataframe_expanding_std.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'std',
+    'example_caption': 'Calculate expanding standard deviation.',
+    'limitations_block': sums_limitations,
+    'extra_params': ddof_param_doc
+})
+
+sdc_pandas_dataframe_expanding_sum.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'sum',
+    'example_caption': 'Calculate expanding sum',
+    'limitations_block': sums_limitations,
+    'extra_params': ''
+})
+
+sdc_pandas_dataframe_expanding_var.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'var',
+    'example_caption': 'Calculate unbiased expanding variance.',
+    'limitations_block': sums_limitations,
+    'extra_params': ddof_param_doc
+})
@@ -54,10 +54,15 @@ from sdc.hiframes.pd_dataframe_type import DataFrameType
 from sdc.datatypes.hpat_pandas_dataframe_getitem_types import (DataFrameGetitemAccessorType,
                                                                dataframe_getitem_accessor_init)
 from sdc.datatypes.common_functions import SDCLimitation
+from sdc.datatypes.hpat_pandas_dataframe_ewm_types import _hpat_pandas_df_ewm_init
+from sdc.datatypes.hpat_pandas_dataframe_expanding_types import _hpat_pandas_df_expanding_init
 from sdc.datatypes.hpat_pandas_dataframe_rolling_types import _hpat_pandas_df_rolling_init
+from sdc.datatypes.hpat_pandas_ewm_types import gen_sdc_pandas_ewm_overload_body, sdc_pandas_ewm_docstring_tmpl
+from sdc.datatypes.hpat_pandas_expanding_types import (
+    gen_sdc_pandas_expanding_overload_body, sdc_pandas_expanding_docstring_tmpl)
 from sdc.datatypes.hpat_pandas_rolling_types import (
     gen_sdc_pandas_rolling_overload_body, sdc_pandas_rolling_docstring_tmpl)
-from sdc.datatypes.hpat_pandas_groupby_functions import init_dataframe_groupby, merge_groupby_dicts_inplace
+from sdc.datatypes.hpat_pandas_groupby_functions import init_dataframe_groupby, _sdc_groupby_build_index
 from sdc.hiframes.pd_dataframe_ext import get_dataframe_data
 from sdc.utilities.utils import sdc_overload, sdc_overload_method, sdc_overload_attribute
 from sdc.hiframes.api import isna
@@ -800,10 +805,21 @@ def mean_overload(df, axis=None, skipna=None, level=None, numeric_only=None):
 
 
 sdc_pandas_dataframe_rolling = sdc_overload_method(DataFrameType, 'rolling')(
-    gen_sdc_pandas_rolling_overload_body(_hpat_pandas_df_rolling_init, DataFrameType))
+    gen_sdc_pandas_rolling_overload_body(_hpat_pandas_df_rolling_init, DataFrameType, allow_offset=True,
+                                         allow_center=True, allow_win_type=True))
 sdc_pandas_dataframe_rolling.__doc__ = sdc_pandas_rolling_docstring_tmpl.format(
     ty='DataFrame', ty_lower='dataframe')
 
+sdc_pandas_dataframe_ewm = sdc_overload_method(DataFrameType, 'ewm')(
+    gen_sdc_pandas_ewm_overload_body(_hpat_pandas_df_ewm_init, DataFrameType))
+sdc_pandas_dataframe_ewm.__doc__ = sdc_pandas_ewm_docstring_tmpl.format(
+    ty='DataFrame', ty_lower='dataframe')
+
+sdc_pandas_dataframe_expanding = sdc_overload_method(DataFrameType, 'expanding')(
+    gen_sdc_pandas_expanding_overload_body(_hpat_pandas_df_expanding_init, DataFrameType))
+sdc_pandas_dataframe_expanding.__doc__ = sdc_pandas_expanding_docstring_tmpl.format(
+    ty='DataFrame', ty_lower='dataframe')
+
 
 @sdc_overload_method(DataFrameType, 'std')
 def std_overload(df, axis=None, skipna=None, level=None, ddof=1, numeric_only=None):
@@ -2510,7 +2526,9 @@ def sdc_pandas_dataframe_groupby(self, by=None, axis=0, level=None, as_index=Tru
     -----------
     - Parameters ``axis``, ``level``, ``as_index``, ``group_keys``, ``squeeze`` and ``observed`` \
 are currently unsupported by Intel Scalable Dataframe Compiler
-    - Parameter ``by`` is supported as single literal column name only
+    - Parameter ``by`` is supported as literal column name or tuple (or list) of literal column names only
+    - Grouping by multiple columns returns key columns as leading columns of the result \
+(as with ``as_index=False``) whatever ``as_index`` is, as MultiIndex is not supported
     - Mutating the contents of a DataFrame between creating a groupby object and calling it's methods is unsupported
 
     Examples
@@ -2571,12 +2589,13 @@ are currently unsupported by Intel Scalable Dataframe Compiler
         Returns a groupby object that contains information about the groups.
 """
 
+    if isinstance(by, (types.BaseTuple, types.List)):
+        return sdc_pandas_dataframe_groupby_multiple_keys(self, by)
+
     if not isinstance(by, types.StringLiteral):
         return None
 
     column_id = self.columns.index(by.literal_value)
-    list_type = types.ListType(types.int64)
-    by_type = self.data[column_id].dtype
 
     col_loc = self.column_loc[by.literal_value]
     type_id, col_id = col_loc.type_id, col_loc.col_id
@@ -2585,35 +2604,56 @@ are currently unsupported by Intel Scalable Dataframe Compiler
                                           group_keys=True, squeeze=False, observed=False):
 
         by_column_data = self._data[type_id][col_id]
-        chunks = parallel_chunks(len(by_column_data))
-        dict_parts = [Dict.empty(by_type, list_type) for _ in range(len(chunks))]
-
-        # filling separate dict of by_value -> positions for each chunk of initial array
-        for i in numba.prange(len(chunks)):
-            chunk = chunks[i]
-            res = dict_parts[i]
-            for j in range(chunk.start, chunk.stop):
-                if isna(by_column_data, j):
-                    continue
-                value = by_column_data[j]
-                group_list = res.get(value)
-                if group_list is None:
-                    new_group_list = List.empty_list(types.int64)
-                    new_group_list.append(j)
-                    res[value] = new_group_list
-                else:
-                    group_list.append(j)
-
-        # merging all dict parts into a single resulting dict
-        res_dict = dict_parts[0]
-        for i in range(1, len(chunks)):
-            res_dict = merge_groupby_dicts_inplace(res_dict, dict_parts[i])
-
-        return init_dataframe_groupby(self, column_id, res_dict, sort)
+        group_index = _sdc_groupby_build_index(by_column_data)
+
+        return init_dataframe_groupby(self, column_id, group_index, sort)
 
     return sdc_pandas_dataframe_groupby_impl
 
 
+def sdc_pandas_dataframe_groupby_multiple_keys(self, by):
+    """ Generates implementation of DataFrame.groupby by a tuple or a list of literal column names,
+    rows are grouped by composite keys made of values of all these columns. There is no MultiIndex yet,
+    so result keys are returned as columns (as with as_index=False) whatever as_index is """
+
+    _func_name = 'Method groupby().'
+    if isinstance(by, types.BaseTuple) and all(isinstance(a, types.StringLiteral) for a in by):
+        by_names = [a.literal_value for a in by]
+    elif isinstance(by, types.List) and getattr(by, 'initial_value', None) is not None:
+        by_names = list(by.initial_value)
+    else:
+        raise TypingError('{} The object by\n given: {}\n expected: {}'.format(
+            _func_name, by, 'tuple or list of literal column names'))
+
+    unknown_names = [name for name in by_names if name not in self.columns]
+    if unknown_names:
+        raise TypingError('{} Columns {} are not found in DataFrame'.format(_func_name, unknown_names))
+
+    func_lines = [
+        'def sdc_pandas_dataframe_groupby_impl(self, by=None, axis=0, level=None, as_index=True, sort=True,',
+        '                                      group_keys=True, squeeze=False, observed=False):',
+    ]
+    global_vars = {'_sdc_groupby_build_index': _sdc_groupby_build_index,
+                   'init_dataframe_groupby': init_dataframe_groupby}
+    for i, name in enumerate(by_names):
+        col_loc = self.column_loc[name]
+        func_lines.append(f'  by_column_data_{i} = self._data[{col_loc.type_id}][{col_loc.col_id}]')
+        # column ids are passed via globals to be typed as literals
+        global_vars[f'column_id_{i}'] = self.columns.index(name)
+
+    by_data = ''.join(f'by_column_data_{i}, ' for i in range(len(by_names)))
+    column_ids = ''.join(f'column_id_{i}, ' for i in range(len(by_names)))
+    func_lines += [
+        f'  group_index = _sdc_groupby_build_index(({by_data}))',
+        f'  return init_dataframe_groupby(self, ({column_ids}), group_index, sort)',
+    ]
+
+    func_text = '\n'.join(func_lines)
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    return loc_vars['sdc_pandas_dataframe_groupby_impl']
+
+
 def df_set_column_index_codelines(self):
     """Generate code lines with definition of resulting index for DF set_column"""
     func_lines = []
@@ -26,13 +26,17 @@
 import numpy
 import pandas
 
-from numba.core.types import (float64, Boolean, Integer, Number, Omitted,
+from numba import prange
+from numba.core.types import (float64, Boolean, DictType, Integer, Number, Omitted,
                          NoneType, StringLiteral, UnicodeType)
 from sdc.utilities.sdc_typing_utils import TypeChecker, kwsparams2list
 from sdc.datatypes.hpat_pandas_dataframe_rolling_types import DataFrameRollingType
+from sdc.datatypes.hpat_pandas_series_rolling_functions import (
+    rolling_center_offset, sdc_rolling_chunks, sdc_rolling_freq_chunks, sdc_rolling_pairwise_impls)
 from sdc.hiframes.pd_dataframe_ext import get_dataframe_data
 from sdc.hiframes.pd_dataframe_type import DataFrameType
 from sdc.hiframes.pd_series_type import SeriesType
+from sdc.utilities.prange_utils import parallel_chunks
 from sdc.utilities.utils import sdc_overload_method
 
 
@@ -83,17 +87,38 @@ sdc_pandas_dataframe_rolling_docstring_tmpl = """
 """
 
 
-def df_rolling_params_codegen():
-    """Generate rolling parameters"""
+# parameter passed to the chunk kernel of the method computing all the columns by single parallel loop
+sdc_rolling_fused_params = {
+    'count': '0', 'kurt': '0', 'max': '0', 'mean': '0', 'median': '0', 'min': '0',
+    'quantile': 'quantile', 'skew': '0', 'std': 'ddof', 'sum': '0', 'var': 'ddof',
+}
+
+
+def df_rolling_params_codegen(freq=None, win_type=None):
+    """Generate rolling parameters, offset window and type of weighted window are passed as string literals"""
     params = ['window', 'min_periods', 'center', 'win_type', 'on', 'axis', 'closed']
-    return ', '.join(f'self._{p}' for p in params)
+    rolling_params = [f'self._{p}' for p in params]
+    if freq is not None:
+        rolling_params[0] = repr(freq)
+    if win_type is not None:
+        rolling_params[3] = repr(win_type)
+
+    return ', '.join(rolling_params)
+
+
+def df_rolling_series_codegen(data, freq=None):
+    """Generate creation of column series, offset window requires the index of the DataFrame"""
+    if freq is not None:
+        return f'pandas.Series({data}, self._data._index)'
+
+    return f'pandas.Series({data})'
 
 
 def df_rolling_method_other_df_codegen(method_name, self, other, args=None, kws=None):
     args = args or []
     kwargs = kws or {}
 
-    rolling_params = df_rolling_params_codegen()
+    rolling_params = df_rolling_params_codegen(self.freq, self.win_type_name)
     method_kws = {k: k for k in kwargs}
     impl_params = ['self'] + args + kwsparams2list(kwargs)
     impl_params_as_str = ', '.join(impl_params)
@@ -142,7 +167,7 @@ def df_rolling_method_other_df_codegen(method_name, self, other, args=None, kws=
             func_lines += [
                 f'  data_{col} = self._data._data[{type_id}][{col_id}]',
                 f'  other_data_{col} = other._data[{other_type_id}][{other_col_id}]',
-                f'  series_{col} = pandas.Series(data_{col})',
+                f'  series_{col} = {df_rolling_series_codegen(f"data_{col}", self.freq)}',
                 f'  {other_series} = pandas.Series(other_data_{col})',
                 f'  rolling_{col} = series_{col}.rolling({rolling_params})',
                 f'  result_{col} = rolling_{col}.{method_name}({method_params})',
@@ -164,8 +189,9 @@ def df_rolling_method_other_df_codegen(method_name, self, other, args=None, kws=
     return func_text, global_vars
 
 
-def df_rolling_method_main_codegen(method_params, df_columns, column_loc, method_name):
-    rolling_params = df_rolling_params_codegen()
+def df_rolling_method_main_codegen(method_params, df_columns, column_loc, method_name, freq=None,
+                                   win_type=None):
+    rolling_params = df_rolling_params_codegen(freq, win_type)
     method_params_as_str = ', '.join(method_params)
 
     results = []
@@ -176,7 +202,7 @@ def df_rolling_method_main_codegen(method_params, df_columns, column_loc, method
         res_data = f'result_data_{col}'
         func_lines += [
             f'  data_{col} = self._data._data[{type_id}][{col_id}]',
-            f'  series_{col} = pandas.Series(data_{col})',
+            f'  series_{col} = {df_rolling_series_codegen(f"data_{col}", freq)}',
             f'  rolling_{col} = series_{col}.rolling({rolling_params})',
             f'  result_{col} = rolling_{col}.{method_name}({method_params_as_str})',
             f'  {res_data} = result_{col}._data[:len(data_{col})]'
@@ -184,7 +210,10 @@ def df_rolling_method_main_codegen(method_params, df_columns, column_loc, method
         results.append((col, res_data))
 
     data = ', '.join(f'"{col}": {data}' for col, data in results)
-    func_lines += [f'  return pandas.DataFrame({{{data}}})']
+    if freq is not None:
+        func_lines += [f'  return pandas.DataFrame({{{data}}}, index=self._data._index)']
+    else:
+        func_lines += [f'  return pandas.DataFrame({{{data}}})']
 
     return func_lines
 
@@ -209,15 +238,37 @@ def gen_df_rolling_method_other_none_codegen(rewrite_name=None):
                 '  else:',
                 '    _pairwise = pairwise',
                 '  if _pairwise:',
-                f'    raise ValueError("Method rolling.{_method_name}(). The object pairwise\\n expected: False")'
             ]
+            columns = self.data.columns
+            if columns:
+                # long-format result: matrices of every row are stacked, i.e. row idx * ncols + i
+                # of column j is the result of the pair of columns (i, j) at row idx
+                param = 'ddof' if _method_name == 'cov' else '0'
+                first_loc = self.data.column_loc[columns[0]]
+                func_lines += [
+                    '    if self._center:',
+                    f'      raise ValueError("Method rolling.{_method_name}(). The object center\\n expected: False")',
+                    f'    length = len(self._data._data[{first_loc.type_id}][{first_loc.col_id}])',
+                    f'    values = numpy.empty(({len(columns)}, length), dtype=float64)',
+                ]
+                for idx, col in enumerate(columns):
+                    col_loc = self.data.column_loc[col]
+                    func_lines.append(f'    values[{idx}] = self._data._data[{col_loc.type_id}][{col_loc.col_id}]')
+                results = ', '.join(f'"{col}": output[{idx}]' for idx, col in enumerate(columns))
+                func_lines += [
+                    f'    output = rolling_pairwise(values, self._window, self._min_periods, {param})',
+                    f'    return pandas.DataFrame({{{results}}})'
+                ]
+            else:
+                func_lines.append('    pass')
         method_params = args + ['{}={}'.format(k, k) for k in kwargs if k != 'other']
         func_lines += df_rolling_method_main_codegen(method_params, self.data.columns, self.data.column_loc,
-                                                     method_name)
+                                                     method_name, self.freq, self.win_type_name)
 
         func_text = '\n'.join(func_lines)
 
-        global_vars = {'pandas': pandas}
+        global_vars = {'pandas': pandas, 'numpy': numpy, 'float64': float64,
+                       'rolling_pairwise': sdc_rolling_pairwise_impls[_method_name]}
 
         return func_text, global_vars
 
@@ -228,7 +279,104 @@ df_rolling_method_other_none_codegen = gen_df_rolling_method_other_none_codegen(
 df_rolling_cov_other_none_codegen = gen_df_rolling_method_other_none_codegen('cov')
 
 
+def df_rolling_method_fused_codegen(method_name, self, args=None, kws=None):
+    """
+    Generate df.rolling method code computing all the columns by single parallel loop over row chunks:
+    columns of each type block are passed through the chunk kernel of the method together
+    and results are written into 2-D array of the block.
+    """
+    args = args or []
+    kwargs = kws or {}
+
+    impl_params = ['self'] + args + kwsparams2list(kwargs)
+    impl_params_as_str = ', '.join(impl_params)
+
+    impl_name = f'_df_rolling_{method_name}_impl'
+    func_lines = [f'def {impl_name}({impl_params_as_str}):']
+
+    if method_name == 'quantile':
+        func_lines += [
+            '  if quantile < 0 or quantile > 1:',
+            '    raise ValueError("quantile value not in [0, 1]")',
+            '  if interpolation != "linear":',
+            '    raise ValueError(\'interpolation value not "linear"\')'
+        ]
+
+    type_ids = []
+    for col in self.data.columns:
+        type_id = self.data.column_loc[col].type_id
+        if type_id not in type_ids:
+            type_ids.append(type_id)
+
+    func_lines += [
+        '  win = self._window',
+        '  minp = self._min_periods'
+    ]
+    if self.is_freq_type:
+        func_lines += [
+            '  times = self._data._index.view(numpy.int64)',
+            f'  length = len(self._data._data[{type_ids[0]}][0])'
+        ]
+    else:
+        func_lines += [
+            '  offset = rolling_center_offset(win, self._center)',
+            f'  length = len(self._data._data[{type_ids[0]}][0]) + offset'
+        ]
+
+    for type_id in type_ids:
+        func_lines += [
+            f'  data_{type_id} = self._data._data[{type_id}]',
+            f'  output_{type_id} = numpy.empty((len(data_{type_id}), length), dtype=float64)'
+        ]
+
+    param = sdc_rolling_fused_params[method_name]
+    func_lines += [
+        '  chunks = parallel_chunks(length)',
+        '  for i in prange(len(chunks)):',
+        '    chunk = chunks[i]'
+    ]
+    for type_id in type_ids:
+        if self.is_freq_type:
+            chunk_args = f'data_{type_id}[j], times, output_{type_id}[j], chunk, win, minp, {param}'
+        else:
+            chunk_args = f'data_{type_id}[j], output_{type_id}[j], chunk, win, minp, {param}'
+        func_lines += [
+            f'    for j in range(len(data_{type_id})):',
+            f'      rolling_chunk({chunk_args})'
+        ]
+
+    results = []
+    for col in self.data.columns:
+        col_loc = self.data.column_loc[col]
+        if self.is_freq_type:
+            results.append((col, f'output_{col_loc.type_id}[{col_loc.col_id}]'))
+        else:
+            results.append((col, f'output_{col_loc.type_id}[{col_loc.col_id}][offset:]'))
+
+    data = ', '.join(f'"{col}": {data}' for col, data in results)
+    if self.is_freq_type:
+        func_lines += [f'  return pandas.DataFrame({{{data}}}, index=self._data._index)']
+    else:
+        func_lines += [f'  return pandas.DataFrame({{{data}}})']
+
+    func_text = '\n'.join(func_lines)
+
+    if self.is_freq_type:
+        rolling_chunk = sdc_rolling_freq_chunks[method_name]
+    else:
+        rolling_chunk = sdc_rolling_chunks[method_name]
+
+    global_vars = {'numpy': numpy, 'pandas': pandas, 'float64': float64, 'prange': prange,
+                   'parallel_chunks': parallel_chunks, 'rolling_center_offset': rolling_center_offset,
+                   'rolling_chunk': rolling_chunk}
+
+    return func_text, global_vars
+
+
 def df_rolling_method_codegen(method_name, self, args=None, kws=None):
+    if method_name in sdc_rolling_fused_params and self.data.columns and not self.is_weighted_type:
+        return df_rolling_method_fused_codegen(method_name, self, args=args, kws=kws)
+
     args = args or []
     kwargs = kws or {}
 
@@ -239,8 +387,8 @@ def df_rolling_method_codegen(method_name, self, args=None, kws=None):
     func_lines = [f'def {impl_name}({impl_params_as_str}):']
 
     method_params = args + ['{}={}'.format(k, k) for k in kwargs]
-    func_lines += df_rolling_method_main_codegen(method_params, self.data.columns,
-                                                 self.data.column_loc, method_name)
+    func_lines += df_rolling_method_main_codegen(method_params, self.data.columns, self.data.column_loc,
+                                                 method_name, self.freq, self.win_type_name)
     func_text = '\n'.join(func_lines)
 
     global_vars = {'pandas': pandas}
@@ -289,7 +437,7 @@ def gen_df_rolling_method_impl(method_name, self, args=None, kws=None):
 
 
 @sdc_overload_method(DataFrameRollingType, 'apply')
-def sdc_pandas_dataframe_rolling_apply(self, func, raw=None):
+def sdc_pandas_dataframe_rolling_apply(self, func, raw=None, engine_kwargs=None):
 
     ty_checker = TypeChecker('Method rolling.apply().')
     ty_checker.check(self, DataFrameRollingType)
@@ -298,8 +446,12 @@ def sdc_pandas_dataframe_rolling_apply(self, func, raw=None):
     if not isinstance(raw, raw_accepted) and raw is not None:
         ty_checker.raise_exc(raw, 'bool', 'raw')
 
+    engine_kwargs_accepted = (Omitted, NoneType, DictType)
+    if not isinstance(engine_kwargs, engine_kwargs_accepted) and engine_kwargs is not None:
+        ty_checker.raise_exc(engine_kwargs, 'dict', 'engine_kwargs')
+
     return gen_df_rolling_method_impl('apply', self, args=['func'],
-                                      kws={'raw': 'None'})
+                                      kws={'raw': 'None', 'engine_kwargs': 'None'})
 
 
 @sdc_overload_method(DataFrameRollingType, 'corr')
@@ -387,12 +539,20 @@ def sdc_pandas_dataframe_rolling_max(self):
 
 
 @sdc_overload_method(DataFrameRollingType, 'mean')
-def sdc_pandas_dataframe_rolling_mean(self):
+def sdc_pandas_dataframe_rolling_mean(self, std=None):
 
     ty_checker = TypeChecker('Method rolling.mean().')
     ty_checker.check(self, DataFrameRollingType)
 
-    return gen_df_rolling_method_impl('mean', self)
+    accepted_std = (Omitted, NoneType, Number)
+    if not isinstance(std, accepted_std) and std is not None:
+        ty_checker.raise_exc(std, 'float', 'std')
+
+    nan_std = isinstance(std, (Omitted, NoneType)) or std is None
+    if not (self.is_weighted_type or nan_std):
+        ty_checker.raise_exc(std, 'None', 'std')
+
+    return gen_df_rolling_method_impl('mean', self, kws={'std': 'None'})
 
 
 @sdc_overload_method(DataFrameRollingType, 'median')
@@ -452,12 +612,20 @@ def sdc_pandas_dataframe_rolling_std(self, ddof=1):
 
 
 @sdc_overload_method(DataFrameRollingType, 'sum')
-def sdc_pandas_dataframe_rolling_sum(self):
+def sdc_pandas_dataframe_rolling_sum(self, std=None):
 
     ty_checker = TypeChecker('Method rolling.sum().')
     ty_checker.check(self, DataFrameRollingType)
 
-    return gen_df_rolling_method_impl('sum', self)
+    accepted_std = (Omitted, NoneType, Number)
+    if not isinstance(std, accepted_std) and std is not None:
+        ty_checker.raise_exc(std, 'float', 'std')
+
+    nan_std = isinstance(std, (Omitted, NoneType)) or std is None
+    if not (self.is_weighted_type or nan_std):
+        ty_checker.raise_exc(std, 'None', 'std')
+
+    return gen_df_rolling_method_impl('sum', self, kws={'std': 'None'})
 
 
 @sdc_overload_method(DataFrameRollingType, 'var')
@@ -481,7 +649,10 @@ sdc_pandas_dataframe_rolling_apply.__doc__ = sdc_pandas_dataframe_rolling_docstr
     -----------
     - This function may reveal slower performance than Pandas* on user system. Users should exercise a tradeoff
     between staying in JIT-region with that function or going back to interpreter mode.
-    - Supported ``raw`` only can be `None` or `True`. Parameters ``args``, ``kwargs`` unsupported.
+    - ``raw`` equal to `None` is handled as `True`. Parameters ``args``, ``kwargs`` unsupported.
+    - Windows are passed to the function as views of the data (and index for ``raw=False``) without copying
+    and are processed in parallel, so the function should not modify its argument.
+    - Non-constant ``raw`` requires the function to accept both ndarray and Series.
     - DataFrame elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
     """,
     'extra_params':
@@ -491,6 +662,8 @@ sdc_pandas_dataframe_rolling_apply.__doc__ = sdc_pandas_dataframe_rolling_docstr
     raw: :obj:`bool`
         False : passes each row or column as a Series to the function.
         True or None : the passed function will receive ndarray objects instead.
+    engine_kwargs: :obj:`dict`
+        Dictionary of str to bool, only ``parallel`` is used: False disables parallel processing of windows.
     """
 })
 
@@ -502,6 +675,9 @@ sdc_pandas_dataframe_rolling_corr.__doc__ = sdc_pandas_dataframe_rolling_docstri
     Limitations
     -----------
     DataFrame elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
+    Pairwise result (``other=None`` with ``pairwise`` not False) is returned in long format with default index:
+    matrices of every row are stacked, i.e. ``i``-th row of the matrix at row ``t`` is row ``t * ncols + i``.
+    Pairwise result for ``other`` of type :obj:`DataFrame` is not supported.
     """,
     'extra_params':
     """
@@ -529,6 +705,9 @@ sdc_pandas_dataframe_rolling_cov.__doc__ = sdc_pandas_dataframe_rolling_docstrin
     DataFrame elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
     Different size of `self` and `other` can produce result different from the result of Pandas
     due to different float rounding in Python and SDC.
+    Pairwise result (``other=None`` with ``pairwise`` not False) is returned in long format with default index:
+    matrices of every row are stacked, i.e. ``i``-th row of the matrix at row ``t`` is row ``t * ncols + i``.
+    Pairwise result for ``other`` of type :obj:`DataFrame` is not supported.
     """,
     'extra_params':
     """
@@ -563,8 +742,13 @@ sdc_pandas_dataframe_rolling_mean.__doc__ = sdc_pandas_dataframe_rolling_docstri
     Limitations
     -----------
     DataFrame elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
+    Weighted windows are computed directly in O(window) operations per element.
     """,
-    'extra_params': ''
+    'extra_params':
+    """
+    std: :obj:`float`
+        Standard deviation of the 'gaussian' window.
+    """
 })
 
 sdc_pandas_dataframe_rolling_median.__doc__ = sdc_pandas_dataframe_rolling_docstring_tmpl.format(**{
@@ -639,8 +823,13 @@ sdc_pandas_dataframe_rolling_sum.__doc__ = sdc_pandas_dataframe_rolling_docstrin
     Limitations
     -----------
     DataFrame elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
+    Weighted windows are computed directly in O(window) operations per element.
     """,
-    'extra_params': ''
+    'extra_params':
+    """
+    std: :obj:`float`
+        Standard deviation of the 'gaussian' window.
+    """
 })
 
 sdc_pandas_dataframe_rolling_var.__doc__ = sdc_pandas_dataframe_rolling_docstring_tmpl.format(**{
@@ -0,0 +1,246 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+import numpy
+
+from numba.core import cgutils, types
+from numba.core.datamodel import StructModel
+from numba.extending import make_attribute_wrapper, models
+from numba.core.typing.templates import signature
+from sdc.utilities.sdc_typing_utils import TypeChecker
+
+
+class EWMType(types.Type):
+    """Type definition for pandas.ewm functions handling.
+    Parameters com/span/halflife/alpha are reduced to center of mass stored in com member."""
+    def __init__(self, ty, data):
+        self.data = data
+
+        name = '{}({})'.format(ty, data)
+        super(EWMType, self).__init__(name)
+
+
+class EWMTypeModel(StructModel):
+    """Model for EWMType type."""
+    def __init__(self, dmm, fe_type):
+        members = [
+            ('data', fe_type.data),
+            ('com', types.float64),
+            ('min_periods', types.intp),
+            ('adjust', types.boolean),
+            ('ignore_na', types.boolean),
+            # string axis is mapped to its number
+            ('axis', types.intp),
+        ]
+        models.StructModel.__init__(self, dmm, fe_type, members)
+
+
+make_attribute_wrapper(EWMType, 'data', '_data')
+make_attribute_wrapper(EWMType, 'com', '_com')
+make_attribute_wrapper(EWMType, 'min_periods', '_min_periods')
+make_attribute_wrapper(EWMType, 'adjust', '_adjust')
+make_attribute_wrapper(EWMType, 'ignore_na', '_ignore_na')
+make_attribute_wrapper(EWMType, 'axis', '_axis')
+
+
+def gen_hpat_pandas_ewm_init(ty):
+    """Generate ewm initializer based on data type"""
+    def _hpat_pandas_ewm_init(typingctx, self, com, min_periods, adjust, ignore_na, axis):
+        """Internal Numba required function to register EWMType."""
+        ret_typ = ty(self)
+        sig = signature(ret_typ, self, types.float64, types.intp, types.boolean, types.boolean, types.intp)
+
+        def _codegen(context, builder, sig, args):
+            """Create EWMTypeModel structure."""
+            data, com, min_periods, adjust, ignore_na, axis = args
+            ewm = cgutils.create_struct_proxy(sig.return_type)(context, builder)
+            ewm.data = data
+            ewm.com = com
+            ewm.min_periods = min_periods
+            ewm.adjust = adjust
+            ewm.ignore_na = ignore_na
+            ewm.axis = axis
+
+            if context.enable_nrt:
+                context.nrt.incref(builder, self, ewm.data)
+
+            return ewm._getvalue()
+
+        return sig, _codegen
+
+    return _hpat_pandas_ewm_init
+
+
+def gen_sdc_pandas_ewm_overload_body(initializer, ty):
+    """Generate code of the overloaded method using associated DataType and constructor."""
+    def sdc_pandas_ewm(self, com=None, span=None, halflife=None, alpha=None,
+                       min_periods=0, adjust=True, ignore_na=False, axis=0):
+        ty_checker = TypeChecker('Method ewm().')
+        ty_checker.check(self, ty)
+
+        none_types = (types.Omitted, types.NoneType)
+
+        def is_none(param):
+            return isinstance(param, none_types) or param is None
+
+        decay_params = {'com': com, 'span': span, 'halflife': halflife, 'alpha': alpha}
+        for name, param in decay_params.items():
+            if not isinstance(param, types.Number) and not is_none(param):
+                ty_checker.raise_exc(param, 'float', name)
+
+        minp_accepted = (types.Omitted, types.Integer)
+        if not isinstance(min_periods, minp_accepted) and min_periods != 0:
+            ty_checker.raise_exc(min_periods, 'int', 'min_periods')
+
+        bool_accepted = (types.Omitted, types.Boolean)
+        if not isinstance(adjust, bool_accepted) and adjust is not True:
+            ty_checker.raise_exc(adjust, 'bool', 'adjust')
+
+        if not isinstance(ignore_na, bool_accepted) and ignore_na is not False:
+            ty_checker.raise_exc(ignore_na, 'bool', 'ignore_na')
+
+        axis_accepted = (types.Omitted, types.Integer, types.StringLiteral, types.UnicodeType)
+        if not isinstance(axis, axis_accepted) and axis != 0:
+            ty_checker.raise_exc(axis, 'int, str', 'axis')
+
+        str_axis = isinstance(axis, (types.StringLiteral, types.UnicodeType))
+        given_com = not is_none(com)
+        given_span = not is_none(span)
+        given_halflife = not is_none(halflife)
+        given_alpha = not is_none(alpha)
+        n_given = sum([given_com, given_span, given_halflife, given_alpha])
+
+        def sdc_pandas_ewm_impl(self, com=None, span=None, halflife=None, alpha=None,
+                                min_periods=0, adjust=True, ignore_na=False, axis=0):
+            if n_given > 1:
+                raise ValueError('comass, span, halflife, and alpha are mutually exclusive')
+            if n_given == 0:
+                raise ValueError('Must pass one of comass, span, halflife, or alpha')
+
+            _com = 0.
+            if given_com == True:  # noqa
+                if com < 0:
+                    raise ValueError('comass must satisfy: comass >= 0')
+                _com = com
+
+            if given_span == True:  # noqa
+                if span < 1:
+                    raise ValueError('span must satisfy: span >= 1')
+                _com = (span - 1) / 2.
+
+            if given_halflife == True:  # noqa
+                if halflife <= 0:
+                    raise ValueError('halflife must satisfy: halflife > 0')
+                decay = 1. - numpy.exp(numpy.log(0.5) / halflife)
+                _com = 1. / decay - 1.
+
+            if given_alpha == True:  # noqa
+                if alpha <= 0 or alpha > 1:
+                    raise ValueError('alpha must satisfy: 0 < alpha <= 1')
+                _com = (1. - alpha) / alpha
+
+            _axis = 0
+            if str_axis == True:  # noqa
+                if axis != 'index' and axis != 'rows':
+                    raise ValueError('Method ewm(). The object axis\n expected: 0')
+            else:
+                if axis != 0:
+                    raise ValueError('Method ewm(). The object axis\n expected: 0')
+                _axis = axis
+
+            return initializer(self, _com, min_periods, adjust, ignore_na, _axis)
+
+        return sdc_pandas_ewm_impl
+
+    return sdc_pandas_ewm
+
+
+sdc_pandas_ewm_docstring_tmpl = """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.{ty}.ewm
+
+    Limitations
+    -----------
+    Parameter ``axis`` is supported only with default value.
+    Parameters ``com``, ``span``, ``halflife`` and ``alpha`` are mutually exclusive, exactly one of them is required.
+
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/{ty_lower}/ewm/{ty_lower}_ewm_mean.py
+       :language: python
+       :lines: 27-
+       :caption: Calculate the exponentially weighted mean.
+       :name: ex_{ty_lower}_ewm
+
+    .. command-output:: python ./{ty_lower}/ewm/{ty_lower}_ewm_mean.py
+       :cwd: ../../../examples
+
+    .. todo:: Add support of parameter ``axis``
+
+    .. seealso::
+        :ref:`rolling <pandas.{ty}.rolling>`
+            Provides rolling window calculations.
+        :ref:`expanding <pandas.{ty}.expanding>`
+            Provides expanding transformations.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas {ty} attribute :attr:`pandas.{ty}.ewm` implementation
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_ewm.TestEWM.test_{ty_lower}_ewm
+
+    Parameters
+    ----------
+    self: :obj:`pandas.{ty}`
+        Input {ty}.
+    com: :obj:`float`
+        Specify decay in terms of center of mass.
+    span: :obj:`float`
+        Specify decay in terms of span.
+    halflife: :obj:`float`
+        Specify decay in terms of half-life.
+    alpha: :obj:`float`
+        Specify smoothing factor directly.
+    min_periods: :obj:`int`
+        Minimum number of observations in window required to have a value.
+    adjust: :obj:`bool`
+        Divide by decaying adjustment factor in beginning periods to account for imbalance in relative weightings.
+    ignore_na: :obj:`bool`
+        Ignore missing values when calculating weights.
+    axis: :obj:`int`, :obj:`str`
+        Axis along which the operation acts
+        0/'index'/'rows' - row-wise operation
+        1/'columns'        - column-wise operation
+        *unsupported*
+
+    Returns
+    -------
+    :class:`pandas.{ty}.ewm`
+        Output class to manipulate with input data.
+"""
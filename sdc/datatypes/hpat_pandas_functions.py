@@ -37,16 +37,77 @@ from numba.np import numpy_support
 from numba.core.errors import TypingError
 from numba.extending import overload
 
+import sdc
 from sdc.io.csv_ext import (
     _gen_csv_reader_py_pyarrow_py_func,
     _gen_csv_reader_py_pyarrow_func_text_dataframe,
 )
 from sdc.str_arr_ext import string_array_type
+from sdc.datatypes.common_functions import _sdc_factorize
+from sdc.hiframes.pd_series_type import SeriesType
+from sdc.utilities.sdc_typing_utils import TypeChecker
 
 from sdc.hiframes import join, aggregate, sort
 from sdc.types import CategoricalDtypeType, Categorical
 
 
+@overload(pd.factorize)
+def sdc_pandas_factorize(values, sort=False, order=None, na_sentinel=-1, size_hint=None):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.factorize
+
+    Limitations
+    -----------
+    Parameter ``values`` is supported only as Series or 1D array of numbers or strings.
+    Parameters ``order`` and ``size_hint`` are ignored as they are by pandas.
+    Uniques are returned as array, not as Index.
+
+    Examples
+    --------
+    Encode strings as codes of the unique strings in order of appearance.
+
+    >>> pd.factorize(pd.Series(['b', 'a', 'b', 'c']))
+    (array([0, 1, 0, 2]), array(['b', 'a', 'c'], dtype=object))
+
+    .. seealso::
+        :ref:`Series.factorize <pandas.Series.factorize>`
+            Encode the object as an enumerated type or categorical variable.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas function :func:`pandas.factorize` implementation.
+
+    .. only:: developer
+
+        Test: python -m sdc.runtests -k sdc.tests.test_series.TestSeries.test_pandas_factorize*
+    """
+
+    ty_checker = TypeChecker('Function factorize().')
+
+    data = values.data if isinstance(values, SeriesType) else values
+    if not (isinstance(data, types.Array) and data.ndim == 1 or data == string_array_type):
+        ty_checker.raise_exc(values, 'Series or array', 'values')
+
+    if not isinstance(sort, (types.Omitted, types.Boolean, bool)):
+        ty_checker.raise_exc(sort, 'bool', 'sort')
+
+    if not isinstance(na_sentinel, (types.Omitted, types.Integer, int)):
+        ty_checker.raise_exc(na_sentinel, 'int', 'na_sentinel')
+
+    def sdc_pandas_factorize_impl(values, sort=False, order=None, na_sentinel=-1, size_hint=None):
+        data = sdc.hiframes.api.fix_df_array(values)
+        codes, uniques = _sdc_factorize(data, sort)
+        if na_sentinel != -1:
+            codes[codes == -1] = na_sentinel
+
+        return codes, uniques
+
+    return sdc_pandas_factorize_impl
+
+
 def get_numba_array_types_for_csv(df):
     """Extracts Numba array types from the given DataFrame."""
     result = []
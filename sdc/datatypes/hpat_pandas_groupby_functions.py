@@ -34,17 +34,26 @@ import numpy
 import operator
 import sdc
 
+from typing import NamedTuple, Optional, Tuple
+
 from numba import types
 from numba.core import cgutils
 from numba.extending import intrinsic
 from numba.core.registry import cpu_target
 from numba.core.typing import signature
+from numba.core.errors import TypingError
 from numba import literally
+from numba.typed import Dict
 
-from sdc.datatypes.common_functions import sdc_arrays_argsort, _sdc_asarray, _sdc_take
+from sdc.datatypes.common_functions import SDCLimitation, sdc_arrays_argsort, _sdc_asarray, _sdc_take
 from sdc.datatypes.hpat_pandas_groupby_types import DataFrameGroupByType, SeriesGroupByType
-from sdc.utilities.sdc_typing_utils import TypeChecker, kwsparams2list, sigparams2list
+from sdc.datatypes.hpat_pandas_groupby_rolling_types import (
+    _hpat_pandas_df_groupby_rolling_init, _hpat_pandas_series_groupby_rolling_init)
+from sdc.datatypes.hpat_pandas_rolling_types import gen_sdc_pandas_rolling_overload_body
+from sdc.utilities.sdc_typing_utils import TypeChecker, sigparams2list
 from sdc.utilities.utils import (sdc_overload, sdc_overload_method, sdc_register_jitable)
+from sdc.utilities.prange_utils import parallel_chunks
+from sdc.hiframes.api import isna
 from sdc.hiframes.pd_series_type import SeriesType
 from sdc.str_ext import string_type
 
@@ -54,31 +63,346 @@ performance_limitation = "This function may reveal slower performance than Panda
     going back to interpreter mode."
 
 
-@sdc_register_jitable
-def merge_groupby_dicts_inplace(left, right):
-    """ Merges one internal groupby dictionary (right) into another one (left) and returns
-    the merging result. Used for aggregating partial dicts into single result. """
+def _sdc_groupby_key(by_data, idx):
+    pass
 
-    if not right:
-        return left
 
-    for key, right_group_list in right.items():
-        left_group_list = left.get(key)
-        if left_group_list is None:
-            left[key] = right_group_list
-        else:
-            left_group_list.extend(right_group_list)
+@sdc_overload(_sdc_groupby_key)
+def _sdc_groupby_key_overload(by_data, idx):
+    """ Returns group key of row idx, where by_data is either an array or a tuple of arrays
+    in which case composite key is a tuple of values of all arrays """
+
+    if not isinstance(by_data, types.BaseTuple):
+        def _sdc_groupby_key_impl(by_data, idx):
+            return by_data[idx]
+        return _sdc_groupby_key_impl
+
+    key_values = ''.join(f'by_data[{i}][idx], ' for i in range(len(by_data)))
+    func_text = '\n'.join([
+        'def _sdc_groupby_key_impl(by_data, idx):',
+        f'  return ({key_values})',
+    ])
+    loc_vars = {}
+    exec(func_text, {}, loc_vars)
+    return loc_vars['_sdc_groupby_key_impl']
+
+
+def _sdc_groupby_key_isna(by_data, idx):
+    pass
+
+
+@sdc_overload(_sdc_groupby_key_isna)
+def _sdc_groupby_key_isna_overload(by_data, idx):
+    """ Checks if group key of row idx is missing, composite key is missing if any of its values is """
+
+    if not isinstance(by_data, types.BaseTuple):
+        def _sdc_groupby_key_isna_impl(by_data, idx):
+            return isna(by_data, idx)
+        return _sdc_groupby_key_isna_impl
+
+    key_isna = ' or '.join(f'isna(by_data[{i}], idx)' for i in range(len(by_data)))
+    func_text = '\n'.join([
+        'def _sdc_groupby_key_isna_impl(by_data, idx):',
+        f'  return {key_isna}',
+    ])
+    loc_vars = {}
+    exec(func_text, {'isna': isna}, loc_vars)
+    return loc_vars['_sdc_groupby_key_isna_impl']
+
+
+def _sdc_groupby_build_index(by_data):
+    pass
+
+
+@sdc_overload(_sdc_groupby_build_index)
+def _sdc_groupby_build_index_overload(by_data):
+    """ Builds compact index of groups formed by values of by_data (an array or a tuple of arrays
+    for grouping by composite keys). Returns a tuple of:
+        keys_map - list of dicts partitioning keys by hash, i.e. key is in keys_map[hash(key) % len(keys_map)],
+            each mapping key to the row of its first appearance (group id of a key is labels of this row)
+        labels - array with group id of each row (-1 for rows with missing key), group ids are assigned
+            in order of first appearance
+        offsets, positions - CSR layout of groups, i.e. positions of rows of group gid
+            (in ascending order) are positions[offsets[gid]:offsets[gid + 1]]
+    Integer keys with small range of values (detected by min/max pre-pass) are grouped
+    by direct indexing with no hashing of rows.
+    """
+
+    if isinstance(by_data, types.Array) and isinstance(by_data.dtype, types.Integer):
+        def _sdc_groupby_build_index_int_impl(by_data):
+            size = len(by_data)
+            if size == 0:
+                return _sdc_groupby_build_index_hashed(by_data)
+
+            chunks = parallel_chunks(size)
+            n_chunks = len(chunks)
+            chunk_mins = numpy.empty(n_chunks, dtype=by_data.dtype)
+            chunk_maxs = numpy.empty(n_chunks, dtype=by_data.dtype)
+            for i in numba.prange(n_chunks):
+                chunk = chunks[i]
+                chunk_min = by_data[chunk.start]
+                chunk_max = by_data[chunk.start]
+                for j in range(chunk.start + 1, chunk.stop):
+                    value = by_data[j]
+                    if value < chunk_min:
+                        chunk_min = value
+                    if value > chunk_max:
+                        chunk_max = value
+                chunk_mins[i] = chunk_min
+                chunk_maxs[i] = chunk_max
+
+            # per-chunk counters of dense path take n_values * n_chunks cells, so it is used only if
+            # they are no larger than data, the product is not computed as it can overflow for wide ranges
+            # (as does the range itself, giving non-positive n_values)
+            min_value = chunk_mins.min()
+            n_values = numpy.int64(chunk_maxs.max() - min_value) + 1
+            min_value = numpy.int64(min_value)
+            if 0 < n_values <= size // n_chunks:
+                return _sdc_groupby_build_index_dense(by_data, min_value, n_values)
+
+            return _sdc_groupby_build_index_hashed(by_data)
+
+        return _sdc_groupby_build_index_int_impl
+
+    def _sdc_groupby_build_index_impl(by_data):
+        return _sdc_groupby_build_index_hashed(by_data)
+
+    return _sdc_groupby_build_index_impl
+
+
+def _sdc_groupby_build_index_dense(by_data, min_value, n_values):
+    pass
+
+
+@sdc_overload(_sdc_groupby_build_index_dense)
+def _sdc_groupby_build_index_dense_overload(by_data, min_value, n_values):
+    """ Builds index of groups (see _sdc_groupby_build_index) for integer keys with values
+    in range [min_value, min_value + n_values), where key value - min_value is used as id of a slot
+    in per-chunk arrays of counters and first rows """
+
+    by_type = by_data.dtype
+
+    def _sdc_groupby_build_index_dense_impl(by_data, min_value, n_values):
+        size = len(by_data)
+        chunks = parallel_chunks(size)
+        n_chunks = len(chunks)
+
+        chunk_counts = numpy.zeros((n_chunks, n_values), dtype=numpy.int64)
+        chunk_firsts = numpy.empty((n_chunks, n_values), dtype=numpy.int64)
+        for i in numba.prange(n_chunks):
+            chunk = chunks[i]
+            for j in range(chunk.start, chunk.stop):
+                slot = numpy.int64(by_data[j]) - min_value
+                if chunk_counts[i, slot] == 0:
+                    chunk_firsts[i, slot] = j
+                chunk_counts[i, slot] += 1
+
+        # count of rows of each chunk is replaced with the number of rows of the same value
+        # in preceding chunks, i.e. with offset of chunk rows within the group
+        value_firsts = numpy.empty(n_values, dtype=numpy.int64)
+        value_counts = numpy.zeros(n_values, dtype=numpy.int64)
+        for slot in numba.prange(n_values):
+            value_first = size
+            value_count = 0
+            for i in range(n_chunks):
+                chunk_count = chunk_counts[i, slot]
+                if chunk_count > 0 and value_first == size:
+                    value_first = chunk_firsts[i, slot]
+                chunk_counts[i, slot] = value_count
+                value_count += chunk_count
+            value_firsts[slot] = value_first
+            value_counts[slot] = value_count
+
+        # group ids are ranks of first rows of groups, slots of absent values are ordered last
+        slots_order = numpy.argsort(value_firsts, kind='mergesort')
+        n_groups = 0
+        for slot in range(n_values):
+            if value_counts[slot] > 0:
+                n_groups += 1
+
+        slot_gids = numpy.empty(n_values, dtype=numpy.int64)
+        offsets = numpy.zeros(n_groups + 1, dtype=numpy.int64)
+        for gid in range(n_groups):
+            slot = slots_order[gid]
+            slot_gids[slot] = gid
+            offsets[gid + 1] = offsets[gid] + value_counts[slot]
+
+        labels = numpy.empty(size, dtype=numpy.int64)
+        positions = numpy.empty(offsets[n_groups], dtype=numpy.int64)
+        for i in numba.prange(n_chunks):
+            chunk = chunks[i]
+            slot_positions = chunk_counts[i].copy()
+            for j in range(chunk.start, chunk.stop):
+                slot = numpy.int64(by_data[j]) - min_value
+                gid = slot_gids[slot]
+                labels[j] = gid
+                positions[offsets[gid] + slot_positions[slot]] = j
+                slot_positions[slot] += 1
+
+        n_parts = n_chunks
+        keys_map = [Dict.empty(by_type, types.int64) for _ in range(n_parts)]
+        for gid in range(n_groups):
+            first = value_firsts[slots_order[gid]]
+            value = by_data[first]
+            keys_map[hash(value) % n_parts][value] = first
+
+        return keys_map, labels, offsets, positions
+
+    return _sdc_groupby_build_index_dense_impl
+
+
+def _sdc_groupby_build_index_hashed(by_data):
+    pass
+
+
+@sdc_overload(_sdc_groupby_build_index_hashed)
+def _sdc_groupby_build_index_hashed_overload(by_data):
+    """ Builds index of groups (see _sdc_groupby_build_index) for keys of any hashable type. Rows of each
+    chunk are grouped separately with chunk-local hash tables, which are then merged by hash partitions """
+
+    if isinstance(by_data, types.BaseTuple):
+        by_type = types.BaseTuple.from_types([a.dtype for a in by_data])
+    else:
+        by_type = by_data.dtype
+    by_is_tuple = isinstance(by_data, types.BaseTuple)
 
-    return left
+    def _sdc_groupby_build_index_hashed_impl(by_data):
+        if by_is_tuple == True:  # noqa
+            size = len(by_data[0])
+        else:
+            size = len(by_data)
+        chunks = parallel_chunks(size)
+        n_chunks = len(chunks)
+        n_parts = n_chunks
+
+        # rows of each chunk are grouped separately with chunk-local groups identified
+        # by their first row (head), so that per-group data can be kept in arrays of data size,
+        # each head is also assigned to a partition by hash of its key
+        chunk_maps = [Dict.empty(by_type, types.int64) for _ in range(n_chunks)]
+        heads = numpy.empty(size, dtype=numpy.int64)
+        head_counts = numpy.zeros(size, dtype=numpy.int64)
+        head_parts = numpy.empty(size, dtype=numpy.int64)
+        part_counts = numpy.zeros((n_chunks, n_parts), dtype=numpy.int64)
+        for i in numba.prange(n_chunks):
+            chunk = chunks[i]
+            chunk_map = chunk_maps[i]
+            for j in range(chunk.start, chunk.stop):
+                if _sdc_groupby_key_isna(by_data, j):
+                    heads[j] = -1
+                    continue
+                value = _sdc_groupby_key(by_data, j)
+                if value in chunk_map:
+                    head = chunk_map[value]
+                else:
+                    head = j
+                    chunk_map[value] = head
+                    part = hash(value) % n_parts
+                    head_parts[j] = part
+                    part_counts[i, part] += 1
+                heads[j] = head
+                head_counts[head] += 1
+
+        # lay out heads by partitions, heads of each partition being ordered by chunks and rows
+        part_starts = numpy.zeros(n_parts + 1, dtype=numpy.int64)
+        slot_starts = numpy.empty((n_chunks, n_parts), dtype=numpy.int64)
+        for part in range(n_parts):
+            slot_start = part_starts[part]
+            for i in range(n_chunks):
+                slot_starts[i, part] = slot_start
+                slot_start += part_counts[i, part]
+            part_starts[part + 1] = slot_start
+
+        part_heads = numpy.empty(part_starts[n_parts], dtype=numpy.int64)
+        for i in numba.prange(n_chunks):
+            chunk = chunks[i]
+            slots = slot_starts[i].copy()
+            for j in range(chunk.start, chunk.stop):
+                if heads[j] == j:
+                    part = head_parts[j]
+                    part_heads[slots[part]] = j
+                    slots[part] += 1
+
+        # partitions have disjoint sets of keys and are merged in parallel: each head is mapped
+        # to the first row of its group and count of rows of each chunk-local group is replaced with
+        # the number of rows of the same group in preceding chunks, i.e. with its offset within the group
+        keys_map = [Dict.empty(by_type, types.int64) for _ in range(n_parts)]
+        labels = numpy.empty(size, dtype=numpy.int64)
+        first_counts = numpy.zeros(size, dtype=numpy.int64)
+        for part in numba.prange(n_parts):
+            part_map = keys_map[part]
+            for k in range(part_starts[part], part_starts[part + 1]):
+                head = part_heads[k]
+                value = _sdc_groupby_key(by_data, head)
+                if value in part_map:
+                    first = part_map[value]
+                else:
+                    first = head
+                    part_map[value] = first
+                labels[head] = first
+                head_count = head_counts[head]
+                head_counts[head] = first_counts[first]
+                first_counts[first] += head_count
+
+        # group ids are ranks of first rows of groups
+        chunk_groups = numpy.zeros(n_chunks, dtype=numpy.int64)
+        for i in numba.prange(n_chunks):
+            chunk = chunks[i]
+            for j in range(chunk.start, chunk.stop):
+                if first_counts[j] > 0:
+                    chunk_groups[i] += 1
+
+        chunk_gids = numpy.zeros(n_chunks + 1, dtype=numpy.int64)
+        chunk_gids[1:] = numpy.cumsum(chunk_groups)
+        n_groups = chunk_gids[n_chunks]
+
+        # first_counts of first rows are replaced with group ids once counts are saved
+        group_counts = numpy.empty(n_groups, dtype=numpy.int64)
+        for i in numba.prange(n_chunks):
+            chunk = chunks[i]
+            gid = chunk_gids[i]
+            for j in range(chunk.start, chunk.stop):
+                if first_counts[j] > 0:
+                    group_counts[gid] = first_counts[j]
+                    first_counts[j] = gid
+                    gid += 1
+
+        for k in numba.prange(len(part_heads)):
+            head = part_heads[k]
+            labels[head] = first_counts[labels[head]]
+
+        offsets = numpy.zeros(n_groups + 1, dtype=numpy.int64)
+        offsets[1:] = numpy.cumsum(group_counts)
+
+        positions = numpy.empty(offsets[n_groups], dtype=numpy.int64)
+        for i in numba.prange(n_chunks):
+            chunk = chunks[i]
+            for j in range(chunk.start, chunk.stop):
+                head = heads[j]
+                if head < 0:
+                    labels[j] = -1
+                    continue
+                gid = labels[head]
+                labels[j] = gid
+                positions[offsets[gid] + head_counts[head]] = j
+                head_counts[head] += 1
+
+        return keys_map, labels, offsets, positions
+
+    return _sdc_groupby_build_index_hashed_impl
 
 
 @intrinsic
 def init_dataframe_groupby(typingctx, parent, column_id, data, sort, target_columns=None):
 
+    if isinstance(column_id, types.BaseTuple):
+        by_col_ids = tuple(a.literal_value for a in column_id)
+    else:
+        by_col_ids = (column_id.literal_value, )
+
     target_columns = types.none if target_columns is None else target_columns
     if isinstance(target_columns, types.NoneType):
         target_not_specified = True
-        selected_col_names = tuple([a for i, a in enumerate(parent.columns) if i != column_id.literal_value])
+        selected_col_names = tuple([a for i, a in enumerate(parent.columns) if i not in by_col_ids])
     else:
         target_not_specified = False
         selected_col_names = tuple([a.literal_value for a in target_columns])
@@ -91,7 +415,8 @@ def init_dataframe_groupby(typingctx, parent, column_id, data, sort, target_colu
             signature.return_type)(context, builder)
         groupby_obj.parent = parent_val
         groupby_obj.col_id = column_id_val
-        groupby_obj.data = data_val
+        groupby_obj.keys_map, groupby_obj.labels, groupby_obj.offsets, groupby_obj.positions = \
+            cgutils.unpack_tuple(builder, data_val)
         groupby_obj.sort = sort_val
         groupby_obj.target_default = context.get_constant(types.bool_, target_not_specified)
 
@@ -120,17 +445,20 @@ def init_dataframe_groupby(typingctx, parent, column_id, data, sort, target_colu
 def init_series_groupby(typingctx, parent, by_data, data, sort):
 
     def codegen(context, builder, signature, args):
-        parent_val, _, data_val, sort_val = args
+        parent_val, by_data_val, data_val, sort_val = args
         # create series struct and store values
         groupby_obj = cgutils.create_struct_proxy(
             signature.return_type)(context, builder)
         groupby_obj.parent = parent_val
-        groupby_obj.data = data_val
+        groupby_obj.by = by_data_val
+        groupby_obj.keys_map, groupby_obj.labels, groupby_obj.offsets, groupby_obj.positions = \
+            cgutils.unpack_tuple(builder, data_val)
         groupby_obj.sort = sort_val
 
         # increase refcount of stored values
         if context.enable_nrt:
             context.nrt.incref(builder, signature.args[0], parent_val)
+            context.nrt.incref(builder, signature.args[1], by_data_val)
             context.nrt.incref(builder, signature.args[2], data_val)
 
         return groupby_obj._getvalue()
@@ -151,11 +479,13 @@ def sdc_pandas_dataframe_getitem(self, idx):
         or (isinstance(idx, types.Tuple)
             and all(isinstance(a, types.StringLiteral) for a in idx))):
 
-        by_col_id_literal = self.col_id.literal_value
-        by_col_loc = self.parent.column_loc[self.parent.columns[by_col_id_literal]]
+        # with composite keys selecting single column still gives DataFrameGroupBy as key columns
+        # are part of the result (they are returned as columns as there is no MultiIndex)
+        by_multiple_cols = len(self.by_col_ids) > 1
+        by_col_loc = self.parent.column_loc[self.parent.columns[self.by_col_ids[0]]]
         by_type_id, by_col_id = by_col_loc.type_id, by_col_loc.col_id
 
-        if idx_is_literal_str:
+        if idx_is_literal_str and not by_multiple_cols:
             target_col_id_literal = self.parent.columns.index(idx.literal_value)
             target_col_loc = self.parent.column_loc[self.parent.columns[target_col_id_literal]]
             target_type_id, target_col_id = target_col_loc.type_id, target_col_loc.col_id
@@ -166,16 +496,23 @@ def sdc_pandas_dataframe_getitem(self, idx):
             if not self._target_default:
                 raise IndexError("DataFrame.GroupBy.getitem: Columns already selected")
 
-            if idx_is_literal_str == True:  # noqa
-                # no need to pass index into this series, as we group by array
+            group_index = (self._keys_map, self._labels, self._offsets, self._positions)
+            if by_multiple_cols == True:  # noqa
+                if idx_is_literal_str == True:  # noqa
+                    return init_dataframe_groupby(self._parent, self._col_id, group_index, self._sort, (idx, ))
+                else:
+                    return init_dataframe_groupby(self._parent, self._col_id, group_index, self._sort, idx)
+            elif idx_is_literal_str == True:  # noqa
+                # index of the series is needed for results of transformations, which are aligned with rows
                 target_series = pandas.Series(
                     data=self._parent._data[target_type_id][target_col_id],
+                    index=self._parent._index,
                     name=self._parent._columns[target_col_id_literal]
                 )
                 by_arr_data = self._parent._data[by_type_id][by_col_id]
-                return init_series_groupby(target_series, by_arr_data, self._data, self._sort)
+                return init_series_groupby(target_series, by_arr_data, group_index, self._sort)
             else:
-                return init_dataframe_groupby(self._parent, by_col_id_literal, self._data, self._sort, idx)
+                return init_dataframe_groupby(self._parent, self._col_id, group_index, self._sort, idx)
 
         return sdc_pandas_dataframe_getitem_common_impl
 
@@ -188,459 +525,2759 @@ def sdc_pandas_dataframe_getitem(self, idx):
     return None
 
 
-def _sdc_pandas_groupby_generic_func_codegen(func_name, columns, column_loc,
-                                             func_params, defaults, impl_params):
-    all_params_as_str = ', '.join(sigparams2list(func_params, defaults))
-    extra_impl_params = ', '.join(kwsparams2list(impl_params))
+class GroupByAccumulator(NamedTuple):
+    """ Describes streaming computation of a groupby reduction. State is kept per group as a set
+    of named slots, each slot is a tuple of (name, dtype, initial value), where dtype is either
+    numpy dtype name or one of 'column'/'result' meaning dtype of the column or of the result.
+    Templates refer to state slots as {slot} (or {other_slot} in merge), to the current value as {val}
+    and to the prefix reserved for temporary variables as {tmp}, update lines may refer to the position
+    of the current row as j. Rows are passed to update lines in ascending order of positions and partial
+    states are merged in the same order. Result is set to NaN when result dtype is float and nan_condition holds. """
+    state: Tuple[Tuple[str, str, str], ...]
+    update: Tuple[str, ...]
+    merge: Tuple[str, ...]
+    result: str
+    nan_condition: Optional[str] = None
+
+
+groupby_accumulators = {
+    'count': GroupByAccumulator(
+        state=(('cnt', 'int64', '0'), ),
+        update=('{cnt} += 1', ),
+        merge=('{cnt} += {other_cnt}', ),
+        result='{cnt}'
+    ),
+    'sum': GroupByAccumulator(
+        state=(('sum', 'result', '0'), ),
+        update=('{sum} += {val}', ),
+        merge=('{sum} += {other_sum}', ),
+        result='{sum}'
+    ),
+    'prod': GroupByAccumulator(
+        state=(('prod', 'result', '1'), ),
+        update=('{prod} *= {val}', ),
+        merge=('{prod} *= {other_prod}', ),
+        result='{prod}'
+    ),
+    'mean': GroupByAccumulator(
+        state=(('sum', 'float64', '0'), ('cnt', 'int64', '0')),
+        update=('{sum} += {val}', '{cnt} += 1'),
+        merge=('{sum} += {other_sum}', '{cnt} += {other_cnt}'),
+        result='{sum} / {cnt}',
+        nan_condition='{cnt} == 0'
+    ),
+    'min': GroupByAccumulator(
+        state=(('min', 'column', '0'), ('cnt', 'int64', '0')),
+        update=('if {cnt} == 0 or {val} < {min}:',
+                '  {min} = {val}',
+                '{cnt} += 1'),
+        merge=('if {other_cnt} > 0 and ({cnt} == 0 or {other_min} < {min}):',
+               '  {min} = {other_min}',
+               '{cnt} += {other_cnt}'),
+        result='{min}',
+        nan_condition='{cnt} == 0'
+    ),
+    'max': GroupByAccumulator(
+        state=(('max', 'column', '0'), ('cnt', 'int64', '0')),
+        update=('if {cnt} == 0 or {val} > {max}:',
+                '  {max} = {val}',
+                '{cnt} += 1'),
+        merge=('if {other_cnt} > 0 and ({cnt} == 0 or {other_max} > {max}):',
+               '  {max} = {other_max}',
+               '{cnt} += {other_cnt}'),
+        result='{max}',
+        nan_condition='{cnt} == 0'
+    ),
+    # var and std use Welford's online algorithm and Chan's formula for merging partial results
+    'var': GroupByAccumulator(
+        state=(('cnt', 'int64', '0'), ('mean', 'float64', '0'), ('m2', 'float64', '0')),
+        update=('{cnt} += 1',
+                '{tmp}_delta = {val} - {mean}',
+                '{mean} += {tmp}_delta / {cnt}',
+                '{m2} += {tmp}_delta * ({val} - {mean})'),
+        merge=('if {other_cnt} > 0:',
+               '  {tmp}_n = {cnt} + {other_cnt}',
+               '  {tmp}_delta = {other_mean} - {mean}',
+               '  {m2} += {other_m2} + {tmp}_delta * {tmp}_delta * {cnt} * {other_cnt} / {tmp}_n',
+               '  {mean} += {tmp}_delta * {other_cnt} / {tmp}_n',
+               '  {cnt} = {tmp}_n'),
+        result='{m2} / ({cnt} - ddof)',
+        nan_condition='{cnt} <= ddof'
+    ),
+    'first': GroupByAccumulator(
+        state=(('first', 'column', '0'), ('cnt', 'int64', '0')),
+        update=('if {cnt} == 0:',
+                '  {first} = {val}',
+                '{cnt} += 1'),
+        merge=('if {cnt} == 0:',
+               '  {first} = {other_first}',
+               '{cnt} += {other_cnt}'),
+        result='{first}',
+        nan_condition='{cnt} == 0'
+    ),
+    'last': GroupByAccumulator(
+        state=(('last', 'column', '0'), ('cnt', 'int64', '0')),
+        update=('{last} = {val}',
+                '{cnt} += 1'),
+        merge=('if {other_cnt} > 0:',
+               '  {last} = {other_last}',
+               '{cnt} += {other_cnt}'),
+        result='{last}',
+        nan_condition='{cnt} == 0'
+    ),
+    # idxmin and idxmax compute positions of rows, which are converted to index labels afterwards
+    'idxmin': GroupByAccumulator(
+        state=(('min', 'column', '0'), ('pos', 'int64', '-1')),
+        update=('if {pos} < 0 or {val} < {min}:',
+                '  {min} = {val}',
+                '  {pos} = j'),
+        merge=('if {other_pos} >= 0 and ({pos} < 0 or {other_min} < {min}):',
+               '  {min} = {other_min}',
+               '  {pos} = {other_pos}'),
+        result='{pos}'
+    ),
+    'idxmax': GroupByAccumulator(
+        state=(('max', 'column', '0'), ('pos', 'int64', '-1')),
+        update=('if {pos} < 0 or {val} > {max}:',
+                '  {max} = {val}',
+                '  {pos} = j'),
+        merge=('if {other_pos} >= 0 and ({pos} < 0 or {other_max} > {max}):',
+               '  {max} = {other_max}',
+               '  {pos} = {other_pos}'),
+        result='{pos}'
+    ),
+}
+
+groupby_accumulators['std'] = groupby_accumulators['var']._replace(result='numpy.sqrt({m2} / ({cnt} - ddof))')
 
-    groupby_obj = f'{func_params[0]}'
-    df = f'{groupby_obj}._parent'
-    groupby_dict = f'{groupby_obj}._data'
-    groupby_param_sort = f'{groupby_obj}._sort'
-    column_names, column_ids = tuple(zip(*columns))
 
+def _groupby_accumulator_state_dtype(dtype_name, target_index):
+    if dtype_name == 'column':
+        return f'column_dtype_{target_index}'
+    if dtype_name == 'result':
+        return f'result_dtype_{target_index}'
+    return f'numpy.{dtype_name}'
+
+
+def _sdc_groupby_accumulate_codelines(targets, group_rows_loop):
+    """
+    Generates code lines that compute groupby reductions of several columns in a single data pass.
+    Each target is a tuple (res_var, column_var, column_dtype, result_dtype, func_name): res_var names
+    pre-allocated array for results ordered as in res_order, column_var names the array with data.
+    Generated code expects variables labels (group id of each row or -1), n_groups and res_order
+    to be defined and group_rows_loop to be header lines of a loop setting j to positions of group gid.
+    Returns generated code lines and global variables these lines refer to.
+
+    If the number of groups is small compared to data length, rows are processed in parallel chunks
+    and each chunk keeps its own state of accumulators, partial states are merged in parallel
+    across groups. Otherwise groups are processed in parallel, each one iterating over its own rows.
+    """
+
+    def state_refs(a, accumulator, fmt):
+        refs = {slot: fmt.format(a=a, slot=slot) for slot, _, _ in accumulator.state}
+        refs['tmp'] = f'tmp_{a}'
+        return refs
+
+    def indent(lines, n):
+        return [' ' * n + line for line in lines]
+
+    def row_update_lines(state_fmt):
+        # value of each column is loaded once per row even if several targets use it
+        lines = []
+        value_vars = {}
+        for a, (_, column_var, column_dtype, _, _) in enumerate(targets):
+            if column_var not in value_vars:
+                value_vars[column_var] = f'val_{a}'
+                lines.append(f'val_{a} = {column_var}[j]')
+            value_var = value_vars[column_var]
+            refs = state_refs(a, accumulators[a], state_fmt)
+            update_lines = [line.format(val=value_var, **refs) for line in accumulators[a].update]
+            # missing values are skipped: NaN of float columns, None of strings and NaT of datetimes
+            if isinstance(column_dtype, types.Float):
+                lines += [f'if not numpy.isnan({value_var}):'] + indent(update_lines, 2)
+            else:
+                lines += [f'if not isna({column_var}, j):'] + indent(update_lines, 2)
+        return lines
+
+    def result_lines(a, res_var, accumulator, refs, result_dtype):
+        res_value = accumulator.result.format(**refs)
+        if accumulator.nan_condition is None or not isinstance(result_dtype, types.Float):
+            return [f'{res_var}[k] = {res_value}']
+        nan_condition = accumulator.nan_condition.format(**refs)
+        return [f'if {nan_condition}:',
+                f'  {res_var}[k] = numpy.nan',
+                f'else:',
+                f'  {res_var}[k] = {res_value}']
+
+    accumulators = [groupby_accumulators[func_name] for _, _, _, _, func_name in targets]
+
+    # per-chunk state is kept in 2D arrays, so chunked processing is used if their size does not exceed data length
     func_lines = [
-        f'def _dataframe_groupby_{func_name}_impl({all_params_as_str}):',
-        f'  group_keys = _sdc_asarray([key for key in {groupby_dict}])',
-        f'  res_index_len = len(group_keys)',
-        f'  if {groupby_param_sort}:',
-        f'    argsorted_index = sdc_arrays_argsort(group_keys, kind=\'mergesort\')',
+        f'chunks = parallel_chunks(len(labels))',
+        f'n_chunks = len(chunks)',
+        f'if n_groups * n_chunks <= len(labels):',
     ]
 
-    # TODO: remove conversion from Numba typed.List to reflected one while creating group_arr_{i}
-    for i in range(len(columns)):
-        col_loc = column_loc[column_names[i]]
-        type_id, col_id = col_loc.type_id, col_loc.col_id
-        func_lines += [
-            f'  result_data_{i} = numpy.empty(res_index_len, dtype=res_arrays_dtypes[{i}])',
-            f'  column_data_{i} = {df}._data[{type_id}][{col_id}]',
-            f'  for j in numpy.arange(res_index_len):',
-            f'    idx = argsorted_index[j] if {groupby_param_sort} else j',
-            f'    group_arr_{i} = _sdc_take(column_data_{i}, list({groupby_dict}[group_keys[idx]]))',
-            f'    group_series_{i} = pandas.Series(group_arr_{i})',
-            f'    result_data_{i}[j] = group_series_{i}.{func_name}({extra_impl_params})',
-        ]
+    chunked_lines = []
+    for a, accumulator in enumerate(accumulators):
+        for slot, dtype_name, init_value in accumulator.state:
+            state_dtype = _groupby_accumulator_state_dtype(dtype_name, a)
+            chunked_lines.append(
+                f'acc_{a}_{slot} = numpy.full((n_chunks, n_groups), {init_value}, dtype={state_dtype})')
+
+    chunked_lines += [
+        f'for i in numba.prange(n_chunks):',
+        f'  chunk = chunks[i]',
+        f'  for j in range(chunk.start, chunk.stop):',
+        f'    gid = labels[j]',
+        f'    if gid < 0:',
+        f'      continue',
+    ]
+    chunked_lines += indent(row_update_lines('acc_{a}_{slot}[i, gid]'), 4)
 
-    data = ', '.join(f'\'{column_names[i]}\': result_data_{i}' for i in range(len(columns)))
-    func_lines.extend(['\n'.join([
-        f'  if {groupby_param_sort}:',
-        f'    res_index = _sdc_take(group_keys, argsorted_index)',
-        f'  else:',
-        f'    res_index = group_keys',
-        f'  return pandas.DataFrame({{{data}}}, index=res_index)'
-    ])])
+    chunked_lines += [
+        f'for k in numba.prange(n_groups):',
+        f'  gid = res_order[k]',
+    ]
+    for a, (res_var, _, _, result_dtype, _) in enumerate(targets):
+        accumulator = accumulators[a]
+        refs = state_refs(a, accumulator, 'r_{a}_{slot}')
+        other_refs = {f'other_{slot}': f'acc_{a}_{slot}[i, gid]' for slot, _, _ in accumulator.state}
+        chunked_lines += [f'  r_{a}_{slot} = acc_{a}_{slot}[0, gid]' for slot, _, _ in accumulator.state]
+        chunked_lines += [f'  for i in range(1, n_chunks):']
+        chunked_lines += indent([line.format(**refs, **other_refs) for line in accumulator.merge], 4)
+        chunked_lines += indent(result_lines(a, res_var, accumulator, refs, result_dtype), 2)
+
+    grouped_lines = [
+        f'for k in numba.prange(n_groups):',
+        f'  gid = res_order[k]',
+    ]
+    for a, accumulator in enumerate(accumulators):
+        for slot, dtype_name, init_value in accumulator.state:
+            state_dtype = _groupby_accumulator_state_dtype(dtype_name, a)
+            grouped_lines.append(f'  r_{a}_{slot} = {state_dtype}({init_value})')
 
-    func_text = '\n'.join(func_lines)
-    global_vars = {'pandas': pandas,
-                   'numpy': numpy,
-                   '_sdc_asarray': _sdc_asarray,
-                   '_sdc_take': _sdc_take,
-                   'sdc_arrays_argsort': sdc_arrays_argsort}
+    grouped_lines += indent(group_rows_loop, 2)
+    grouped_lines += indent(row_update_lines('r_{a}_{slot}'), 4)
 
-    return func_text, global_vars
+    for a, (res_var, _, _, result_dtype, _) in enumerate(targets):
+        refs = state_refs(a, accumulators[a], 'r_{a}_{slot}')
+        grouped_lines += indent(result_lines(a, res_var, accumulators[a], refs, result_dtype), 2)
 
+    func_lines += indent(chunked_lines, 2)
+    func_lines += ['else:']
+    func_lines += indent(grouped_lines, 2)
 
-def _sdc_pandas_series_groupby_generic_func_codegen(func_name, func_params, defaults, impl_params):
+    global_vars = {'isna': isna}
+    for a, (_, _, column_dtype, result_dtype, _) in enumerate(targets):
+        global_vars[f'column_dtype_{a}'] = column_dtype
+        global_vars[f'result_dtype_{a}'] = result_dtype
 
-    all_params_as_str = ', '.join(sigparams2list(func_params, defaults))
-    extra_impl_params = ', '.join(kwsparams2list(impl_params))
+    return func_lines, global_vars
 
-    groupby_obj = f'{func_params[0]}'
-    series = f'{groupby_obj}._parent'
-    groupby_dict = f'{groupby_obj}._data'
-    groupby_param_sort = f'{groupby_obj}._sort'
 
-    # TODO: remove conversion from Numba typed.List to reflected one while creating group_arr_{i}
-    func_lines = [
-        f'def _series_groupby_{func_name}_impl({all_params_as_str}):',
-        f'  group_keys = _sdc_asarray([key for key in {groupby_dict}])',
-        f'  res_index_len = len(group_keys)',
-        f'  if {groupby_param_sort}:',
-        f'    argsorted_index = sdc_arrays_argsort(group_keys, kind=\'mergesort\')',
-        f'  result_data = numpy.empty(res_index_len, dtype=res_dtype)',
-        f'  for j in numpy.arange(res_index_len):',
-        f'    idx = argsorted_index[j] if {groupby_param_sort} else j',
-        f'    group_arr = _sdc_take({series}._data, list({groupby_dict}[group_keys[idx]]))',
-        f'    group_series = pandas.Series(group_arr)',
-        f'    result_data[j] = group_series.{func_name}({extra_impl_params})',
-        f'  if {groupby_param_sort}:',
-        f'    res_index = _sdc_take(group_keys, argsorted_index)',
-        f'  else:',
-        f'    res_index = group_keys',
-        f'  return pandas.Series(data=result_data, index=res_index, name={series}._name)'
-    ]
+# functions computed by selection from values of each group gathered into a scratch buffer rather than by accumulators
+groupby_selections = ('median', 'nunique', 'quantile')
 
-    func_text = '\n'.join(func_lines)
-    global_vars = {'pandas': pandas,
-                   'numpy': numpy,
-                   '_sdc_asarray': _sdc_asarray,
-                   '_sdc_take': _sdc_take,
-                   'sdc_arrays_argsort': sdc_arrays_argsort}
 
-    return func_text, global_vars
+@sdc_register_jitable
+def _sdc_groupby_select(buf, left, right, k):
+    """ Partially reorders values of buf[left:right] so that buf[k] gets the value it would have if the range
+    was sorted, values before it are not greater and values after it are not less. Quickselect with
+    median-of-three pivots falls back to sorting the remaining range if partitioning does not shrink it
+    fast enough (introselect), so selection is linear on average and O(n log n) in the worst case """
+    depth_limit = 2 * int(numpy.log2(right - left + 1)) + 4
+    right = right - 1
+    while left < right:
+        if depth_limit == 0:
+            buf[left:right + 1].sort()
+            return
+        depth_limit -= 1
+
+        mid = left + (right - left) // 2
+        if buf[mid] < buf[left]:
+            buf[left], buf[mid] = buf[mid], buf[left]
+        if buf[right] < buf[left]:
+            buf[left], buf[right] = buf[right], buf[left]
+        if buf[right] < buf[mid]:
+            buf[mid], buf[right] = buf[right], buf[mid]
+        pivot = buf[mid]
+
+        i = left
+        j = right
+        while i <= j:
+            while buf[i] < pivot:
+                i += 1
+            while pivot < buf[j]:
+                j -= 1
+            if i <= j:
+                buf[i], buf[j] = buf[j], buf[i]
+                i += 1
+                j -= 1
+
+        if k <= j:
+            right = j
+        elif k >= i:
+            left = i
+        else:
+            return
 
 
-series_method_to_func = {
-    'count': lambda S: S.count(),
-    'max': lambda S: S.max(),
-    'mean': lambda S: S.mean(),
-    'median': lambda S: S.median(),
-    'min': lambda S: S.min(),
-    'prod': lambda S: S.prod(),
-    'std': lambda S: S.std(),
-    'sum': lambda S: S.sum(),
-    'var': lambda S: S.var()
-}
+@sdc_register_jitable
+def _sdc_groupby_group_quantiles(data, group_positions, buf, quantiles, quantiles_order, res, res_start):
+    """ Computes quantiles of values of data at group_positions, ignoring NaNs and interpolating linearly
+    as numpy.quantile does, and writes them to res starting from res_start. Values are gathered into
+    the scratch buffer buf and quantiles are selected in ascending order, so that each selection
+    only reorders the part of buf following the position of the previous one """
+    n = 0
+    for j in group_positions:
+        if not isna(data, j):
+            buf[n] = data[j]
+            n += 1
+
+    left = 0
+    for i in quantiles_order:
+        if n == 0:
+            res[res_start + i] = numpy.nan
+            continue
+
+        h = (n - 1) * quantiles[i]
+        lo = int(numpy.floor(h))
+        _sdc_groupby_select(buf, left, n, lo)
+        left = lo
+
+        result = buf[lo]
+        frac = h - lo
+        if frac > 0:
+            # values following the selected one are not less than it, the next order statistic is their minimum
+            hi = buf[lo + 1]
+            for p in range(lo + 2, n):
+                if buf[p] < hi:
+                    hi = buf[p]
+            # equal neighbours are not interpolated, so that infinite values do not produce NaN
+            if hi != result:
+                result += (hi - result) * frac
+        res[res_start + i] = result
 
 
-def _groupby_resolve_impl_func_type(series_dtype, method_name):
-    """ Used for typing result value of functions implementing groupby methods,
-        assuming that these implementation call method of Series.
-    """
-    ty_series = SeriesType(series_dtype)
-    jitted_func = numba.njit(series_method_to_func[method_name])
-    return cpu_target.typing_context.resolve_function_type(jitted_func, (ty_series, ), {})
+@sdc_register_jitable
+def _sdc_groupby_check_quantiles(quantiles):
+    for value in quantiles:
+        if not (0 <= value <= 1):
+            raise ValueError("GroupBy.quantile(). Parameter q must be in the range [0, 1]")
+    return quantiles
 
 
-def sdc_pandas_dataframe_groupby_apply_func(self, func_name, func_args, defaults=None, impl_args=None):
+def _sdc_groupby_quantiles_array(q):
+    pass
 
-    defaults = defaults or {}
-    impl_args = impl_args or {}
 
-    df_column_types = self.parent.data
-    df_column_names = self.parent.columns
-    by_column_id = self.col_id.literal_value
-    selected_cols_set = set(self.target_columns)
-    subject_columns = [(name, i) for i, name in enumerate(df_column_names) if name in selected_cols_set]
+@sdc_overload(_sdc_groupby_quantiles_array)
+def _sdc_groupby_quantiles_array_overload(q):
+    """ Returns quantiles given as a number or a sequence as float64 array, checking their range """
 
-    # resolve types of result dataframe columns
-    res_arrays_dtypes = tuple(
-        _groupby_resolve_impl_func_type(
-            ty_arr.dtype, func_name
-            ).return_type for i, ty_arr in enumerate(df_column_types) if i != by_column_id)
+    if isinstance(q, (types.Number, int, float)):
+        def _sdc_groupby_quantiles_array_impl(q):
+            return _sdc_groupby_check_quantiles(numpy.full(1, q, dtype=numpy.float64))
+    else:
+        def _sdc_groupby_quantiles_array_impl(q):
+            return _sdc_groupby_check_quantiles(numpy.asarray(q).astype(numpy.float64))
 
-    groupby_func_name = f'_dataframe_groupby_{func_name}_impl'
-    func_text, global_vars = _sdc_pandas_groupby_generic_func_codegen(
-        func_name, subject_columns, self.parent.column_loc, func_args, defaults, impl_args)
+    return _sdc_groupby_quantiles_array_impl
 
-    # capture result column types into generated func context
-    global_vars['res_arrays_dtypes'] = res_arrays_dtypes
 
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _groupby_method_impl = loc_vars[groupby_func_name]
+def _sdc_groupby_nunique_buffer(data, size):
+    pass
 
-    return _groupby_method_impl
 
+@sdc_overload(_sdc_groupby_nunique_buffer)
+def _sdc_groupby_nunique_buffer_overload(data, size):
+    """ Returns scratch buffer for counting distinct values of groups of at most size rows of data:
+    an array for numeric data and a hash set (typed Dict with ignored values) for other data """
+    if isinstance(data.dtype, (types.Number, types.Boolean)):
+        dtype = data.dtype
 
-def sdc_pandas_series_groupby_apply_func(self, func_name, func_args, defaults=None, impl_args=None):
+        def _sdc_groupby_nunique_buffer_array_impl(data, size):
+            return numpy.empty(size, dtype=dtype)
 
-    defaults = defaults or {}
-    impl_args = impl_args or {}
+        return _sdc_groupby_nunique_buffer_array_impl
 
-    # resolve type of result series
-    res_dtype = _groupby_resolve_impl_func_type(self.parent.dtype, func_name).return_type
+    key_type = data.dtype
 
-    groupby_func_name = f'_series_groupby_{func_name}_impl'
-    func_text, global_vars = _sdc_pandas_series_groupby_generic_func_codegen(
-        func_name, func_args, defaults, impl_args)
+    def _sdc_groupby_nunique_buffer_set_impl(data, size):
+        return Dict.empty(key_type=key_type, value_type=types.boolean)
 
-    # capture result column types into generated func context
-    global_vars['res_dtype'] = res_dtype
+    return _sdc_groupby_nunique_buffer_set_impl
 
-    loc_vars = {}
-    exec(func_text, global_vars, loc_vars)
-    _groupby_method_impl = loc_vars[groupby_func_name]
 
-    return _groupby_method_impl
+def _sdc_groupby_group_nunique(data, group_positions, buf, dropna):
+    pass
 
 
-@sdc_overload_method(DataFrameGroupByType, 'count')
-def sdc_pandas_dataframe_groupby_count(self):
+@sdc_overload(_sdc_groupby_group_nunique)
+def _sdc_groupby_group_nunique_overload(data, group_positions, buf, dropna):
+    """ Counts distinct values of data at group_positions, NaN is counted unless dropna is set.
+    Numeric values are gathered into the scratch buffer buf, sorted in place and runs of equal values
+    are counted, other values are inserted into the hash set buf, which is emptied first """
+    if isinstance(buf, types.Array):
+        def _sdc_groupby_group_nunique_sorted_impl(data, group_positions, buf, dropna):
+            n = 0
+            for j in group_positions:
+                if not isna(data, j):
+                    buf[n] = data[j]
+                    n += 1
 
-    method_name = 'GroupBy.count().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, DataFrameGroupByType)
+            group_values = buf[:n]
+            group_values.sort()
+            n_unique = 0
+            for i in range(n):
+                if i == 0 or group_values[i] != group_values[i - 1]:
+                    n_unique += 1
+            if not dropna and n < len(group_positions):
+                n_unique += 1
+            return n_unique
 
-    method_args = ['self']
-    applied_func_name = 'count'
-    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
+        return _sdc_groupby_group_nunique_sorted_impl
 
+    def _sdc_groupby_group_nunique_hashed_impl(data, group_positions, buf, dropna):
+        buf.clear()
+        n = 0
+        for j in group_positions:
+            if not isna(data, j):
+                buf[data[j]] = True
+                n += 1
+        if not dropna and n < len(group_positions):
+            return len(buf) + 1
+        return len(buf)
 
-@sdc_overload_method(DataFrameGroupByType, 'max')
-def sdc_pandas_dataframe_groupby_max(self):
+    return _sdc_groupby_group_nunique_hashed_impl
 
-    method_name = 'GroupBy.max().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, DataFrameGroupByType)
 
-    method_args = ['self']
-    applied_func_name = 'max'
-    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
+@sdc_register_jitable
+def _sdc_groupby_check_positions(positions):
+    """ Checks positions of rows computed for idxmin or idxmax, negative position means
+    that the group has no values other than NaN """
+    for k in numba.prange(len(positions)):
+        if positions[k] < 0:
+            raise ValueError("GroupBy.idxmin()/idxmax(). Encountered a group with all NA values")
 
 
-@sdc_overload_method(DataFrameGroupByType, 'mean')
-def sdc_pandas_dataframe_groupby_mean(self, *args):
+def _sdc_groupby_index_take(index, positions):
+    pass
 
-    method_name = 'GroupBy.mean().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, DataFrameGroupByType)
 
-    method_args = ['self', '*args']
-    applied_func_name = 'mean'
-    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
+@sdc_overload(_sdc_groupby_index_take)
+def _sdc_groupby_index_take_overload(index, positions):
+    """ Returns labels of index (positions themselves for default index) at positions """
+    if isinstance(index, types.NoneType) or index is None:
+        def _sdc_groupby_index_take_none_impl(index, positions):
+            return positions
 
+        return _sdc_groupby_index_take_none_impl
 
-@sdc_overload_method(DataFrameGroupByType, 'median')
-def sdc_pandas_dataframe_groupby_median(self):
+    def _sdc_groupby_index_take_impl(index, positions):
+        return _sdc_take(index, positions)
 
-    method_name = 'GroupBy.median().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, DataFrameGroupByType)
+    return _sdc_groupby_index_take_impl
 
-    method_args = ['self']
-    applied_func_name = 'median'
-    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
 
+def _sdc_groupby_labels_codelines(targets, index):
+    """ Generates code lines converting positions of rows computed for idxmin and idxmax targets
+    to labels of index, each target is a tuple (res_var, ..., func_name) """
+    func_lines = []
+    for res_var, *_, func_name in targets:
+        if func_name in ('idxmin', 'idxmax'):
+            func_lines += [f'  _sdc_groupby_check_positions({res_var})',
+                           f'  {res_var} = _sdc_groupby_index_take({index}, {res_var})']
+    return func_lines
 
-@sdc_overload_method(DataFrameGroupByType, 'min')
-def sdc_pandas_dataframe_groupby_min(self):
 
-    method_name = 'GroupBy.min().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, DataFrameGroupByType)
+def _sdc_groupby_select_codelines(targets):
+    """
+    Generates code lines computing groupby median, quantiles and numbers of distinct values by selection
+    from values of each group. Each target is a tuple (res_var, column_var, column_dtype, result_dtype, func_name):
+    res_var names pre-allocated array for results ordered as in res_order, having len(quantiles) results
+    per group for quantile targets. Generated code expects variables offsets, positions, n_groups and res_order
+    to be defined, as well as quantiles if there are quantile targets.
+
+    Groups are processed in parallel chunks and each chunk allocates scratch buffers which fit
+    the largest group, so no memory is allocated per group.
+    """
+    func_names = {func_name for *_, func_name in targets}
+    func_lines = []
+    if 'median' in func_names:
+        func_lines += [
+            f'median_quantiles = numpy.full(1, 0.5)',
+            f'median_quantiles_order = numpy.zeros(1, dtype=numpy.int64)',
+        ]
+    if 'quantile' in func_names:
+        func_lines.append(f'quantiles_order = numpy.argsort(quantiles)')
+
+    func_lines += [
+        f'group_sizes = offsets[1:] - offsets[:-1]',
+        f'max_group_size = group_sizes.max() if n_groups > 0 else 0',
+        f'group_chunks = parallel_chunks(n_groups)',
+        f'for i in numba.prange(len(group_chunks)):',
+    ]
+    # quantiles of all columns are selected from float64 values, so they share the buffer
+    if func_names & {'median', 'quantile'}:
+        func_lines.append(f'  buf = numpy.empty(max_group_size, dtype=numpy.float64)')
+    for a, (_, column_var, _, _, func_name) in enumerate(targets):
+        if func_name == 'nunique':
+            func_lines.append(f'  nunique_buf_{a} = _sdc_groupby_nunique_buffer({column_var}, max_group_size)')
+
+    func_lines += [
+        f'  for k in range(group_chunks[i].start, group_chunks[i].stop):',
+        f'    gid = res_order[k]',
+        f'    group_positions = positions[offsets[gid]:offsets[gid + 1]]',
+    ]
+    for a, (res_var, column_var, _, _, func_name) in enumerate(targets):
+        if func_name == 'nunique':
+            func_lines.append(f'    {res_var}[k] = _sdc_groupby_group_nunique('
+                              f'{column_var}, group_positions, nunique_buf_{a}, dropna)')
+            continue
+
+        quantiles = 'median_quantiles' if func_name == 'median' else 'quantiles'
+        func_lines.append(f'    _sdc_groupby_group_quantiles({column_var}, group_positions, buf, {quantiles}, '
+                          f'{quantiles}_order, {res_var}, k * len({quantiles}))')
+
+    global_vars = {'_sdc_groupby_group_quantiles': _sdc_groupby_group_quantiles,
+                   '_sdc_groupby_quantiles_array': _sdc_groupby_quantiles_array,
+                   '_sdc_groupby_nunique_buffer': _sdc_groupby_nunique_buffer,
+                   '_sdc_groupby_group_nunique': _sdc_groupby_group_nunique}
+    return func_lines, global_vars
+
+
+class GroupByTransform(NamedTuple):
+    """ Describes groupby transformation computing result for each row from rows of its group. Rows of
+    each group are visited in ascending order, init lines are executed before the first row of a group
+    and update lines for each row. Templates refer to the result array as {res} (current row is j),
+    to the current value as {val}, to the data array as {data}, to the position of current row in positions
+    as {p}, to bounds of group rows in positions as {start} and {stop}, to dtypes of data and result
+    as {column_dtype} and {result_dtype} and to the prefix reserved for temporary variables as {tmp}.
+    If skipna is set, rows with NaN values get NaN result and are not passed to update lines. """
+    init: Tuple[str, ...]
+    update: Tuple[str, ...]
+    skipna: bool = True
+
+
+groupby_transforms = {
+    'cumsum': GroupByTransform(
+        init=('{tmp}_sum = {result_dtype}(0)', ),
+        update=('{tmp}_sum += {val}',
+                '{res}[j] = {tmp}_sum')
+    ),
+    'cumprod': GroupByTransform(
+        init=('{tmp}_prod = {result_dtype}(1)', ),
+        update=('{tmp}_prod *= {val}',
+                '{res}[j] = {tmp}_prod')
+    ),
+    'cummin': GroupByTransform(
+        init=('{tmp}_min = {column_dtype}(0)', '{tmp}_empty = True'),
+        update=('if {tmp}_empty or {val} < {tmp}_min:',
+                '  {tmp}_min = {val}',
+                '  {tmp}_empty = False',
+                '{res}[j] = {tmp}_min')
+    ),
+    'cummax': GroupByTransform(
+        init=('{tmp}_max = {column_dtype}(0)', '{tmp}_empty = True'),
+        update=('if {tmp}_empty or {val} > {tmp}_max:',
+                '  {tmp}_max = {val}',
+                '  {tmp}_empty = False',
+                '{res}[j] = {tmp}_max')
+    ),
+    'cumcount': GroupByTransform(
+        init=(),
+        update=('if ascending:',
+                '  {res}[j] = {p} - {start}',
+                'else:',
+                '  {res}[j] = {stop} - 1 - {p}'),
+        skipna=False
+    ),
+    'shift': GroupByTransform(
+        init=(),
+        update=('{tmp}_p = {p} - periods',
+                'if {start} <= {tmp}_p < {stop}:',
+                '  {res}[j] = {data}[positions[{tmp}_p]]',
+                'else:',
+                '  {res}[j] = numpy.nan'),
+        skipna=False
+    ),
+    'diff': GroupByTransform(
+        init=(),
+        update=('{tmp}_p = {p} - periods',
+                'if {start} <= {tmp}_p < {stop}:',
+                '  {res}[j] = {val} - {data}[positions[{tmp}_p]]',
+                'else:',
+                '  {res}[j] = numpy.nan'),
+        skipna=False
+    ),
+    'rank': GroupByTransform(
+        init=('_sdc_groupby_rank_group({data}, positions[{start}:{stop}], {res}, rank_method_id, ascending, pct)', ),
+        update=(),
+        skipna=False
+    ),
+}
 
-    method_args = ['self']
-    applied_func_name = 'min'
-    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
+# results of reductions are computed by accumulators and broadcast to all rows of the group
+_groupby_broadcast_transform = GroupByTransform(init=(), update=('{res}[j] = group_{res}[k]', ), skipna=False)
 
+_groupby_rank_methods = ('average', 'min', 'max', 'first', 'dense')
 
-@sdc_overload_method(DataFrameGroupByType, 'prod')
-def sdc_pandas_dataframe_groupby_prod(self):
 
-    method_name = 'GroupBy.prod().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, DataFrameGroupByType)
+@sdc_register_jitable
+def _sdc_groupby_rank_method_id(method):
+    for i, rank_method in enumerate(_groupby_rank_methods):
+        if method == rank_method:
+            return i
+    raise ValueError("GroupBy.rank(). Parameter method must be one of 'average', 'min', 'max', 'first', 'dense'")
 
-    method_args = ['self']
-    applied_func_name = 'prod'
-    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
 
+@sdc_register_jitable
+def _sdc_groupby_rank_group(data, group_positions, res, method_id, ascending, pct):
+    """ Ranks values of data at group_positions and writes ranks to the same positions of res,
+    method_id is index of ranking method in _groupby_rank_methods, NaN values get NaN ranks """
+    n_valid = 0
+    valid_positions = numpy.empty(len(group_positions), dtype=numpy.int64)
+    for j in group_positions:
+        if isna(data, j):
+            res[j] = numpy.nan
+        else:
+            valid_positions[n_valid] = j
+            n_valid += 1
+
+    valid_positions = valid_positions[:n_valid]
+    values = data[valid_positions]
+    order = numpy.argsort(values, kind='mergesort')
+
+    # ranks are assigned to runs of equal values of sorted data, which are walked in reverse for
+    # descending ranks, so that values are not negated and ties keep their order for method 'first'
+    n_distinct = 0
+    n_ranked = 0
+    while n_ranked < n_valid:
+        if ascending:
+            run_start = n_ranked
+            run_stop = run_start + 1
+            while run_stop < n_valid and values[order[run_stop]] == values[order[run_start]]:
+                run_stop += 1
+        else:
+            run_stop = n_valid - n_ranked
+            run_start = run_stop - 1
+            while run_start > 0 and values[order[run_start - 1]] == values[order[run_stop - 1]]:
+                run_start -= 1
+        run_size = run_stop - run_start
+        n_distinct += 1
+        for k in range(run_size):
+            if method_id == 0:
+                rank = n_ranked + (run_size + 1) / 2
+            elif method_id == 1:
+                rank = n_ranked + 1
+            elif method_id == 2:
+                rank = n_ranked + run_size
+            elif method_id == 3:
+                rank = n_ranked + k + 1
+            else:
+                rank = n_distinct
+            res[valid_positions[order[run_start + k]]] = rank
+        n_ranked += run_size
+
+    if pct:
+        n_ranks = n_distinct if method_id == 4 else n_valid
+        for j in valid_positions:
+            res[j] = res[j] / n_ranks
+
+
+def _groupby_transform_result_dtype(column_dtype, func_name):
+    """ Returns dtype of result of groupby transformation or of reduction broadcast to rows of groups """
+    if func_name in groupby_accumulators:
+        return _groupby_resolve_impl_func_type(column_dtype, func_name).return_type
+    if func_name in ('cumsum', 'cumprod'):
+        return _groupby_resolve_impl_func_type(column_dtype, 'sum').return_type
+    if func_name in ('cummin', 'cummax'):
+        return column_dtype
+    if func_name == 'cumcount':
+        return types.int64
+    if func_name == 'rank':
+        return types.float64
+
+    # shift and diff introduce NaN values
+    return column_dtype if isinstance(column_dtype, types.Float) else types.float64
+
+
+def _sdc_groupby_transform_codelines(targets):
+    """
+    Generates code lines computing groupby transformations, whose results are aligned with data rows.
+    Each target is a tuple (res_var, column_var, column_dtype, result_dtype, func_name), where func_name is
+    either a name of transformation or a name of reduction which result is broadcast to all rows of the group.
+    Generated code expects variables labels, offsets, positions and n_groups to be defined.
+    Returns generated code lines and global variables these lines refer to.
+
+    Groups are processed in parallel, each one iterating over its own rows, so results of all targets
+    are computed in a single data pass. Rows with missing keys get NaN (or 0 if result dtype is integer).
+    """
 
-@sdc_overload_method(DataFrameGroupByType, 'std')
-def sdc_pandas_dataframe_groupby_std(self, ddof=1, *args):
+    def indent(lines, n):
+        return [' ' * n + line for line in lines]
+
+    transforms = [groupby_transforms.get(func_name, _groupby_broadcast_transform)
+                  for _, _, _, _, func_name in targets]
+
+    func_lines = []
+    global_vars = {}
+    reduced_targets = [(f'group_{res_var}', column_var, column_dtype, result_dtype, func_name)
+                       for res_var, column_var, column_dtype, result_dtype, func_name in targets
+                       if func_name in groupby_accumulators]
+    if reduced_targets:
+        func_lines.append(f'res_order = numpy.arange(n_groups)')
+        for i, (group_res_var, *_) in enumerate(reduced_targets):
+            func_lines.append(f'{group_res_var} = numpy.empty(n_groups, dtype=result_dtype_{i})')
+        accumulate_lines, global_vars = _sdc_groupby_accumulate_codelines(reduced_targets, _sdc_groupby_rows_loop)
+        func_lines += accumulate_lines
+
+    init_lines = []
+    update_lines = []
+    value_vars = {}
+    for a, (res_var, column_var, column_dtype, _, _) in enumerate(targets):
+        transform = transforms[a]
+        func_lines.append(f'{res_var} = numpy.empty(len(labels), dtype=transform_result_dtype_{a})')
+
+        # value of each column is loaded once per row even if several targets use it
+        skipna = transform.skipna and isinstance(column_dtype, types.Float)
+        uses_value = skipna or any('{val}' in line for line in transform.update)
+        if uses_value and column_var not in value_vars:
+            value_vars[column_var] = f'val_{a}'
+            update_lines.append(f'val_{a} = {column_var}[j]')
+
+        refs = {
+            'res': res_var,
+            'val': value_vars.get(column_var),
+            'data': column_var,
+            'p': 'p',
+            'start': 'start',
+            'stop': 'stop',
+            'column_dtype': f'transform_column_dtype_{a}',
+            'result_dtype': f'transform_result_dtype_{a}',
+            'tmp': f'tmp_{a}',
+        }
+        init_lines += [line.format(**refs) for line in transform.init]
+        target_update_lines = [line.format(**refs) for line in transform.update]
+        if skipna and target_update_lines:
+            update_lines += [f'if numpy.isnan({refs["val"]}):',
+                             f'  {res_var}[j] = numpy.nan',
+                             f'else:']
+            update_lines += indent(target_update_lines, 2)
+        else:
+            update_lines += target_update_lines
 
-    method_name = 'GroupBy.std().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, DataFrameGroupByType)
+    func_lines += [
+        f'for k in numba.prange(n_groups):',
+        f'  start = offsets[k]',
+        f'  stop = offsets[k + 1]',
+    ]
+    func_lines += indent(init_lines, 2)
+    if update_lines:
+        func_lines += [
+            f'  for p in range(start, stop):',
+            f'    j = positions[p]',
+        ]
+        func_lines += indent(update_lines, 4)
 
-    if not isinstance(ddof, (types.Omitted, int, types.Integer)):
-        ty_checker.raise_exc(ddof, 'int', 'ddof')
+    func_lines += [
+        f'if offsets[n_groups] < len(labels):',
+        f'  for j in numba.prange(len(labels)):',
+        f'    if labels[j] < 0:',
+    ]
+    for res_var, _, _, result_dtype, _ in targets:
+        missing_value = 'numpy.nan' if isinstance(result_dtype, types.Float) else '0'
+        func_lines.append(f'      {res_var}[j] = {missing_value}')
 
-    method_args = ['self', 'ddof', '*args']
-    default_values = {'ddof': 1}
-    impl_used_params = {'ddof': 'ddof'}
+    for a, (_, _, column_dtype, result_dtype, _) in enumerate(targets):
+        global_vars[f'transform_column_dtype_{a}'] = column_dtype
+        global_vars[f'transform_result_dtype_{a}'] = result_dtype
+    global_vars['_sdc_groupby_rank_group'] = _sdc_groupby_rank_group
 
-    applied_func_name = 'std'
-    return sdc_pandas_dataframe_groupby_apply_func(
-        self, applied_func_name, method_args, default_values, impl_used_params)
+    return func_lines, global_vars
 
 
-@sdc_overload_method(DataFrameGroupByType, 'sum')
-def sdc_pandas_dataframe_groupby_sum(self):
+@sdc_register_jitable
+def _sdc_groupby_sort_groups(group_keys, res_order):
+    """ Stably reorders group ids in res_order by keys of groups """
+    argsorted_index = sdc_arrays_argsort(_sdc_take(group_keys, res_order), kind='mergesort')
+    return _sdc_take(res_order, argsorted_index)
 
-    method_name = 'GroupBy.sum().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, DataFrameGroupByType)
 
-    method_args = ['self']
-    applied_func_name = 'sum'
-    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
+def _sdc_groupby_index_codelines(groupby_obj, by_data):
+    """ Generates code lines unpacking group index of groupby object and computing keys of groups
+    (taken from first row of each group) for each of by_data arrays and the order of groups in the result,
+    which for composite keys is lexicographical (obtained by stable sorting starting from the last key) """
+    func_lines = [
+        f'  labels = {groupby_obj}._labels',
+        f'  offsets = {groupby_obj}._offsets',
+        f'  positions = {groupby_obj}._positions',
+        f'  n_groups = len(offsets) - 1',
+        f'  group_heads = positions[offsets[:-1]]',
+    ]
+    for i, by_arr in enumerate(by_data):
+        func_lines.append(f'  group_keys_{i} = _sdc_take({by_arr}, group_heads)')
 
+    func_lines += [
+        f'  res_order = numpy.arange(n_groups)',
+        f'  if {groupby_obj}._sort:',
+    ]
+    for i in reversed(range(len(by_data))):
+        func_lines.append(f'    res_order = _sdc_groupby_sort_groups(group_keys_{i}, res_order)')
 
-@sdc_overload_method(DataFrameGroupByType, 'var')
-def sdc_pandas_dataframe_groupby_var(self, ddof=1, *args):
+    return func_lines
 
-    method_name = 'GroupBy.var().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, DataFrameGroupByType)
 
-    if not isinstance(ddof, (types.Omitted, int, types.Integer)):
-        ty_checker.raise_exc(ddof, 'int', 'ddof')
+def _sdc_groupby_result_keys_codelines(groupby_obj, n_keys, repeat_keys=False):
+    """ Generates code lines computing keys of groups in the order of the result. If repeat_keys is set,
+    the result has len(quantiles) rows per group and each key is repeated as many times """
+    func_lines = []
+    for i in range(n_keys):
+        func_lines += [
+            f'  if {groupby_obj}._sort:',
+            f'    res_keys_{i} = _sdc_take(group_keys_{i}, res_order)',
+            f'  else:',
+            f'    res_keys_{i} = group_keys_{i}',
+        ]
 
-    method_args = ['self', 'ddof', '*args']
-    default_values = {'ddof': 1}
-    impl_used_params = {'ddof': 'ddof'}
+    if repeat_keys:
+        func_lines.append(f'  res_keys_positions = numpy.repeat(numpy.arange(n_groups), len(quantiles))')
+        func_lines += [f'  res_keys_{i} = _sdc_take(res_keys_{i}, res_keys_positions)' for i in range(n_keys)]
 
-    applied_func_name = 'var'
-    return sdc_pandas_dataframe_groupby_apply_func(
-        self, applied_func_name, method_args, default_values, impl_used_params)
+    return func_lines
 
 
-@sdc_overload_method(SeriesGroupByType, 'count')
-def sdc_pandas_series_groupby_count(self):
+def _sdc_groupby_dataframe_result_codelines(groupby_obj, by_columns, data, repeat_keys=False):
+    """ Generates code lines returning DataFrame with result data of groupby reduction. Result is indexed
+    by group keys if grouped by one column, otherwise key columns are prepended to the result columns """
+    func_lines = _sdc_groupby_result_keys_codelines(groupby_obj, len(by_columns), repeat_keys)
+    if len(by_columns) == 1:
+        func_lines.append(f'  return pandas.DataFrame({{{data}}}, index=res_keys_0)')
+    else:
+        keys_data = ''.join(f'\'{name}\': res_keys_{i}, ' for i, (name, _) in enumerate(by_columns))
+        func_lines.append(f'  return pandas.DataFrame({{{keys_data}{data}}})')
 
-    method_name = 'GroupBy.count().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, SeriesGroupByType)
+    return func_lines
 
-    method_args = ['self']
-    applied_func_name = 'count'
-    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
 
+def _sdc_groupby_by_columns_codelines(df, by_columns):
+    """ Generates code lines getting data of DataFrame columns used as group keys """
+    return [f'  by_column_data_{i} = {df}._data[{col_loc.type_id}][{col_loc.col_id}]'
+            for i, (_, col_loc) in enumerate(by_columns)]
 
-@sdc_overload_method(SeriesGroupByType, 'max')
-def sdc_pandas_series_groupby_max(self):
 
-    method_name = 'GroupBy.max().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, SeriesGroupByType)
+_sdc_groupby_rows_loop = [
+    'for p in range(offsets[gid], offsets[gid + 1]):',
+    '  j = positions[p]',
+]
 
-    method_args = ['self']
-    applied_func_name = 'max'
-    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
 
+def _sdc_groupby_apply_codelines(targets, column_vars):
+    """ Generates code lines computing results of groupby targets: accumulator based reductions are fused
+    into a single data pass, median, quantiles and nunique are computed by selection in another parallel
+    pass over groups. Each target is a tuple (res_var, column_name, column_type, res_dtype, func_name) """
+    func_lines = []
+    accumulated_targets = []
+    selected_targets = []
+    for i, (res_var, column_name, column_type, res_dtype, func_name) in enumerate(targets):
+        column_var = column_vars[column_name]
+        res_size = 'n_groups * len(quantiles)' if func_name == 'quantile' else 'n_groups'
+        func_lines.append(f'  {res_var} = numpy.empty({res_size}, dtype=res_arrays_dtypes[{i}])')
+        if func_name in groupby_accumulators:
+            accumulated_targets.append((res_var, column_var, column_type.dtype, res_dtype, func_name))
+        else:
+            selected_targets.append((res_var, column_var, column_type.dtype, res_dtype, func_name))
+
+    global_vars = {}
+    if accumulated_targets:
+        accumulate_lines, global_vars = _sdc_groupby_accumulate_codelines(accumulated_targets, _sdc_groupby_rows_loop)
+        func_lines += [f'  {line}' for line in accumulate_lines]
+
+    if selected_targets:
+        select_lines, select_global_vars = _sdc_groupby_select_codelines(selected_targets)
+        func_lines += [f'  {line}' for line in select_lines]
+        global_vars.update(select_global_vars)
+
+    global_vars.update({'pandas': pandas,
+                        'numpy': numpy,
+                        'numba': numba,
+                        'parallel_chunks': parallel_chunks,
+                        '_sdc_take': _sdc_take,
+                        '_sdc_groupby_sort_groups': _sdc_groupby_sort_groups,
+                        '_sdc_groupby_check_positions': _sdc_groupby_check_positions,
+                        '_sdc_groupby_index_take': _sdc_groupby_index_take,
+                        'res_arrays_dtypes': tuple(res_dtype for _, _, _, res_dtype, _ in targets)})
+
+    return func_lines, global_vars
+
+
+def _sdc_groupby_params_codelines(targets, func_params):
+    """ Generates code lines defining default values of parameters used by accumulators
+    of target functions, if these parameters are not passed to the implementation,
+    and preparing parameters of transformations """
+    func_names = {func_name for _, _, _, _, func_name in targets}
+    func_lines = []
+    if func_names & {'std', 'var'} and 'ddof' not in func_params:
+        func_lines.append('  ddof = 1')
+    if 'rank' in func_names:
+        func_lines.append('  rank_method_id = _sdc_groupby_rank_method_id(method)')
+    if 'quantile' in func_names:
+        quantiles = 'q' if 'q' in func_params else '0.5'
+        func_lines.append(f'  quantiles = _sdc_groupby_quantiles_array({quantiles})')
+    if 'nunique' in func_names and 'dropna' not in func_params:
+        func_lines.append('  dropna = True')
+    return func_lines
+
+
+def _sdc_pandas_groupby_generic_func_codegen(func_name, targets, column_loc, by_columns,
+                                             func_params, defaults, repeat_keys=False):
+    """ Generates implementation computing results of DataFrameGroupBy targets, each target is a tuple
+    (res_name, column_name, column_type, res_dtype, func_name). If repeat_keys is set, targets compute
+    several quantiles per group and result has a row for each of them """
+    all_params_as_str = ', '.join(sigparams2list(func_params, defaults))
 
-@sdc_overload_method(SeriesGroupByType, 'mean')
-def sdc_pandas_series_groupby_mean(self, *args):
+    groupby_obj = f'{func_params[0]}'
+    df = f'{groupby_obj}._parent'
 
-    method_name = 'GroupBy.mean().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, SeriesGroupByType)
+    func_lines = [f'def _dataframe_groupby_{func_name}_impl({all_params_as_str}):']
+    func_lines += _sdc_groupby_params_codelines(targets, func_params)
+    func_lines += _sdc_groupby_by_columns_codelines(df, by_columns)
+    func_lines += _sdc_groupby_index_codelines(
+        groupby_obj, [f'by_column_data_{i}' for i in range(len(by_columns))])
 
-    method_args = ['self', '*args']
-    applied_func_name = 'mean'
-    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
+    # data of each column is read once even if several functions are applied to it
+    column_vars = {}
+    for column_name in dict.fromkeys(column_name for _, column_name, _, _, _ in targets):
+        col_loc = column_loc[column_name]
+        column_vars[column_name] = f'column_data_{len(column_vars)}'
+        func_lines.append(f'  {column_vars[column_name]} = {df}._data[{col_loc.type_id}][{col_loc.col_id}]')
 
+    res_targets = [(f'result_data_{i}', *target[1:]) for i, target in enumerate(targets)]
+    apply_lines, global_vars = _sdc_groupby_apply_codelines(res_targets, column_vars)
+    func_lines += apply_lines
+    func_lines += _sdc_groupby_labels_codelines(res_targets, f'{df}._index')
 
-@sdc_overload_method(SeriesGroupByType, 'median')
-def sdc_pandas_series_groupby_median(self):
+    data = ', '.join(f'\'{res_name}\': result_data_{i}' for i, (res_name, *_) in enumerate(targets))
+    func_lines += _sdc_groupby_dataframe_result_codelines(groupby_obj, by_columns, data, repeat_keys)
 
-    method_name = 'GroupBy.median().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, SeriesGroupByType)
+    func_text = '\n'.join(func_lines)
+    return func_text, global_vars
 
-    method_args = ['self']
-    applied_func_name = 'median'
-    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
 
+def _sdc_pandas_series_groupby_generic_func_codegen(func_name, targets, series_type, func_params, defaults,
+                                                    as_frame=False, repeat_keys=False):
+    """ Generates implementation computing results of SeriesGroupBy targets, each target is a tuple
+    (res_name, res_dtype, func_name). Result is a Series unless as_frame is set, in which case
+    it is a DataFrame with columns named by target res_name. If repeat_keys is set, targets compute
+    several quantiles per group and result has a row for each of them """
+    all_params_as_str = ', '.join(sigparams2list(func_params, defaults))
 
-@sdc_overload_method(SeriesGroupByType, 'min')
-def sdc_pandas_series_groupby_min(self):
+    groupby_obj = f'{func_params[0]}'
+    series = f'{groupby_obj}._parent'
+    res_targets = [(f'result_data_{i}', 'data', series_type, res_dtype, target_func)
+                   for i, (_, res_dtype, target_func) in enumerate(targets)]
+
+    func_lines = [f'def _series_groupby_{func_name}_impl({all_params_as_str}):']
+    func_lines += _sdc_groupby_params_codelines(res_targets, func_params)
+    func_lines += _sdc_groupby_index_codelines(groupby_obj, [f'{groupby_obj}._by'])
+    func_lines += [f'  column_data = {series}._data']
+
+    apply_lines, global_vars = _sdc_groupby_apply_codelines(res_targets, {'data': 'column_data'})
+    func_lines += apply_lines
+    func_lines += _sdc_groupby_labels_codelines(res_targets, f'{series}._index')
+
+    func_lines += _sdc_groupby_result_keys_codelines(groupby_obj, 1, repeat_keys)
+    if as_frame:
+        data = ', '.join(f'\'{res_name}\': result_data_{i}' for i, (res_name, *_) in enumerate(targets))
+        func_lines += [f'  return pandas.DataFrame({{{data}}}, index=res_keys_0)']
+    else:
+        func_lines += [f'  return pandas.Series(data=result_data_0, index=res_keys_0, name={series}._name)']
 
-    method_name = 'GroupBy.min().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, SeriesGroupByType)
+    func_text = '\n'.join(func_lines)
+    return func_text, global_vars
 
-    method_args = ['self']
-    applied_func_name = 'min'
-    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
 
+def _sdc_groupby_transform_index_codelines(groupby_obj):
+    """ Generates code lines unpacking group index of groupby object for computing transformations """
+    return [
+        f'  labels = {groupby_obj}._labels',
+        f'  offsets = {groupby_obj}._offsets',
+        f'  positions = {groupby_obj}._positions',
+        f'  n_groups = len(offsets) - 1',
+    ]
 
-@sdc_overload_method(SeriesGroupByType, 'prod')
-def sdc_pandas_series_groupby_prod(self):
 
-    method_name = 'GroupBy.prod().'
-    ty_checker = TypeChecker(method_name)
+def _sdc_groupby_transform_globals(global_vars):
+    global_vars.update({'pandas': pandas,
+                        'numpy': numpy,
+                        'numba': numba,
+                        'parallel_chunks': parallel_chunks,
+                        '_sdc_groupby_rank_method_id': _sdc_groupby_rank_method_id})
+    return global_vars
+
+
+def _sdc_pandas_groupby_transform_codegen(func_name, targets, column_loc, func_params, defaults, as_series=False):
+    """ Generates implementation computing transformations of DataFrameGroupBy targets, each target is a tuple
+    (res_name, column_name, column_type, res_dtype, func_name). Result is a DataFrame indexed as the grouped one
+    unless as_series is set, in which case it is a Series with result of the only target """
+    all_params_as_str = ', '.join(sigparams2list(func_params, defaults))
+
+    groupby_obj = f'{func_params[0]}'
+    df = f'{groupby_obj}._parent'
+
+    func_lines = [f'def _dataframe_groupby_{func_name}_impl({all_params_as_str}):']
+    func_lines += _sdc_groupby_params_codelines(targets, func_params)
+    func_lines += _sdc_groupby_transform_index_codelines(groupby_obj)
+
+    column_vars = {}
+    for column_name in dict.fromkeys(column_name for _, column_name, _, _, _ in targets if column_name is not None):
+        col_loc = column_loc[column_name]
+        column_vars[column_name] = f'column_data_{len(column_vars)}'
+        func_lines.append(f'  {column_vars[column_name]} = {df}._data[{col_loc.type_id}][{col_loc.col_id}]')
+
+    res_targets = [(f'result_data_{i}', column_vars.get(column_name),
+                    column_type.dtype if column_type is not None else None, res_dtype, target_func)
+                   for i, (_, column_name, column_type, res_dtype, target_func) in enumerate(targets)]
+    transform_lines, global_vars = _sdc_groupby_transform_codelines(res_targets)
+    func_lines += [f'  {line}' for line in transform_lines]
+
+    if as_series:
+        func_lines += [f'  return pandas.Series(data=result_data_0, index={df}._index)']
+    else:
+        data = ', '.join(f'\'{res_name}\': result_data_{i}' for i, (res_name, *_) in enumerate(targets))
+        func_lines += [f'  return pandas.DataFrame({{{data}}}, index={df}._index)']
+
+    func_text = '\n'.join(func_lines)
+    return func_text, _sdc_groupby_transform_globals(global_vars)
+
+
+def _sdc_pandas_series_groupby_transform_codegen(func_name, target_func, series_type, res_dtype,
+                                                 func_params, defaults, keep_name=True):
+    """ Generates implementation computing transformation (or broadcast reduction) target_func of SeriesGroupBy,
+    result is a Series indexed as the grouped one and named as it, unless keep_name is unset """
+    all_params_as_str = ', '.join(sigparams2list(func_params, defaults))
+
+    groupby_obj = f'{func_params[0]}'
+    series = f'{groupby_obj}._parent'
+    res_targets = [('result_data_0', 'column_data', series_type.dtype, res_dtype, target_func)]
+
+    func_lines = [f'def _series_groupby_{func_name}_impl({all_params_as_str}):']
+    func_lines += _sdc_groupby_params_codelines(res_targets, func_params)
+    func_lines += _sdc_groupby_transform_index_codelines(groupby_obj)
+    func_lines += [f'  column_data = {series}._data']
+
+    transform_lines, global_vars = _sdc_groupby_transform_codelines(res_targets)
+    func_lines += [f'  {line}' for line in transform_lines]
+
+    res_name = f'{series}._name' if keep_name else 'None'
+    func_lines += [f'  return pandas.Series(data=result_data_0, index={series}._index, name={res_name})']
+
+    func_text = '\n'.join(func_lines)
+    return func_text, _sdc_groupby_transform_globals(global_vars)
+
+
+def _sdc_groupby_size_codelines():
+    """ Generates code lines computing sizes of groups in the order of the result """
+    return [
+        f'  result_data_0 = numpy.empty(n_groups, dtype=numpy.int64)',
+        f'  for k in numba.prange(n_groups):',
+        f'    gid = res_order[k]',
+        f'    result_data_0[k] = offsets[gid + 1] - offsets[gid]',
+    ]
+
+
+def _sdc_groupby_nth_codelines(n_keys):
+    """ Generates code lines computing positions nth_rows of n-th rows of groups in the order of the result
+    and keys of groups having these rows, groups with less than n rows are skipped """
+    func_lines = [
+        f'  nth_rows = numpy.empty(n_groups, dtype=numpy.int64)',
+        f'  for k in numba.prange(n_groups):',
+        f'    gid = res_order[k]',
+        f'    group_size = offsets[gid + 1] - offsets[gid]',
+        f'    p = n if n >= 0 else group_size + n',
+        f'    if 0 <= p < group_size:',
+        f'      nth_rows[k] = positions[offsets[gid] + p]',
+        f'    else:',
+        f'      nth_rows[k] = -1',
+        f'  nth_groups = numpy.nonzero(nth_rows >= 0)[0]',
+        f'  nth_rows = nth_rows[nth_groups]',
+    ]
+    func_lines += [f'  res_keys_{i} = _sdc_take(res_keys_{i}, nth_groups)' for i in range(n_keys)]
+    return func_lines
+
+
+def _sdc_groupby_head_codelines():
+    """ Generates code lines computing positions head_rows of the first n rows of each group (all rows
+    except the last -n if n is negative) in the order of rows, rows with missing keys are skipped """
+    return [
+        f'  head_mask = numpy.zeros(len(labels), dtype=numpy.bool_)',
+        f'  for gid in numba.prange(n_groups):',
+        f'    start = offsets[gid]',
+        f'    stop = min(offsets[gid + 1], start + n) if n >= 0 else max(start, offsets[gid + 1] + n)',
+        f'    for p in range(start, stop):',
+        f'      head_mask[positions[p]] = True',
+        f'  head_rows = numpy.nonzero(head_mask)[0]',
+    ]
+
+
+def _sdc_pandas_dataframe_groupby_rows_codegen(func_name, groupby_type, func_params, defaults):
+    """ Generates implementation of DataFrameGroupBy size, nth and head, which compute sizes of groups
+    or select rows of groups. Results of size and nth are indexed by group keys (key columns are
+    prepended to the result if grouped by several columns), result of head is indexed as the grouped
+    DataFrame and includes columns of the grouped DataFrame, as pandas does """
+    all_params_as_str = ', '.join(sigparams2list(func_params, defaults))
+
+    groupby_obj = f'{func_params[0]}'
+    df = f'{groupby_obj}._parent'
+    by_columns = _sdc_pandas_dataframe_groupby_by_columns(groupby_type)
+    column_loc = groupby_type.parent.column_loc
+
+    func_lines = [f'def _dataframe_groupby_{func_name}_impl({all_params_as_str}):']
+    if func_name == 'head':
+        # rows are selected in their original order, so keys of groups are not needed
+        func_lines += _sdc_groupby_transform_index_codelines(groupby_obj)
+    else:
+        func_lines += _sdc_groupby_by_columns_codelines(df, by_columns)
+        func_lines += _sdc_groupby_index_codelines(
+            groupby_obj, [f'by_column_data_{i}' for i in range(len(by_columns))])
+
+    if func_name == 'size':
+        func_lines += _sdc_groupby_size_codelines()
+        func_lines += _sdc_groupby_result_keys_codelines(groupby_obj, len(by_columns))
+        if len(by_columns) == 1:
+            func_lines += [f'  return pandas.Series(data=result_data_0, index=res_keys_0)']
+        else:
+            keys_data = ''.join(f'\'{name}\': res_keys_{i}, ' for i, (name, _) in enumerate(by_columns))
+            func_lines += [f'  return pandas.DataFrame({{{keys_data}\'size\': result_data_0}})']
+
+    elif func_name == 'nth':
+        func_lines += _sdc_groupby_result_keys_codelines(groupby_obj, len(by_columns))
+        func_lines += _sdc_groupby_nth_codelines(len(by_columns))
+        res_columns = groupby_type.target_columns
+        for i, name in enumerate(res_columns):
+            col_loc = column_loc[name]
+            func_lines.append(
+                f'  result_data_{i} = _sdc_take({df}._data[{col_loc.type_id}][{col_loc.col_id}], nth_rows)')
+        data = ', '.join(f'\'{name}\': result_data_{i}' for i, name in enumerate(res_columns))
+        if len(by_columns) == 1:
+            func_lines += [f'  return pandas.DataFrame({{{data}}}, index=res_keys_0)']
+        else:
+            keys_data = ''.join(f'\'{name}\': res_keys_{i}, ' for i, (name, _) in enumerate(by_columns))
+            func_lines += [f'  return pandas.DataFrame({{{keys_data}{data}}})']
+
+    else:
+        func_lines += _sdc_groupby_head_codelines()
+        res_columns = _groupby_selected_columns(groupby_type)
+        for i, name in enumerate(res_columns):
+            col_loc = column_loc[name]
+            func_lines.append(
+                f'  result_data_{i} = _sdc_take({df}._data[{col_loc.type_id}][{col_loc.col_id}], head_rows)')
+        data = ', '.join(f'\'{name}\': result_data_{i}' for i, name in enumerate(res_columns))
+        func_lines += [f'  return pandas.DataFrame({{{data}}}, index=_sdc_groupby_index_take({df}._index, head_rows))']
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'pandas': pandas,
+                   'numpy': numpy,
+                   'numba': numba,
+                   '_sdc_take': _sdc_take,
+                   '_sdc_groupby_sort_groups': _sdc_groupby_sort_groups,
+                   '_sdc_groupby_index_take': _sdc_groupby_index_take}
+    return func_text, global_vars
+
+
+def _sdc_pandas_series_groupby_rows_codegen(func_name, func_params, defaults):
+    """ Generates implementation of SeriesGroupBy size, nth and head, which compute sizes of groups
+    or select rows of groups. Results of size and nth are indexed by group keys, result of head
+    is indexed as the grouped Series """
+    all_params_as_str = ', '.join(sigparams2list(func_params, defaults))
+
+    groupby_obj = f'{func_params[0]}'
+    series = f'{groupby_obj}._parent'
+
+    func_lines = [f'def _series_groupby_{func_name}_impl({all_params_as_str}):']
+    if func_name == 'head':
+        func_lines += _sdc_groupby_transform_index_codelines(groupby_obj)
+    else:
+        func_lines += _sdc_groupby_index_codelines(groupby_obj, [f'{groupby_obj}._by'])
+
+    if func_name == 'size':
+        func_lines += _sdc_groupby_size_codelines()
+        func_lines += _sdc_groupby_result_keys_codelines(groupby_obj, 1)
+        func_lines += [f'  return pandas.Series(data=result_data_0, index=res_keys_0, name={series}._name)']
+    elif func_name == 'nth':
+        func_lines += _sdc_groupby_result_keys_codelines(groupby_obj, 1)
+        func_lines += _sdc_groupby_nth_codelines(1)
+        func_lines += [f'  result_data_0 = _sdc_take({series}._data, nth_rows)',
+                       f'  return pandas.Series(data=result_data_0, index=res_keys_0, name={series}._name)']
+    else:
+        func_lines += _sdc_groupby_head_codelines()
+        func_lines += [f'  result_data_0 = _sdc_take({series}._data, head_rows)',
+                       f'  result_index = _sdc_groupby_index_take({series}._index, head_rows)',
+                       f'  return pandas.Series(data=result_data_0, index=result_index, name={series}._name)']
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'pandas': pandas,
+                   'numpy': numpy,
+                   'numba': numba,
+                   '_sdc_take': _sdc_take,
+                   '_sdc_groupby_sort_groups': _sdc_groupby_sort_groups,
+                   '_sdc_groupby_index_take': _sdc_groupby_index_take}
+    return func_text, global_vars
+
+
+series_method_to_func = {
+    'count': lambda S: S.count(),
+    'first': lambda S: S.iloc[0],
+    # idxmax and idxmin are typed as positions of rows, which implementations convert to index labels
+    'idxmax': lambda S: S._data.argmax(),
+    'idxmin': lambda S: S._data.argmin(),
+    'last': lambda S: S.iloc[-1],
+    'max': lambda S: S.max(),
+    'mean': lambda S: S.mean(),
+    'median': lambda S: S.median(),
+    'min': lambda S: S.min(),
+    'nunique': lambda S: S.nunique(),
+    'prod': lambda S: S.prod(),
+    'quantile': lambda S: S.quantile(),
+    'std': lambda S: S.std(),
+    'sum': lambda S: S.sum(),
+    'var': lambda S: S.var()
+}
+
+
+def _groupby_resolve_impl_func_type(series_dtype, method_name):
+    """ Used for typing result value of functions implementing groupby methods,
+        assuming that these implementation call method of Series.
+    """
+    ty_series = SeriesType(series_dtype)
+    jitted_func = numba.njit(series_method_to_func[method_name])
+    return cpu_target.typing_context.resolve_function_type(jitted_func, (ty_series, ), {})
+
+
+def _sdc_pandas_dataframe_groupby_by_columns(self):
+    """ Returns list of (name, column location) of columns DataFrameGroupBy groups by """
+    df_column_names = self.parent.columns
+    return [(df_column_names[i], self.parent.column_loc[df_column_names[i]]) for i in self.by_col_ids]
+
+
+def _groupby_selected_columns(self):
+    """ Returns names of columns of the grouped DataFrame that pandas includes to results of head and nunique,
+    i.e. target columns along with the column grouped by if columns were not selected explicitly """
+    df_column_names = self.parent.columns
+    key_columns = {df_column_names[i] for i in self.by_col_ids}
+    if len(key_columns) > 1 or set(self.target_columns) != set(df_column_names) - key_columns:
+        return self.target_columns
+    return df_column_names
+
+
+def sdc_pandas_dataframe_groupby_apply_func(self, func_name, func_args, defaults=None,
+                                            repeat_keys=False, columns=None):
+
+    defaults = defaults or {}
+
+    df_column_types = self.parent.data
+    df_column_names = self.parent.columns
+    selected_cols_set = set(self.target_columns if columns is None else columns)
+    subject_columns = [(name, i) for i, name in enumerate(df_column_names) if name in selected_cols_set]
+
+    # resolve types of result dataframe columns
+    targets = []
+    for name, i in subject_columns:
+        res_dtype = _groupby_resolve_impl_func_type(df_column_types[i].dtype, func_name).return_type
+        targets.append((name, name, df_column_types[i], res_dtype, func_name))
+
+    func_text, global_vars = _sdc_pandas_groupby_generic_func_codegen(
+        func_name, targets, self.parent.column_loc, _sdc_pandas_dataframe_groupby_by_columns(self),
+        func_args, defaults, repeat_keys)
+
+    groupby_func_name = f'_dataframe_groupby_{func_name}_impl'
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    _groupby_method_impl = loc_vars[groupby_func_name]
+
+    return _groupby_method_impl
+
+
+def sdc_pandas_series_groupby_apply_func(self, func_name, func_args, defaults=None,
+                                         repeat_keys=False):
+
+    defaults = defaults or {}
+
+    # resolve type of result series
+    res_dtype = _groupby_resolve_impl_func_type(self.parent.dtype, func_name).return_type
+
+    targets = [(func_name, res_dtype, func_name)]
+    func_text, global_vars = _sdc_pandas_series_groupby_generic_func_codegen(
+        func_name, targets, self.parent.data, func_args, defaults, repeat_keys=repeat_keys)
+
+    groupby_func_name = f'_series_groupby_{func_name}_impl'
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    _groupby_method_impl = loc_vars[groupby_func_name]
+
+    return _groupby_method_impl
+
+
+def sdc_pandas_dataframe_groupby_transform_func(self, func_name, func_args, defaults=None, target_func=None):
+    """ Returns implementation of DataFrameGroupBy transformation target_func (defaults to func_name)
+    applied to all numeric target columns """
+
+    defaults = defaults or {}
+    target_func = target_func or func_name
+
+    df_column_types = self.parent.data
+    df_column_names = self.parent.columns
+    selected_cols_set = set(self.target_columns)
+
+    targets = []
+    for i, name in enumerate(df_column_names):
+        if name not in selected_cols_set or not isinstance(df_column_types[i].dtype, types.Number):
+            continue
+        res_dtype = _groupby_transform_result_dtype(df_column_types[i].dtype, target_func)
+        targets.append((name, name, df_column_types[i], res_dtype, target_func))
+
+    func_text, global_vars = _sdc_pandas_groupby_transform_codegen(
+        func_name, targets, self.parent.column_loc, func_args, defaults)
+
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    _groupby_method_impl = loc_vars[f'_dataframe_groupby_{func_name}_impl']
+
+    return _groupby_method_impl
+
+
+def sdc_pandas_series_groupby_transform_func(self, func_name, func_args, defaults=None, target_func=None):
+    """ Returns implementation of SeriesGroupBy transformation target_func (defaults to func_name) """
+
+    defaults = defaults or {}
+    target_func = target_func or func_name
+
+    if target_func != 'cumcount' and not isinstance(self.parent.dtype, types.Number):
+        TypeChecker(f'GroupBy.{func_name}().').raise_exc(self.parent.dtype, 'number', 'self.parent.dtype')
+
+    res_dtype = _groupby_transform_result_dtype(self.parent.dtype, target_func)
+    func_text, global_vars = _sdc_pandas_series_groupby_transform_codegen(
+        func_name, target_func, self.parent.data, res_dtype, func_args, defaults,
+        keep_name=target_func != 'cumcount')
+
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    _groupby_method_impl = loc_vars[f'_series_groupby_{func_name}_impl']
+
+    return _groupby_method_impl
+
+
+def _groupby_check_rank_params(ty_checker, method, ascending, na_option, pct):
+    if not isinstance(method, (types.Omitted, types.UnicodeType, types.StringLiteral, str)):
+        ty_checker.raise_exc(method, 'str', 'method')
+
+    if not isinstance(ascending, (types.Omitted, types.Boolean, bool)):
+        ty_checker.raise_exc(ascending, 'bool', 'ascending')
+
+    if not (isinstance(na_option, (types.Omitted, str))
+            or isinstance(na_option, types.StringLiteral) and na_option.literal_value == 'keep'):
+        raise SDCLimitation(f"{ty_checker.func_name} Unsupported parameter. Only na_option='keep' is supported")
+
+    if not isinstance(pct, (types.Omitted, types.Boolean, bool)):
+        ty_checker.raise_exc(pct, 'bool', 'pct')
+
+
+def _groupby_check_quantile_params(ty_checker, q, interpolation):
+    """ Checks parameters of GroupBy.quantile() and returns True if q is a sequence of quantiles """
+    if not isinstance(interpolation, (types.Omitted, str)) and interpolation != 'linear':
+        raise SDCLimitation(f"{ty_checker.func_name} Unsupported parameter. Only interpolation='linear' is supported")
+
+    if isinstance(q, (types.Omitted, types.Number, int, float)):
+        return False
+    if isinstance(q, (types.List, types.UniTuple, types.Array)) and isinstance(q.dtype, types.Number):
+        return True
+    ty_checker.raise_exc(q, 'float, list, tuple or array of floats', 'q')
+
+
+def _groupby_transform_literal_func(ty_checker, func):
+    """ Returns name of reduction given as func argument of transform """
+    if not isinstance(func, types.StringLiteral):
+        ty_checker.raise_exc(func, 'literal string', 'func')
+
+    # idxmin and idxmax accumulators compute positions of rows rather than results
+    supported_funcs = sorted(set(groupby_accumulators) - {'idxmin', 'idxmax'})
+    func_name = func.literal_value
+    if func_name not in supported_funcs:
+        raise SDCLimitation(f"{ty_checker.func_name} Unsupported function: {func_name}. "
+                            f"Supported functions are: {supported_funcs}")
+    return func_name
+
+
+def _groupby_agg_literal_func(func):
+    """ Returns value of func argument of agg given as literal string, tuple or list of literal strings
+    or as literal dict mapping column names to these, or None if func is not such a literal """
+    if isinstance(func, types.StringLiteral):
+        return func.literal_value
+    if isinstance(func, types.BaseTuple) and all(isinstance(a, types.StringLiteral) for a in func):
+        return [a.literal_value for a in func]
+    if isinstance(func, types.List) and getattr(func, 'initial_value', None) is not None:
+        return list(func.initial_value)
+
+    literal_dict_type = getattr(types, 'LiteralStrKeyDict', None)
+    if literal_dict_type is not None and isinstance(func, literal_dict_type):
+        func_dict = {name: _groupby_agg_literal_func(value) for name, value in func.literal_value.items()}
+        if any(value is None or isinstance(value, dict) for value in func_dict.values()):
+            return None
+        return func_dict
+    if isinstance(func, types.DictType) and getattr(func, 'initial_value', None) is not None:
+        return {name: value if isinstance(value, str) else list(value)
+                for name, value in func.initial_value.items()}
+
+    return None
+
+
+def _groupby_agg_check_func_names(func_names, method_name):
+    unsupported_funcs = [name for name in func_names if name not in series_method_to_func]
+    if unsupported_funcs:
+        raise SDCLimitation(f"{method_name} Unsupported functions: {unsupported_funcs}. "
+                            f"Supported functions are: {sorted(series_method_to_func)}")
+
+
+@sdc_overload_method(DataFrameGroupByType, 'agg')
+def sdc_pandas_dataframe_groupby_agg(self, func):
+
+    method_name = 'GroupBy.agg().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    agg_func = _groupby_agg_literal_func(func)
+    if agg_func is None:
+        ty_checker.raise_exc(func, 'literal string, tuple or list of literal strings or literal dict', 'func')
+
+    if isinstance(agg_func, dict):
+        column_funcs = agg_func
+    else:
+        column_funcs = {name: agg_func for name in self.target_columns}
+
+    missing_columns = [name for name in column_funcs if name not in self.target_columns]
+    if missing_columns:
+        raise TypingError(f"{method_name} Column(s) {missing_columns} do not exist")
+
+    # several functions applied to a column give MultiIndex columns (column, function) in pandas,
+    # which are flattened to names 'column_function' as MultiIndex is not supported
+    flatten_names = not all(isinstance(a, str) for a in column_funcs.values())
+    df_column_types = self.parent.data
+    targets = []
+    for name, funcs in column_funcs.items():
+        func_names = [funcs] if isinstance(funcs, str) else funcs
+        if len(set(func_names)) != len(func_names):
+            raise TypingError(f"{method_name} Function names must be unique, given: {func_names}")
+        _groupby_agg_check_func_names(func_names, method_name)
+
+        column_type = df_column_types[self.parent.columns.index(name)]
+        for func_name in func_names:
+            res_name = f'{name}_{func_name}' if flatten_names else name
+            res_dtype = _groupby_resolve_impl_func_type(column_type.dtype, func_name).return_type
+            targets.append((res_name, name, column_type, res_dtype, func_name))
+
+    func_text, global_vars = _sdc_pandas_groupby_generic_func_codegen(
+        'agg', targets, self.parent.column_loc, _sdc_pandas_dataframe_groupby_by_columns(self),
+        ['self', 'func'], {})
+
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    _groupby_agg_impl = loc_vars['_dataframe_groupby_agg_impl']
+
+    return _groupby_agg_impl
+
+
+@sdc_overload_method(DataFrameGroupByType, 'count')
+def sdc_pandas_dataframe_groupby_count(self):
+
+    method_name = 'GroupBy.count().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'count'
+    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'max')
+def sdc_pandas_dataframe_groupby_max(self):
+
+    method_name = 'GroupBy.max().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'max'
+    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'mean')
+def sdc_pandas_dataframe_groupby_mean(self, *args):
+
+    method_name = 'GroupBy.mean().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self', '*args']
+    applied_func_name = 'mean'
+    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'median')
+def sdc_pandas_dataframe_groupby_median(self):
+
+    method_name = 'GroupBy.median().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'median'
+    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'quantile')
+def sdc_pandas_dataframe_groupby_quantile(self, q=0.5, interpolation='linear'):
+
+    method_name = 'GroupBy.quantile().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+    repeat_keys = _groupby_check_quantile_params(ty_checker, q, interpolation)
+
+    method_args = ['self', 'q', 'interpolation']
+    default_values = {'q': 0.5, 'interpolation': "'linear'"}
+    applied_func_name = 'quantile'
+    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args, default_values,
+                                                   repeat_keys=repeat_keys)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'min')
+def sdc_pandas_dataframe_groupby_min(self):
+
+    method_name = 'GroupBy.min().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'min'
+    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'prod')
+def sdc_pandas_dataframe_groupby_prod(self):
+
+    method_name = 'GroupBy.prod().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'prod'
+    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'std')
+def sdc_pandas_dataframe_groupby_std(self, ddof=1, *args):
+
+    method_name = 'GroupBy.std().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    if not isinstance(ddof, (types.Omitted, int, types.Integer)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    method_args = ['self', 'ddof', '*args']
+    default_values = {'ddof': 1}
+
+    applied_func_name = 'std'
+    return sdc_pandas_dataframe_groupby_apply_func(
+        self, applied_func_name, method_args, default_values)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'sum')
+def sdc_pandas_dataframe_groupby_sum(self):
+
+    method_name = 'GroupBy.sum().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'sum'
+    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'var')
+def sdc_pandas_dataframe_groupby_var(self, ddof=1, *args):
+
+    method_name = 'GroupBy.var().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    if not isinstance(ddof, (types.Omitted, int, types.Integer)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    method_args = ['self', 'ddof', '*args']
+    default_values = {'ddof': 1}
+
+    applied_func_name = 'var'
+    return sdc_pandas_dataframe_groupby_apply_func(
+        self, applied_func_name, method_args, default_values)
+
+
+def _groupby_numeric_target_columns(self, method_name):
+    """ Returns names of target columns of DataFrameGroupBy, which all must have numeric dtype,
+    as pandas keeps non-numeric columns in results of methods using this check """
+    df_column_types = self.parent.data
+    target_columns = [(name, df_column_types[i].dtype) for i, name in enumerate(self.parent.columns)
+                      if name in self.target_columns]
+    non_numeric_columns = [name for name, dtype in target_columns if not isinstance(dtype, types.Number)]
+    if non_numeric_columns:
+        raise SDCLimitation(f"{method_name} Only numeric columns are supported, "
+                            f"given non-numeric columns: {non_numeric_columns}")
+
+    return [name for name, _ in target_columns]
+
+
+@sdc_overload_method(DataFrameGroupByType, 'first')
+def sdc_pandas_dataframe_groupby_first(self):
+
+    method_name = 'GroupBy.first().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'first'
+    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args,
+                                                   columns=_groupby_numeric_target_columns(self, method_name))
+
+
+@sdc_overload_method(DataFrameGroupByType, 'head')
+def sdc_pandas_dataframe_groupby_head(self, n=5):
+
+    method_name = 'GroupBy.head().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    if not isinstance(n, (types.Omitted, int, types.Integer)):
+        ty_checker.raise_exc(n, 'int', 'n')
+
+    func_text, global_vars = _sdc_pandas_dataframe_groupby_rows_codegen('head', self, ['self', 'n'], {'n': 5})
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    return loc_vars['_dataframe_groupby_head_impl']
+
+
+@sdc_overload_method(DataFrameGroupByType, 'idxmax')
+def sdc_pandas_dataframe_groupby_idxmax(self):
+
+    method_name = 'GroupBy.idxmax().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'idxmax'
+    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args,
+                                                   columns=_groupby_numeric_target_columns(self, method_name))
+
+
+@sdc_overload_method(DataFrameGroupByType, 'idxmin')
+def sdc_pandas_dataframe_groupby_idxmin(self):
+
+    method_name = 'GroupBy.idxmin().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'idxmin'
+    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args,
+                                                   columns=_groupby_numeric_target_columns(self, method_name))
+
+
+@sdc_overload_method(DataFrameGroupByType, 'last')
+def sdc_pandas_dataframe_groupby_last(self):
+
+    method_name = 'GroupBy.last().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'last'
+    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args,
+                                                   columns=_groupby_numeric_target_columns(self, method_name))
+
+
+@sdc_overload_method(DataFrameGroupByType, 'nth')
+def sdc_pandas_dataframe_groupby_nth(self, n, dropna=None):
+
+    method_name = 'GroupBy.nth().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    if not isinstance(n, (int, types.Integer)):
+        ty_checker.raise_exc(n, 'int', 'n')
+
+    if not (isinstance(dropna, (types.Omitted, types.NoneType)) or dropna is None):
+        raise SDCLimitation(f"{method_name} Unsupported parameter. Only dropna=None is supported")
+
+    func_text, global_vars = _sdc_pandas_dataframe_groupby_rows_codegen(
+        'nth', self, ['self', 'n', 'dropna'], {'dropna': None})
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    return loc_vars['_dataframe_groupby_nth_impl']
+
+
+@sdc_overload_method(DataFrameGroupByType, 'nunique')
+def sdc_pandas_dataframe_groupby_nunique(self, dropna=True):
+
+    method_name = 'GroupBy.nunique().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    if not isinstance(dropna, (types.Omitted, types.Boolean, bool)):
+        ty_checker.raise_exc(dropna, 'bool', 'dropna')
+
+    method_args = ['self', 'dropna']
+    default_values = {'dropna': True}
+    applied_func_name = 'nunique'
+    return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args, default_values,
+                                                   columns=_groupby_selected_columns(self))
+
+
+@sdc_overload_method(DataFrameGroupByType, 'size')
+def sdc_pandas_dataframe_groupby_size(self):
+
+    method_name = 'GroupBy.size().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    func_text, global_vars = _sdc_pandas_dataframe_groupby_rows_codegen('size', self, ['self'], {})
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    return loc_vars['_dataframe_groupby_size_impl']
+
+
+@sdc_overload_method(DataFrameGroupByType, 'cumcount')
+def sdc_pandas_dataframe_groupby_cumcount(self, ascending=True):
+
+    method_name = 'GroupBy.cumcount().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    if not isinstance(ascending, (types.Omitted, types.Boolean, bool)):
+        ty_checker.raise_exc(ascending, 'bool', 'ascending')
+
+    targets = [('cumcount', None, None, types.int64, 'cumcount')]
+    func_text, global_vars = _sdc_pandas_groupby_transform_codegen(
+        'cumcount', targets, self.parent.column_loc, ['self', 'ascending'], {'ascending': True}, as_series=True)
+
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    _groupby_cumcount_impl = loc_vars['_dataframe_groupby_cumcount_impl']
+
+    return _groupby_cumcount_impl
+
+
+@sdc_overload_method(DataFrameGroupByType, 'cummax')
+def sdc_pandas_dataframe_groupby_cummax(self):
+
+    method_name = 'GroupBy.cummax().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'cummax'
+    return sdc_pandas_dataframe_groupby_transform_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'cummin')
+def sdc_pandas_dataframe_groupby_cummin(self):
+
+    method_name = 'GroupBy.cummin().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'cummin'
+    return sdc_pandas_dataframe_groupby_transform_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'cumprod')
+def sdc_pandas_dataframe_groupby_cumprod(self):
+
+    method_name = 'GroupBy.cumprod().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'cumprod'
+    return sdc_pandas_dataframe_groupby_transform_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'cumsum')
+def sdc_pandas_dataframe_groupby_cumsum(self):
+
+    method_name = 'GroupBy.cumsum().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'cumsum'
+    return sdc_pandas_dataframe_groupby_transform_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'diff')
+def sdc_pandas_dataframe_groupby_diff(self, periods=1):
+
+    method_name = 'GroupBy.diff().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    if not isinstance(periods, (types.Omitted, int, types.Integer)):
+        ty_checker.raise_exc(periods, 'int', 'periods')
+
+    method_args = ['self', 'periods']
+    default_values = {'periods': 1}
+    applied_func_name = 'diff'
+    return sdc_pandas_dataframe_groupby_transform_func(self, applied_func_name, method_args, default_values)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'rank')
+def sdc_pandas_dataframe_groupby_rank(self, method='average', ascending=True, na_option='keep', pct=False):
+
+    method_name = 'GroupBy.rank().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    _groupby_check_rank_params(ty_checker, method, ascending, na_option, pct)
+
+    method_args = ['self', 'method', 'ascending', 'na_option', 'pct']
+    default_values = {'method': "'average'", 'ascending': True, 'na_option': "'keep'", 'pct': False}
+    applied_func_name = 'rank'
+    return sdc_pandas_dataframe_groupby_transform_func(self, applied_func_name, method_args, default_values)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'shift')
+def sdc_pandas_dataframe_groupby_shift(self, periods=1):
+
+    method_name = 'GroupBy.shift().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    if not isinstance(periods, (types.Omitted, int, types.Integer)):
+        ty_checker.raise_exc(periods, 'int', 'periods')
+
+    method_args = ['self', 'periods']
+    default_values = {'periods': 1}
+    applied_func_name = 'shift'
+    return sdc_pandas_dataframe_groupby_transform_func(self, applied_func_name, method_args, default_values)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'transform')
+def sdc_pandas_dataframe_groupby_transform(self, func):
+
+    method_name = 'GroupBy.transform().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    reduction_name = _groupby_transform_literal_func(ty_checker, func)
+
+    method_args = ['self', 'func']
+    return sdc_pandas_dataframe_groupby_transform_func(self, 'transform', method_args, target_func=reduction_name)
+
+
+@sdc_overload_method(SeriesGroupByType, 'agg')
+def sdc_pandas_series_groupby_agg(self, func):
+
+    method_name = 'GroupBy.agg().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    agg_func = _groupby_agg_literal_func(func)
+    if agg_func is None or isinstance(agg_func, dict):
+        ty_checker.raise_exc(func, 'literal string, tuple or list of literal strings', 'func')
+
+    func_names = [agg_func] if isinstance(agg_func, str) else agg_func
+    if len(set(func_names)) != len(func_names):
+        raise TypingError(f"{method_name} Function names must be unique, given: {func_names}")
+    _groupby_agg_check_func_names(func_names, method_name)
+
+    targets = [(func_name, _groupby_resolve_impl_func_type(self.parent.dtype, func_name).return_type, func_name)
+               for func_name in func_names]
+    func_text, global_vars = _sdc_pandas_series_groupby_generic_func_codegen(
+        'agg', targets, self.parent.data, ['self', 'func'], {}, as_frame=not isinstance(agg_func, str))
+
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    _groupby_agg_impl = loc_vars['_series_groupby_agg_impl']
+
+    return _groupby_agg_impl
+
+
+@sdc_overload_method(SeriesGroupByType, 'count')
+def sdc_pandas_series_groupby_count(self):
+
+    method_name = 'GroupBy.count().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'count'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'max')
+def sdc_pandas_series_groupby_max(self):
+
+    method_name = 'GroupBy.max().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'max'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'mean')
+def sdc_pandas_series_groupby_mean(self, *args):
+
+    method_name = 'GroupBy.mean().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    method_args = ['self', '*args']
+    applied_func_name = 'mean'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'median')
+def sdc_pandas_series_groupby_median(self):
+
+    method_name = 'GroupBy.median().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'median'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'quantile')
+def sdc_pandas_series_groupby_quantile(self, q=0.5, interpolation='linear'):
+
+    method_name = 'GroupBy.quantile().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+    repeat_keys = _groupby_check_quantile_params(ty_checker, q, interpolation)
+
+    method_args = ['self', 'q', 'interpolation']
+    default_values = {'q': 0.5, 'interpolation': "'linear'"}
+    applied_func_name = 'quantile'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args, default_values,
+                                                repeat_keys=repeat_keys)
+
+
+@sdc_overload_method(SeriesGroupByType, 'min')
+def sdc_pandas_series_groupby_min(self):
+
+    method_name = 'GroupBy.min().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'min'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'prod')
+def sdc_pandas_series_groupby_prod(self):
+
+    method_name = 'GroupBy.prod().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'prod'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'std')
+def sdc_pandas_series_groupby_std(self, ddof=1, *args):
+
+    method_name = 'GroupBy.std().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    if not isinstance(ddof, (types.Omitted, int, types.Integer)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    method_args = ['self', 'ddof', '*args']
+    default_values = {'ddof': 1}
+
+    applied_func_name = 'std'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args, default_values)
+
+
+@sdc_overload_method(SeriesGroupByType, 'sum')
+def sdc_pandas_series_groupby_sum(self):
+
+    method_name = 'GroupBy.sum().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'sum'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'var')
+def sdc_pandas_series_groupby_var(self, ddof=1, *args):
+
+    method_name = 'GroupBy.var().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    if not isinstance(ddof, (types.Omitted, int, types.Integer)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    method_args = ['self', 'ddof', '*args']
+    default_values = {'ddof': 1}
+
+    applied_func_name = 'var'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args, default_values)
+
+
+def _groupby_check_numeric_series(ty_checker, self):
+    if not isinstance(self.parent.dtype, types.Number):
+        ty_checker.raise_exc(self.parent.dtype, 'number', 'self.parent.dtype')
+
+
+@sdc_overload_method(SeriesGroupByType, 'first')
+def sdc_pandas_series_groupby_first(self):
+
+    method_name = 'GroupBy.first().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+    _groupby_check_numeric_series(ty_checker, self)
+
+    method_args = ['self']
+    applied_func_name = 'first'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'head')
+def sdc_pandas_series_groupby_head(self, n=5):
+
+    method_name = 'GroupBy.head().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    if not isinstance(n, (types.Omitted, int, types.Integer)):
+        ty_checker.raise_exc(n, 'int', 'n')
+
+    func_text, global_vars = _sdc_pandas_series_groupby_rows_codegen('head', ['self', 'n'], {'n': 5})
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    return loc_vars['_series_groupby_head_impl']
+
+
+@sdc_overload_method(SeriesGroupByType, 'idxmax')
+def sdc_pandas_series_groupby_idxmax(self):
+
+    method_name = 'GroupBy.idxmax().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+    _groupby_check_numeric_series(ty_checker, self)
+
+    method_args = ['self']
+    applied_func_name = 'idxmax'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'idxmin')
+def sdc_pandas_series_groupby_idxmin(self):
+
+    method_name = 'GroupBy.idxmin().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+    _groupby_check_numeric_series(ty_checker, self)
+
+    method_args = ['self']
+    applied_func_name = 'idxmin'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'last')
+def sdc_pandas_series_groupby_last(self):
+
+    method_name = 'GroupBy.last().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+    _groupby_check_numeric_series(ty_checker, self)
+
+    method_args = ['self']
+    applied_func_name = 'last'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'nth')
+def sdc_pandas_series_groupby_nth(self, n, dropna=None):
+
+    method_name = 'GroupBy.nth().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    if not isinstance(n, (int, types.Integer)):
+        ty_checker.raise_exc(n, 'int', 'n')
+
+    if not (isinstance(dropna, (types.Omitted, types.NoneType)) or dropna is None):
+        raise SDCLimitation(f"{method_name} Unsupported parameter. Only dropna=None is supported")
+
+    func_text, global_vars = _sdc_pandas_series_groupby_rows_codegen('nth', ['self', 'n', 'dropna'], {'dropna': None})
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    return loc_vars['_series_groupby_nth_impl']
+
+
+@sdc_overload_method(SeriesGroupByType, 'nunique')
+def sdc_pandas_series_groupby_nunique(self, dropna=True):
+
+    method_name = 'GroupBy.nunique().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    if not isinstance(dropna, (types.Omitted, types.Boolean, bool)):
+        ty_checker.raise_exc(dropna, 'bool', 'dropna')
+
+    method_args = ['self', 'dropna']
+    default_values = {'dropna': True}
+    applied_func_name = 'nunique'
+    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args, default_values)
+
+
+@sdc_overload_method(SeriesGroupByType, 'size')
+def sdc_pandas_series_groupby_size(self):
+
+    method_name = 'GroupBy.size().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    func_text, global_vars = _sdc_pandas_series_groupby_rows_codegen('size', ['self'], {})
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    return loc_vars['_series_groupby_size_impl']
+
+
+@sdc_overload_method(SeriesGroupByType, 'cumcount')
+def sdc_pandas_series_groupby_cumcount(self, ascending=True):
+
+    method_name = 'GroupBy.cumcount().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    if not isinstance(ascending, (types.Omitted, types.Boolean, bool)):
+        ty_checker.raise_exc(ascending, 'bool', 'ascending')
+
+    method_args = ['self', 'ascending']
+    default_values = {'ascending': True}
+    applied_func_name = 'cumcount'
+    return sdc_pandas_series_groupby_transform_func(self, applied_func_name, method_args, default_values)
+
+
+@sdc_overload_method(SeriesGroupByType, 'cummax')
+def sdc_pandas_series_groupby_cummax(self):
+
+    method_name = 'GroupBy.cummax().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'cummax'
+    return sdc_pandas_series_groupby_transform_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'cummin')
+def sdc_pandas_series_groupby_cummin(self):
+
+    method_name = 'GroupBy.cummin().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'cummin'
+    return sdc_pandas_series_groupby_transform_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'cumprod')
+def sdc_pandas_series_groupby_cumprod(self):
+
+    method_name = 'GroupBy.cumprod().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'cumprod'
+    return sdc_pandas_series_groupby_transform_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'cumsum')
+def sdc_pandas_series_groupby_cumsum(self):
+
+    method_name = 'GroupBy.cumsum().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    method_args = ['self']
+    applied_func_name = 'cumsum'
+    return sdc_pandas_series_groupby_transform_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(SeriesGroupByType, 'diff')
+def sdc_pandas_series_groupby_diff(self, periods=1):
+
+    method_name = 'GroupBy.diff().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    if not isinstance(periods, (types.Omitted, int, types.Integer)):
+        ty_checker.raise_exc(periods, 'int', 'periods')
+
+    method_args = ['self', 'periods']
+    default_values = {'periods': 1}
+    applied_func_name = 'diff'
+    return sdc_pandas_series_groupby_transform_func(self, applied_func_name, method_args, default_values)
+
+
+@sdc_overload_method(SeriesGroupByType, 'rank')
+def sdc_pandas_series_groupby_rank(self, method='average', ascending=True, na_option='keep', pct=False):
+
+    method_name = 'GroupBy.rank().'
+    ty_checker = TypeChecker(method_name)
     ty_checker.check(self, SeriesGroupByType)
 
-    method_args = ['self']
-    applied_func_name = 'prod'
-    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
+    _groupby_check_rank_params(ty_checker, method, ascending, na_option, pct)
 
+    method_args = ['self', 'method', 'ascending', 'na_option', 'pct']
+    default_values = {'method': "'average'", 'ascending': True, 'na_option': "'keep'", 'pct': False}
+    applied_func_name = 'rank'
+    return sdc_pandas_series_groupby_transform_func(self, applied_func_name, method_args, default_values)
 
-@sdc_overload_method(SeriesGroupByType, 'std')
-def sdc_pandas_series_groupby_std(self, ddof=1, *args):
 
-    method_name = 'GroupBy.std().'
+@sdc_overload_method(SeriesGroupByType, 'shift')
+def sdc_pandas_series_groupby_shift(self, periods=1):
+
+    method_name = 'GroupBy.shift().'
     ty_checker = TypeChecker(method_name)
     ty_checker.check(self, SeriesGroupByType)
 
-    if not isinstance(ddof, (types.Omitted, int, types.Integer)):
-        ty_checker.raise_exc(ddof, 'int', 'ddof')
+    if not isinstance(periods, (types.Omitted, int, types.Integer)):
+        ty_checker.raise_exc(periods, 'int', 'periods')
 
-    method_args = ['self', 'ddof', '*args']
-    default_values = {'ddof': 1}
-    impl_used_params = {'ddof': 'ddof'}
+    method_args = ['self', 'periods']
+    default_values = {'periods': 1}
+    applied_func_name = 'shift'
+    return sdc_pandas_series_groupby_transform_func(self, applied_func_name, method_args, default_values)
 
-    applied_func_name = 'std'
-    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args, default_values, impl_used_params)
 
+@sdc_overload_method(SeriesGroupByType, 'transform')
+def sdc_pandas_series_groupby_transform(self, func):
 
-@sdc_overload_method(SeriesGroupByType, 'sum')
-def sdc_pandas_series_groupby_sum(self):
+    method_name = 'GroupBy.transform().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    reduction_name = _groupby_transform_literal_func(ty_checker, func)
+
+    method_args = ['self', 'func']
+    return sdc_pandas_series_groupby_transform_func(self, 'transform', method_args, target_func=reduction_name)
+
+
+def gen_sdc_pandas_groupby_expanding_overload_body(initializer, ty):
+    """Generate code of the overloaded expanding method of groupby type, expanding window is represented
+    as rolling window not shorter than any group, so that values are never removed from it"""
+    def sdc_pandas_groupby_expanding(self, min_periods=1, center=False, axis=0):
+        ty_checker = TypeChecker('Method expanding().')
+        ty_checker.check(self, ty)
+
+        if not isinstance(min_periods, (int, types.Omitted, types.Integer)):
+            ty_checker.raise_exc(min_periods, 'int', 'min_periods')
+
+        if not isinstance(center, (bool, types.Omitted, types.Boolean)):
+            ty_checker.raise_exc(center, 'bool', 'center')
+
+        if not isinstance(axis, (int, types.Omitted, types.Integer)):
+            ty_checker.raise_exc(axis, 'int', 'axis')
+
+        def sdc_pandas_groupby_expanding_impl(self, min_periods=1, center=False, axis=0):
+            if min_periods < 0:
+                raise ValueError('min_periods must be >= 0')
+
+            if center != False:  # noqa
+                raise ValueError('Method expanding(). The object center\n expected: False')
+
+            if axis != 0:
+                raise ValueError('Method expanding(). The object axis\n expected: 0')
+
+            window = len(self._labels)
+            return initializer(self, window, min_periods, center, None, None, axis, None)
+
+        return sdc_pandas_groupby_expanding_impl
+
+    return sdc_pandas_groupby_expanding
+
+
+sdc_pandas_dataframe_groupby_expanding = sdc_overload_method(DataFrameGroupByType, 'expanding')(
+    gen_sdc_pandas_groupby_expanding_overload_body(_hpat_pandas_df_groupby_rolling_init, DataFrameGroupByType))
+sdc_pandas_dataframe_groupby_rolling = sdc_overload_method(DataFrameGroupByType, 'rolling')(
+    gen_sdc_pandas_rolling_overload_body(_hpat_pandas_df_groupby_rolling_init, DataFrameGroupByType))
+sdc_pandas_series_groupby_expanding = sdc_overload_method(SeriesGroupByType, 'expanding')(
+    gen_sdc_pandas_groupby_expanding_overload_body(_hpat_pandas_series_groupby_rolling_init, SeriesGroupByType))
+sdc_pandas_series_groupby_rolling = sdc_overload_method(SeriesGroupByType, 'rolling')(
+    gen_sdc_pandas_rolling_overload_body(_hpat_pandas_series_groupby_rolling_init, SeriesGroupByType))
+
+
+sdc_pandas_dataframe_groupby_docstring_tmpl = """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.core.groupby.GroupBy.{method_name}
+{limitations_block}
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/dataframe/groupby/dataframe_groupby_{method_name}.py
+       :language: python
+       :lines: 27-
+       :caption: {example_caption}
+       :name: ex_dataframe_groupby_{method_name}
+
+    .. command-output:: python ./dataframe/groupby/dataframe_groupby_{method_name}.py
+       :cwd: ../../../examples
+{see_also}
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas DataFrame method :meth:`pandas.DataFrame.groupby.{method_name}()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_groupby.TestGroupBy.test_dataframe_groupby_{method_name}*
+
+    Parameters
+    ----------
+    self: :class:`pandas.DataFrame.groupby`
+        input arg{extra_params}
+
+    Returns
+    -------
+    :obj:`pandas.DataFrame`
+         returns :obj:`pandas.DataFrame` object
+"""
+
+
+sdc_pandas_dataframe_groupby_agg.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'agg',
+    'example_caption': 'Compute several aggregations of groups in a single pass over data.',
+    'limitations_block':
+        f"""
+        Limitations
+        -----------
+        - Parameter ``func`` is supported as literal function name, literal list of function names or \
+literal dict mapping column names to these only, functions are the ones supported as methods of GroupBy
+        - Result of applying several functions to a column has columns named 'column_function' instead of \
+MultiIndex columns (column, function)
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params':
+    """
+    func: :obj:`str`, :obj:`list` or :obj:`dict`
+        Name or list of names of functions to apply to all columns or dict mapping column names to these"""
+})
+
+
+sdc_pandas_dataframe_groupby_count.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'count',
+    'example_caption': 'Compute count of group, excluding missing values.',
+    'limitations_block':
+        f"""
+        Limitations
+        -----------
+        - {performance_limitation}
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_max.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'max',
+    'example_caption': 'Compute max of group values.',
+    'limitations_block':
+        f"""
+        Limitations
+        -----------
+        - {performance_limitation}
+        """,
+    'see_also': '',
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_mean.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'mean',
+    'example_caption': 'Compute mean of groups, excluding missing values.',
+    'limitations_block':
+        f"""
+        Limitations
+        -----------
+        - {performance_limitation}
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_median.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'median',
+    'example_caption': 'Compute median of groups, excluding missing values.',
+    'limitations_block':
+        f"""
+        Limitations
+        -----------
+        - {performance_limitation}
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_quantile.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'quantile',
+    'example_caption': 'Compute quantiles of groups, excluding missing values.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Parameter ``interpolation`` is supported only with default value 'linear'
+        - If ``q`` is a sequence, result has a row for each quantile of each group and is indexed \
+by repeated group keys only, as MultiIndex is not supported
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+        :ref:`Series.quantile <pandas.Series.quantile>`
+            Return value at the given quantile.
+    """,
+    'extra_params': """
+    q: :obj:`float` or array-like
+        Value(s) between 0 and 1 providing the quantile(s) to compute
+    interpolation: :obj:`str`
+        Method to use when the desired quantile falls between two points"""
+})
+
+
+sdc_pandas_dataframe_groupby_min.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'min',
+    'example_caption': 'Compute min of group values.',
+    'limitations_block':
+        f"""
+        Limitations
+        -----------
+        - {performance_limitation}
+        """,
+    'see_also': '',
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_prod.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'prod',
+    'example_caption': 'Compute prod of group values.',
+    'limitations_block':
+        f"""
+        Limitations
+        -----------
+        - {performance_limitation}
+        """,
+    'see_also': '',
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_std.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'std',
+    'example_caption': 'Compute standard deviation of groups, excluding missing values.',
+    'limitations_block':
+        f"""
+        Limitations
+        -----------
+        - {performance_limitation}
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_sum.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'sum',
+    'example_caption': 'Compute sum of groups, excluding missing values.',
+    'limitations_block':
+        f"""
+        Limitations
+        -----------
+        - {performance_limitation}
+        """,
+    'see_also': '',
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_var.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'var',
+    'example_caption': 'Compute variance of groups, excluding missing values.',
+    'limitations_block':
+        f"""
+        Limitations
+        -----------
+        - {performance_limitation}
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': ''
+})
 
-    method_name = 'GroupBy.sum().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, SeriesGroupByType)
 
-    method_args = ['self']
-    applied_func_name = 'sum'
-    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args)
+sdc_pandas_dataframe_groupby_first.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'first',
+    'example_caption': 'Compute first non-null value of each column within groups.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Only numeric columns are supported, non-numeric target columns raise SDCLimitation
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': ''
+})
 
 
-@sdc_overload_method(SeriesGroupByType, 'var')
-def sdc_pandas_series_groupby_var(self, ddof=1, *args):
+sdc_pandas_dataframe_groupby_head.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'head',
+    'example_caption': 'Return first n rows of each group.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Result includes the column grouped by only if columns were not selected explicitly and the DataFrame \
+is grouped by one column
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': """
+    n: :obj:`int`
+        Number of rows to return from each group, all rows except the last -n if negative"""
+})
 
-    method_name = 'GroupBy.var().'
-    ty_checker = TypeChecker(method_name)
-    ty_checker.check(self, SeriesGroupByType)
 
-    if not isinstance(ddof, (types.Omitted, int, types.Integer)):
-        ty_checker.raise_exc(ddof, 'int', 'ddof')
+sdc_pandas_dataframe_groupby_idxmax.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'idxmax',
+    'example_caption': 'Compute index labels of maximum values of each column within groups.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Only numeric columns are supported, non-numeric target columns raise SDCLimitation
+        - Groups with all NA values raise ValueError
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': ''
+})
 
-    method_args = ['self', 'ddof', '*args']
-    default_values = {'ddof': 1}
-    impl_used_params = {'ddof': 'ddof'}
 
-    applied_func_name = 'var'
-    return sdc_pandas_series_groupby_apply_func(self, applied_func_name, method_args, default_values, impl_used_params)
+sdc_pandas_dataframe_groupby_idxmin.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'idxmin',
+    'example_caption': 'Compute index labels of minimum values of each column within groups.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Only numeric columns are supported, non-numeric target columns raise SDCLimitation
+        - Groups with all NA values raise ValueError
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': ''
+})
 
 
-sdc_pandas_dataframe_groupby_docstring_tmpl = """
-    Intel Scalable Dataframe Compiler User Guide
-    ********************************************
-    Pandas API: pandas.core.groupby.GroupBy.{method_name}
-{limitations_block}
-    Examples
-    --------
-    .. literalinclude:: ../../../examples/dataframe/groupby/dataframe_groupby_{method_name}.py
-       :language: python
-       :lines: 27-
-       :caption: {example_caption}
-       :name: ex_dataframe_groupby_{method_name}
+sdc_pandas_dataframe_groupby_last.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'last',
+    'example_caption': 'Compute last non-null value of each column within groups.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Only numeric columns are supported, non-numeric target columns raise SDCLimitation
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': ''
+})
 
-    .. command-output:: python ./dataframe/groupby/dataframe_groupby_{method_name}.py
-       :cwd: ../../../examples
-{see_also}
-    Intel Scalable Dataframe Compiler Developer Guide
-    *************************************************
 
-    Pandas DataFrame method :meth:`pandas.DataFrame.groupby.{method_name}()` implementation.
+sdc_pandas_dataframe_groupby_nth.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'nth',
+    'example_caption': 'Take the nth row from each group.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Parameter ``n`` is supported only as single integer
+        - Parameter ``dropna`` is supported only with default value None
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': """
+    n: :obj:`int`
+        Position of the row to take from each group, negative positions count from the end of the group
+    dropna: :obj:`None`
+        Not supported"""
+})
 
-    .. only:: developer
 
-    Test: python -m sdc.runtests -k sdc.tests.test_groupby.TestGroupBy.test_dataframe_groupby_{method_name}*
+sdc_pandas_dataframe_groupby_nunique.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'nunique',
+    'example_caption': 'Count distinct values of each column within groups.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Result includes the column grouped by only if columns were not selected explicitly and the DataFrame \
+is grouped by one column
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': """
+    dropna: :obj:`bool`
+        Don't include NaN in the counts"""
+})
 
-    Parameters
-    ----------
-    self: :class:`pandas.DataFrame.groupby`
-        input arg{extra_params}
 
-    Returns
-    -------
-    :obj:`pandas.DataFrame`
-         returns :obj:`pandas.DataFrame` object
-"""
+sdc_pandas_dataframe_groupby_size.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'size',
+    'example_caption': 'Compute size of each group.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - If the DataFrame is grouped by several columns, result is a DataFrame with key columns and column \
+'size' instead of a Series indexed by MultiIndex
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': ''
+})
 
 
-sdc_pandas_dataframe_groupby_count.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
-    'method_name': 'count',
-    'example_caption': 'Compute count of group, excluding missing values.',
+sdc_pandas_dataframe_groupby_cumcount.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'cumcount',
+    'example_caption': 'Number each row within its group.',
     'limitations_block':
         f"""
         Limitations
         -----------
+        - Result is :obj:`pandas.Series` aligned with rows of the DataFrame
         - {performance_limitation}
         """,
     'see_also':
@@ -651,31 +3288,44 @@ sdc_pandas_dataframe_groupby_count.__doc__ = sdc_pandas_dataframe_groupby_docstr
         :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
             Group DataFrame using a mapper or by a Series of columns.
     """,
-    'extra_params': ''
+    'extra_params': """
+    ascending: :obj:`bool`
+        Number rows from the first (default) or from the last row of group"""
 })
 
 
-sdc_pandas_dataframe_groupby_max.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
-    'method_name': 'max',
-    'example_caption': 'Compute max of group values.',
+sdc_pandas_dataframe_groupby_cummax.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'cummax',
+    'example_caption': 'Compute cumulative max of values within groups.',
     'limitations_block':
         f"""
         Limitations
         -----------
+        - Transformations are applied to numeric columns only, rows with missing group keys get NaN \
+(or 0 in integer results)
         - {performance_limitation}
         """,
-    'see_also': '',
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
     'extra_params': ''
 })
 
 
-sdc_pandas_dataframe_groupby_mean.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
-    'method_name': 'mean',
-    'example_caption': 'Compute mean of groups, excluding missing values.',
+sdc_pandas_dataframe_groupby_cummin.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'cummin',
+    'example_caption': 'Compute cumulative min of values within groups.',
     'limitations_block':
         f"""
         Limitations
         -----------
+        - Transformations are applied to numeric columns only, rows with missing group keys get NaN \
+(or 0 in integer results)
         - {performance_limitation}
         """,
     'see_also':
@@ -690,13 +3340,15 @@ sdc_pandas_dataframe_groupby_mean.__doc__ = sdc_pandas_dataframe_groupby_docstri
 })
 
 
-sdc_pandas_dataframe_groupby_median.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
-    'method_name': 'median',
-    'example_caption': 'Compute median of groups, excluding missing values.',
+sdc_pandas_dataframe_groupby_cumprod.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'cumprod',
+    'example_caption': 'Compute cumulative product of values within groups.',
     'limitations_block':
         f"""
         Limitations
         -----------
+        - Transformations are applied to numeric columns only, rows with missing group keys get NaN \
+(or 0 in integer results)
         - {performance_limitation}
         """,
     'see_also':
@@ -711,41 +3363,65 @@ sdc_pandas_dataframe_groupby_median.__doc__ = sdc_pandas_dataframe_groupby_docst
 })
 
 
-sdc_pandas_dataframe_groupby_min.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
-    'method_name': 'min',
-    'example_caption': 'Compute min of group values.',
+sdc_pandas_dataframe_groupby_cumsum.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'cumsum',
+    'example_caption': 'Compute cumulative sum of values within groups.',
     'limitations_block':
         f"""
         Limitations
         -----------
+        - Transformations are applied to numeric columns only, rows with missing group keys get NaN \
+(or 0 in integer results)
         - {performance_limitation}
         """,
-    'see_also': '',
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
     'extra_params': ''
 })
 
 
-sdc_pandas_dataframe_groupby_prod.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
-    'method_name': 'prod',
-    'example_caption': 'Compute prod of group values.',
+sdc_pandas_dataframe_groupby_diff.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'diff',
+    'example_caption': 'Compute difference of values with values of preceding rows of the same group.',
     'limitations_block':
         f"""
         Limitations
         -----------
+        - Parameters ``axis`` and ``fill_value`` are unsupported
+        - Transformations are applied to numeric columns only, rows with missing group keys get NaN \
+(or 0 in integer results)
         - {performance_limitation}
         """,
-    'see_also': '',
-    'extra_params': ''
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': """
+    periods: :obj:`int`
+        Number of rows of the group to shift for computing difference"""
 })
 
 
-sdc_pandas_dataframe_groupby_std.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
-    'method_name': 'std',
-    'example_caption': 'Compute standard deviation of groups, excluding missing values.',
+sdc_pandas_dataframe_groupby_rank.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'rank',
+    'example_caption': 'Compute rank of values within groups.',
     'limitations_block':
         f"""
         Limitations
         -----------
+        - Parameter ``na_option`` is supported with default value ``'keep'`` only
+        - Transformations are applied to numeric columns only, rows with missing group keys get NaN \
+(or 0 in integer results)
         - {performance_limitation}
         """,
     'see_also':
@@ -756,31 +3432,55 @@ sdc_pandas_dataframe_groupby_std.__doc__ = sdc_pandas_dataframe_groupby_docstrin
         :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
             Group DataFrame using a mapper or by a Series of columns.
     """,
-    'extra_params': ''
+    'extra_params': """
+    method: :obj:`str`
+        How to rank equal values: 'average', 'min', 'max', 'first' or 'dense'
+    ascending: :obj:`bool`
+        Rank values in ascending or descending order
+    na_option: :obj:`str`
+        How to rank NaN values, only 'keep' is supported
+    pct: :obj:`bool`
+        Whether to display ranks in percentile form"""
 })
 
 
-sdc_pandas_dataframe_groupby_sum.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
-    'method_name': 'sum',
-    'example_caption': 'Compute sum of groups, excluding missing values.',
+sdc_pandas_dataframe_groupby_shift.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'shift',
+    'example_caption': 'Shift values by number of rows within groups.',
     'limitations_block':
         f"""
         Limitations
         -----------
+        - Parameters ``freq``, ``axis`` and ``fill_value`` are unsupported
+        - Transformations are applied to numeric columns only, rows with missing group keys get NaN \
+(or 0 in integer results)
         - {performance_limitation}
         """,
-    'see_also': '',
-    'extra_params': ''
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': """
+    periods: :obj:`int`
+        Number of rows of the group to shift"""
 })
 
 
-sdc_pandas_dataframe_groupby_var.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
-    'method_name': 'var',
-    'example_caption': 'Compute variance of groups, excluding missing values.',
+sdc_pandas_dataframe_groupby_transform.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'transform',
+    'example_caption': 'Broadcast results of reduction of groups to their rows.',
     'limitations_block':
         f"""
         Limitations
         -----------
+        - Parameter ``func`` is supported as literal name of function computed in a single pass over data: \
+count, first, last, max, mean, min, prod, std, sum, var
+        - Transformations are applied to numeric columns only, rows with missing group keys get NaN \
+(or 0 in integer results)
         - {performance_limitation}
         """,
     'see_also':
@@ -791,5 +3491,59 @@ sdc_pandas_dataframe_groupby_var.__doc__ = sdc_pandas_dataframe_groupby_docstrin
         :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
             Group DataFrame using a mapper or by a Series of columns.
     """,
-    'extra_params': ''
+    'extra_params': """
+    func: :obj:`str`
+        Name of function reducing groups"""
+})
+
+
+sdc_pandas_dataframe_groupby_expanding.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'expanding',
+    'example_caption': 'Compute expanding sum of values within groups.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Parameters ``center`` and ``axis`` are supported only with default values
+        - Results of window methods are aligned with rows of the grouped DataFrame instead of being indexed \
+by MultiIndex of group keys and original index
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+        :ref:`DataFrame.rolling <pandas.DataFrame.rolling>`
+            Provides rolling window calculations.
+    """,
+    'extra_params': """
+    min_periods: :obj:`int`
+        Minimum number of observations in window required to have a value"""
+})
+
+
+sdc_pandas_dataframe_groupby_rolling.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'rolling',
+    'example_caption': 'Compute rolling mean of values within groups.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Parameters ``center``, ``win_type``, ``on``, ``axis`` and ``closed`` are supported only with default values
+        - Results of window methods are aligned with rows of the grouped DataFrame instead of being indexed \
+by MultiIndex of group keys and original index
+        """,
+    'see_also':
+    """
+    .. seealso::
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+        :ref:`DataFrame.rolling <pandas.DataFrame.rolling>`
+            Provides rolling window calculations.
+    """,
+    'extra_params': """
+    window: :obj:`int`
+        Size of the moving window
+    min_periods: :obj:`int`
+        Minimum number of observations in window required to have a value"""
 })
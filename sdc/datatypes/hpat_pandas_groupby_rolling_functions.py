@@ -0,0 +1,474 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+
+import numba
+import numpy
+import pandas
+
+from numba.core import types
+from numba.extending import register_jitable
+
+from sdc.datatypes.hpat_pandas_groupby_rolling_types import (
+    DataFrameGroupByRollingType, SeriesGroupByRollingType)
+from sdc.datatypes.hpat_pandas_series_rolling_functions import (
+    compensated_mean_result_or_nan, compensated_sum_result_or_nan, deque_result_or_nan, gen_init_moments,
+    moments_kurt_result_or_nan, moments_skew_result_or_nan, moments_std_result_or_nan, moments_var_result_or_nan,
+    result, result_or_nan, init_deque, pop_compensated_sum, pop_count, pop_deque, pop_moments,
+    put_compensated_sum, put_count, put_max, put_min, put_moments)
+from sdc.utilities.sdc_typing_utils import TypeChecker
+from sdc.utilities.utils import sdc_overload_method
+
+
+sdc_pandas_dataframe_groupby_rolling_docstring_tmpl = """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.core.window.RollingGroupby.{method_name}
+
+    Limitations
+    -----------
+    - Result is aligned with rows of the grouped DataFrame (as results of GroupBy.transform) \
+instead of being indexed by MultiIndex of group keys and original index
+    - Numeric columns are processed only, rows with missing group keys get NaN results
+
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/dataframe/groupby/dataframe_groupby_rolling_{method_name}.py
+       :language: python
+       :lines: 27-
+       :caption: {example_caption}
+       :name: ex_dataframe_groupby_rolling_{method_name}
+
+    .. command-output:: python ./dataframe/groupby/dataframe_groupby_rolling_{method_name}.py
+       :cwd: ../../../examples
+
+    .. seealso::
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+        :ref:`DataFrame.rolling <pandas.DataFrame.rolling>`
+            Calling object with a DataFrame.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas DataFrame method :meth:`pandas.DataFrame.groupby.rolling.{method_name}()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_groupby.TestGroupBy.test_dataframe_groupby_rolling*
+
+    Parameters
+    ----------
+    self: :class:`pandas.DataFrame.groupby.rolling`
+        input arg{extra_params}
+
+    Returns
+    -------
+    :obj:`pandas.DataFrame`
+         returns :obj:`pandas.DataFrame` object
+"""
+
+
+def gen_sdc_groupby_rolling_group_impl(pop, put, get_result=result_or_nan, init_result=numpy.nan,
+                                       init_state=None, use_positions=False, use_ddof=False):
+    """Generate function computing rolling window results for rows of one group based on pop/put funcs.
+    Values of the group are gathered into contiguous array, init_state allocates state sized by the window
+    limited by the group size, use_positions passes positions of this array to pop/put (min/max keep them
+    in the monotonic deque), results are written to output_arr at positions of group rows"""
+    use_state = init_state is not None
+
+    def impl(arr, group_positions, output_arr, win, minp, ddof):
+        values = arr[group_positions]
+        nfinite = 0
+        if use_state == True:  # noqa
+            result = init_state(min(win, len(values)))
+        else:
+            result = init_result
+
+        for idx in range(len(values)):
+            if use_positions == True:  # noqa
+                nfinite, result = put(values[idx], nfinite, result, idx)
+            else:
+                nfinite, result = put(values[idx], nfinite, result)
+            if idx >= win:
+                pop_value = values[idx - win]
+                if use_positions == True:  # noqa
+                    nfinite, result = pop(pop_value, nfinite, result, idx - win)
+                else:
+                    nfinite, result = pop(pop_value, nfinite, result)
+
+            if use_ddof == True:  # noqa
+                output_arr[group_positions[idx]] = get_result(nfinite, minp, result, ddof)
+            else:
+                output_arr[group_positions[idx]] = get_result(nfinite, minp, result)
+
+    return register_jitable(impl)
+
+
+sdc_groupby_rolling_group_impls = {
+    'count': gen_sdc_groupby_rolling_group_impl(
+        pop_count, put_count, get_result=result, init_result=0.),
+    'kurt': gen_sdc_groupby_rolling_group_impl(
+        pop_moments, put_moments, get_result=moments_kurt_result_or_nan, init_state=gen_init_moments(4)),
+    'max': gen_sdc_groupby_rolling_group_impl(
+        pop_deque, put_max, get_result=deque_result_or_nan, init_state=init_deque, use_positions=True),
+    'mean': gen_sdc_groupby_rolling_group_impl(
+        pop_compensated_sum, put_compensated_sum, get_result=compensated_mean_result_or_nan,
+        init_result=(0., 0.)),
+    'min': gen_sdc_groupby_rolling_group_impl(
+        pop_deque, put_min, get_result=deque_result_or_nan, init_state=init_deque, use_positions=True),
+    'skew': gen_sdc_groupby_rolling_group_impl(
+        pop_moments, put_moments, get_result=moments_skew_result_or_nan, init_state=gen_init_moments(3)),
+    'sum': gen_sdc_groupby_rolling_group_impl(
+        pop_compensated_sum, put_compensated_sum, get_result=compensated_sum_result_or_nan,
+        init_result=(0., 0.)),
+    'var': gen_sdc_groupby_rolling_group_impl(
+        pop_moments, put_moments, get_result=moments_var_result_or_nan, init_state=gen_init_moments(2),
+        use_ddof=True),
+    'std': gen_sdc_groupby_rolling_group_impl(
+        pop_moments, put_moments, get_result=moments_std_result_or_nan, init_state=gen_init_moments(2),
+        use_ddof=True),
+}
+
+
+def _sdc_groupby_rolling_codegen(method_name, data, data_vars, result_lines, with_ddof):
+    """Generate implementation of groupby rolling method, data lines define data_vars arrays,
+    groups are processed in parallel each one running rolling window over its own rows"""
+    impl_name = f'_groupby_rolling_{method_name}_impl'
+    impl_params = 'self, ddof=1' if with_ddof else 'self'
+    func_lines = [
+        f'def {impl_name}({impl_params}):',
+        f'  groupby = self._data',
+        f'  win = self._window',
+        f'  minp = self._min_periods',
+        f'  labels = groupby._labels',
+        f'  offsets = groupby._offsets',
+        f'  positions = groupby._positions',
+        f'  n_groups = len(offsets) - 1',
+    ]
+    if not with_ddof:
+        func_lines.append(f'  ddof = 1')
+
+    func_lines += data
+    for i in range(len(data_vars)):
+        func_lines.append(f'  result_data_{i} = numpy.empty(len(labels), dtype=numpy.float64)')
+
+    func_lines += [
+        f'  for k in numba.prange(n_groups):',
+        f'    group_positions = positions[offsets[k]:offsets[k + 1]]',
+    ]
+    for i, data_var in enumerate(data_vars):
+        func_lines.append(f'    rolling_group_impl({data_var}, group_positions, result_data_{i}, win, minp, ddof)')
+
+    func_lines += [
+        f'  if offsets[n_groups] < len(labels):',
+        f'    for j in numba.prange(len(labels)):',
+        f'      if labels[j] < 0:',
+    ]
+    for i in range(len(data_vars)):
+        func_lines.append(f'        result_data_{i}[j] = numpy.nan')
+    func_lines += result_lines
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'numpy': numpy, 'numba': numba, 'pandas': pandas,
+                   'rolling_group_impl': sdc_groupby_rolling_group_impls[method_name]}
+
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    return loc_vars[impl_name]
+
+
+def sdc_pandas_dataframe_groupby_rolling_method(self, method_name, with_ddof=False):
+    """Returns implementation of DataFrameGroupBy rolling method applied to all numeric target columns"""
+    groupby_type = self.data
+    df_type = groupby_type.parent
+    selected_cols_set = set(groupby_type.target_columns)
+
+    data_lines = [f'  df = groupby._parent']
+    data_vars, res_columns = [], []
+    for i, name in enumerate(df_type.columns):
+        if name not in selected_cols_set or not isinstance(df_type.data[i].dtype, types.Number):
+            continue
+        col_loc = df_type.column_loc[name]
+        data_lines.append(f'  column_data_{len(data_vars)} = df._data[{col_loc.type_id}][{col_loc.col_id}]')
+        data_vars.append(f'column_data_{len(data_vars)}')
+        res_columns.append(name)
+
+    data = ', '.join(f'\'{name}\': result_data_{i}' for i, name in enumerate(res_columns))
+    result_lines = [f'  return pandas.DataFrame({{{data}}}, index=df._index)']
+
+    return _sdc_groupby_rolling_codegen(method_name, data_lines, data_vars, result_lines, with_ddof)
+
+
+def sdc_pandas_series_groupby_rolling_method(self, method_name, with_ddof=False):
+    """Returns implementation of SeriesGroupBy rolling method"""
+    ty_checker = TypeChecker(f'Method rolling.{method_name}().')
+    series_dtype = self.data.parent.dtype
+    if not isinstance(series_dtype, types.Number):
+        ty_checker.raise_exc(series_dtype, 'number', 'self.data.parent.dtype')
+
+    data_lines = [f'  series = groupby._parent',
+                  f'  series_data = series._data']
+    result_lines = [f'  return pandas.Series(result_data_0, index=series._index, name=series._name)']
+
+    return _sdc_groupby_rolling_codegen(method_name, data_lines, ['series_data'], result_lines, with_ddof)
+
+
+@sdc_overload_method(DataFrameGroupByRollingType, 'count')
+def sdc_pandas_dataframe_groupby_rolling_count(self):
+
+    ty_checker = TypeChecker('Method rolling.count().')
+    ty_checker.check(self, DataFrameGroupByRollingType)
+
+    return sdc_pandas_dataframe_groupby_rolling_method(self, 'count')
+
+
+@sdc_overload_method(DataFrameGroupByRollingType, 'kurt')
+def sdc_pandas_dataframe_groupby_rolling_kurt(self):
+
+    ty_checker = TypeChecker('Method rolling.kurt().')
+    ty_checker.check(self, DataFrameGroupByRollingType)
+
+    return sdc_pandas_dataframe_groupby_rolling_method(self, 'kurt')
+
+
+@sdc_overload_method(DataFrameGroupByRollingType, 'max')
+def sdc_pandas_dataframe_groupby_rolling_max(self):
+
+    ty_checker = TypeChecker('Method rolling.max().')
+    ty_checker.check(self, DataFrameGroupByRollingType)
+
+    return sdc_pandas_dataframe_groupby_rolling_method(self, 'max')
+
+
+@sdc_overload_method(DataFrameGroupByRollingType, 'mean')
+def sdc_pandas_dataframe_groupby_rolling_mean(self):
+
+    ty_checker = TypeChecker('Method rolling.mean().')
+    ty_checker.check(self, DataFrameGroupByRollingType)
+
+    return sdc_pandas_dataframe_groupby_rolling_method(self, 'mean')
+
+
+@sdc_overload_method(DataFrameGroupByRollingType, 'min')
+def sdc_pandas_dataframe_groupby_rolling_min(self):
+
+    ty_checker = TypeChecker('Method rolling.min().')
+    ty_checker.check(self, DataFrameGroupByRollingType)
+
+    return sdc_pandas_dataframe_groupby_rolling_method(self, 'min')
+
+
+@sdc_overload_method(DataFrameGroupByRollingType, 'skew')
+def sdc_pandas_dataframe_groupby_rolling_skew(self):
+
+    ty_checker = TypeChecker('Method rolling.skew().')
+    ty_checker.check(self, DataFrameGroupByRollingType)
+
+    return sdc_pandas_dataframe_groupby_rolling_method(self, 'skew')
+
+
+@sdc_overload_method(DataFrameGroupByRollingType, 'std')
+def sdc_pandas_dataframe_groupby_rolling_std(self, ddof=1):
+
+    ty_checker = TypeChecker('Method rolling.std().')
+    ty_checker.check(self, DataFrameGroupByRollingType)
+
+    if not isinstance(ddof, (int, types.Integer, types.Omitted)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    return sdc_pandas_dataframe_groupby_rolling_method(self, 'std', with_ddof=True)
+
+
+@sdc_overload_method(DataFrameGroupByRollingType, 'sum')
+def sdc_pandas_dataframe_groupby_rolling_sum(self):
+
+    ty_checker = TypeChecker('Method rolling.sum().')
+    ty_checker.check(self, DataFrameGroupByRollingType)
+
+    return sdc_pandas_dataframe_groupby_rolling_method(self, 'sum')
+
+
+@sdc_overload_method(DataFrameGroupByRollingType, 'var')
+def sdc_pandas_dataframe_groupby_rolling_var(self, ddof=1):
+
+    ty_checker = TypeChecker('Method rolling.var().')
+    ty_checker.check(self, DataFrameGroupByRollingType)
+
+    if not isinstance(ddof, (int, types.Integer, types.Omitted)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    return sdc_pandas_dataframe_groupby_rolling_method(self, 'var', with_ddof=True)
+
+
+@sdc_overload_method(SeriesGroupByRollingType, 'count')
+def sdc_pandas_series_groupby_rolling_count(self):
+
+    ty_checker = TypeChecker('Method rolling.count().')
+    ty_checker.check(self, SeriesGroupByRollingType)
+
+    return sdc_pandas_series_groupby_rolling_method(self, 'count')
+
+
+@sdc_overload_method(SeriesGroupByRollingType, 'kurt')
+def sdc_pandas_series_groupby_rolling_kurt(self):
+
+    ty_checker = TypeChecker('Method rolling.kurt().')
+    ty_checker.check(self, SeriesGroupByRollingType)
+
+    return sdc_pandas_series_groupby_rolling_method(self, 'kurt')
+
+
+@sdc_overload_method(SeriesGroupByRollingType, 'max')
+def sdc_pandas_series_groupby_rolling_max(self):
+
+    ty_checker = TypeChecker('Method rolling.max().')
+    ty_checker.check(self, SeriesGroupByRollingType)
+
+    return sdc_pandas_series_groupby_rolling_method(self, 'max')
+
+
+@sdc_overload_method(SeriesGroupByRollingType, 'mean')
+def sdc_pandas_series_groupby_rolling_mean(self):
+
+    ty_checker = TypeChecker('Method rolling.mean().')
+    ty_checker.check(self, SeriesGroupByRollingType)
+
+    return sdc_pandas_series_groupby_rolling_method(self, 'mean')
+
+
+@sdc_overload_method(SeriesGroupByRollingType, 'min')
+def sdc_pandas_series_groupby_rolling_min(self):
+
+    ty_checker = TypeChecker('Method rolling.min().')
+    ty_checker.check(self, SeriesGroupByRollingType)
+
+    return sdc_pandas_series_groupby_rolling_method(self, 'min')
+
+
+@sdc_overload_method(SeriesGroupByRollingType, 'skew')
+def sdc_pandas_series_groupby_rolling_skew(self):
+
+    ty_checker = TypeChecker('Method rolling.skew().')
+    ty_checker.check(self, SeriesGroupByRollingType)
+
+    return sdc_pandas_series_groupby_rolling_method(self, 'skew')
+
+
+@sdc_overload_method(SeriesGroupByRollingType, 'std')
+def sdc_pandas_series_groupby_rolling_std(self, ddof=1):
+
+    ty_checker = TypeChecker('Method rolling.std().')
+    ty_checker.check(self, SeriesGroupByRollingType)
+
+    if not isinstance(ddof, (int, types.Integer, types.Omitted)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    return sdc_pandas_series_groupby_rolling_method(self, 'std', with_ddof=True)
+
+
+@sdc_overload_method(SeriesGroupByRollingType, 'sum')
+def sdc_pandas_series_groupby_rolling_sum(self):
+
+    ty_checker = TypeChecker('Method rolling.sum().')
+    ty_checker.check(self, SeriesGroupByRollingType)
+
+    return sdc_pandas_series_groupby_rolling_method(self, 'sum')
+
+
+@sdc_overload_method(SeriesGroupByRollingType, 'var')
+def sdc_pandas_series_groupby_rolling_var(self, ddof=1):
+
+    ty_checker = TypeChecker('Method rolling.var().')
+    ty_checker.check(self, SeriesGroupByRollingType)
+
+    if not isinstance(ddof, (int, types.Integer, types.Omitted)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    return sdc_pandas_series_groupby_rolling_method(self, 'var', with_ddof=True)
+
+
+sdc_pandas_dataframe_groupby_rolling_count.__doc__ = sdc_pandas_dataframe_groupby_rolling_docstring_tmpl.format(**{
+    'method_name': 'count',
+    'example_caption': 'Count of non-NaN values in rolling windows within groups.',
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_rolling_kurt.__doc__ = sdc_pandas_dataframe_groupby_rolling_docstring_tmpl.format(**{
+    'method_name': 'kurt',
+    'example_caption': 'Unbiased rolling kurtosis within groups.',
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_rolling_max.__doc__ = sdc_pandas_dataframe_groupby_rolling_docstring_tmpl.format(**{
+    'method_name': 'max',
+    'example_caption': 'Rolling maximum within groups.',
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_rolling_mean.__doc__ = sdc_pandas_dataframe_groupby_rolling_docstring_tmpl.format(**{
+    'method_name': 'mean',
+    'example_caption': 'Rolling mean within groups.',
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_rolling_min.__doc__ = sdc_pandas_dataframe_groupby_rolling_docstring_tmpl.format(**{
+    'method_name': 'min',
+    'example_caption': 'Rolling minimum within groups.',
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_rolling_skew.__doc__ = sdc_pandas_dataframe_groupby_rolling_docstring_tmpl.format(**{
+    'method_name': 'skew',
+    'example_caption': 'Unbiased rolling skewness within groups.',
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_rolling_std.__doc__ = sdc_pandas_dataframe_groupby_rolling_docstring_tmpl.format(**{
+    'method_name': 'std',
+    'example_caption': 'Rolling standard deviation within groups.',
+    'extra_params': '\n    ddof: :obj:`int`\n        Delta Degrees of Freedom.'
+})
+
+
+sdc_pandas_dataframe_groupby_rolling_sum.__doc__ = sdc_pandas_dataframe_groupby_rolling_docstring_tmpl.format(**{
+    'method_name': 'sum',
+    'example_caption': 'Rolling sum within groups.',
+    'extra_params': ''
+})
+
+
+sdc_pandas_dataframe_groupby_rolling_var.__doc__ = sdc_pandas_dataframe_groupby_rolling_docstring_tmpl.format(**{
+    'method_name': 'var',
+    'example_caption': 'Rolling variance within groups.',
+    'extra_params': '\n    ddof: :obj:`int`\n        Delta Degrees of Freedom.'
+})
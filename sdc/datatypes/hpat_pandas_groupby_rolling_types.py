@@ -0,0 +1,68 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+
+from numba.extending import intrinsic, register_model
+from sdc.datatypes.hpat_pandas_rolling_types import (
+    gen_hpat_pandas_rolling_init, RollingType, RollingTypeModel)
+
+
+class DataFrameGroupByRollingType(RollingType):
+    """Type definition for pandas.DataFrame.groupby.rolling/expanding functions handling."""
+    def __init__(self, data, win_type=None, on=None, closed=None, freq=None, win_type_name=None):
+        super(DataFrameGroupByRollingType, self).__init__('DataFrameGroupByRollingType',
+                                                          data, win_type=win_type,
+                                                          on=on, closed=closed, freq=freq,
+                                                          win_type_name=win_type_name)
+
+
+@register_model(DataFrameGroupByRollingType)
+class DataFrameGroupByRollingTypeModel(RollingTypeModel):
+    """Model for DataFrameGroupByRollingType type."""
+    def __init__(self, dmm, fe_type):
+        super(DataFrameGroupByRollingTypeModel, self).__init__(dmm, fe_type)
+
+
+class SeriesGroupByRollingType(RollingType):
+    """Type definition for pandas.Series.groupby.rolling/expanding functions handling."""
+    def __init__(self, data, win_type=None, on=None, closed=None, freq=None, win_type_name=None):
+        super(SeriesGroupByRollingType, self).__init__('SeriesGroupByRollingType',
+                                                       data, win_type=win_type,
+                                                       on=on, closed=closed, freq=freq,
+                                                       win_type_name=win_type_name)
+
+
+@register_model(SeriesGroupByRollingType)
+class SeriesGroupByRollingTypeModel(RollingTypeModel):
+    """Model for SeriesGroupByRollingType type."""
+    def __init__(self, dmm, fe_type):
+        super(SeriesGroupByRollingTypeModel, self).__init__(dmm, fe_type)
+
+
+_hpat_pandas_df_groupby_rolling_init = intrinsic(gen_hpat_pandas_rolling_init(
+    DataFrameGroupByRollingType))
+_hpat_pandas_series_groupby_rolling_init = intrinsic(gen_hpat_pandas_rolling_init(
+    SeriesGroupByRollingType))
@@ -47,21 +47,42 @@ class DataFrameGroupByType(types.Type):
     def key(self):
         return self.parent, self.col_id, self.target_columns
 
+    @property
+    def by_col_ids(self):
+        """ Ids of columns the DataFrame is grouped by, col_id is either literal or tuple of literals """
+        if isinstance(self.col_id, types.BaseTuple):
+            return tuple(a.literal_value for a in self.col_id)
+        return (self.col_id.literal_value, )
+
+    @property
+    def by_dtype(self):
+        """ Type of group keys, composite keys are represented as tuples of values of all by columns """
+        by_dtypes = [self.parent.data[i].dtype for i in self.by_col_ids]
+        if len(by_dtypes) == 1:
+            return by_dtypes[0]
+        return types.BaseTuple.from_types(by_dtypes)
+
+
+def _groupby_index_members(by_dtype):
+    """ Members of groupby models keeping compact index of groups: hash tables partitioning keys by hash
+    and mapping them to first rows of groups, group id of each row and positions of rows of each group
+    in CSR layout """
+    return [
+        ('keys_map', types.List(types.containers.DictType(by_dtype, types.int64))),
+        ('labels', types.Array(types.int64, 1, 'C')),
+        ('offsets', types.Array(types.int64, 1, 'C')),
+        ('positions', types.Array(types.int64, 1, 'C')),
+    ]
+
 
 @register_model(DataFrameGroupByType)
 class DataFrameGroupByModel(models.StructModel):
     def __init__(self, dmm, fe_type):
-        by_series_dtype = fe_type.parent.data[fe_type.col_id.literal_value].dtype
-        ty_data = types.containers.DictType(
-            by_series_dtype,
-            types.containers.ListType(types.int64)
-        )
-
         n_target_cols = len(fe_type.target_columns)
         members = [
             ('parent', fe_type.parent),
-            ('col_id', types.int64),
-            ('data', ty_data),
+            ('col_id', fe_type.col_id),
+            *_groupby_index_members(fe_type.by_dtype),
             ('sort', types.bool_),
             ('target_default', types.bool_),
             ('target_columns', types.UniTuple(string_type, n_target_cols))
@@ -71,7 +92,10 @@ class DataFrameGroupByModel(models.StructModel):
 
 make_attribute_wrapper(DataFrameGroupByType, 'parent', '_parent')
 make_attribute_wrapper(DataFrameGroupByType, 'col_id', '_col_id')
-make_attribute_wrapper(DataFrameGroupByType, 'data', '_data')
+make_attribute_wrapper(DataFrameGroupByType, 'keys_map', '_keys_map')
+make_attribute_wrapper(DataFrameGroupByType, 'labels', '_labels')
+make_attribute_wrapper(DataFrameGroupByType, 'offsets', '_offsets')
+make_attribute_wrapper(DataFrameGroupByType, 'positions', '_positions')
 make_attribute_wrapper(DataFrameGroupByType, 'sort', '_sort')
 make_attribute_wrapper(DataFrameGroupByType, 'target_default', '_target_default')
 make_attribute_wrapper(DataFrameGroupByType, 'target_columns', '_target_columns')
@@ -97,19 +121,20 @@ class SeriesGroupByType(types.Type):
 class SeriesGroupByModel(models.StructModel):
     def __init__(self, dmm, fe_type):
         by_dtype = fe_type.by_data.dtype
-        ty_data = types.containers.DictType(
-            by_dtype,
-            types.containers.ListType(types.int64)
-        )
 
         members = [
             ('parent', fe_type.parent),
-            ('data', ty_data),
+            ('by', fe_type.by_data),
+            *_groupby_index_members(by_dtype),
             ('sort', types.bool_)
         ]
         super(SeriesGroupByModel, self).__init__(dmm, fe_type, members)
 
 
 make_attribute_wrapper(SeriesGroupByType, 'parent', '_parent')
-make_attribute_wrapper(SeriesGroupByType, 'data', '_data')
+make_attribute_wrapper(SeriesGroupByType, 'by', '_by')
+make_attribute_wrapper(SeriesGroupByType, 'keys_map', '_keys_map')
+make_attribute_wrapper(SeriesGroupByType, 'labels', '_labels')
+make_attribute_wrapper(SeriesGroupByType, 'offsets', '_offsets')
+make_attribute_wrapper(SeriesGroupByType, 'positions', '_positions')
 make_attribute_wrapper(SeriesGroupByType, 'sort', '_sort')
@@ -24,25 +24,40 @@
 # EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 # *****************************************************************************
 
+from numba import literally, prange
 from numba.core import cgutils, types
 from numba.core.datamodel import StructModel
 from numba.extending import make_attribute_wrapper, models
 from numba.core.typing.templates import signature
+from pandas.tseries.frequencies import to_offset
 from sdc.utilities.sdc_typing_utils import TypeChecker
+from sdc.utilities.utils import sdc_register_jitable
 
 
 class RollingType(types.Type):
-    """Type definition for pandas.rolling functions handling."""
-    def __init__(self, ty, data, win_type=None, on=None, closed=None):
+    """Type definition for pandas.rolling functions handling.
+    Offset windows (e.g. '5s') keep offset string in freq, window member holds offset in nanoseconds.
+    Weighted windows keep window type name (e.g. 'triang') in win_type_name."""
+    def __init__(self, ty, data, win_type=None, on=None, closed=None, freq=None, win_type_name=None):
         self.data = data
         self.win_type = win_type or types.none
         self.on = on or types.none
         self.closed = closed or types.none
+        self.freq = freq
+        self.win_type_name = win_type_name
 
-        name_tmpl = '{}({}, win_type={}, on={}, closed={})'
-        name = name_tmpl.format(ty, data, self.win_type, self.on, self.closed)
+        name_tmpl = '{}({}, win_type={}, on={}, closed={}, freq={}, win_type_name={})'
+        name = name_tmpl.format(ty, data, self.win_type, self.on, self.closed, self.freq, self.win_type_name)
         super(RollingType, self).__init__(name)
 
+    @property
+    def is_freq_type(self):
+        return self.freq is not None
+
+    @property
+    def is_weighted_type(self):
+        return self.win_type_name is not None
+
 
 class RollingTypeModel(StructModel):
     """Model for RollingType type."""
@@ -78,7 +93,16 @@ def gen_hpat_pandas_rolling_init(ty):
                                   center=False, win_type=None,
                                   on=None, axis=0, closed=None):
         """Internal Numba required function to register RollingType."""
-        ret_typ = ty(self, win_type, on, closed)
+        freq = None
+        if isinstance(window, types.StringLiteral):
+            freq = window.literal_value
+
+        win_type_name = None
+        if isinstance(win_type, types.StringLiteral):
+            win_type_name = win_type.literal_value
+
+        ret_typ = ty(self, None if win_type_name else win_type, on, closed,
+                     freq=freq, win_type_name=win_type_name)
         sig = signature(ret_typ, self, window, min_periods,
                         center, win_type, on, axis, closed)
 
@@ -87,10 +111,14 @@ def gen_hpat_pandas_rolling_init(ty):
             data, window, min_periods, center, win_type, on, axis, closed = args
             rolling = cgutils.create_struct_proxy(sig.return_type)(context, builder)
             rolling.data = data
-            rolling.window = window
+            if freq is not None:
+                rolling.window = context.get_constant(types.intp, to_offset(freq).nanos)
+            else:
+                rolling.window = window
             rolling.min_periods = min_periods
             rolling.center = center
-            rolling.win_type = win_type
+            if win_type_name is None:
+                rolling.win_type = win_type
             rolling.on = on
             rolling.axis = axis
             rolling.closed = closed
@@ -105,14 +133,56 @@ def gen_hpat_pandas_rolling_init(ty):
     return _hpat_pandas_rolling_init
 
 
-def gen_sdc_pandas_rolling_overload_body(initializer, ty):
-    """Generate code of the overloaded method using associated DataType and constructor."""
+@sdc_register_jitable
+def sdc_rolling_index_is_monotonic(index):
+    """Check that index of offset window is monotonic increasing"""
+    n_decreasing = 0
+    for i in prange(1, len(index)):
+        if index[i] < index[i - 1]:
+            n_decreasing += 1
+
+    return n_decreasing == 0
+
+
+sdc_rolling_supported_win_types = ('triang', 'gaussian', 'hann')
+
+
+def gen_sdc_pandas_rolling_overload_body(initializer, ty, allow_offset=False, allow_center=False,
+                                         allow_win_type=False):
+    """Generate code of the overloaded method using associated DataType and constructor.
+    If allow_offset is set window can be a fixed frequency offset for data with datetime64 index.
+    If allow_center is set labels can be set at the center of the window.
+    If allow_win_type is set window can be weighted by one of sdc_rolling_supported_win_types."""
     def sdc_pandas_rolling(self, window, min_periods=None, center=False,
                            win_type=None, on=None, axis=0, closed=None):
         ty_checker = TypeChecker('Method rolling().')
         ty_checker.check(self, ty)
 
-        if not isinstance(window, types.Integer):
+        if allow_offset and isinstance(window, types.UnicodeType):
+            def sdc_pandas_rolling_unicode_window_impl(self, window, min_periods=None, center=False,
+                                                       win_type=None, on=None, axis=0, closed=None):
+                # literally raises special exception to call rolling with literal window got from unicode
+                return literally(window)
+
+            return sdc_pandas_rolling_unicode_window_impl
+
+        if allow_win_type and isinstance(win_type, types.UnicodeType):
+            def sdc_pandas_rolling_unicode_win_type_impl(self, window, min_periods=None, center=False,
+                                                         win_type=None, on=None, axis=0, closed=None):
+                # literally raises special exception to call rolling with literal win_type got from unicode
+                return literally(win_type)
+
+            return sdc_pandas_rolling_unicode_win_type_impl
+
+        offset_window = allow_offset and isinstance(window, types.StringLiteral)
+        if offset_window:
+            if not (isinstance(self.index, types.Array) and isinstance(self.index.dtype, types.NPDatetime)):
+                ty_checker.raise_exc(window, 'int', 'window')
+            try:
+                to_offset(window.literal_value).nanos
+            except ValueError:
+                ty_checker.raise_exc(window, 'int, fixed frequency offset', 'window')
+        elif not isinstance(window, types.Integer):
             ty_checker.raise_exc(window, 'int', 'window')
 
         minp_accepted = (types.Omitted, types.NoneType, types.Integer)
@@ -127,6 +197,14 @@ def gen_sdc_pandas_rolling_overload_body(initializer, ty):
         if not isinstance(win_type, str_types) and win_type is not None:
             ty_checker.raise_exc(win_type, 'str', 'win_type')
 
+        weighted_window = allow_win_type and isinstance(win_type, types.StringLiteral)
+        if weighted_window:
+            if win_type.literal_value not in sdc_rolling_supported_win_types:
+                expected_win_types = ', '.join(repr(t) for t in sdc_rolling_supported_win_types)
+                ty_checker.raise_exc(win_type, expected_win_types, 'win_type')
+            if offset_window:
+                ty_checker.raise_exc(window, 'int', 'window')
+
         if not isinstance(on, str_types) and on is not None:
             ty_checker.raise_exc(on, 'str', 'on')
 
@@ -141,23 +219,40 @@ def gen_sdc_pandas_rolling_overload_body(initializer, ty):
 
         def sdc_pandas_rolling_impl(self, window, min_periods=None, center=False,
                                     win_type=None, on=None, axis=0, closed=None):
-            if window < 0:
-                raise ValueError('window must be non-negative')
-
-            if nan_minp == True:  # noqa
-                minp = window
+            if offset_window == True:  # noqa
+                if nan_minp == True:  # noqa
+                    minp = 1
+                else:
+                    minp = min_periods
+
+                if minp < 0:
+                    raise ValueError('min_periods must be >= 0')
+                if not sdc_rolling_index_is_monotonic(self._index):
+                    raise ValueError('index must be monotonic')
             else:
-                minp = min_periods
-
-            if minp < 0:
-                raise ValueError('min_periods must be >= 0')
-            if minp > window:
-                raise ValueError('min_periods must be <= window')
-
-            if center != False:  # noqa
+                if weighted_window == True:  # noqa
+                    if window <= 0:
+                        raise ValueError('window must be > 0')
+                elif window < 0:
+                    raise ValueError('window must be non-negative')
+
+                if nan_minp == True:  # noqa
+                    minp = window
+                else:
+                    minp = min_periods
+
+                if minp < 0:
+                    raise ValueError('min_periods must be >= 0')
+                if minp > window:
+                    raise ValueError('min_periods must be <= window')
+
+            if allow_center == True:  # noqa
+                if offset_window == True and center != False:  # noqa
+                    raise ValueError('center is not implemented for datetimelike and offset based windows')
+            elif center != False:  # noqa
                 raise ValueError('Method rolling(). The object center\n expected: False')
 
-            if win_type is not None:
+            if weighted_window == False and win_type is not None:  # noqa
                 raise ValueError('Method rolling(). The object win_type\n expected: None')
 
             if on is not None:
@@ -183,7 +278,12 @@ sdc_pandas_rolling_docstring_tmpl = """
 
     Limitations
     -----------
-    Parameters ``center``, ``win_type``, ``on``, ``axis`` and ``closed`` are supported only with default values.
+    Parameters ``on``, ``axis`` and ``closed`` are supported only with default values.
+    Offset ``window`` (e.g. '5s') is supported only as fixed frequency for {ty} with monotonic datetime64 index,
+    methods ``apply``, ``corr`` and ``cov`` do not support offset windows.
+    Parameter ``center`` is not supported with offset windows and by methods ``apply``, ``corr`` and ``cov``.
+    Parameter ``win_type`` supports only 'triang', 'gaussian' and 'hann' windows with integer ``window``,
+    weighted windows provide methods ``mean`` and ``sum``.
 
     Examples
     --------
@@ -196,7 +296,7 @@ sdc_pandas_rolling_docstring_tmpl = """
     .. command-output:: python ./{ty_lower}/rolling/{ty_lower}_rolling_min.py
        :cwd: ../../../examples
 
-    .. todo:: Add support of parameters ``center``, ``win_type``, ``on``, ``axis`` and ``closed``
+    .. todo:: Add support of parameters ``on``, ``axis`` and ``closed``
 
     .. seealso::
         :ref:`expanding <pandas.{ty}.expanding>`
@@ -222,10 +322,8 @@ sdc_pandas_rolling_docstring_tmpl = """
         Minimum number of observations in window required to have a value.
     center: :obj:`bool`
         Set the labels at the center of the window.
-        *unsupported*
     win_type: :obj:`str`
         Provide a window type.
-        *unsupported*
     on: :obj:`str`
         Column on which to calculate the rolling window.
         *unsupported*
@@ -0,0 +1,683 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+import numpy
+import pandas
+
+from numba import prange
+from numba.core.types import float64, Boolean, Omitted, NoneType
+
+from sdc.datatypes.hpat_pandas_series_ewm_types import SeriesEWMType
+from sdc.hiframes.pd_series_type import SeriesType
+from sdc.utilities.prange_utils import parallel_chunks
+from sdc.utilities.sdc_typing_utils import TypeChecker
+from sdc.utilities.utils import sdc_overload_method, sdc_register_jitable
+
+
+hpat_pandas_series_ewm_docstring_tmpl = """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.core.window.EWM.{method_name}
+{limitations_block}
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/series/ewm/series_ewm_{method_name}.py
+       :language: python
+       :lines: 27-
+       :caption: {example_caption}
+       :name: ex_series_ewm_{method_name}
+
+    .. command-output:: python ./series/ewm/series_ewm_{method_name}.py
+       :cwd: ../../../examples
+
+    .. literalinclude:: ../../../examples/dataframe/ewm/dataframe_ewm_{method_name}.py
+       :language: python
+       :lines: 27-
+       :caption: {example_caption}
+       :name: ex_dataframe_ewm_{method_name}
+
+    .. command-output:: python ./dataframe/ewm/dataframe_ewm_{method_name}.py
+       :cwd: ../../../examples
+
+    .. seealso::
+        :ref:`Series.ewm <pandas.Series.ewm>`
+            Calling object with a Series.
+        :ref:`DataFrame.ewm <pandas.DataFrame.ewm>`
+            Calling object with a DataFrame.
+        :ref:`Series.rolling.{method_name} <pandas.core.window.Rolling.{method_name}>`
+            Similar method for rolling window.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas Series method :meth:`pandas.Series.ewm.{method_name}()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_ewm.TestEWM.test_series_ewm_{method_name}
+
+    Parameters
+    ----------
+    self: :class:`pandas.Series.ewm`
+        input arg{extra_params}
+
+    Returns
+    -------
+    :obj:`pandas.Series`
+         returns :obj:`pandas.Series` object
+"""
+
+
+@sdc_register_jitable
+def ewm_value(arr, idx):
+    """Get element of the array as float, infinite elements and elements out of the array are missing"""
+    if idx < len(arr):
+        value = float64(arr[idx])
+        if numpy.isfinite(value):
+            return value
+
+    return numpy.nan
+
+
+@sdc_register_jitable
+def ewm_zsqrt(value):
+    """Square root which is zero for negative values"""
+    if value < 0.:
+        return 0.
+
+    return numpy.sqrt(value)
+
+
+@sdc_register_jitable
+def ewm_mean_chunk(input_arr, output_arr, start, stop, alpha, adjust, ignore_na, minp, avg, old_wt, nobs):
+    """Exponentially weighted mean of input_arr[start:stop] starting from state (avg, old_wt, nobs)"""
+    old_wt_factor = 1. - alpha
+    new_wt = 1. if adjust else alpha
+    for idx in range(start, stop):
+        value = ewm_value(input_arr, idx)
+        is_observation = not numpy.isnan(value)
+        nobs += is_observation
+        if not numpy.isnan(avg):
+            if is_observation or not ignore_na:
+                old_wt *= old_wt_factor
+                if is_observation:
+                    # avoid numerical errors on constant series
+                    if avg != value:
+                        avg = (old_wt * avg + new_wt * value) / (old_wt + new_wt)
+                    if adjust:
+                        old_wt += new_wt
+                    else:
+                        old_wt = 1.
+        elif is_observation:
+            avg = value
+
+        output_arr[idx] = avg if nobs >= minp else numpy.nan
+
+    return avg, old_wt, nobs
+
+
+@sdc_register_jitable
+def ewm_mean_transfer(input_arr, start, stop, alpha, adjust, ignore_na, transfer):
+    """
+    Compose linear transfer of the ewm mean state over input_arr[start:stop] up to the last observation.
+    State is homogeneous vector (S, W, Z) with avg = S / W and old_wt = W / Z,
+    state before the first observation is (0, 0, 1).
+    Returns number of observations and number of weight decays after the last observation.
+    """
+    f = 1. - alpha
+    s0, s1, s2 = 1., 0., 0.
+    w0, w1, w2 = 0., 1., 0.
+    z0, z1, z2 = 0., 0., 1.
+    nobs = 0
+    ndecays = 0
+    for idx in range(start, stop):
+        value = ewm_value(input_arr, idx)
+        if numpy.isnan(value):
+            if not ignore_na:
+                ndecays += 1
+            continue
+
+        decay = f * f ** ndecays
+        ndecays = 0
+        nobs += 1
+        if adjust:
+            s0, s1, s2 = decay * s0 + value * z0, decay * s1 + value * z1, decay * s2 + value * z2
+            w0, w1, w2 = decay * w0 + z0, decay * w1 + z1, decay * w2 + z2
+        else:
+            s0, s1, s2 = (decay * s0 + alpha * value * z0, decay * s1 + alpha * value * z1,
+                          decay * s2 + alpha * value * z2)
+            w0, w1, w2 = decay * w0 + alpha * z0, decay * w1 + alpha * z1, decay * w2 + alpha * z2
+            z0, z1, z2 = w0, w1, w2
+
+    transfer[0, 0], transfer[0, 1], transfer[0, 2] = s0, s1, s2
+    transfer[1, 0], transfer[1, 1], transfer[1, 2] = w0, w1, w2
+    transfer[2, 0], transfer[2, 1], transfer[2, 2] = z0, z1, z2
+
+    return nobs, ndecays
+
+
+@sdc_register_jitable
+def ewm_mean_carry(transfer, nobs, ndecays, alpha, avg, old_wt):
+    """Apply transfer of the chunk to the ewm mean state (avg, old_wt)"""
+    decay = (1. - alpha) ** ndecays
+    if nobs == 0:
+        if numpy.isnan(avg):
+            return avg, old_wt
+
+        return avg, old_wt * decay
+
+    if numpy.isnan(avg):
+        s, w, z = 0., 0., 1.
+    else:
+        s, w, z = avg * old_wt, old_wt, 1.
+
+    next_s = transfer[0, 0] * s + transfer[0, 1] * w + transfer[0, 2] * z
+    next_w = transfer[1, 0] * s + transfer[1, 1] * w + transfer[1, 2] * z
+    next_z = transfer[2, 0] * s + transfer[2, 1] * w + transfer[2, 2] * z
+
+    return next_s / next_w, next_w / next_z * decay
+
+
+@sdc_register_jitable
+def ewm_mean_kernel(input_arr, output_arr, alpha, adjust, ignore_na, minp):
+    """Sequential exponentially weighted mean"""
+    ewm_mean_chunk(input_arr, output_arr, 0, len(output_arr), alpha, adjust, ignore_na, minp, numpy.nan, 1., 0)
+
+
+@sdc_register_jitable
+def ewm_cov_chunk(x, y, output_arr, start, stop, alpha, adjust, ignore_na, minp, bias,
+                  mean_x, mean_y, cov, sum_wt, sum_wt2, old_wt, nobs):
+    """
+    Exponentially weighted covariance of x[start:stop] and y[start:stop]
+    starting from state (mean_x, mean_y, cov, sum_wt, sum_wt2, old_wt, nobs)
+    """
+    old_wt_factor = 1. - alpha
+    new_wt = 1. if adjust else alpha
+    for idx in range(start, stop):
+        value_x = ewm_value(x, idx)
+        value_y = ewm_value(y, idx)
+        is_observation = not (numpy.isnan(value_x) or numpy.isnan(value_y))
+        nobs += is_observation
+        if not numpy.isnan(mean_x):
+            if is_observation or not ignore_na:
+                sum_wt *= old_wt_factor
+                sum_wt2 *= old_wt_factor * old_wt_factor
+                old_wt *= old_wt_factor
+                if is_observation:
+                    old_mean_x, old_mean_y = mean_x, mean_y
+                    # avoid numerical errors on constant series
+                    if mean_x != value_x:
+                        mean_x = (old_wt * old_mean_x + new_wt * value_x) / (old_wt + new_wt)
+                    if mean_y != value_y:
+                        mean_y = (old_wt * old_mean_y + new_wt * value_y) / (old_wt + new_wt)
+                    cov = (old_wt * (cov + (old_mean_x - mean_x) * (old_mean_y - mean_y))
+                           + new_wt * (value_x - mean_x) * (value_y - mean_y)) / (old_wt + new_wt)
+                    sum_wt += new_wt
+                    sum_wt2 += new_wt * new_wt
+                    old_wt += new_wt
+                    if not adjust:
+                        sum_wt /= old_wt
+                        sum_wt2 /= old_wt * old_wt
+                        old_wt = 1.
+        elif is_observation:
+            mean_x, mean_y = value_x, value_y
+
+        if nobs < minp:
+            output_arr[idx] = numpy.nan
+        elif bias:
+            output_arr[idx] = cov
+        else:
+            numerator = sum_wt * sum_wt
+            denominator = numerator - sum_wt2
+            output_arr[idx] = numerator / denominator * cov if denominator > 0. else numpy.nan
+
+    return mean_x, mean_y, cov, sum_wt, sum_wt2, old_wt, nobs
+
+
+@sdc_register_jitable
+def ewm_cov_merge(wt, wt2, mean_x, mean_y, comoment, other_wt, other_wt2, other_mean_x, other_mean_y,
+                  other_comoment):
+    """
+    Merge weighted second moments of two sets of observations.
+    Set is (wt, wt2, mean_x, mean_y, comoment) with sums of weights and squared weights
+    and weighted sum of (x - mean_x) * (y - mean_y).
+    """
+    total_wt = wt + other_wt
+    if total_wt <= 0.:
+        return wt, wt2, mean_x, mean_y, comoment
+
+    delta_x = other_mean_x - mean_x
+    delta_y = other_mean_y - mean_y
+    return (total_wt, wt2 + other_wt2,
+            mean_x + delta_x * other_wt / total_wt, mean_y + delta_y * other_wt / total_wt,
+            comoment + other_comoment + delta_x * delta_y * wt * other_wt / total_wt)
+
+
+@sdc_register_jitable
+def ewm_cov_transfer(x, y, start, stop, alpha, adjust, ignore_na, transfer):
+    """
+    Collect second moments of observations of the chunk x[start:stop], y[start:stop] except the first one.
+    Weights of these observations don't depend on the state before the chunk,
+    the weight of the first observation and of the previous ones is scaled by transfer[2] up to the chunk end.
+    Transfer is (x0, y0, scale, wt, wt2, mean_x, mean_y, comoment).
+    Returns number of observations, number of weight decays before the first and after the last observation.
+    """
+    f = 1. - alpha
+    x0 = y0 = numpy.nan
+    scale = 1.
+    wt = wt2 = comoment = 0.
+    mean_x = mean_y = 0.
+    nobs = 0
+    first_ndecays = 0
+    ndecays = 0
+    for idx in range(start, stop):
+        value_x = ewm_value(x, idx)
+        value_y = ewm_value(y, idx)
+        if numpy.isnan(value_x) or numpy.isnan(value_y):
+            if not ignore_na:
+                ndecays += 1
+            continue
+
+        nobs += 1
+        if nobs == 1:
+            x0, y0 = value_x, value_y
+            first_ndecays = ndecays
+            ndecays = 0
+            continue
+
+        decay = f * f ** ndecays
+        ndecays = 0
+        if adjust:
+            old_factor, new_wt = decay, 1.
+        else:
+            # weights are normalized after every observation
+            old_factor, new_wt = decay / (decay + alpha), alpha / (decay + alpha)
+
+        scale *= old_factor
+        wt, wt2, comoment = wt * old_factor, wt2 * old_factor * old_factor, comoment * old_factor
+        wt, wt2, mean_x, mean_y, comoment = ewm_cov_merge(wt, wt2, mean_x, mean_y, comoment,
+                                                          new_wt, new_wt * new_wt, value_x, value_y, 0.)
+
+    transfer[0], transfer[1], transfer[2], transfer[3] = x0, y0, scale, wt
+    transfer[4], transfer[5], transfer[6], transfer[7] = wt2, mean_x, mean_y, comoment
+
+    return nobs, first_ndecays, ndecays
+
+
+@sdc_register_jitable
+def ewm_cov_carry(transfer, nobs, first_ndecays, last_ndecays, alpha, adjust,
+                  mean_x, mean_y, cov, sum_wt, sum_wt2, old_wt):
+    """Apply transfer of the chunk to the ewm covariance state (mean_x, mean_y, cov, sum_wt, sum_wt2, old_wt)"""
+    f = 1. - alpha
+    last_decay = f ** last_ndecays
+    if nobs == 0:
+        if numpy.isnan(mean_x):
+            return mean_x, mean_y, cov, sum_wt, sum_wt2, old_wt
+
+        return (mean_x, mean_y, cov, sum_wt * last_decay, sum_wt2 * last_decay * last_decay,
+                old_wt * last_decay)
+
+    x0, y0, scale = transfer[0], transfer[1], transfer[2]
+    if numpy.isnan(mean_x):
+        wt, wt2, mean_x, mean_y, comoment = 1., 1., x0, y0, 0.
+    else:
+        decay = f * f ** first_ndecays
+        new_wt = 1. if adjust else alpha
+        wt, wt2, mean_x, mean_y, comoment = ewm_cov_merge(old_wt * decay, sum_wt2 * decay * decay,
+                                                          mean_x, mean_y, cov * old_wt * decay,
+                                                          new_wt, new_wt * new_wt, x0, y0, 0.)
+        if not adjust:
+            wt2, comoment, wt = wt2 / (wt * wt), comoment / wt, 1.
+
+    wt, wt2, mean_x, mean_y, comoment = ewm_cov_merge(wt * scale, wt2 * scale * scale, mean_x, mean_y,
+                                                      comoment * scale, transfer[3], transfer[4],
+                                                      transfer[5], transfer[6], transfer[7])
+    sum_wt = wt * last_decay
+    sum_wt2 = wt2 * last_decay * last_decay
+
+    return mean_x, mean_y, comoment / wt, sum_wt, sum_wt2, sum_wt
+
+
+@sdc_register_jitable
+def ewm_cov_kernel(x, y, output_arr, alpha, adjust, ignore_na, minp, bias):
+    """Sequential exponentially weighted covariance of x and y"""
+    ewm_cov_chunk(x, y, output_arr, 0, len(output_arr), alpha, adjust, ignore_na, minp, bias,
+                  numpy.nan, numpy.nan, 0., 1., 1., 1., 0)
+
+
+@sdc_register_jitable
+def ewm_cov_parallel_kernel(x, y, output_arr, alpha, adjust, ignore_na, minp, bias):
+    """Exponentially weighted covariance of x and y calculated by chunks in parallel"""
+    chunks = parallel_chunks(len(output_arr))
+    n_chunks = len(chunks)
+    transfers = numpy.empty((n_chunks, 8), dtype=float64)
+    chunk_nobs = numpy.zeros(n_chunks, dtype=numpy.int64)
+    chunk_first_ndecays = numpy.zeros(n_chunks, dtype=numpy.int64)
+    chunk_last_ndecays = numpy.zeros(n_chunks, dtype=numpy.int64)
+    # the last chunk doesn't affect the other ones
+    for i in prange(n_chunks - 1):
+        chunk = chunks[i]
+        chunk_nobs[i], chunk_first_ndecays[i], chunk_last_ndecays[i] = ewm_cov_transfer(
+            x, y, chunk.start, chunk.stop, alpha, adjust, ignore_na, transfers[i])
+
+    states = numpy.empty((n_chunks, 6), dtype=float64)
+    nobs = numpy.empty(n_chunks, dtype=numpy.int64)
+    mean_x, mean_y, cov, sum_wt, sum_wt2, old_wt = numpy.nan, numpy.nan, 0., 1., 1., 1.
+    count = 0
+    for i in range(n_chunks):
+        states[i, 0], states[i, 1], states[i, 2] = mean_x, mean_y, cov
+        states[i, 3], states[i, 4], states[i, 5] = sum_wt, sum_wt2, old_wt
+        nobs[i] = count
+        if i < n_chunks - 1:
+            mean_x, mean_y, cov, sum_wt, sum_wt2, old_wt = ewm_cov_carry(
+                transfers[i], chunk_nobs[i], chunk_first_ndecays[i], chunk_last_ndecays[i], alpha, adjust,
+                mean_x, mean_y, cov, sum_wt, sum_wt2, old_wt)
+            count += chunk_nobs[i]
+
+    for i in prange(n_chunks):
+        chunk = chunks[i]
+        ewm_cov_chunk(x, y, output_arr, chunk.start, chunk.stop, alpha, adjust, ignore_na, minp, bias,
+                      states[i, 0], states[i, 1], states[i, 2], states[i, 3], states[i, 4], states[i, 5], nobs[i])
+
+
+def gen_ewm_var_kernel(cov_kernel):
+    """Generate exponentially weighted variance kernel based on covariance kernel"""
+    def ewm_var_kernel(input_arr, output_arr, alpha, adjust, ignore_na, minp, bias):
+        cov_kernel(input_arr, input_arr, output_arr, alpha, adjust, ignore_na, minp, bias)
+
+    return sdc_register_jitable(ewm_var_kernel)
+
+
+def gen_ewm_std_kernel(cov_kernel):
+    """Generate exponentially weighted standard deviation kernel based on covariance kernel"""
+    def ewm_std_kernel(input_arr, output_arr, alpha, adjust, ignore_na, minp, bias):
+        cov_kernel(input_arr, input_arr, output_arr, alpha, adjust, ignore_na, minp, bias)
+        for idx in range(len(output_arr)):
+            output_arr[idx] = ewm_zsqrt(output_arr[idx])
+
+    return sdc_register_jitable(ewm_std_kernel)
+
+
+def gen_ewm_corr_kernel(cov_kernel):
+    """Generate exponentially weighted correlation kernel based on covariance kernel"""
+    def ewm_corr_kernel(x, y, output_arr, alpha, adjust, ignore_na, minp):
+        length = len(output_arr)
+        # variances are calculated over pairwise observations only
+        masked_x = numpy.empty(length, dtype=float64)
+        masked_y = numpy.empty(length, dtype=float64)
+        for idx in range(length):
+            value_x = ewm_value(x, idx)
+            value_y = ewm_value(y, idx)
+            masked_x[idx] = value_x + 0. * value_y
+            masked_y[idx] = value_y + 0. * value_x
+
+        var_x = numpy.empty(length, dtype=float64)
+        var_y = numpy.empty(length, dtype=float64)
+        cov_kernel(masked_x, masked_y, output_arr, alpha, adjust, ignore_na, minp, True)
+        cov_kernel(masked_x, masked_x, var_x, alpha, adjust, ignore_na, minp, True)
+        cov_kernel(masked_y, masked_y, var_y, alpha, adjust, ignore_na, minp, True)
+        for idx in range(length):
+            cov = output_arr[idx]
+            denominator = ewm_zsqrt(var_x[idx] * var_y[idx])
+            if denominator > 0.:
+                output_arr[idx] = cov / denominator
+            elif cov == 0.:
+                output_arr[idx] = numpy.nan
+            else:
+                output_arr[idx] = numpy.inf * numpy.sign(cov)
+
+    return sdc_register_jitable(ewm_corr_kernel)
+
+
+ewm_var_kernel = gen_ewm_var_kernel(ewm_cov_kernel)
+ewm_std_kernel = gen_ewm_std_kernel(ewm_cov_kernel)
+ewm_corr_kernel = gen_ewm_corr_kernel(ewm_cov_kernel)
+ewm_var_parallel_kernel = gen_ewm_var_kernel(ewm_cov_parallel_kernel)
+ewm_std_parallel_kernel = gen_ewm_std_kernel(ewm_cov_parallel_kernel)
+ewm_corr_parallel_kernel = gen_ewm_corr_kernel(ewm_cov_parallel_kernel)
+
+
+def sdc_pandas_series_ewm_mean_impl(self):
+    alpha = 1. / (1. + self._com)
+    adjust = self._adjust
+    ignore_na = self._ignore_na
+    minp = max(self._min_periods, 1)
+
+    input_series = self._data
+    input_arr = input_series._data
+    length = len(input_arr)
+    output_arr = numpy.empty(length, dtype=float64)
+
+    chunks = parallel_chunks(length)
+    n_chunks = len(chunks)
+    transfers = numpy.empty((n_chunks, 3, 3), dtype=float64)
+    chunk_nobs = numpy.zeros(n_chunks, dtype=numpy.int64)
+    chunk_ndecays = numpy.zeros(n_chunks, dtype=numpy.int64)
+    # the last chunk doesn't affect the other ones
+    for i in prange(n_chunks - 1):
+        chunk = chunks[i]
+        chunk_nobs[i], chunk_ndecays[i] = ewm_mean_transfer(input_arr, chunk.start, chunk.stop, alpha,
+                                                            adjust, ignore_na, transfers[i])
+
+    avgs = numpy.empty(n_chunks, dtype=float64)
+    old_wts = numpy.empty(n_chunks, dtype=float64)
+    nobs = numpy.empty(n_chunks, dtype=numpy.int64)
+    avg, old_wt, count = numpy.nan, 1., 0
+    for i in range(n_chunks):
+        avgs[i], old_wts[i], nobs[i] = avg, old_wt, count
+        if i < n_chunks - 1:
+            avg, old_wt = ewm_mean_carry(transfers[i], chunk_nobs[i], chunk_ndecays[i], alpha, avg, old_wt)
+            count += chunk_nobs[i]
+
+    for i in prange(n_chunks):
+        chunk = chunks[i]
+        ewm_mean_chunk(input_arr, output_arr, chunk.start, chunk.stop, alpha, adjust, ignore_na, minp,
+                       avgs[i], old_wts[i], nobs[i])
+
+    return pandas.Series(output_arr, input_series._index, name=input_series._name)
+
+
+def gen_sdc_pandas_series_ewm_bias_impl(kernel):
+    """Generate series ewm methods implementations with bias parameter based on kernel"""
+    def impl(self, bias=False):
+        alpha = 1. / (1. + self._com)
+        minp = max(self._min_periods, 1)
+
+        input_series = self._data
+        input_arr = input_series._data
+        length = len(input_arr)
+        output_arr = numpy.empty(length, dtype=float64)
+        kernel(input_arr, output_arr, alpha, self._adjust, self._ignore_na, minp, bias)
+
+        return pandas.Series(output_arr, input_series._index, name=input_series._name)
+
+    return impl
+
+
+sdc_pandas_series_ewm_var_impl = gen_sdc_pandas_series_ewm_bias_impl(ewm_var_parallel_kernel)
+sdc_pandas_series_ewm_std_impl = gen_sdc_pandas_series_ewm_bias_impl(ewm_std_parallel_kernel)
+
+
+def _hpat_pandas_series_ewm_other_check_types(ty_checker, other, pairwise):
+    """Check types of other and pairwise parameters of series.ewm.corr()/cov()"""
+    accepted_other = (bool, Omitted, NoneType, SeriesType)
+    if not isinstance(other, accepted_other) and other is not None:
+        ty_checker.raise_exc(other, 'Series', 'other')
+
+    accepted_pairwise = (bool, Boolean, Omitted, NoneType)
+    if not isinstance(pairwise, accepted_pairwise) and pairwise is not None:
+        ty_checker.raise_exc(pairwise, 'bool', 'pairwise')
+
+
+@sdc_overload_method(SeriesEWMType, 'corr')
+def hpat_pandas_series_ewm_corr(self, other=None, pairwise=None):
+
+    ty_checker = TypeChecker('Method ewm.corr().')
+    ty_checker.check(self, SeriesEWMType)
+
+    _hpat_pandas_series_ewm_other_check_types(ty_checker, other, pairwise)
+
+    nan_other = isinstance(other, (Omitted, NoneType)) or other is None
+
+    def hpat_pandas_series_ewm_corr_impl(self, other=None, pairwise=None):
+        alpha = 1. / (1. + self._com)
+        minp = max(self._min_periods, 1)
+
+        main_arr = self._data._data
+        if nan_other == True:  # noqa
+            other_arr = main_arr
+        else:
+            other_arr = other._data
+
+        length = max(len(main_arr), len(other_arr))
+        output_arr = numpy.empty(length, dtype=float64)
+        ewm_corr_parallel_kernel(main_arr, other_arr, output_arr, alpha, self._adjust, self._ignore_na, minp)
+
+        return pandas.Series(output_arr)
+
+    return hpat_pandas_series_ewm_corr_impl
+
+
+@sdc_overload_method(SeriesEWMType, 'cov')
+def hpat_pandas_series_ewm_cov(self, other=None, pairwise=None, bias=False):
+
+    ty_checker = TypeChecker('Method ewm.cov().')
+    ty_checker.check(self, SeriesEWMType)
+
+    _hpat_pandas_series_ewm_other_check_types(ty_checker, other, pairwise)
+
+    if not isinstance(bias, (bool, Boolean, Omitted)):
+        ty_checker.raise_exc(bias, 'bool', 'bias')
+
+    nan_other = isinstance(other, (Omitted, NoneType)) or other is None
+
+    def hpat_pandas_series_ewm_cov_impl(self, other=None, pairwise=None, bias=False):
+        alpha = 1. / (1. + self._com)
+        minp = max(self._min_periods, 1)
+
+        main_arr = self._data._data
+        if nan_other == True:  # noqa
+            other_arr = main_arr
+        else:
+            other_arr = other._data
+
+        length = max(len(main_arr), len(other_arr))
+        output_arr = numpy.empty(length, dtype=float64)
+        ewm_cov_parallel_kernel(main_arr, other_arr, output_arr, alpha, self._adjust, self._ignore_na, minp,
+                                bias)
+
+        return pandas.Series(output_arr)
+
+    return hpat_pandas_series_ewm_cov_impl
+
+
+@sdc_overload_method(SeriesEWMType, 'mean')
+def hpat_pandas_series_ewm_mean(self):
+
+    ty_checker = TypeChecker('Method ewm.mean().')
+    ty_checker.check(self, SeriesEWMType)
+
+    return sdc_pandas_series_ewm_mean_impl
+
+
+@sdc_overload_method(SeriesEWMType, 'std')
+def hpat_pandas_series_ewm_std(self, bias=False):
+
+    ty_checker = TypeChecker('Method ewm.std().')
+    ty_checker.check(self, SeriesEWMType)
+
+    if not isinstance(bias, (bool, Boolean, Omitted)):
+        ty_checker.raise_exc(bias, 'bool', 'bias')
+
+    return sdc_pandas_series_ewm_std_impl
+
+
+@sdc_overload_method(SeriesEWMType, 'var')
+def hpat_pandas_series_ewm_var(self, bias=False):
+
+    ty_checker = TypeChecker('Method ewm.var().')
+    ty_checker.check(self, SeriesEWMType)
+
+    if not isinstance(bias, (bool, Boolean, Omitted)):
+        ty_checker.raise_exc(bias, 'bool', 'bias')
+
+    return sdc_pandas_series_ewm_var_impl
+
+
+bias_param_doc = """
+    bias: :obj:`bool`
+        Use a standard estimation bias correction.
+"""
+
+other_params_doc = """
+    other: :obj:`pandas.Series`
+        Other Series.
+    pairwise: :obj:`bool`
+        Not relevant for Series.
+        *unsupported*
+"""
+
+ewm_limitation = """
+    Limitations
+    -----------
+    Series elements are processed by chunks in parallel, DataFrame columns are processed in parallel.
+    Series of different lengths are aligned by position.
+"""
+
+hpat_pandas_series_ewm_corr.__doc__ = hpat_pandas_series_ewm_docstring_tmpl.format(**{
+    'method_name': 'corr',
+    'example_caption': 'Calculate exponentially weighted correlation.',
+    'limitations_block': ewm_limitation,
+    'extra_params': other_params_doc
+})
+
+hpat_pandas_series_ewm_cov.__doc__ = hpat_pandas_series_ewm_docstring_tmpl.format(**{
+    'method_name': 'cov',
+    'example_caption': 'Calculate exponentially weighted covariance.',
+    'limitations_block': ewm_limitation,
+    'extra_params': other_params_doc + bias_param_doc
+})
+
+hpat_pandas_series_ewm_mean.__doc__ = hpat_pandas_series_ewm_docstring_tmpl.format(**{
+    'method_name': 'mean',
+    'example_caption': 'Calculate exponentially weighted mean.',
+    'limitations_block': '',
+    'extra_params': ''
+})
+
+hpat_pandas_series_ewm_std.__doc__ = hpat_pandas_series_ewm_docstring_tmpl.format(**{
+    'method_name': 'std',
+    'example_caption': 'Calculate exponentially weighted standard deviation.',
+    'limitations_block': ewm_limitation,
+    'extra_params': bias_param_doc
+})
+
+hpat_pandas_series_ewm_var.__doc__ = hpat_pandas_series_ewm_docstring_tmpl.format(**{
+    'method_name': 'var',
+    'example_caption': 'Calculate exponentially weighted variance.',
+    'limitations_block': ewm_limitation,
+    'extra_params': bias_param_doc
+})
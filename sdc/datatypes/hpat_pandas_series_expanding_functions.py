@@ -0,0 +1,505 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+import numpy
+import pandas
+
+from numba import prange
+from numba.core.types import float64, Integer, Omitted
+
+from sdc.datatypes.hpat_pandas_series_expanding_types import SeriesExpandingType
+from sdc.datatypes.hpat_pandas_series_rolling_functions import (
+    kurt_result_or_nan, mean_result_or_nan, put_count, put_sum, result, result_or_nan, skew_result_or_nan,
+    var_result_or_nan)
+from sdc.utilities.prange_utils import parallel_chunks
+from sdc.utilities.sdc_typing_utils import TypeChecker
+from sdc.utilities.utils import sdc_overload_method, sdc_register_jitable
+
+
+hpat_pandas_series_expanding_docstring_tmpl = """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.core.window.Expanding.{method_name}
+{limitations_block}
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/series/expanding/series_expanding_{method_name}.py
+       :language: python
+       :lines: 27-
+       :caption: {example_caption}
+       :name: ex_series_expanding_{method_name}
+
+    .. command-output:: python ./series/expanding/series_expanding_{method_name}.py
+       :cwd: ../../../examples
+
+    .. literalinclude:: ../../../examples/dataframe/expanding/dataframe_expanding_{method_name}.py
+       :language: python
+       :lines: 27-
+       :caption: {example_caption}
+       :name: ex_dataframe_expanding_{method_name}
+
+    .. command-output:: python ./dataframe/expanding/dataframe_expanding_{method_name}.py
+       :cwd: ../../../examples
+
+    .. seealso::
+        :ref:`Series.expanding <pandas.Series.expanding>`
+            Calling object with a Series.
+        :ref:`DataFrame.expanding <pandas.DataFrame.expanding>`
+            Calling object with a DataFrame.
+        :ref:`Series.{method_name} <pandas.Series.{method_name}>`
+            Similar method for Series.
+        :ref:`DataFrame.{method_name} <pandas.DataFrame.{method_name}>`
+            Similar method for DataFrame.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas Series method :meth:`pandas.Series.expanding.{method_name}()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_expanding.TestExpanding.test_series_expanding_{method_name}
+
+    Parameters
+    ----------
+    self: :class:`pandas.Series.expanding`
+        input arg{extra_params}
+
+    Returns
+    -------
+    :obj:`pandas.Series`
+         returns :obj:`pandas.Series` object
+"""
+
+
+@sdc_register_jitable
+def put_expanding_max(value, nfinite, result):
+    """Calculate the expanding max with new value."""
+    if not numpy.isfinite(value):
+        return nfinite, result
+
+    if nfinite == 0 or value > result:
+        return nfinite + 1, float64(value)
+
+    return nfinite + 1, result
+
+
+@sdc_register_jitable
+def put_expanding_min(value, nfinite, result):
+    """Calculate the expanding min with new value."""
+    if not numpy.isfinite(value):
+        return nfinite, result
+
+    if nfinite == 0 or value < result:
+        return nfinite + 1, float64(value)
+
+    return nfinite + 1, result
+
+
+@sdc_register_jitable
+def merge_max(nfinite, result, other_nfinite, other_result):
+    """Merge max of consecutive parts of data."""
+    if other_nfinite == 0 or (nfinite > 0 and result >= other_result):
+        return nfinite + other_nfinite, result
+
+    return nfinite + other_nfinite, other_result
+
+
+@sdc_register_jitable
+def merge_min(nfinite, result, other_nfinite, other_result):
+    """Merge min of consecutive parts of data."""
+    if other_nfinite == 0 or (nfinite > 0 and result <= other_result):
+        return nfinite + other_nfinite, result
+
+    return nfinite + other_nfinite, other_result
+
+
+@sdc_register_jitable
+def merge_sum(nfinite, result, other_nfinite, other_result):
+    """Merge sums of consecutive parts of data."""
+    return nfinite + other_nfinite, result + other_result
+
+
+@sdc_register_jitable
+def put_mean_m2(value, nfinite, result):
+    """Calculate the mean and the sum of squared deviations from it with new value (Welford's update)."""
+    if not numpy.isfinite(value):
+        return nfinite, result
+
+    mean, m2 = result
+    nfinite += 1
+    delta = value - mean
+    mean += delta / nfinite
+
+    return nfinite, (mean, m2 + delta * (value - mean))
+
+
+@sdc_register_jitable
+def merge_mean_m2(nfinite, result, other_nfinite, other_result):
+    """Merge the means and the sums of squared deviations of consecutive parts of data (Chan's formulas)."""
+    if other_nfinite == 0:
+        return nfinite, result
+    if nfinite == 0:
+        return other_nfinite, other_result
+
+    mean, m2 = result
+    other_mean, other_m2 = other_result
+    n = nfinite + other_nfinite
+    delta = other_mean - mean
+
+    return n, (mean + delta * other_nfinite / n, m2 + other_m2 + delta * delta * nfinite * other_nfinite / n)
+
+
+@sdc_register_jitable
+def put_central_moments(value, nfinite, result):
+    """Calculate the mean and the sums of powers (2nd to 4th) of deviations from it with new value."""
+    if not numpy.isfinite(value):
+        return nfinite, result
+
+    mean, m2, m3, m4 = result
+    n = nfinite + 1
+    delta = value - mean
+    delta_n = delta / n
+    delta_n2 = delta_n * delta_n
+    term = delta * delta_n * nfinite
+
+    mean += delta_n
+    m4 += term * delta_n2 * (n * n - 3 * n + 3) + 6 * delta_n2 * m2 - 4 * delta_n * m3
+    m3 += term * delta_n * (n - 2) - 3 * delta_n * m2
+    m2 += term
+
+    return n, (mean, m2, m3, m4)
+
+
+@sdc_register_jitable
+def merge_central_moments(nfinite, result, other_nfinite, other_result):
+    """Merge the means and the sums of powers of deviations of consecutive parts of data (Chan's formulas)."""
+    if other_nfinite == 0:
+        return nfinite, result
+    if nfinite == 0:
+        return other_nfinite, other_result
+
+    mean, m2, m3, m4 = result
+    other_mean, other_m2, other_m3, other_m4 = other_result
+    na, nb = float64(nfinite), float64(other_nfinite)
+    n = na + nb
+    delta = other_mean - mean
+    delta_n = delta / n
+    delta_n2 = delta_n * delta_n
+    term = delta * delta_n * na * nb
+
+    new_mean = mean + delta_n * nb
+    new_m4 = (m4 + other_m4 + term * delta_n2 * (na * na - na * nb + nb * nb)
+              + 6 * delta_n2 * (na * na * other_m2 + nb * nb * m2) + 4 * delta_n * (na * other_m3 - nb * m3))
+    new_m3 = m3 + other_m3 + term * delta_n * (na - nb) + 3 * delta_n * (na * other_m2 - nb * m2)
+    new_m2 = m2 + other_m2 + term
+
+    return nfinite + other_nfinite, (new_mean, new_m2, new_m3, new_m4)
+
+
+@sdc_register_jitable
+def central_kurt_result_or_nan(nfinite, minp, result):
+    """Get result kurt of the central moments taking into account min periods."""
+    _, m2, m3, m4 = result
+
+    return kurt_result_or_nan(nfinite, minp, (0., m2, m3, m4))
+
+
+@sdc_register_jitable
+def central_skew_result_or_nan(nfinite, minp, result):
+    """Get result skew of the central moments taking into account min periods."""
+    _, m2, m3, _ = result
+
+    return skew_result_or_nan(nfinite, minp, (0., m2, m3))
+
+
+@sdc_register_jitable
+def central_var_result_or_nan(nfinite, minp, result, ddof):
+    """Get result var of the central moments taking into account min periods."""
+    _, m2 = result
+
+    return var_result_or_nan(nfinite, minp, (0., m2), ddof)
+
+
+@sdc_register_jitable
+def central_std_result_or_nan(nfinite, minp, result, ddof):
+    """Get result std of the central moments taking into account min periods."""
+    return central_var_result_or_nan(nfinite, minp, result, ddof) ** 0.5
+
+
+def gen_sdc_expanding_scan_impl(put, merge, get_result=result_or_nan, init_result=numpy.nan, use_param=False):
+    """
+    Generate function computing expanding results as parallel prefix scan based on put/merge funcs.
+    The 1st pass accumulates results of every chunk, the 2nd one merges them into results of preceding chunks,
+    the 3rd pass continues accumulation of every chunk from result of preceding chunks.
+    use_param passes param (ddof) to get_result.
+    """
+    def impl(input_arr, output_arr, minp, param):
+        chunks = parallel_chunks(len(input_arr))
+        n_chunks = len(chunks)
+        chunk_nfinite = numpy.zeros(n_chunks, dtype=numpy.int64)
+        chunk_results = [init_result] * n_chunks
+        # the last chunk doesn't affect the other ones
+        for i in prange(n_chunks - 1):
+            chunk = chunks[i]
+            nfinite, result = 0, init_result
+            for idx in range(chunk.start, chunk.stop):
+                nfinite, result = put(input_arr[idx], nfinite, result)
+            chunk_nfinite[i], chunk_results[i] = nfinite, result
+
+        nfinite, result = 0, init_result
+        for i in range(n_chunks):
+            next_nfinite, next_result = merge(nfinite, result, chunk_nfinite[i], chunk_results[i])
+            chunk_nfinite[i], chunk_results[i] = nfinite, result
+            nfinite, result = next_nfinite, next_result
+
+        for i in prange(n_chunks):
+            chunk = chunks[i]
+            nfinite, result = chunk_nfinite[i], chunk_results[i]
+            for idx in range(chunk.start, chunk.stop):
+                nfinite, result = put(input_arr[idx], nfinite, result)
+                if use_param == True:  # noqa
+                    output_arr[idx] = get_result(nfinite, minp, result, param)
+                else:
+                    output_arr[idx] = get_result(nfinite, minp, result)
+
+    return sdc_register_jitable(impl)
+
+
+def gen_sdc_pandas_series_expanding_impl(expanding_scan):
+    """Generate series expanding methods implementations based on scan func"""
+    def impl(self):
+        input_series = self._data
+        input_arr = input_series._data
+        output_arr = numpy.empty(len(input_arr), dtype=float64)
+        expanding_scan(input_arr, output_arr, self._min_periods, 0)
+
+        return pandas.Series(output_arr, input_series._index,
+                             name=input_series._name)
+    return impl
+
+
+def gen_sdc_pandas_series_expanding_ddof_impl(expanding_scan):
+    """Generate series expanding ddof implementations based on scan func"""
+    def impl(self, ddof=1):
+        input_series = self._data
+        input_arr = input_series._data
+        output_arr = numpy.empty(len(input_arr), dtype=float64)
+        expanding_scan(input_arr, output_arr, self._min_periods, ddof)
+
+        return pandas.Series(output_arr, input_series._index,
+                             name=input_series._name)
+    return impl
+
+
+sdc_pandas_series_expanding_count_impl = gen_sdc_pandas_series_expanding_impl(gen_sdc_expanding_scan_impl(
+    put_count, merge_sum, get_result=result, init_result=0.))
+sdc_pandas_series_expanding_kurt_impl = gen_sdc_pandas_series_expanding_impl(gen_sdc_expanding_scan_impl(
+    put_central_moments, merge_central_moments, get_result=central_kurt_result_or_nan,
+    init_result=(0., 0., 0., 0.)))
+sdc_pandas_series_expanding_max_impl = gen_sdc_pandas_series_expanding_impl(gen_sdc_expanding_scan_impl(
+    put_expanding_max, merge_max))
+sdc_pandas_series_expanding_mean_impl = gen_sdc_pandas_series_expanding_impl(gen_sdc_expanding_scan_impl(
+    put_sum, merge_sum, get_result=mean_result_or_nan, init_result=0.))
+sdc_pandas_series_expanding_min_impl = gen_sdc_pandas_series_expanding_impl(gen_sdc_expanding_scan_impl(
+    put_expanding_min, merge_min))
+sdc_pandas_series_expanding_skew_impl = gen_sdc_pandas_series_expanding_impl(gen_sdc_expanding_scan_impl(
+    put_central_moments, merge_central_moments, get_result=central_skew_result_or_nan,
+    init_result=(0., 0., 0., 0.)))
+sdc_pandas_series_expanding_sum_impl = gen_sdc_pandas_series_expanding_impl(gen_sdc_expanding_scan_impl(
+    put_sum, merge_sum, init_result=0.))
+sdc_pandas_series_expanding_var_impl = gen_sdc_pandas_series_expanding_ddof_impl(gen_sdc_expanding_scan_impl(
+    put_mean_m2, merge_mean_m2, get_result=central_var_result_or_nan, init_result=(0., 0.), use_param=True))
+sdc_pandas_series_expanding_std_impl = gen_sdc_pandas_series_expanding_ddof_impl(gen_sdc_expanding_scan_impl(
+    put_mean_m2, merge_mean_m2, get_result=central_std_result_or_nan, init_result=(0., 0.), use_param=True))
+
+
+@sdc_overload_method(SeriesExpandingType, 'count')
+def hpat_pandas_series_expanding_count(self):
+
+    ty_checker = TypeChecker('Method expanding.count().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    return sdc_pandas_series_expanding_count_impl
+
+
+@sdc_overload_method(SeriesExpandingType, 'kurt')
+def hpat_pandas_series_expanding_kurt(self):
+
+    ty_checker = TypeChecker('Method expanding.kurt().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    return sdc_pandas_series_expanding_kurt_impl
+
+
+@sdc_overload_method(SeriesExpandingType, 'max')
+def hpat_pandas_series_expanding_max(self):
+
+    ty_checker = TypeChecker('Method expanding.max().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    return sdc_pandas_series_expanding_max_impl
+
+
+@sdc_overload_method(SeriesExpandingType, 'mean')
+def hpat_pandas_series_expanding_mean(self):
+
+    ty_checker = TypeChecker('Method expanding.mean().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    return sdc_pandas_series_expanding_mean_impl
+
+
+@sdc_overload_method(SeriesExpandingType, 'min')
+def hpat_pandas_series_expanding_min(self):
+
+    ty_checker = TypeChecker('Method expanding.min().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    return sdc_pandas_series_expanding_min_impl
+
+
+@sdc_overload_method(SeriesExpandingType, 'skew')
+def hpat_pandas_series_expanding_skew(self):
+
+    ty_checker = TypeChecker('Method expanding.skew().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    return sdc_pandas_series_expanding_skew_impl
+
+
+@sdc_overload_method(SeriesExpandingType, 'std')
+def hpat_pandas_series_expanding_std(self, ddof=1):
+
+    ty_checker = TypeChecker('Method expanding.std().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    if not isinstance(ddof, (int, Integer, Omitted)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    return sdc_pandas_series_expanding_std_impl
+
+
+@sdc_overload_method(SeriesExpandingType, 'sum')
+def hpat_pandas_series_expanding_sum(self):
+
+    ty_checker = TypeChecker('Method expanding.sum().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    return sdc_pandas_series_expanding_sum_impl
+
+
+@sdc_overload_method(SeriesExpandingType, 'var')
+def hpat_pandas_series_expanding_var(self, ddof=1):
+
+    ty_checker = TypeChecker('Method expanding.var().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    if not isinstance(ddof, (int, Integer, Omitted)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    return sdc_pandas_series_expanding_var_impl
+
+
+extremum_limitations = """
+    Limitations
+    -----------
+    Infinite values are ignored.
+"""
+
+sums_limitations = """
+    Limitations
+    -----------
+    DataFrame/Series elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
+"""
+
+ddof_param_doc = """
+    ddof: :obj:`int`
+        Delta Degrees of Freedom.
+"""
+
+hpat_pandas_series_expanding_count.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'count',
+    'example_caption': 'Count of any non-NaN observations inside the window.',
+    'limitations_block': '',
+    'extra_params': ''
+})
+
+hpat_pandas_series_expanding_kurt.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'kurt',
+    'example_caption': 'Calculate unbiased expanding kurtosis.',
+    'limitations_block': sums_limitations,
+    'extra_params': ''
+})
+
+hpat_pandas_series_expanding_max.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'max',
+    'example_caption': 'Calculate the expanding maximum.',
+    'limitations_block': extremum_limitations,
+    'extra_params': ''
+})
+
+hpat_pandas_series_expanding_mean.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'mean',
+    'example_caption': 'Calculate the expanding mean of the values.',
+    'limitations_block': sums_limitations,
+    'extra_params': ''
+})
+
+hpat_pandas_series_expanding_min.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'min',
+    'example_caption': 'Calculate the expanding minimum.',
+    'limitations_block': extremum_limitations,
+    'extra_params': ''
+})
+
+hpat_pandas_series_expanding_skew.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'skew',
+    'example_caption': 'Unbiased expanding skewness.',
+    'limitations_block': sums_limitations,
+    'extra_params': ''
+})
+
+hpat_pandas_series_expanding_std.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'std',
+    'example_caption': 'Calculate expanding standard deviation.',
+    'limitations_block': sums_limitations,
+    'extra_params': ddof_param_doc
+})
+
+hpat_pandas_series_expanding_sum.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'sum',
+    'example_caption': 'Calculate expanding sum',
+    'limitations_block': sums_limitations,
+    'extra_params': ''
+})
+
+hpat_pandas_series_expanding_var.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'var',
+    'example_caption': 'Calculate unbiased expanding variance.',
+    'limitations_block': sums_limitations,
+    'extra_params': ddof_param_doc
+})
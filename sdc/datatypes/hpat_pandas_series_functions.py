@@ -53,9 +53,14 @@ from sdc.utilities.sdc_typing_utils import (TypeChecker, check_index_is_numeric,
                                             find_common_dtype_from_numpy_dtypes, has_literal_value,
                                             has_python_value)
 from sdc.datatypes.common_functions import (sdc_join_series_indexes, sdc_arrays_argsort, sdc_check_indexes_equal,
-                                            sdc_reindex_series)
+                                            sdc_reindex_series, _sdc_factorize)
+from sdc.datatypes.hpat_pandas_ewm_types import gen_sdc_pandas_ewm_overload_body, sdc_pandas_ewm_docstring_tmpl
+from sdc.datatypes.hpat_pandas_expanding_types import (
+    gen_sdc_pandas_expanding_overload_body, sdc_pandas_expanding_docstring_tmpl)
 from sdc.datatypes.hpat_pandas_rolling_types import (
     gen_sdc_pandas_rolling_overload_body, sdc_pandas_rolling_docstring_tmpl)
+from sdc.datatypes.hpat_pandas_series_ewm_types import _hpat_pandas_series_ewm_init
+from sdc.datatypes.hpat_pandas_series_expanding_types import _hpat_pandas_series_expanding_init
 from sdc.datatypes.hpat_pandas_series_rolling_types import _hpat_pandas_series_rolling_init
 from sdc.datatypes.hpat_pandas_stringmethods_types import StringMethodsType
 from sdc.datatypes.hpat_pandas_getitem_types import SeriesGetitemAccessorType
@@ -69,7 +74,8 @@ from sdc.utilities.utils import to_array, sdc_overload, sdc_overload_method, sdc
 from sdc import sdc_autogenerated
 from sdc.functions import numpy_like
 from sdc.hiframes.api import isna
-from sdc.datatypes.hpat_pandas_groupby_functions import init_series_groupby
+from sdc.datatypes.hpat_pandas_groupby_functions import init_series_groupby, _sdc_groupby_build_index
+from sdc.hiframes.split_impl import split_view_explode, string_array_split_view_type
 from sdc.utilities.prange_utils import parallel_chunks
 
 from .pandas_series_functions import apply
@@ -1425,33 +1431,21 @@ def hpat_pandas_series_value_counts(self, normalize=False, sort=True, ascending=
         def hpat_pandas_series_value_counts_str_impl(
                 self, normalize=False, sort=True, ascending=False, bins=None, dropna=True):
 
-            value_counts_dict = Dict.empty(
-                key_type=types.unicode_type,
-                value_type=types.intp
-            )
-
-            nan_counts = 0
-            for i, value in enumerate(self._data):
-                if str_arr_is_na(self._data, i):
-                    if not dropna:
-                        nan_counts += 1
-                    continue
-
-                value_counts_dict[value] = value_counts_dict.get(value, 0) + 1
-
-            need_add_nan_count = not dropna and nan_counts
-
-            values = [key for key in value_counts_dict]
-            counts_as_list = [value_counts_dict[key] for key in value_counts_dict.keys()]
-            values_len = len(values)
-
-            if need_add_nan_count:
-                # append a separate empty string for NaN elements
-                values_len += 1
-                values.append('')
-                counts_as_list.append(nan_counts)
-
-            counts = numpy.asarray(counts_as_list, dtype=numpy.intp)
+            # count codes of the unique strings, NaN code -1 is counted in the last element
+            codes, uniques = _sdc_factorize(self._data)
+            num_uniques = len(uniques)
+            chunks = parallel_chunks(len(codes))
+            chunks_counts = numpy.zeros((len(chunks), num_uniques + 1), dtype=numpy.intp)
+            for i in prange(len(chunks)):
+                chunk = chunks[i]
+                for j in range(chunk.start, chunk.stop):
+                    chunks_counts[i, codes[j]] += 1
+            all_counts = chunks_counts.sum(axis=0)
+
+            need_add_nan_count = not dropna and all_counts[num_uniques] > 0
+            values_len = num_uniques + 1 if need_add_nan_count else num_uniques
+
+            counts = all_counts[:values_len]
             indexes_order = numpy.arange(values_len)
             if sort:
                 indexes_order = counts.argsort()
@@ -1459,15 +1453,15 @@ def hpat_pandas_series_value_counts(self, normalize=False, sort=True, ascending=
                     indexes_order = indexes_order[::-1]
 
             counts_sorted = numpy.take(counts, indexes_order)
-            values_sorted_by_count = [values[i] for i in indexes_order]
+            # a separate empty string is used for NaN elements
+            values_sorted_by_count = [uniques[i] if i < num_uniques else '' for i in indexes_order]
 
             # allocate the result index as a StringArray and copy values to it
             result_index = create_str_arr_from_list(values_sorted_by_count)
             if need_add_nan_count:
                 # set null bit for StringArray element corresponding to NaN element (was added as last in values)
-                index_previous_nan_pos = values_len - 1
                 for i in numpy.arange(values_len):
-                    if indexes_order[i] == index_previous_nan_pos:
+                    if indexes_order[i] == num_uniques:
                         str_arr_set_na(result_index, i)
                         break
 
@@ -1662,10 +1656,21 @@ def hpat_pandas_series_index(self):
 
 
 hpat_pandas_series_rolling = sdc_overload_method(SeriesType, 'rolling')(
-    gen_sdc_pandas_rolling_overload_body(_hpat_pandas_series_rolling_init, SeriesType))
+    gen_sdc_pandas_rolling_overload_body(_hpat_pandas_series_rolling_init, SeriesType, allow_offset=True,
+                                         allow_center=True, allow_win_type=True))
 hpat_pandas_series_rolling.__doc__ = sdc_pandas_rolling_docstring_tmpl.format(
     ty='Series', ty_lower='series')
 
+hpat_pandas_series_ewm = sdc_overload_method(SeriesType, 'ewm')(
+    gen_sdc_pandas_ewm_overload_body(_hpat_pandas_series_ewm_init, SeriesType))
+hpat_pandas_series_ewm.__doc__ = sdc_pandas_ewm_docstring_tmpl.format(
+    ty='Series', ty_lower='series')
+
+hpat_pandas_series_expanding = sdc_overload_method(SeriesType, 'expanding')(
+    gen_sdc_pandas_expanding_overload_body(_hpat_pandas_series_expanding_init, SeriesType))
+hpat_pandas_series_expanding.__doc__ = sdc_pandas_expanding_docstring_tmpl.format(
+    ty='Series', ty_lower='series')
+
 
 @sdc_overload_attribute(SeriesType, 'size')
 def hpat_pandas_series_size(self):
@@ -2714,6 +2719,132 @@ def hpat_pandas_series_take(self, indices, axis=0, is_copy=False):
     return hpat_pandas_series_take_impl
 
 
+@sdc_overload_method(SeriesType, 'explode')
+def hpat_pandas_series_explode(self):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+
+    Pandas API: pandas.Series.explode
+
+    Limitations
+    -----------
+    Supported only for Series of lists of strings returned by :ref:`Series.str.split <pandas.Series.str.split>`.
+
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/series/series_explode.py
+       :language: python
+       :lines: 27-
+       :caption: Transform each element of a list-like to a row, replicating the index values.
+       :name: ex_series_explode
+
+    .. command-output:: python ./series/series_explode.py
+       :cwd: ../../../examples
+
+    .. seealso::
+        :ref:`Series.str.split <pandas.Series.str.split>`
+            Split strings around given separator/delimiter.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas Series method :meth:`pandas.Series.explode` implementation.
+
+    .. only:: developer
+
+        Test: python -m sdc.runtests -k sdc.tests.test_series.TestSeries.test_series_explode*
+    """
+
+    _func_name = 'Method explode().'
+
+    ty_checker = TypeChecker(_func_name)
+    ty_checker.check(self, SeriesType)
+
+    if self.data != string_array_split_view_type:
+        ty_checker.raise_exc(self.data, 'split strings', 'self.data')
+
+    if isinstance(self.index, types.NoneType) or self.index is None:
+        def hpat_pandas_series_explode_noindex_impl(self):
+            data, positions = split_view_explode(self._data)
+
+            return pandas.Series(data, positions, name=self._name)
+
+        return hpat_pandas_series_explode_noindex_impl
+
+    def hpat_pandas_series_explode_impl(self):
+        data, positions = split_view_explode(self._data)
+        index = common_functions._sdc_take(self._index, positions)
+
+        return pandas.Series(data, index, name=self._name)
+
+    return hpat_pandas_series_explode_impl
+
+
+@sdc_overload_method(SeriesType, 'factorize')
+def hpat_pandas_series_factorize(self, sort=False, na_sentinel=-1):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+
+    Pandas API: pandas.Series.factorize
+
+    Limitations
+    -----------
+    Series elements are expected to be numbers or strings.
+    Uniques are returned as array, not as Index.
+
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/series/series_factorize.py
+       :language: python
+       :lines: 27-
+       :caption: Encode the object as an enumerated type or categorical variable.
+       :name: ex_series_factorize
+
+    .. command-output:: python ./series/series_factorize.py
+       :cwd: ../../../examples
+
+    .. seealso::
+        :ref:`Series.unique <pandas.Series.unique>`
+            Return unique values of Series object.
+        :ref:`Series.value_counts <pandas.Series.value_counts>`
+            Return a Series containing counts of unique values.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas Series method :meth:`pandas.Series.factorize` implementation.
+
+    .. only:: developer
+
+        Test: python -m sdc.runtests -k sdc.tests.test_series.TestSeries.test_series_factorize*
+    """
+
+    _func_name = 'Method factorize().'
+
+    ty_checker = TypeChecker(_func_name)
+    ty_checker.check(self, SeriesType)
+
+    if not (isinstance(self.data, types.Array) or self.data == string_array_type):
+        ty_checker.raise_exc(self.data, 'array of numbers or strings', 'self.data')
+
+    if not isinstance(sort, (types.Omitted, types.Boolean, bool)):
+        ty_checker.raise_exc(sort, 'bool', 'sort')
+
+    if not isinstance(na_sentinel, (types.Omitted, types.Integer, int)):
+        ty_checker.raise_exc(na_sentinel, 'int', 'na_sentinel')
+
+    def hpat_pandas_series_factorize_impl(self, sort=False, na_sentinel=-1):
+        codes, uniques = _sdc_factorize(self._data, sort)
+        if na_sentinel != -1:
+            codes[codes == -1] = na_sentinel
+
+        return codes, uniques
+
+    return hpat_pandas_series_factorize_impl
+
+
 @sdc_overload_method(SeriesType, 'idxmax')
 def hpat_pandas_series_idxmax(self, axis=None, skipna=None):
     """
@@ -4826,24 +4957,15 @@ are currently unsupported by Intel Scalable Dataframe Compiler
     if not (observed is False or isinstance(observed, types.Omitted)):
         raise TypingError('{} Unsupported parameters. Given inplace: {}'.format(_func_name, observed))
 
-    by_type = by.dtype
-    list_type = types.ListType(types.int64)
     def sdc_pandas_series_groupby_impl(self, by=None, axis=0, level=None, as_index=True, sort=True,
                                        group_keys=True, squeeze=False, observed=False):
 
         if len(self) != len(by):
             raise ValueError("Series.groupby(). Grouper and axis must be same length")
 
-        grouped = Dict.empty(by_type, list_type)
-        for i in numpy.arange(len(by)):
-            if isna(by, i):
-                continue
-            value = by[i]
-            group_list = grouped.get(value, List.empty_list(types.int64))
-            group_list.append(i)
-            grouped[value] = group_list
+        group_index = _sdc_groupby_build_index(by)
 
-        return init_series_groupby(self, by, grouped, sort)
+        return init_series_groupby(self, by, group_index, sort)
 
     return sdc_pandas_series_groupby_impl
 
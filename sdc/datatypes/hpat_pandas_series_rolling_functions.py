@@ -27,14 +27,13 @@
 import numpy
 import pandas
 
-from functools import partial
-
 from numba import prange
 from numba.extending import register_jitable
-from numba.core.types import (float64, Boolean, Integer, NoneType, Number,
+from numba.core.types import (float64, Boolean, BooleanLiteral, DictType, Integer, NoneType, Number,
                          Omitted, StringLiteral, UnicodeType)
 
-from sdc.datatypes.common_functions import _almost_equal
+from sdc.config import config_rolling_resync_period
+from sdc.datatypes.common_functions import SDCLimitation, _almost_equal
 from sdc.datatypes.hpat_pandas_series_rolling_types import SeriesRollingType
 from sdc.functions.statistics import skew_formula
 from sdc.hiframes.pd_series_type import SeriesType
@@ -43,10 +42,6 @@ from sdc.utilities.sdc_typing_utils import TypeChecker
 from sdc.utilities.utils import sdc_overload_method, sdc_register_jitable
 
 
-# disabling parallel execution for rolling due to numba issue https://github.com/numba/numba/issues/5098
-sdc_rolling_overload = partial(sdc_overload_method, parallel=False)
-
-
 hpat_pandas_series_rolling_docstring_tmpl = """
     Intel Scalable Dataframe Compiler User Guide
     ********************************************
@@ -103,12 +98,6 @@ hpat_pandas_series_rolling_docstring_tmpl = """
 """
 
 
-@sdc_register_jitable
-def arr_apply(arr, func):
-    """Apply function for values"""
-    return func(arr)
-
-
 @sdc_register_jitable
 def arr_mean(arr):
     """Calculate mean of values"""
@@ -119,51 +108,87 @@ def arr_mean(arr):
 
 
 @sdc_register_jitable
-def arr_median(arr):
-    """Calculate median of values"""
-    if len(arr) == 0:
-        return numpy.nan
+def apply_raw_window(func, raw, values, index, name, start, stop):
+    """Apply function for view of window values"""
+    return func(values[start:stop])
+
 
-    return numpy.median(arr)
+@sdc_register_jitable
+def apply_series_window(func, raw, values, index, name, start, stop):
+    """Apply function for series over views of window values and index"""
+    return func(pandas.Series(values[start:stop], index[start:stop], name=name))
 
 
 @sdc_register_jitable
-def arr_quantile(arr, q):
-    """Calculate quantile of values"""
-    if len(arr) == 0:
-        return numpy.nan
+def apply_runtime_raw_window(func, raw, values, index, name, start, stop):
+    """Apply function for view of window values or series over it depending on raw"""
+    if raw:
+        return apply_raw_window(func, raw, values, index, name, start, stop)
 
-    return numpy.quantile(arr, q)
+    return apply_series_window(func, raw, values, index, name, start, stop)
 
 
-def gen_hpat_pandas_series_rolling_impl(rolling_func):
-    """Generate series rolling methods implementations based on input func"""
-    def impl(self):
+@sdc_register_jitable
+def rolling_apply_values(input_arr):
+    """
+    Get float values with infinite values replaced by nans
+    and cumulative number of finite values, windows are views of the values.
+    """
+    length = len(input_arr)
+    values = numpy.empty(length, dtype=float64)
+    for i in prange(length):
+        value = float64(input_arr[i])
+        values[i] = value if not numpy.isinf(value) else numpy.nan
+
+    cum_nfinite = numpy.zeros(length + 1, dtype=numpy.int64)
+    cum_nfinite[1:] = numpy.cumsum(numpy.isfinite(values))
+
+    return values, cum_nfinite
+
+
+def gen_hpat_pandas_series_rolling_apply_impl(apply_window, use_index, use_engine_kwargs):
+    """
+    Generate series rolling apply implementation passing views of windows to the function
+    via apply_window(func, raw, values, index, name, start, stop), windows are processed in parallel
+    unless it is disabled by engine_kwargs.
+    """
+    def impl(self, func, raw=None, engine_kwargs=None):
+        if self._center:
+            raise ValueError('Method rolling.apply(). The object center\n expected: False')
+
+        parallel = True
+        if use_engine_kwargs == True:  # noqa
+            parallel = engine_kwargs.get('parallel', True)
+
         win = self._window
         minp = self._min_periods
 
         input_series = self._data
-        input_arr = input_series._data
-        length = len(input_arr)
+        length = len(input_series._data)
+        values, cum_nfinite = rolling_apply_values(input_series._data)
+        if use_index == True:  # noqa
+            index = input_series.index
+        else:
+            index = input_series._index
+        name = input_series._name
         output_arr = numpy.empty(length, dtype=float64)
 
-        def apply_minp(arr, minp):
-            finite_arr = arr[numpy.isfinite(arr)]
-            if len(finite_arr) < minp:
-                return numpy.nan
-            else:
-                return rolling_func(finite_arr)
-
-        boundary = min(win, length)
-        for i in prange(boundary):
-            arr_range = input_arr[:i + 1]
-            output_arr[i] = apply_minp(arr_range, minp)
-
-        for i in prange(boundary, length):
-            arr_range = input_arr[i + 1 - win:i + 1]
-            output_arr[i] = apply_minp(arr_range, minp)
+        if parallel:
+            for i in prange(length):
+                start = max(0, i + 1 - win)
+                if cum_nfinite[i + 1] - cum_nfinite[start] < minp:
+                    output_arr[i] = numpy.nan
+                else:
+                    output_arr[i] = apply_window(func, raw, values, index, name, start, i + 1)
+        else:
+            for i in range(length):
+                start = max(0, i + 1 - win)
+                if cum_nfinite[i + 1] - cum_nfinite[start] < minp:
+                    output_arr[i] = numpy.nan
+                else:
+                    output_arr[i] = apply_window(func, raw, values, index, name, start, i + 1)
 
-        return pandas.Series(output_arr, input_series._index, name=input_series._name)
+        return pandas.Series(output_arr, input_series._index, name=name)
 
     return impl
 
@@ -200,10 +225,6 @@ def gen_hpat_pandas_series_rolling_ddof_impl(rolling_func):
     return impl
 
 
-hpat_pandas_rolling_series_median_impl = register_jitable(
-    gen_hpat_pandas_series_rolling_impl(arr_median))
-
-
 @sdc_register_jitable
 def pop_corr(x, y, nfinite, result):
     """Calculate the window sums for corr without old value."""
@@ -298,6 +319,18 @@ def put_cov(x, y, nfinite, result, align_finiteness=False):
     return nfinite, (sum_x, sum_y, sum_xy, count + 1)
 
 
+@sdc_register_jitable
+def pop_aligned_cov(x, y, nfinite, result):
+    """Calculate the window sums for cov of values finite in both series without old values."""
+    return pop_cov(x, y, nfinite, result, align_finiteness=True)
+
+
+@sdc_register_jitable
+def put_aligned_cov(x, y, nfinite, result):
+    """Calculate the window sums for cov of values finite in both series with new values."""
+    return put_cov(x, y, nfinite, result, align_finiteness=True)
+
+
 @sdc_register_jitable
 def put_kurt(value, nfinite, result):
     """Calculate the window sums for kurt with new value."""
@@ -327,81 +360,245 @@ def pop_kurt(value, nfinite, result):
 
 
 @sdc_register_jitable
-def calc_max(arr, idx, win_size):
-    """Recalculate the window max based on data, index and window size."""
-    start = max(0, idx - win_size + 1)
-    nfinite = 0
-    result = numpy.nan
-    for i in range(start, idx + 1):
-        value = arr[i]
-        nfinite, result = put_max(value, nfinite, result)
+def init_deque(win):
+    """
+    Allocate a monotonic deque of window values for rolling min/max.
+    Deque is kept in ring buffers of positions and values with head and size.
+    """
+    positions = numpy.empty(win + 1, dtype=numpy.int64)
+    values = numpy.empty(win + 1, dtype=float64)
 
-    return nfinite, result
+    return positions, values, 0, 0
 
 
 @sdc_register_jitable
-def pop_max(value, nfinite, result, arr, idx, win_size):
-    """Calculate the window max without old value."""
-    if numpy.isfinite(value):
-        nfinite -= 1
-        if nfinite:
-            if value == result:
-                return calc_max(arr, idx, win_size)
-        else:
-            result = numpy.nan
+def pop_deque(value, nfinite, result, idx):
+    """Remove old value at position idx from the front of the monotonic deque."""
+    if not numpy.isfinite(value):
+        return nfinite, result
 
-    return nfinite, result
+    positions, values, head, size = result
+    if size > 0 and positions[head] == idx:
+        head += 1
+        if head == len(values):
+            head = 0
+        size -= 1
+
+    return nfinite - 1, (positions, values, head, size)
 
 
 @sdc_register_jitable
-def put_max(value, nfinite, result):
-    """Calculate the window max with new value."""
-    if numpy.isfinite(value):
-        nfinite += 1
-        if numpy.isnan(result) or value > result:
-            result = value
+def put_max(value, nfinite, result, idx):
+    """Calculate the window max with new value at position idx."""
+    if not numpy.isfinite(value):
+        return nfinite, result
 
-    return nfinite, result
+    positions, values, head, size = result
+    capacity = len(values)
+    while size > 0:
+        tail = head + size - 1
+        if tail >= capacity:
+            tail -= capacity
+        if values[tail] > value:
+            break
+        size -= 1
+
+    tail = head + size
+    if tail >= capacity:
+        tail -= capacity
+    positions[tail] = idx
+    values[tail] = value
+
+    return nfinite + 1, (positions, values, head, size + 1)
 
 
 @sdc_register_jitable
-def calc_min(arr, idx, win_size):
-    """Recalculate the window min based on data, index and window size."""
-    start = max(0, idx - win_size + 1)
-    nfinite = 0
-    result = numpy.nan
-    for i in range(start, idx + 1):
-        value = arr[i]
-        nfinite, result = put_min(value, nfinite, result)
+def put_min(value, nfinite, result, idx):
+    """Calculate the window min with new value at position idx."""
+    if not numpy.isfinite(value):
+        return nfinite, result
 
-    return nfinite, result
+    positions, values, head, size = result
+    capacity = len(values)
+    while size > 0:
+        tail = head + size - 1
+        if tail >= capacity:
+            tail -= capacity
+        if values[tail] < value:
+            break
+        size -= 1
+
+    tail = head + size
+    if tail >= capacity:
+        tail -= capacity
+    positions[tail] = idx
+    values[tail] = value
+
+    return nfinite + 1, (positions, values, head, size + 1)
 
 
 @sdc_register_jitable
-def pop_min(value, nfinite, result, arr, idx, win_size):
-    """Calculate the window min without old value."""
-    if numpy.isfinite(value):
-        nfinite -= 1
-        if nfinite:
-            if value == result:
-                return calc_min(arr, idx, win_size)
-        else:
-            result = numpy.nan
+def deque_result_or_nan(nfinite, minp, result):
+    """Get result min/max from the front of the monotonic deque taking into account min periods."""
+    if nfinite == 0 or nfinite < minp:
+        return numpy.nan
 
-    return nfinite, result
+    positions, values, head, size = result
+
+    return values[head]
 
 
 @sdc_register_jitable
-def put_min(value, nfinite, result):
-    """Calculate the window min with new value."""
-    if numpy.isfinite(value):
-        nfinite += 1
-        if numpy.isnan(result) or value < result:
-            result = value
+def init_skiplist(win):
+    """
+    Allocate an indexable skiplist able to keep the finite values of a window of size win.
+    Nodes are stored in arrays: node 0 is the head, node 1 is the tail sentinel (+inf),
+    the rest are reused through the stack of free nodes. Heights of nodes are drawn from the local
+    xorshift generator seeded with a constant, so the layout is reproducible.
+    """
+    capacity = win + 3
+    nlevels = 1
+    while (1 << nlevels) <= win:
+        nlevels += 1
+
+    values = numpy.empty(capacity, dtype=float64)
+    links = numpy.ones((capacity, nlevels), dtype=numpy.int64)
+    widths = numpy.ones((capacity, nlevels), dtype=numpy.int64)
+    heights = numpy.zeros(capacity, dtype=numpy.int64)
+    free_nodes = numpy.arange(2, capacity)
+    chain = numpy.zeros(nlevels, dtype=numpy.int64)
+    steps = numpy.zeros(nlevels, dtype=numpy.int64)
+    rng_state = numpy.full(1, 88172645463325252, dtype=numpy.uint64)
+    values[0] = -numpy.inf
+    values[1] = numpy.inf
+
+    return values, links, widths, heights, free_nodes, chain, steps, rng_state
+
+
+@sdc_register_jitable
+def skiplist_random_height(rng_state, nlevels):
+    """
+    Draw height of a new skiplist node, reaching every next level with probability 0.5, from xorshift64
+    generator kept in rng_state, so that random stream of the user (numpy.random) is not advanced.
+    """
+    bits = rng_state[0]
+    bits ^= bits << numpy.uint64(13)
+    bits ^= bits >> numpy.uint64(7)
+    bits ^= bits << numpy.uint64(17)
+    rng_state[0] = bits
+
+    height = 1
+    while height < nlevels and (bits & numpy.uint64(1)) != 0:
+        height += 1
+        bits >>= numpy.uint64(1)
+
+    return height
+
+
+@sdc_register_jitable
+def skiplist_node_at(result, rank):
+    """Find the skiplist node keeping the value of the given rank (0-based) in O(log(win))."""
+    values, links, widths, heights, free_nodes, chain, steps, rng_state = result
+    node = 0
+    rank += 1
+    for level in range(links.shape[1] - 1, -1, -1):
+        while widths[node, level] <= rank:
+            rank -= widths[node, level]
+            node = links[node, level]
+
+    return node
+
+
+@sdc_register_jitable
+def pop_quantile(value, nfinite, result):
+    """Remove old value from the skiplist of window values."""
+    if not numpy.isfinite(value):
+        return nfinite, result
+
+    values, links, widths, heights, free_nodes, chain, steps, rng_state = result
+    nlevels = links.shape[1]
+    node = 0
+    for level in range(nlevels - 1, -1, -1):
+        while values[links[node, level]] < value:
+            node = links[node, level]
+        chain[level] = node
+
+    removed = links[chain[0], 0]
+    height = heights[removed]
+    for level in range(height):
+        prev = chain[level]
+        widths[prev, level] += widths[removed, level] - 1
+        links[prev, level] = links[removed, level]
+    for level in range(height, nlevels):
+        widths[chain[level], level] -= 1
+
+    nfinite -= 1
+    free_nodes[len(free_nodes) - 1 - nfinite] = removed
 
     return nfinite, result
 
 
+@sdc_register_jitable
+def put_quantile(value, nfinite, result):
+    """Insert new value into the skiplist of window values."""
+    if not numpy.isfinite(value):
+        return nfinite, result
+
+    values, links, widths, heights, free_nodes, chain, steps, rng_state = result
+    nlevels = links.shape[1]
+    node = 0
+    for level in range(nlevels - 1, -1, -1):
+        steps[level] = 0
+        while values[links[node, level]] <= value:
+            steps[level] += widths[node, level]
+            node = links[node, level]
+        chain[level] = node
+
+    height = skiplist_random_height(rng_state, nlevels)
+
+    new_node = free_nodes[len(free_nodes) - 1 - nfinite]
+    values[new_node] = value
+    heights[new_node] = height
+    passed = 0
+    for level in range(height):
+        prev = chain[level]
+        links[new_node, level] = links[prev, level]
+        links[prev, level] = new_node
+        widths[new_node, level] = widths[prev, level] - passed
+        widths[prev, level] = passed + 1
+        passed += steps[level]
+    for level in range(height, nlevels):
+        widths[chain[level], level] += 1
+
+    return nfinite + 1, result
+
+
+@sdc_register_jitable
+def quantile_result_or_nan(nfinite, minp, result, quantile):
+    """Get result quantile of the skiplist values taking into account min periods."""
+    if nfinite == 0 or nfinite < minp:
+        return numpy.nan
+
+    values, links, widths, heights, free_nodes, chain, steps, rng_state = result
+    position = quantile * (nfinite - 1)
+    rank = int(position)
+    node = skiplist_node_at(result, rank)
+    lower = values[node]
+    fraction = position - rank
+    if fraction == 0:
+        return lower
+
+    upper = values[links[node, 0]]
+
+    return lower + (upper - lower) * fraction
+
+
+@sdc_register_jitable
+def median_result_or_nan(nfinite, minp, result):
+    """Get result median of the skiplist values taking into account min periods."""
+    return quantile_result_or_nan(nfinite, minp, result, 0.5)
+
+
 @sdc_register_jitable
 def put_skew(value, nfinite, result):
     """Calculate the window sums for skew with new value."""
@@ -472,6 +669,100 @@ def put_sum2(value, nfinite, result):
     return nfinite, (_sum, square_sum)
 
 
+@sdc_register_jitable
+def neumaier_add(total, compensation, value):
+    """
+    Add value to the total keeping low-order bits lost by the total in the compensation
+    (Kahan-Babuska-Neumaier summation), compensated total is total + compensation.
+    """
+    new_total = total + value
+    if numpy.abs(total) >= numpy.abs(value):
+        compensation += (total - new_total) + value
+    else:
+        compensation += (value - new_total) + total
+
+    return new_total, compensation
+
+
+@sdc_register_jitable
+def pop_compensated_sum(value, nfinite, result):
+    """Calculate the window compensated sum without old value, sum of empty window is reset."""
+    if not numpy.isfinite(value):
+        return nfinite, result
+
+    nfinite -= 1
+    if nfinite == 0:
+        return nfinite, (0., 0.)
+
+    total, compensation = result
+
+    return nfinite, neumaier_add(total, compensation, -value)
+
+
+@sdc_register_jitable
+def put_compensated_sum(value, nfinite, result):
+    """Calculate the window compensated sum with new value."""
+    if not numpy.isfinite(value):
+        return nfinite, result
+
+    total, compensation = result
+
+    return nfinite + 1, neumaier_add(total, compensation, value)
+
+
+def gen_init_moments(degree):
+    """
+    Generate function allocating state of the window moments up to the degree:
+    shift of the values followed by compensated sums (with compensations) of powers of the shifted values.
+    """
+    def impl(win):
+        return numpy.zeros(2 * degree + 1, dtype=float64)
+
+    return register_jitable(impl)
+
+
+@sdc_register_jitable
+def pop_moments(value, nfinite, result):
+    """Calculate the window sums of powers of the shifted values without old value."""
+    if not numpy.isfinite(value):
+        return nfinite, result
+
+    nfinite -= 1
+    if nfinite == 0:
+        result[:] = 0.
+        return nfinite, result
+
+    delta = value - result[0]
+    term = -1.
+    for k in range(1, len(result), 2):
+        term *= delta
+        result[k], result[k + 1] = neumaier_add(result[k], result[k + 1], term)
+
+    return nfinite, result
+
+
+@sdc_register_jitable
+def put_moments(value, nfinite, result):
+    """
+    Calculate the window sums of powers of the shifted values with new value.
+    Values are shifted by the first value put into the empty window to avoid cancellation in central moments.
+    """
+    if not numpy.isfinite(value):
+        return nfinite, result
+
+    if nfinite == 0:
+        result[:] = 0.
+        result[0] = value
+
+    delta = value - result[0]
+    term = 1.
+    for k in range(1, len(result), 2):
+        term *= delta
+        result[k], result[k + 1] = neumaier_add(result[k], result[k + 1], term)
+
+    return nfinite + 1, result
+
+
 @sdc_register_jitable
 def result_or_nan(nfinite, minp, result):
     """Get result taking into account min periods."""
@@ -580,216 +871,570 @@ def std_result_or_nan(nfinite, minp, result, ddof):
     return var_result_or_nan(nfinite, minp, result, ddof) ** 0.5
 
 
-def gen_sdc_pandas_series_rolling_impl(pop, put, get_result=result_or_nan,
-                                       init_result=numpy.nan):
-    """Generate series rolling methods implementations based on pop/put funcs"""
-    def impl(self):
-        win = self._window
-        minp = self._min_periods
+@sdc_register_jitable
+def compensated_sum_result_or_nan(nfinite, minp, result):
+    """Get result compensated sum taking into account min periods."""
+    total, compensation = result
 
-        input_series = self._data
-        input_arr = input_series._data
-        length = len(input_arr)
-        output_arr = numpy.empty(length, dtype=float64)
+    return result_or_nan(nfinite, minp, total + compensation)
 
-        chunks = parallel_chunks(length)
-        for i in prange(len(chunks)):
-            chunk = chunks[i]
-            nfinite = 0
+
+@sdc_register_jitable
+def compensated_mean_result_or_nan(nfinite, minp, result):
+    """Get result mean of compensated sum taking into account min periods."""
+    total, compensation = result
+
+    return mean_result_or_nan(nfinite, minp, total + compensation)
+
+
+@sdc_register_jitable
+def moments_kurt_result_or_nan(nfinite, minp, result):
+    """Get result kurt of the window moments taking into account min periods."""
+    sums = (result[1] + result[2], result[3] + result[4], result[5] + result[6], result[7] + result[8])
+
+    return kurt_result_or_nan(nfinite, minp, sums)
+
+
+@sdc_register_jitable
+def moments_skew_result_or_nan(nfinite, minp, result):
+    """Get result skew of the window moments taking into account min periods."""
+    sums = (result[1] + result[2], result[3] + result[4], result[5] + result[6])
+
+    return skew_result_or_nan(nfinite, minp, sums)
+
+
+@sdc_register_jitable
+def moments_var_result_or_nan(nfinite, minp, result, ddof):
+    """Get result var of the window moments taking into account min periods, rounding errors are clipped."""
+    sums = (result[1] + result[2], result[3] + result[4])
+    res = var_result_or_nan(nfinite, minp, sums, ddof)
+    if res < 0:
+        return 0.
+
+    return res
+
+
+@sdc_register_jitable
+def moments_std_result_or_nan(nfinite, minp, result, ddof):
+    """Get result std of the window moments taking into account min periods."""
+    return moments_var_result_or_nan(nfinite, minp, result, ddof) ** 0.5
+
+
+@sdc_register_jitable
+def rolling_center_offset(win, center):
+    """Get offset of the labels of the window, labels of centered windows are shifted by half of the window."""
+    if center and win > 0:
+        return (win - 1) // 2
+
+    return 0
+
+
+@sdc_register_jitable
+def rolling_value(input_arr, idx):
+    """Get value at position idx, positions after the end of the input are missing values."""
+    if idx < len(input_arr):
+        return input_arr[idx]
+
+    return numpy.nan
+
+
+def gen_sdc_rolling_chunk_impl(pop, put, get_result=result_or_nan, init_result=numpy.nan,
+                               init_state=None, use_positions=False, use_param=False, resync=False):
+    """
+    Generate function computing rolling results of fixed window for a chunk of data based on pop/put funcs.
+    Window of a row covers rows in (idx - win, idx], the beginning of the chunk windows is taken
+    from the previous rows, so that chunks are processed independently. Positions after the end of the input
+    are missing values, so that results of centered windows are got by shifting the output.
+    init_state allocates state sized by the window, use_positions passes row positions to pop/put,
+    use_param passes param (ddof, quantile) to get_result. If resync is set the state is recomputed
+    from the window values every config_rolling_resync_period rows, put is expected to reset state of empty window.
+    """
+    use_state = init_state is not None
+    resync_period = config_rolling_resync_period if resync else 0
+    use_resync = resync_period > 0
+
+    def impl(input_arr, output_arr, chunk, win, minp, param):
+        nfinite = 0
+        if use_state == True:  # noqa
+            result = init_state(win)
+        else:
             result = init_result
 
-            if win == 0:
-                for idx in range(chunk.start, chunk.stop):
+        if win == 0:
+            for idx in range(chunk.start, chunk.stop):
+                if use_param == True:  # noqa
+                    output_arr[idx] = get_result(nfinite, minp, result, param)
+                else:
                     output_arr[idx] = get_result(nfinite, minp, result)
-                continue
+            return
 
-            prelude_start = max(0, chunk.start - win + 1)
-            prelude_stop = chunk.start
+        prelude_start = max(0, chunk.start - win + 1)
+        prelude_stop = chunk.start
 
-            interlude_start = prelude_stop
-            interlude_stop = min(prelude_start + win, chunk.stop)
+        interlude_start = prelude_stop
+        interlude_stop = min(prelude_start + win, chunk.stop)
 
-            for idx in range(prelude_start, prelude_stop):
-                value = input_arr[idx]
+        for idx in range(prelude_start, prelude_stop):
+            value = rolling_value(input_arr, idx)
+            if use_positions == True:  # noqa
+                nfinite, result = put(value, nfinite, result, idx)
+            else:
                 nfinite, result = put(value, nfinite, result)
 
-            for idx in range(interlude_start, interlude_stop):
-                value = input_arr[idx]
+        for idx in range(interlude_start, interlude_stop):
+            value = rolling_value(input_arr, idx)
+            if use_positions == True:  # noqa
+                nfinite, result = put(value, nfinite, result, idx)
+            else:
                 nfinite, result = put(value, nfinite, result)
+
+            if use_param == True:  # noqa
+                output_arr[idx] = get_result(nfinite, minp, result, param)
+            else:
                 output_arr[idx] = get_result(nfinite, minp, result)
 
-            for idx in range(interlude_stop, chunk.stop):
-                put_value = input_arr[idx]
-                pop_value = input_arr[idx - win]
+        for idx in range(interlude_stop, chunk.stop):
+            put_value = rolling_value(input_arr, idx)
+            pop_value = rolling_value(input_arr, idx - win)
+            if use_positions == True:  # noqa
+                nfinite, result = put(put_value, nfinite, result, idx)
+                nfinite, result = pop(pop_value, nfinite, result, idx - win)
+            else:
                 nfinite, result = put(put_value, nfinite, result)
                 nfinite, result = pop(pop_value, nfinite, result)
+
+            if use_resync == True:  # noqa
+                if (idx - interlude_stop + 1) % resync_period == 0:
+                    # drop rounding errors accumulated by pop/put
+                    nfinite = 0
+                    for pos in range(idx - win + 1, idx + 1):
+                        nfinite, result = put(rolling_value(input_arr, pos), nfinite, result)
+
+            if use_param == True:  # noqa
+                output_arr[idx] = get_result(nfinite, minp, result, param)
+            else:
                 output_arr[idx] = get_result(nfinite, minp, result)
 
-        return pandas.Series(output_arr, input_series._index,
-                             name=input_series._name)
-    return impl
+    return register_jitable(impl)
 
 
-def gen_sdc_pandas_series_rolling_minmax_impl(pop, put, init_result=numpy.nan):
-    """Generate series rolling min/max implementations based on pop/put funcs"""
-    def impl(self):
+def gen_sdc_rolling_impl(rolling_chunk):
+    """
+    Generate function computing series rolling results of fixed window based on chunk func.
+    Centered windows are computed over the input padded by the offset of the labels and shifted back.
+    """
+    def impl(self, param):
         win = self._window
         minp = self._min_periods
+        offset = rolling_center_offset(win, self._center)
 
         input_series = self._data
         input_arr = input_series._data
-        length = len(input_arr)
+        length = len(input_arr) + offset
         output_arr = numpy.empty(length, dtype=float64)
 
         chunks = parallel_chunks(length)
         for i in prange(len(chunks)):
-            chunk = chunks[i]
-            nfinite = 0
-            result = init_result
+            rolling_chunk(input_arr, output_arr, chunks[i], win, minp, param)
 
-            if win == 0:
-                for idx in range(chunk.start, chunk.stop):
-                    output_arr[idx] = result_or_nan(nfinite, minp, result)
-                continue
+        return pandas.Series(output_arr[offset:], input_series._index,
+                             name=input_series._name)
 
-            prelude_start = max(0, chunk.start - win + 1)
-            prelude_stop = chunk.start
+    return sdc_register_jitable(impl)
 
-            interlude_start = prelude_stop
-            interlude_stop = min(prelude_start + win, chunk.stop)
 
-            for idx in range(prelude_start, prelude_stop):
-                value = input_arr[idx]
-                nfinite, result = put(value, nfinite, result)
+@sdc_register_jitable
+def triang_window_weights(win, std):
+    """Get weights of the symmetric triangular window as scipy.signal.windows.triang does."""
+    n = numpy.arange(1, (win + 1) // 2 + 1)
+    if win % 2 == 0:
+        weights = (2 * n - 1.) / win
+        return numpy.concatenate((weights, weights[::-1]))
 
-            for idx in range(interlude_start, interlude_stop):
-                value = input_arr[idx]
-                nfinite, result = put(value, nfinite, result)
-                output_arr[idx] = result_or_nan(nfinite, minp, result)
+    weights = 2 * n / (win + 1.)
+    return numpy.concatenate((weights, weights[-2::-1]))
 
-            for idx in range(interlude_stop, chunk.stop):
-                put_value = input_arr[idx]
-                pop_value = input_arr[idx - win]
-                nfinite, result = put(put_value, nfinite, result)
-                nfinite, result = pop(pop_value, nfinite, result,
-                                      input_arr, idx, win)
-                output_arr[idx] = result_or_nan(nfinite, minp, result)
 
-        return pandas.Series(output_arr, input_series._index,
-                             name=input_series._name)
-    return impl
+@sdc_register_jitable
+def gaussian_window_weights(win, std):
+    """Get weights of the symmetric gaussian window as scipy.signal.windows.gaussian does."""
+    n = numpy.arange(0, win) - (win - 1.) / 2.
+    sig2 = 2 * std * std
 
+    return numpy.exp(-n ** 2 / sig2)
 
-def gen_sdc_pandas_series_rolling_ddof_impl(pop, put, get_result=ddof_result,
-                                            init_result=numpy.nan):
-    """Generate series rolling ddof implementations based on pop/put funcs"""
-    def impl(self, ddof=1):
+
+@sdc_register_jitable
+def hann_window_weights(win, std):
+    """Get weights of the symmetric hann window as scipy.signal.windows.hann does."""
+    if win <= 1:
+        return numpy.ones(win)
+
+    fac = numpy.linspace(-numpy.pi, numpy.pi, win)
+
+    return 0.5 + 0.5 * numpy.cos(fac)
+
+
+sdc_rolling_window_weights = {
+    'triang': triang_window_weights,
+    'gaussian': gaussian_window_weights,
+    'hann': hann_window_weights,
+}
+
+
+def gen_sdc_rolling_weighted_impl(win_type, average=False):
+    """
+    Generate function computing series rolling sum (mean if average is set) of weighted window.
+    Results are fixed-weight convolution of the input computed directly for rows of each chunk,
+    missing values are skipped and mean is normalized by the total weight of the observations.
+    """
+    window_weights = sdc_rolling_window_weights[win_type]
+
+    def impl(self, std):
         win = self._window
-        minp = self._min_periods
+        minp = max(self._min_periods, 1)
+        offset = rolling_center_offset(win, self._center)
+        weights = window_weights(win, std)
 
         input_series = self._data
         input_arr = input_series._data
-        length = len(input_arr)
+        input_length = len(input_arr)
+        length = input_length + offset
         output_arr = numpy.empty(length, dtype=float64)
 
         chunks = parallel_chunks(length)
         for i in prange(len(chunks)):
             chunk = chunks[i]
-            nfinite = 0
-            result = init_result
+            for idx in range(chunk.start, chunk.stop):
+                start = idx - win + 1
+                nfinite = 0
+                total = 0.
+                total_weight = 0.
+                for k in range(max(0, -start), min(win, input_length - start)):
+                    value = input_arr[start + k]
+                    if numpy.isfinite(value):
+                        nfinite += 1
+                        total += value * weights[k]
+                        total_weight += weights[k]
+
+                if nfinite < minp:
+                    output_arr[idx] = numpy.nan
+                elif average == True:  # noqa
+                    output_arr[idx] = numpy.nan if total_weight == 0 else total / total_weight
+                else:
+                    output_arr[idx] = total
+
+        return pandas.Series(output_arr[offset:], input_series._index,
+                             name=input_series._name)
 
-            if win == 0:
+    return sdc_register_jitable(impl)
+
+
+sdc_rolling_chunks = {
+    'count': gen_sdc_rolling_chunk_impl(
+        pop_count, put_count, get_result=result, init_result=0.),
+    'kurt': gen_sdc_rolling_chunk_impl(
+        pop_moments, put_moments, get_result=moments_kurt_result_or_nan, init_state=gen_init_moments(4),
+        resync=True),
+    'max': gen_sdc_rolling_chunk_impl(
+        pop_deque, put_max, get_result=deque_result_or_nan, init_state=init_deque, use_positions=True),
+    'mean': gen_sdc_rolling_chunk_impl(
+        pop_compensated_sum, put_compensated_sum, get_result=compensated_mean_result_or_nan,
+        init_result=(0., 0.)),
+    'median': gen_sdc_rolling_chunk_impl(
+        pop_quantile, put_quantile, get_result=median_result_or_nan, init_state=init_skiplist),
+    'min': gen_sdc_rolling_chunk_impl(
+        pop_deque, put_min, get_result=deque_result_or_nan, init_state=init_deque, use_positions=True),
+    'quantile': gen_sdc_rolling_chunk_impl(
+        pop_quantile, put_quantile, get_result=quantile_result_or_nan, init_state=init_skiplist, use_param=True),
+    'skew': gen_sdc_rolling_chunk_impl(
+        pop_moments, put_moments, get_result=moments_skew_result_or_nan, init_state=gen_init_moments(3),
+        resync=True),
+    'sum': gen_sdc_rolling_chunk_impl(
+        pop_compensated_sum, put_compensated_sum, get_result=compensated_sum_result_or_nan,
+        init_result=(0., 0.)),
+    'var': gen_sdc_rolling_chunk_impl(
+        pop_moments, put_moments, get_result=moments_var_result_or_nan, init_state=gen_init_moments(2),
+        use_param=True, resync=True),
+    'std': gen_sdc_rolling_chunk_impl(
+        pop_moments, put_moments, get_result=moments_std_result_or_nan, init_state=gen_init_moments(2),
+        use_param=True, resync=True),
+}
+
+sdc_rolling_impls = {method_name: gen_sdc_rolling_impl(rolling_chunk)
+                     for method_name, rolling_chunk in sdc_rolling_chunks.items()}
+
+
+def gen_sdc_rolling_pair_chunk_impl(pop, put, get_result, init_result, use_param=False):
+    """
+    Generate function computing rolling results of fixed window of two series of the same length
+    for a chunk of data based on pop/put funcs of pairs of values.
+    """
+    def impl(x_arr, y_arr, output_arr, chunk, win, minp, param):
+        nfinite = 0
+        result = init_result
+
+        if win == 0:
+            for idx in range(chunk.start, chunk.stop):
+                if use_param == True:  # noqa
+                    output_arr[idx] = get_result(nfinite, minp, result, param)
+                else:
+                    output_arr[idx] = get_result(nfinite, minp, result)
+            return
+
+        prelude_start = max(0, chunk.start - win + 1)
+        prelude_stop = chunk.start
+
+        interlude_start = prelude_stop
+        interlude_stop = min(prelude_start + win, chunk.stop)
+
+        for idx in range(prelude_start, prelude_stop):
+            nfinite, result = put(x_arr[idx], y_arr[idx], nfinite, result)
+
+        for idx in range(interlude_start, interlude_stop):
+            nfinite, result = put(x_arr[idx], y_arr[idx], nfinite, result)
+            if use_param == True:  # noqa
+                output_arr[idx] = get_result(nfinite, minp, result, param)
+            else:
+                output_arr[idx] = get_result(nfinite, minp, result)
+
+        for idx in range(interlude_stop, chunk.stop):
+            nfinite, result = put(x_arr[idx], y_arr[idx], nfinite, result)
+            nfinite, result = pop(x_arr[idx - win], y_arr[idx - win], nfinite, result)
+            if use_param == True:  # noqa
+                output_arr[idx] = get_result(nfinite, minp, result, param)
+            else:
+                output_arr[idx] = get_result(nfinite, minp, result)
+
+    return register_jitable(impl)
+
+
+def gen_sdc_rolling_pairwise_impl(rolling_pair_chunk):
+    """
+    Generate function computing rolling results of every pair of rows of 2-D array of column values.
+    Every pair of columns is computed once in parallel by pairs and chunks of rows, result of the pair (i, j)
+    at row idx is written into positions idx * ncols + i of output row j and idx * ncols + j of output row i,
+    so that output rows are columns of the long-format result (matrices of the rows are stacked).
+    """
+    def impl(values, win, minp, param):
+        ncols, length = values.shape
+        output = numpy.empty((ncols, length * ncols), dtype=float64)
+
+        npairs = ncols * (ncols + 1) // 2
+        pairs = numpy.empty((npairs, 2), dtype=numpy.int64)
+        pair = 0
+        for i in range(ncols):
+            for j in range(i, ncols):
+                pairs[pair, 0] = i
+                pairs[pair, 1] = j
+                pair += 1
+
+        chunks = parallel_chunks(length)
+        nchunks = len(chunks)
+        for task in prange(npairs * nchunks):
+            i = pairs[task // nchunks, 0]
+            j = pairs[task // nchunks, 1]
+            chunk = chunks[task % nchunks]
+            rolling_pair_chunk(values[i], values[j], output[j, i::ncols], chunk, win, minp, param)
+            if i != j:
                 for idx in range(chunk.start, chunk.stop):
-                    output_arr[idx] = get_result(nfinite, minp, result, ddof)
-                continue
+                    output[i, idx * ncols + j] = output[j, idx * ncols + i]
 
-            prelude_start = max(0, chunk.start - win + 1)
-            prelude_stop = chunk.start
+        return output
 
-            interlude_start = prelude_stop
-            interlude_stop = min(prelude_start + win, chunk.stop)
+    return sdc_register_jitable(impl)
 
-            for idx in range(prelude_start, prelude_stop):
-                value = input_arr[idx]
-                nfinite, result = put(value, nfinite, result)
 
-            for idx in range(interlude_start, interlude_stop):
-                value = input_arr[idx]
-                nfinite, result = put(value, nfinite, result)
-                output_arr[idx] = get_result(nfinite, minp, result, ddof)
+sdc_rolling_pairwise_impls = {
+    'corr': gen_sdc_rolling_pairwise_impl(gen_sdc_rolling_pair_chunk_impl(
+        pop_corr, put_corr, corr_result_or_nan, (0., 0., 0., 0., 0.))),
+    'cov': gen_sdc_rolling_pairwise_impl(gen_sdc_rolling_pair_chunk_impl(
+        pop_aligned_cov, put_aligned_cov, cov_result_or_nan, (0., 0., 0., 0.), use_param=True)),
+}
 
-            for idx in range(interlude_stop, chunk.stop):
-                put_value = input_arr[idx]
-                pop_value = input_arr[idx - win]
-                nfinite, result = put(put_value, nfinite, result)
-                nfinite, result = pop(pop_value, nfinite, result)
-                output_arr[idx] = get_result(nfinite, minp, result, ddof)
 
-        return pandas.Series(output_arr, input_series._index,
-                             name=input_series._name)
-    return impl
+def gen_sdc_rolling_freq_chunk_impl(pop, put, get_result=result_or_nan, init_result=numpy.nan,
+                                    init_state=None, use_positions=False, use_param=False, resync=False):
+    """
+    Generate function computing rolling results of offset window for a chunk of data based on pop/put funcs.
+    Window of a row covers rows with times in (time - win, time], start of the window of the first chunk row
+    is found by binary search, so that chunks are processed independently, then window bounds are moved
+    by two pointers. init_state allocates state sized by number of rows the chunk windows can keep,
+    use_positions passes row positions to pop/put, use_param passes param (ddof, quantile) to get_result.
+    If resync is set the state is recomputed from the window values every config_rolling_resync_period rows.
+    """
+    use_state = init_state is not None
+    resync_period = config_rolling_resync_period if resync else 0
+    use_resync = resync_period > 0
+
+    def impl(input_arr, times, output_arr, chunk, win, minp, param):
+        start = numpy.searchsorted(times, times[chunk.start] - win, side='right')
+        nfinite = 0
+        if use_state == True:  # noqa
+            result = init_state(chunk.stop - start)
+        else:
+            result = init_result
 
+        for idx in range(start, chunk.start):
+            if use_positions == True:  # noqa
+                nfinite, result = put(input_arr[idx], nfinite, result, idx)
+            else:
+                nfinite, result = put(input_arr[idx], nfinite, result)
 
-sdc_pandas_series_rolling_count_impl = gen_sdc_pandas_series_rolling_impl(
-    pop_count, put_count, get_result=result, init_result=0.)
-sdc_pandas_series_rolling_kurt_impl = gen_sdc_pandas_series_rolling_impl(
-    pop_kurt, put_kurt, get_result=kurt_result_or_nan,
-    init_result=(0., 0., 0., 0.))
-sdc_pandas_series_rolling_max_impl = gen_sdc_pandas_series_rolling_minmax_impl(
-    pop_max, put_max)
-sdc_pandas_series_rolling_mean_impl = gen_sdc_pandas_series_rolling_impl(
-    pop_sum, put_sum, get_result=mean_result_or_nan, init_result=0.)
-sdc_pandas_series_rolling_min_impl = gen_sdc_pandas_series_rolling_minmax_impl(
-    pop_min, put_min)
-sdc_pandas_series_rolling_skew_impl = gen_sdc_pandas_series_rolling_impl(
-    pop_skew, put_skew, get_result=skew_result_or_nan, init_result=(0., 0., 0.))
-sdc_pandas_series_rolling_sum_impl = gen_sdc_pandas_series_rolling_impl(
-    pop_sum, put_sum, init_result=0.)
-sdc_pandas_series_rolling_var_impl = gen_sdc_pandas_series_rolling_ddof_impl(
-    pop_sum2, put_sum2, get_result=var_result_or_nan, init_result=(0., 0.))
-sdc_pandas_series_rolling_std_impl = gen_sdc_pandas_series_rolling_ddof_impl(
-    pop_sum2, put_sum2, get_result=std_result_or_nan, init_result=(0., 0.))
-
-
-@sdc_rolling_overload(SeriesRollingType, 'apply')
-def hpat_pandas_series_rolling_apply(self, func, raw=None):
+        for idx in range(chunk.start, chunk.stop):
+            if use_positions == True:  # noqa
+                nfinite, result = put(input_arr[idx], nfinite, result, idx)
+            else:
+                nfinite, result = put(input_arr[idx], nfinite, result)
+
+            threshold = times[idx] - win
+            while start <= idx and times[start] <= threshold:
+                if use_positions == True:  # noqa
+                    nfinite, result = pop(input_arr[start], nfinite, result, start)
+                else:
+                    nfinite, result = pop(input_arr[start], nfinite, result)
+                start += 1
+
+            if use_resync == True:  # noqa
+                if (idx - chunk.start + 1) % resync_period == 0:
+                    # drop rounding errors accumulated by pop/put
+                    nfinite = 0
+                    for pos in range(start, idx + 1):
+                        nfinite, result = put(input_arr[pos], nfinite, result)
+
+            if use_param == True:  # noqa
+                output_arr[idx] = get_result(nfinite, minp, result, param)
+            else:
+                output_arr[idx] = get_result(nfinite, minp, result)
 
-    ty_checker = TypeChecker('Method rolling.apply().')
-    ty_checker.check(self, SeriesRollingType)
+    return register_jitable(impl)
 
-    raw_accepted = (Omitted, NoneType, Boolean)
-    if not isinstance(raw, raw_accepted) and raw is not None:
-        ty_checker.raise_exc(raw, 'bool', 'raw')
 
-    def hpat_pandas_rolling_series_apply_impl(self, func, raw=None):
+def gen_sdc_rolling_freq_impl(rolling_freq_chunk):
+    """Generate function computing series rolling results of offset window based on chunk func"""
+    def impl(self, param):
         win = self._window
         minp = self._min_periods
 
         input_series = self._data
         input_arr = input_series._data
+        times = input_series._index.view(numpy.int64)
         length = len(input_arr)
         output_arr = numpy.empty(length, dtype=float64)
 
-        def culc_apply(arr, func, minp):
-            finite_arr = arr.copy()
-            finite_arr[numpy.isinf(arr)] = numpy.nan
-            if len(finite_arr) < minp:
-                return numpy.nan
-            else:
-                return arr_apply(finite_arr, func)
+        chunks = parallel_chunks(length)
+        for i in prange(len(chunks)):
+            rolling_freq_chunk(input_arr, times, output_arr, chunks[i], win, minp, param)
 
-        boundary = min(win, length)
-        for i in prange(boundary):
-            arr_range = input_arr[:i + 1]
-            output_arr[i] = culc_apply(arr_range, func, minp)
+        return pandas.Series(output_arr, input_series._index,
+                             name=input_series._name)
 
-        for i in prange(boundary, length):
-            arr_range = input_arr[i + 1 - win:i + 1]
-            output_arr[i] = culc_apply(arr_range, func, minp)
+    return sdc_register_jitable(impl)
+
+
+sdc_rolling_freq_chunks = {
+    'count': gen_sdc_rolling_freq_chunk_impl(
+        pop_count, put_count, get_result=result, init_result=0.),
+    'kurt': gen_sdc_rolling_freq_chunk_impl(
+        pop_moments, put_moments, get_result=moments_kurt_result_or_nan, init_state=gen_init_moments(4),
+        resync=True),
+    'max': gen_sdc_rolling_freq_chunk_impl(
+        pop_deque, put_max, get_result=deque_result_or_nan, init_state=init_deque, use_positions=True),
+    'mean': gen_sdc_rolling_freq_chunk_impl(
+        pop_compensated_sum, put_compensated_sum, get_result=compensated_mean_result_or_nan,
+        init_result=(0., 0.)),
+    'median': gen_sdc_rolling_freq_chunk_impl(
+        pop_quantile, put_quantile, get_result=median_result_or_nan, init_state=init_skiplist),
+    'min': gen_sdc_rolling_freq_chunk_impl(
+        pop_deque, put_min, get_result=deque_result_or_nan, init_state=init_deque, use_positions=True),
+    'quantile': gen_sdc_rolling_freq_chunk_impl(
+        pop_quantile, put_quantile, get_result=quantile_result_or_nan, init_state=init_skiplist, use_param=True),
+    'skew': gen_sdc_rolling_freq_chunk_impl(
+        pop_moments, put_moments, get_result=moments_skew_result_or_nan, init_state=gen_init_moments(3),
+        resync=True),
+    'sum': gen_sdc_rolling_freq_chunk_impl(
+        pop_compensated_sum, put_compensated_sum, get_result=compensated_sum_result_or_nan,
+        init_result=(0., 0.)),
+    'var': gen_sdc_rolling_freq_chunk_impl(
+        pop_moments, put_moments, get_result=moments_var_result_or_nan, init_state=gen_init_moments(2),
+        use_param=True, resync=True),
+    'std': gen_sdc_rolling_freq_chunk_impl(
+        pop_moments, put_moments, get_result=moments_std_result_or_nan, init_state=gen_init_moments(2),
+        use_param=True, resync=True),
+}
+
+sdc_rolling_freq_impls = {method_name: gen_sdc_rolling_freq_impl(rolling_chunk)
+                          for method_name, rolling_chunk in sdc_rolling_freq_chunks.items()}
+
+
+def _hpat_pandas_series_rolling_select_impl(self, method_name):
+    """Select function computing series rolling results of the method by kind of the window"""
+    if self.is_weighted_type:
+        raise SDCLimitation(f"Method rolling.{method_name}(). Unsupported parameter. Given 'win_type' is not None")
+
+    if self.is_freq_type:
+        return sdc_rolling_freq_impls[method_name]
+
+    return sdc_rolling_impls[method_name]
+
+
+sdc_rolling_weighted_impls = {
+    'mean': {win_type: gen_sdc_rolling_weighted_impl(win_type, average=True)
+             for win_type in sdc_rolling_window_weights},
+    'sum': {win_type: gen_sdc_rolling_weighted_impl(win_type)
+            for win_type in sdc_rolling_window_weights},
+}
+
+
+def _hpat_pandas_series_rolling_select_weighted_impl(ty_checker, self, std, method_name):
+    """Select function computing series rolling results of the method supported by weighted windows"""
+    nan_std = isinstance(std, (Omitted, NoneType)) or std is None
+    if not self.is_weighted_type:
+        if not nan_std:
+            ty_checker.raise_exc(std, 'None', 'std')
+
+        return _hpat_pandas_series_rolling_select_impl(self, method_name)
+
+    if not isinstance(std, Number) and (self.win_type_name == 'gaussian' or not nan_std):
+        ty_checker.raise_exc(std, 'float', 'std')
+
+    return sdc_rolling_weighted_impls[method_name][self.win_type_name]
+
+
+@sdc_overload_method(SeriesRollingType, 'apply')
+def hpat_pandas_series_rolling_apply(self, func, raw=None, engine_kwargs=None):
 
-        return pandas.Series(output_arr, input_series._index, name=input_series._name)
+    ty_checker = TypeChecker('Method rolling.apply().')
+    ty_checker.check(self, SeriesRollingType)
+
+    raw_accepted = (Omitted, NoneType, Boolean)
+    if not isinstance(raw, raw_accepted) and raw is not None:
+        ty_checker.raise_exc(raw, 'bool', 'raw')
+
+    engine_kwargs_accepted = (Omitted, NoneType, DictType)
+    if not isinstance(engine_kwargs, engine_kwargs_accepted) and engine_kwargs is not None:
+        ty_checker.raise_exc(engine_kwargs, 'dict', 'engine_kwargs')
+
+    if isinstance(engine_kwargs, DictType):
+        if not isinstance(engine_kwargs.key_type, UnicodeType) or not isinstance(engine_kwargs.value_type, Boolean):
+            ty_checker.raise_exc(engine_kwargs, 'dict of str to bool', 'engine_kwargs')
 
-    return hpat_pandas_rolling_series_apply_impl
+    if self.is_freq_type:
+        raise SDCLimitation("Method rolling.apply(). Unsupported parameter. Given 'window' is an offset")
+    if self.is_weighted_type:
+        raise SDCLimitation("Method rolling.apply(). Unsupported parameter. Given 'win_type' is not None")
+
+    if isinstance(raw, (Omitted, NoneType)) or raw is None:
+        apply_window = apply_raw_window
+    elif isinstance(raw, BooleanLiteral):
+        apply_window = apply_raw_window if raw.literal_value else apply_series_window
+    else:
+        apply_window = apply_runtime_raw_window
+
+    use_index = apply_window is not apply_raw_window
+    use_engine_kwargs = isinstance(engine_kwargs, DictType)
+
+    return gen_hpat_pandas_series_rolling_apply_impl(apply_window, use_index, use_engine_kwargs)
 
 
 @sdc_overload_method(SeriesRollingType, 'corr')
@@ -806,9 +1451,17 @@ def hpat_pandas_series_rolling_corr(self, other=None, pairwise=None):
     if not isinstance(pairwise, accepted_pairwise) and pairwise is not None:
         ty_checker.raise_exc(pairwise, 'bool', 'pairwise')
 
+    if self.is_freq_type:
+        raise SDCLimitation("Method rolling.corr(). Unsupported parameter. Given 'window' is an offset")
+    if self.is_weighted_type:
+        raise SDCLimitation("Method rolling.corr(). Unsupported parameter. Given 'win_type' is not None")
+
     nan_other = isinstance(other, (Omitted, NoneType)) or other is None
 
     def hpat_pandas_rolling_series_corr_impl(self, other=None, pairwise=None):
+        if self._center:
+            raise ValueError('Method rolling.corr(). The object center\n expected: False')
+
         win = self._window
         minp = self._min_periods
 
@@ -887,7 +1540,12 @@ def hpat_pandas_series_rolling_count(self):
     ty_checker = TypeChecker('Method rolling.count().')
     ty_checker.check(self, SeriesRollingType)
 
-    return sdc_pandas_series_rolling_count_impl
+    rolling_count = _hpat_pandas_series_rolling_select_impl(self, 'count')
+
+    def hpat_pandas_rolling_series_count_impl(self):
+        return rolling_count(self, 0)
+
+    return hpat_pandas_rolling_series_count_impl
 
 
 def _hpat_pandas_series_rolling_cov_check_types(self, other=None,
@@ -907,12 +1565,20 @@ def _hpat_pandas_series_rolling_cov_check_types(self, other=None,
     if not isinstance(ddof, (int, Integer, Omitted)):
         ty_checker.raise_exc(ddof, 'int', 'ddof')
 
+    if self.is_freq_type:
+        raise SDCLimitation("Method rolling.cov(). Unsupported parameter. Given 'window' is an offset")
+    if self.is_weighted_type:
+        raise SDCLimitation("Method rolling.cov(). Unsupported parameter. Given 'win_type' is not None")
+
 
 def _gen_hpat_pandas_rolling_series_cov_impl(other, align_finiteness=False):
     """Generate series.rolling.cov() implementation based on series alignment"""
     nan_other = isinstance(other, (Omitted, NoneType)) or other is None
 
     def _impl(self, other=None, pairwise=None, ddof=1):
+        if self._center:
+            raise ValueError('Method rolling.cov(). The object center\n expected: False')
+
         win = self._window
         minp = self._min_periods
 
@@ -1012,7 +1678,12 @@ def hpat_pandas_series_rolling_kurt(self):
     ty_checker = TypeChecker('Method rolling.kurt().')
     ty_checker.check(self, SeriesRollingType)
 
-    return sdc_pandas_series_rolling_kurt_impl
+    rolling_kurt = _hpat_pandas_series_rolling_select_impl(self, 'kurt')
+
+    def hpat_pandas_rolling_series_kurt_impl(self):
+        return rolling_kurt(self, 0)
+
+    return hpat_pandas_rolling_series_kurt_impl
 
 
 @sdc_overload_method(SeriesRollingType, 'max')
@@ -1021,24 +1692,39 @@ def hpat_pandas_series_rolling_max(self):
     ty_checker = TypeChecker('Method rolling.max().')
     ty_checker.check(self, SeriesRollingType)
 
-    return sdc_pandas_series_rolling_max_impl
+    rolling_max = _hpat_pandas_series_rolling_select_impl(self, 'max')
+
+    def hpat_pandas_rolling_series_max_impl(self):
+        return rolling_max(self, 0)
+
+    return hpat_pandas_rolling_series_max_impl
 
 
 @sdc_overload_method(SeriesRollingType, 'mean')
-def hpat_pandas_series_rolling_mean(self):
+def hpat_pandas_series_rolling_mean(self, std=None):
 
     ty_checker = TypeChecker('Method rolling.mean().')
     ty_checker.check(self, SeriesRollingType)
 
-    return sdc_pandas_series_rolling_mean_impl
+    rolling_mean = _hpat_pandas_series_rolling_select_weighted_impl(ty_checker, self, std, 'mean')
+
+    def hpat_pandas_rolling_series_mean_impl(self, std=None):
+        return rolling_mean(self, std)
 
+    return hpat_pandas_rolling_series_mean_impl
 
-@sdc_rolling_overload(SeriesRollingType, 'median')
+
+@sdc_overload_method(SeriesRollingType, 'median')
 def hpat_pandas_series_rolling_median(self):
 
     ty_checker = TypeChecker('Method rolling.median().')
     ty_checker.check(self, SeriesRollingType)
 
+    rolling_median = _hpat_pandas_series_rolling_select_impl(self, 'median')
+
+    def hpat_pandas_rolling_series_median_impl(self):
+        return rolling_median(self, 0)
+
     return hpat_pandas_rolling_series_median_impl
 
 
@@ -1048,9 +1734,14 @@ def hpat_pandas_series_rolling_min(self):
     ty_checker = TypeChecker('Method rolling.min().')
     ty_checker.check(self, SeriesRollingType)
 
-    return sdc_pandas_series_rolling_min_impl
+    rolling_min = _hpat_pandas_series_rolling_select_impl(self, 'min')
 
-@sdc_rolling_overload(SeriesRollingType, 'quantile')
+    def hpat_pandas_rolling_series_min_impl(self):
+        return rolling_min(self, 0)
+
+    return hpat_pandas_rolling_series_min_impl
+
+@sdc_overload_method(SeriesRollingType, 'quantile')
 def hpat_pandas_series_rolling_quantile(self, quantile, interpolation='linear'):
 
     ty_checker = TypeChecker('Method rolling.quantile().')
@@ -1063,37 +1754,15 @@ def hpat_pandas_series_rolling_quantile(self, quantile, interpolation='linear'):
     if not isinstance(interpolation, str_types) and interpolation != 'linear':
         ty_checker.raise_exc(interpolation, 'str', 'interpolation')
 
+    rolling_quantile = _hpat_pandas_series_rolling_select_impl(self, 'quantile')
+
     def hpat_pandas_rolling_series_quantile_impl(self, quantile, interpolation='linear'):
         if quantile < 0 or quantile > 1:
             raise ValueError('quantile value not in [0, 1]')
         if interpolation != 'linear':
             raise ValueError('interpolation value not "linear"')
 
-        win = self._window
-        minp = self._min_periods
-
-        input_series = self._data
-        input_arr = input_series._data
-        length = len(input_arr)
-        output_arr = numpy.empty(length, dtype=float64)
-
-        def calc_quantile(arr, quantile, minp):
-            finite_arr = arr[numpy.isfinite(arr)]
-            if len(finite_arr) < minp:
-                return numpy.nan
-            else:
-                return arr_quantile(finite_arr, quantile)
-
-        boundary = min(win, length)
-        for i in prange(boundary):
-            arr_range = input_arr[:i + 1]
-            output_arr[i] = calc_quantile(arr_range, quantile, minp)
-
-        for i in prange(boundary, length):
-            arr_range = input_arr[i + 1 - win:i + 1]
-            output_arr[i] = calc_quantile(arr_range, quantile, minp)
-
-        return pandas.Series(output_arr, input_series._index, name=input_series._name)
+        return rolling_quantile(self, quantile)
 
     return hpat_pandas_rolling_series_quantile_impl
 
@@ -1104,7 +1773,12 @@ def hpat_pandas_series_rolling_skew(self):
     ty_checker = TypeChecker('Method rolling.skew().')
     ty_checker.check(self, SeriesRollingType)
 
-    return sdc_pandas_series_rolling_skew_impl
+    rolling_skew = _hpat_pandas_series_rolling_select_impl(self, 'skew')
+
+    def hpat_pandas_rolling_series_skew_impl(self):
+        return rolling_skew(self, 0)
+
+    return hpat_pandas_rolling_series_skew_impl
 
 
 @sdc_overload_method(SeriesRollingType, 'std')
@@ -1116,16 +1790,26 @@ def hpat_pandas_series_rolling_std(self, ddof=1):
     if not isinstance(ddof, (int, Integer, Omitted)):
         ty_checker.raise_exc(ddof, 'int', 'ddof')
 
-    return sdc_pandas_series_rolling_std_impl
+    rolling_std = _hpat_pandas_series_rolling_select_impl(self, 'std')
+
+    def hpat_pandas_rolling_series_std_impl(self, ddof=1):
+        return rolling_std(self, ddof)
+
+    return hpat_pandas_rolling_series_std_impl
 
 
 @sdc_overload_method(SeriesRollingType, 'sum')
-def hpat_pandas_series_rolling_sum(self):
+def hpat_pandas_series_rolling_sum(self, std=None):
 
     ty_checker = TypeChecker('Method rolling.sum().')
     ty_checker.check(self, SeriesRollingType)
 
-    return sdc_pandas_series_rolling_sum_impl
+    rolling_sum = _hpat_pandas_series_rolling_select_weighted_impl(ty_checker, self, std, 'sum')
+
+    def hpat_pandas_rolling_series_sum_impl(self, std=None):
+        return rolling_sum(self, std)
+
+    return hpat_pandas_rolling_series_sum_impl
 
 
 @sdc_overload_method(SeriesRollingType, 'var')
@@ -1137,7 +1821,12 @@ def hpat_pandas_series_rolling_var(self, ddof=1):
     if not isinstance(ddof, (int, Integer, Omitted)):
         ty_checker.raise_exc(ddof, 'int', 'ddof')
 
-    return sdc_pandas_series_rolling_var_impl
+    rolling_var = _hpat_pandas_series_rolling_select_impl(self, 'var')
+
+    def hpat_pandas_rolling_series_var_impl(self, ddof=1):
+        return rolling_var(self, ddof)
+
+    return hpat_pandas_rolling_series_var_impl
 
 
 hpat_pandas_series_rolling_apply.__doc__ = hpat_pandas_series_rolling_docstring_tmpl.format(**{
@@ -1149,7 +1838,10 @@ hpat_pandas_series_rolling_apply.__doc__ = hpat_pandas_series_rolling_docstring_
     -----------
     - This function may reveal slower performance than Pandas* on user system. Users should exercise a tradeoff
     between staying in JIT-region with that function or going back to interpreter mode.
-    - Supported ``raw`` only can be `None` or `True`. Parameters ``args``, ``kwargs`` unsupported.
+    - ``raw`` equal to `None` is handled as `True`. Parameters ``args``, ``kwargs`` unsupported.
+    - Windows are passed to the function as views of the data (and index for ``raw=False``) without copying
+    and are processed in parallel, so the function should not modify its argument.
+    - Non-constant ``raw`` requires the function to accept both ndarray and Series.
     - DataFrame/Series elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
     """,
     'extra_params':
@@ -1159,6 +1851,8 @@ hpat_pandas_series_rolling_apply.__doc__ = hpat_pandas_series_rolling_docstring_
     raw: :obj:`bool`
         False : passes each row or column as a Series to the function.
         True or None : the passed function will receive ndarray objects instead.
+    engine_kwargs: :obj:`dict`
+        Dictionary of str to bool, only ``parallel`` is used: False disables parallel processing of windows.
     """
 })
 
@@ -1231,8 +1925,13 @@ hpat_pandas_series_rolling_mean.__doc__ = hpat_pandas_series_rolling_docstring_t
     Limitations
     -----------
     DataFrame/Series elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
+    Weighted windows are computed directly in O(window) operations per element.
     """,
-    'extra_params': ''
+    'extra_params':
+    """
+    std: :obj:`float`
+        Standard deviation of the 'gaussian' window.
+    """
 })
 
 hpat_pandas_series_rolling_median.__doc__ = hpat_pandas_series_rolling_docstring_tmpl.format(**{
@@ -1307,8 +2006,13 @@ hpat_pandas_series_rolling_sum.__doc__ = hpat_pandas_series_rolling_docstring_tm
     Limitations
     -----------
     DataFrame/Series elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
+    Weighted windows are computed directly in O(window) operations per element.
     """,
-    'extra_params': ''
+    'extra_params':
+    """
+    std: :obj:`float`
+        Standard deviation of the 'gaussian' window.
+    """
 })
 
 hpat_pandas_series_rolling_var.__doc__ = hpat_pandas_series_rolling_docstring_tmpl.format(**{
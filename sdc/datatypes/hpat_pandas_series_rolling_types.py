@@ -31,10 +31,11 @@ from sdc.datatypes.hpat_pandas_rolling_types import (
 
 class SeriesRollingType(RollingType):
     """Type definition for pandas.Series.rolling functions handling."""
-    def __init__(self, data, win_type=None, on=None, closed=None):
+    def __init__(self, data, win_type=None, on=None, closed=None, freq=None, win_type_name=None):
         super(SeriesRollingType, self).__init__('SeriesRollingType',
                                                 data, win_type=win_type,
-                                                on=on, closed=closed)
+                                                on=on, closed=closed, freq=freq,
+                                                win_type_name=win_type_name)
 
 
 @register_model(SeriesRollingType)
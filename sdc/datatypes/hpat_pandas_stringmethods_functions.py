@@ -79,17 +79,117 @@
 
 import numpy
 import pandas
+import re
 
 import numba
-from numba.core.types import (Boolean, Integer, NoneType,
-                         Omitted, StringLiteral, UnicodeType)
+from numba import literally
+from numba.core.errors import TypingError
+from numba.core.types import (Boolean, Float, Integer, Literal, NoneType,
+                         Omitted, StringLiteral, Type, UnicodeType)
 
 from sdc.utilities.sdc_typing_utils import TypeChecker
 from sdc.datatypes.hpat_pandas_stringmethods_types import StringMethodsType
 from sdc.utilities.utils import sdc_overload_method, sdc_register_jitable
+from sdc.utilities.prange_utils import parallel_chunks
 from sdc.hiframes.api import get_nan_mask
-from sdc.str_arr_ext import str_arr_set_na_by_mask, create_str_arr_from_list
+from sdc.str_arr_ext import str_arr_is_na, str_arr_set_na_by_mask, create_str_arr_from_list
+from sdc.str_arr_type import StringArrayType
 from sdc.datatypes.common_functions import SDCLimitation
+from sdc.functions.str_arr_kernels import (ASCII_WHITESPACE, ascii_chars_table, str_arr_ascii_change_case,
+                                           str_arr_endswith, str_arr_find, str_arr_is_ascii, str_arr_len,
+                                           str_arr_startswith, str_arr_strip_bytes, str_to_utf8)
+from sdc.hiframes.split_impl import (compute_split_view, split_view_get, split_view_len,
+                                     string_array_split_view_type)
+from sdc.functions.regex import (compile_regex, parse_regex_template, regex_contains, regex_group,
+                                 regex_group_matched, regex_match, regex_replace, regex_search, regex_workspace)
+
+
+def has_compile_time_value(var):
+    """Check that value of the parameter is known at compile time"""
+    return isinstance(var, (Omitted, Literal, NoneType)) or not isinstance(var, Type)
+
+
+def get_compile_time_value(var):
+    """Get value of the parameter known at compile time"""
+    if isinstance(var, Omitted):
+        return var.value
+    if isinstance(var, Literal):
+        return var.literal_value
+    if isinstance(var, NoneType):
+        return None
+
+    return var
+
+
+def compile_stringmethods_regex(func_name, pat, flags, case=True):
+    """
+    Compile literal pattern for case sensitive and case insensitive matching,
+    the latter is compiled only if parameter case can be False.
+    """
+    pattern = pat.literal_value
+    flags = get_compile_time_value(flags)
+    try:
+        regex = compile_regex(pattern, flags)
+        nocase_regex = regex
+        if not (has_compile_time_value(case) and get_compile_time_value(case) in (True, None)):
+            nocase_regex = compile_regex(pattern, flags | re.IGNORECASE)
+    except ValueError as e:
+        raise TypingError('{} {}'.format(func_name, e))
+    except SDCLimitation as e:
+        raise SDCLimitation('{} {}'.format(func_name, e))
+
+    return regex, nocase_regex
+
+
+@sdc_register_jitable
+def str_arr_contains_plain(str_arr, pat, case, result):
+    """Test if pattern is a substring of strings of string array, ignoring case the same way as pandas"""
+    _pat = pat if case else pat.upper()
+    for idx in numba.prange(len(str_arr)):
+        item = str_arr[idx]
+        result[idx] = _pat in (item if case else item.upper())
+
+
+@sdc_register_jitable
+def str_arr_regex_test(program, nslots, str_arr, anchored, result):
+    """Test if pattern matches strings of string array, at the beginning of the strings if anchored"""
+    chunks = parallel_chunks(len(str_arr))
+    for i in numba.prange(len(chunks)):
+        chunk = chunks[i]
+        workspace = regex_workspace(program, nslots)
+        for idx in range(chunk.start, chunk.stop):
+            if anchored:
+                result[idx] = regex_match(program, workspace, str_arr, idx)
+            else:
+                result[idx] = regex_contains(program, workspace, str_arr, idx)
+
+
+@sdc_register_jitable
+def str_arr_replace_plain(str_arr, nan_mask, pat, repl, count):
+    """Replace occurrences of substring in strings of string array, NaNs are replaced by empty strings"""
+    length = len(str_arr)
+    result = [''] * length
+    for idx in numba.prange(length):
+        if not nan_mask[idx]:
+            result[idx] = str_arr[idx].replace(pat, repl, count)
+
+    return result
+
+
+@sdc_register_jitable
+def str_arr_regex_replace(program, nslots, str_arr, nan_mask, literals, groups, count):
+    """Replace occurrences of pattern in strings of string array, NaNs are replaced by empty strings"""
+    length = len(str_arr)
+    result = [''] * length
+    chunks = parallel_chunks(length)
+    for i in numba.prange(len(chunks)):
+        chunk = chunks[i]
+        workspace = regex_workspace(program, nslots)
+        for idx in range(chunk.start, chunk.stop):
+            if not nan_mask[idx]:
+                result[idx] = regex_replace(program, workspace, str_arr, idx, literals, groups, count)
+
+    return result
 
 
 @sdc_overload_method(StringMethodsType, 'center')
@@ -163,8 +263,9 @@ def hpat_pandas_stringmethods_contains(self, pat, case=True, flags=0, na=None, r
         -----------
         - Series elements are expected to be Unicode strings. Elements cannot be `NaNs`.
         - Parameter ``na`` is supported only with default value ``None``.
-        - Parameter ``flags`` is supported only with default value ``0``.
-        - Parameter ``regex`` is supported only with default value ``True``.
+        - Parameters ``pat`` and ``flags`` are expected to be constants or arguments of the jitted function
+          if ``regex`` is ``True``, the pattern is compiled once per each value.
+        - Regular expressions with backreferences and conditional or possessive constructs are not supported.
 
         Examples
         --------
@@ -182,6 +283,8 @@ def hpat_pandas_stringmethods_contains(self, pat, case=True, flags=0, na=None, r
                 Same as endswith, but tests the start of string.
             :ref:`Series.str.endswith <pandas.Series.str.endswith>`
                 Same as startswith, but tests the end of string.
+            :ref:`Series.str.match <pandas.Series.str.match>`
+                Determine if each string matches a regular expression.
 
         Intel Scalable Dataframe Compiler Developer Guide
         *************************************************
@@ -193,7 +296,8 @@ def hpat_pandas_stringmethods_contains(self, pat, case=True, flags=0, na=None, r
         Test: python -m sdc.runtests -k sdc.tests.test_series.TestSeries.test_series_contains
         """
 
-    ty_checker = TypeChecker('Method contains().')
+    _func_name = 'Method contains().'
+    ty_checker = TypeChecker(_func_name)
     ty_checker.check(self, StringMethodsType)
 
     if not isinstance(pat, (StringLiteral, UnicodeType)):
@@ -211,22 +315,41 @@ def hpat_pandas_stringmethods_contains(self, pat, case=True, flags=0, na=None, r
     if not isinstance(regex, (Omitted, Boolean)) and regex is not True:
         ty_checker.raise_exc(regex, 'bool', 'regex')
 
-    def hpat_pandas_stringmethods_contains_impl(self, pat, case=True, flags=0, na=None, regex=True):
-        if flags != 0:
-            raise SDCLimitation("Method contains(). Unsupported parameter. Given 'flags' != 0")
+    if has_compile_time_value(regex) and get_compile_time_value(regex) is False:
+        def hpat_pandas_stringmethods_contains_plain_impl(self, pat, case=True, flags=0, na=None, regex=True):
+            len_data = len(self._data)
+            res_list = numpy.empty(len_data, numba.types.boolean)
+            str_arr_contains_plain(self._data._data, pat, case, res_list)
 
-        if not regex:
-            raise SDCLimitation("Method contains(). Unsupported parameter. Given 'regex' is False")
+            return pandas.Series(res_list, self._data._index, name=self._data._name)
 
-        if not case:
-            _pat = pat.lower()
-        else:
-            _pat = pat
+        return hpat_pandas_stringmethods_contains_plain_impl
 
-        len_data = len(self._data)
-        res_list = numpy.empty(len_data, numba.types.boolean)
-        for idx in numba.prange(len_data):
-            res_list[idx] = _pat in self._data._data[idx]
+    if isinstance(pat, UnicodeType):
+        def hpat_pandas_stringmethods_contains_unicode_pat_impl(self, pat, case=True, flags=0, na=None, regex=True):
+            # literally raises special exception to call contains with literal pattern got from unicode
+            return literally(pat)
+
+        return hpat_pandas_stringmethods_contains_unicode_pat_impl
+
+    if not has_compile_time_value(flags):
+        def hpat_pandas_stringmethods_contains_int_flags_impl(self, pat, case=True, flags=0, na=None, regex=True):
+            return literally(flags)
+
+        return hpat_pandas_stringmethods_contains_int_flags_impl
+
+    compiled, nocase_compiled = compile_stringmethods_regex(_func_name, pat, flags, case)
+    program, nocase_program, nslots = compiled.program, nocase_compiled.program, compiled.nslots
+
+    def hpat_pandas_stringmethods_contains_impl(self, pat, case=True, flags=0, na=None, regex=True):
+        str_arr = self._data._data
+        res_list = numpy.empty(len(str_arr), numba.types.boolean)
+        if not regex:
+            str_arr_contains_plain(str_arr, pat, case, res_list)
+        elif case:
+            str_arr_regex_test(program, nslots, str_arr, False, res_list)
+        else:
+            str_arr_regex_test(nocase_program, nslots, str_arr, False, res_list)
 
         return pandas.Series(res_list, self._data._index, name=self._data._name)
 
@@ -292,16 +415,173 @@ def hpat_pandas_stringmethods_endswith(self, pat, na=None):
             msg = 'Method endswith(). The object na\n expected: None'
             raise ValueError(msg)
 
-        item_endswith = len(self._data)
-        result = numpy.empty(item_endswith, numba.types.boolean)
-        for idx, item in enumerate(self._data._data):
-            result[idx] = item.endswith(pat)
+        result = str_arr_endswith(self._data._data, str_to_utf8(pat))
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
     return hpat_pandas_stringmethods_endswith_impl
 
 
+def _gen_stringmethods_extract_impl(group_names, as_dataframe):
+    """
+    Generate implementation of extract() creating column of strings per each group:
+        def _stringmethods_extract_impl(self, pat, flags=0, expand=True):
+          str_arr = self._data._data
+          nan_mask = get_nan_mask(str_arr)
+          length = len(str_arr)
+          result_0 = [''] * length
+          mask_0 = numpy.ones(length, dtype=numpy.bool_)
+          result_1 = [''] * length
+          mask_1 = numpy.ones(length, dtype=numpy.bool_)
+          chunks = parallel_chunks(length)
+          for i in numba.prange(len(chunks)):
+            chunk = chunks[i]
+            workspace = regex_workspace(program, nslots)
+            for idx in range(chunk.start, chunk.stop):
+              if nan_mask[idx] or not regex_search(program, workspace, str_arr, idx):
+                continue
+              if regex_group_matched(workspace, 1):
+                result_0[idx] = regex_group(workspace, str_arr, 1)
+                mask_0[idx] = False
+              if regex_group_matched(workspace, 2):
+                result_1[idx] = regex_group(workspace, str_arr, 2)
+                mask_1[idx] = False
+          data_0 = str_arr_set_na_by_mask(create_str_arr_from_list(result_0), mask_0)
+          data_1 = str_arr_set_na_by_mask(create_str_arr_from_list(result_1), mask_1)
+          return pandas.DataFrame({'lvl': data_0, 'date': data_1}, index=self._data._index)
+    """
+    ngroups = len(group_names)
+    func_lines = [
+        'def _stringmethods_extract_impl(self, pat, flags=0, expand=True):',
+        '  str_arr = self._data._data',
+        '  nan_mask = get_nan_mask(str_arr)',
+        '  length = len(str_arr)',
+    ]
+    for i in range(ngroups):
+        func_lines += [f'  result_{i} = [\'\'] * length',
+                       f'  mask_{i} = numpy.ones(length, dtype=numpy.bool_)']
+    func_lines += [
+        '  chunks = parallel_chunks(length)',
+        '  for i in numba.prange(len(chunks)):',
+        '    chunk = chunks[i]',
+        '    workspace = regex_workspace(program, nslots)',
+        '    for idx in range(chunk.start, chunk.stop):',
+        '      if nan_mask[idx] or not regex_search(program, workspace, str_arr, idx):',
+        '        continue',
+    ]
+    for i in range(ngroups):
+        func_lines += [f'      if regex_group_matched(workspace, {i + 1}):',
+                       f'        result_{i}[idx] = regex_group(workspace, str_arr, {i + 1})',
+                       f'        mask_{i}[idx] = False']
+    for i in range(ngroups):
+        func_lines += [f'  data_{i} = str_arr_set_na_by_mask(create_str_arr_from_list(result_{i}), mask_{i})']
+
+    if as_dataframe:
+        data = ', '.join(f'\'{name}\': data_{i}' for i, name in enumerate(group_names))
+        func_lines += [f'  return pandas.DataFrame({{{data}}}, index=self._data._index)']
+    else:
+        name = 'None' if group_names[0] is None else f"'{group_names[0]}'"
+        func_lines += [f'  return pandas.Series(data_0, self._data._index, name={name})']
+
+    return '\n'.join(func_lines)
+
+
+@sdc_overload_method(StringMethodsType, 'extract')
+def hpat_pandas_stringmethods_extract(self, pat, flags=0, expand=True):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.Series.str.extract
+
+    Limitations
+    -----------
+    - Series elements are expected to be Unicode strings. Elements cannot be `NaNs`.
+    - Parameters ``pat``, ``flags`` and ``expand`` are expected to be constants or arguments of the jitted function,
+      the pattern is compiled once per each value.
+    - Groups of the pattern are expected to be named if the result is a DataFrame.
+    - Regular expressions with backreferences and conditional or possessive constructs are not supported.
+
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/series/str/series_str_extract.py
+       :language: python
+       :lines: 27-
+       :caption: Extract capture groups of the regular expression as columns of DataFrame.
+       :name: ex_series_str_extract
+
+    .. command-output:: python ./series/str/series_str_extract.py
+       :cwd: ../../../examples
+
+    .. seealso::
+        :ref:`Series.str.match <pandas.Series.str.match>`
+            Determine if each string matches a regular expression.
+        :ref:`Series.str.replace <pandas.Series.str.replace>`
+            Replace occurrences of pattern/regex in the Series with some other string.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas Series method :meth:`pandas.core.strings.StringMethods.extract()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_series.TestSeries.test_series_str_extract*
+    """
+
+    _func_name = 'Method extract().'
+    ty_checker = TypeChecker(_func_name)
+    ty_checker.check(self, StringMethodsType)
+
+    if not isinstance(pat, (StringLiteral, UnicodeType)):
+        ty_checker.raise_exc(pat, 'str', 'pat')
+
+    if not isinstance(flags, (Omitted, Integer)) and flags != 0:
+        ty_checker.raise_exc(flags, 'int64', 'flags')
+
+    if not isinstance(expand, (Omitted, Boolean)) and expand is not True:
+        ty_checker.raise_exc(expand, 'bool', 'expand')
+
+    if isinstance(pat, UnicodeType):
+        def hpat_pandas_stringmethods_extract_unicode_pat_impl(self, pat, flags=0, expand=True):
+            # literally raises special exception to call extract with literal pattern got from unicode
+            return literally(pat)
+
+        return hpat_pandas_stringmethods_extract_unicode_pat_impl
+
+    if not has_compile_time_value(flags):
+        def hpat_pandas_stringmethods_extract_int_flags_impl(self, pat, flags=0, expand=True):
+            return literally(flags)
+
+        return hpat_pandas_stringmethods_extract_int_flags_impl
+
+    if not has_compile_time_value(expand):
+        def hpat_pandas_stringmethods_extract_bool_expand_impl(self, pat, flags=0, expand=True):
+            return literally(expand)
+
+        return hpat_pandas_stringmethods_extract_bool_expand_impl
+
+    compiled, _ = compile_stringmethods_regex(_func_name, pat, flags)
+    if compiled.groups == 0:
+        raise TypingError('{} Pattern contains no capture groups. Given: {}'.format(_func_name, pat.literal_value))
+
+    as_dataframe = get_compile_time_value(expand) or compiled.groups > 1
+    if as_dataframe and None in compiled.group_names:
+        raise SDCLimitation('{} Unnamed groups are not supported if result is a DataFrame'.format(_func_name))
+
+    func_text = _gen_stringmethods_extract_impl(compiled.group_names, as_dataframe)
+    global_vars = {'pandas': pandas, 'numpy': numpy, 'numba': numba,
+                   'program': compiled.program, 'nslots': compiled.nslots,
+                   'get_nan_mask': get_nan_mask, 'parallel_chunks': parallel_chunks,
+                   'regex_workspace': regex_workspace, 'regex_search': regex_search,
+                   'regex_group': regex_group, 'regex_group_matched': regex_group_matched,
+                   'create_str_arr_from_list': create_str_arr_from_list,
+                   'str_arr_set_na_by_mask': str_arr_set_na_by_mask}
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+
+    return loc_vars['_stringmethods_extract_impl']
+
+
 @sdc_overload_method(StringMethodsType, 'find')
 def hpat_pandas_stringmethods_find(self, sub, start=0, end=None):
     """
@@ -360,16 +640,85 @@ def hpat_pandas_stringmethods_find(self, sub, start=0, end=None):
         if end is not None:
             raise ValueError('Method find(). The object end\n expected: None')
 
-        item_count = len(self._data)
-        result = numpy.empty(item_count, numba.types.int64)
-        for idx, item in enumerate(self._data._data):
-            result[idx] = item.find(sub)
+        result = str_arr_find(self._data._data, str_to_utf8(sub))
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
     return hpat_pandas_stringmethods_find_impl
 
 
+@sdc_overload_method(StringMethodsType, 'get')
+def hpat_pandas_stringmethods_get(self, i):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.Series.str.get
+
+    Limitations
+    -----------
+    Series elements are expected to be Unicode strings or lists of strings returned by
+    :ref:`Series.str.split <pandas.Series.str.split>`.
+
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/series/str/series_str_get.py
+       :language: python
+       :lines: 27-
+       :caption: Extract element from each component at specified position
+       :name: ex_series_str_get
+
+    .. command-output:: python ./series/str/series_str_get.py
+       :cwd: ../../../examples
+
+    .. seealso::
+        :ref:`Series.str.split <pandas.Series.str.split>`
+            Split strings around given separator/delimiter.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas Series method :meth:`pandas.core.strings.StringMethods.get()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_series.TestSeries.test_series_str_get
+    """
+
+    ty_checker = TypeChecker('Method get().')
+    ty_checker.check(self, StringMethodsType)
+
+    if not isinstance(i, Integer):
+        ty_checker.raise_exc(i, 'int', 'i')
+
+    if self.data.data == string_array_split_view_type:
+        def hpat_pandas_stringmethods_get_split_view_impl(self, i):
+            result = split_view_get(self._data._data, i)
+
+            return pandas.Series(result, self._data._index, name=self._data._name)
+
+        return hpat_pandas_stringmethods_get_split_view_impl
+
+    def hpat_pandas_stringmethods_get_impl(self, i):
+        str_arr = self._data._data
+        item_count = len(str_arr)
+        mask = numpy.empty(item_count, dtype=numpy.bool_)
+        res_list = [''] * item_count
+        for idx in numba.prange(item_count):
+            mask[idx] = True
+            if not str_arr_is_na(str_arr, idx):
+                item = str_arr[idx]
+                pos = i + len(item) if i < 0 else i
+                if 0 <= pos < len(item):
+                    res_list[idx] = item[pos]
+                    mask[idx] = False
+        str_arr = create_str_arr_from_list(res_list)
+        result = str_arr_set_na_by_mask(str_arr, mask)
+
+        return pandas.Series(result, self._data._index, name=self._data._name)
+
+    return hpat_pandas_stringmethods_get_impl
+
+
 @sdc_overload_method(StringMethodsType, 'isupper')
 def hpat_pandas_stringmethods_isupper(self):
     ty_checker = TypeChecker('Method isupper().')
@@ -395,7 +744,8 @@ def hpat_pandas_stringmethods_len(self):
 
     Limitations
     -----------
-    Series elements are expected to be Unicode strings. Elements cannot be `NaNs`.
+    Series elements are expected to be Unicode strings or lists of strings returned by
+    :ref:`Series.str.split <pandas.Series.str.split>`. Elements cannot be `NaNs`.
 
     Examples
     --------
@@ -427,11 +777,16 @@ def hpat_pandas_stringmethods_len(self):
     ty_checker = TypeChecker('Method len().')
     ty_checker.check(self, StringMethodsType)
 
+    if self.data.data == string_array_split_view_type:
+        def hpat_pandas_stringmethods_len_split_view_impl(self):
+            result = split_view_len(self._data._data)
+
+            return pandas.Series(result, self._data._index, name=self._data._name)
+
+        return hpat_pandas_stringmethods_len_split_view_impl
+
     def hpat_pandas_stringmethods_len_impl(self):
-        item_count = len(self._data)
-        result = numpy.empty(item_count, numba.types.int64)
-        for idx, item in enumerate(self._data._data):
-            result[idx] = len(item)
+        result = str_arr_len(self._data._data)
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -503,6 +858,225 @@ def hpat_pandas_stringmethods_ljust(self, width, fillchar=' '):
     return hpat_pandas_stringmethods_ljust_impl
 
 
+@sdc_overload_method(StringMethodsType, 'match')
+def hpat_pandas_stringmethods_match(self, pat, case=True, flags=0, na=numpy.nan):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.Series.str.match
+
+    Limitations
+    -----------
+    - Series elements are expected to be Unicode strings. Elements cannot be `NaNs`.
+    - Parameter ``na`` is supported only with default value ``numpy.nan``.
+    - Parameters ``pat`` and ``flags`` are expected to be constants or arguments of the jitted function,
+      the pattern is compiled once per each value.
+    - Regular expressions with backreferences and conditional or possessive constructs are not supported.
+
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/series/str/series_str_match.py
+       :language: python
+       :lines: 27-
+       :caption: Determine if each string matches a regular expression.
+       :name: ex_series_str_match
+
+    .. command-output:: python ./series/str/series_str_match.py
+       :cwd: ../../../examples
+
+    .. seealso::
+        :ref:`Series.str.contains <pandas.Series.str.contains>`
+            Tests if string element contains a pattern.
+        :ref:`Series.str.extract <pandas.Series.str.extract>`
+            Extract capture groups of the regular expression as columns of DataFrame.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas Series method :meth:`pandas.core.strings.StringMethods.match()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_series.TestSeries.test_series_str_match*
+    """
+
+    _func_name = 'Method match().'
+    ty_checker = TypeChecker(_func_name)
+    ty_checker.check(self, StringMethodsType)
+
+    if not isinstance(pat, (StringLiteral, UnicodeType)):
+        ty_checker.raise_exc(pat, 'str', 'pat')
+
+    if not isinstance(case, (Boolean, Omitted)) and case is not True:
+        ty_checker.raise_exc(case, 'bool', 'case')
+
+    if not isinstance(flags, (Omitted, Integer)) and flags != 0:
+        ty_checker.raise_exc(flags, 'int64', 'flags')
+
+    if not isinstance(na, (Omitted, Float)) and not (isinstance(na, float) and numpy.isnan(na)):
+        ty_checker.raise_exc(na, 'float', 'na')
+
+    if isinstance(pat, UnicodeType):
+        def hpat_pandas_stringmethods_match_unicode_pat_impl(self, pat, case=True, flags=0, na=numpy.nan):
+            # literally raises special exception to call match with literal pattern got from unicode
+            return literally(pat)
+
+        return hpat_pandas_stringmethods_match_unicode_pat_impl
+
+    if not has_compile_time_value(flags):
+        def hpat_pandas_stringmethods_match_int_flags_impl(self, pat, case=True, flags=0, na=numpy.nan):
+            return literally(flags)
+
+        return hpat_pandas_stringmethods_match_int_flags_impl
+
+    compiled, nocase_compiled = compile_stringmethods_regex(_func_name, pat, flags, case)
+    program, nocase_program, nslots = compiled.program, nocase_compiled.program, compiled.nslots
+
+    def hpat_pandas_stringmethods_match_impl(self, pat, case=True, flags=0, na=numpy.nan):
+        str_arr = self._data._data
+        res_list = numpy.empty(len(str_arr), numba.types.boolean)
+        if case:
+            str_arr_regex_test(program, nslots, str_arr, True, res_list)
+        else:
+            str_arr_regex_test(nocase_program, nslots, str_arr, True, res_list)
+
+        return pandas.Series(res_list, self._data._index, name=self._data._name)
+
+    return hpat_pandas_stringmethods_match_impl
+
+
+@sdc_overload_method(StringMethodsType, 'replace')
+def hpat_pandas_stringmethods_replace(self, pat, repl, n=-1, case=None, flags=0, regex=True):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.Series.str.replace
+
+    Limitations
+    -----------
+    - All values in Series equal to `None` are converted to `NaNs`.
+    - Parameter ``repl`` is supported only as a string, callables are not supported.
+    - Parameters ``pat``, ``repl`` and ``flags`` are expected to be constants or arguments of the jitted function
+      if ``regex`` is ``True``, the pattern is compiled once per each value.
+    - Regular expressions with backreferences and conditional or possessive constructs are not supported.
+
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/series/str/series_str_replace.py
+       :language: python
+       :lines: 27-
+       :caption: Replace occurrences of pattern/regex in the Series with some other string.
+       :name: ex_series_str_replace
+
+    .. command-output:: python ./series/str/series_str_replace.py
+       :cwd: ../../../examples
+
+    .. seealso::
+        `re.sub <https://docs.python.org/3/library/re.html#re.sub>`_
+            Python standard library function replacing occurrences of regular expression.
+        `str.replace <https://docs.python.org/3/library/stdtypes.html#str.replace>`_
+            Python standard library string method.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas Series method :meth:`pandas.core.strings.StringMethods.replace()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_series.TestSeries.test_series_str_replace*
+    """
+
+    _func_name = 'Method replace().'
+    ty_checker = TypeChecker(_func_name)
+    ty_checker.check(self, StringMethodsType)
+
+    if not isinstance(pat, (StringLiteral, UnicodeType)):
+        ty_checker.raise_exc(pat, 'str', 'pat')
+
+    if not isinstance(repl, (StringLiteral, UnicodeType)):
+        ty_checker.raise_exc(repl, 'str', 'repl')
+
+    if not isinstance(n, (Omitted, Integer)) and n != -1:
+        ty_checker.raise_exc(n, 'int64', 'n')
+
+    if not isinstance(case, (Omitted, NoneType, Boolean)) and case is not None:
+        ty_checker.raise_exc(case, 'bool', 'case')
+
+    if not isinstance(flags, (Omitted, Integer)) and flags != 0:
+        ty_checker.raise_exc(flags, 'int64', 'flags')
+
+    if not isinstance(regex, (Omitted, Boolean)) and regex is not True:
+        ty_checker.raise_exc(regex, 'bool', 'regex')
+
+    if has_compile_time_value(regex) and get_compile_time_value(regex) is False:
+        def hpat_pandas_stringmethods_replace_plain_impl(self, pat, repl, n=-1, case=None, flags=0, regex=True):
+            str_arr = self._data._data
+            mask = get_nan_mask(str_arr)
+            result = str_arr_replace_plain(str_arr, mask, pat, repl, n)
+
+            str_arr = create_str_arr_from_list(result)
+            result = str_arr_set_na_by_mask(str_arr, mask)
+
+            return pandas.Series(result, self._data._index, name=self._data._name)
+
+        return hpat_pandas_stringmethods_replace_plain_impl
+
+    if isinstance(pat, UnicodeType):
+        def hpat_pandas_stringmethods_replace_unicode_pat_impl(self, pat, repl, n=-1, case=None, flags=0,
+                                                               regex=True):
+            # literally raises special exception to call replace with literal pattern got from unicode
+            return literally(pat)
+
+        return hpat_pandas_stringmethods_replace_unicode_pat_impl
+
+    if isinstance(repl, UnicodeType):
+        def hpat_pandas_stringmethods_replace_unicode_repl_impl(self, pat, repl, n=-1, case=None, flags=0,
+                                                                regex=True):
+            # replacement template is parsed at compile time as well as the pattern
+            return literally(repl)
+
+        return hpat_pandas_stringmethods_replace_unicode_repl_impl
+
+    if not has_compile_time_value(flags):
+        def hpat_pandas_stringmethods_replace_int_flags_impl(self, pat, repl, n=-1, case=None, flags=0,
+                                                             regex=True):
+            return literally(flags)
+
+        return hpat_pandas_stringmethods_replace_int_flags_impl
+
+    compiled, nocase_compiled = compile_stringmethods_regex(_func_name, pat, flags, case)
+    program, nocase_program, nslots = compiled.program, nocase_compiled.program, compiled.nslots
+    try:
+        literals, groups = parse_regex_template(repl.literal_value, compiled)
+    except ValueError as e:
+        raise TypingError('{} {}'.format(_func_name, e))
+
+    case_is_none = has_compile_time_value(case) and get_compile_time_value(case) is None
+
+    def hpat_pandas_stringmethods_replace_impl(self, pat, repl, n=-1, case=None, flags=0, regex=True):
+        str_arr = self._data._data
+        mask = get_nan_mask(str_arr)
+        ignore_case = False
+        if case_is_none == False:  # noqa
+            ignore_case = not case
+
+        # the same as pandas does, single character is replaced as a string if no flags are set
+        if not regex or (len(pat) <= 1 and flags == 0 and not ignore_case):
+            result = str_arr_replace_plain(str_arr, mask, pat, repl, n)
+        elif ignore_case:
+            result = str_arr_regex_replace(nocase_program, nslots, str_arr, mask, literals, groups, n)
+        else:
+            result = str_arr_regex_replace(program, nslots, str_arr, mask, literals, groups, n)
+
+        str_arr = create_str_arr_from_list(result)
+        result = str_arr_set_na_by_mask(str_arr, mask)
+
+        return pandas.Series(result, self._data._index, name=self._data._name)
+
+    return hpat_pandas_stringmethods_replace_impl
+
+
 @sdc_overload_method(StringMethodsType, 'rjust')
 def hpat_pandas_stringmethods_rjust(self, width, fillchar=' '):
     """
@@ -563,6 +1137,88 @@ def hpat_pandas_stringmethods_rjust(self, width, fillchar=' '):
     return hpat_pandas_stringmethods_rjust_impl
 
 
+@sdc_overload_method(StringMethodsType, 'split')
+def hpat_pandas_stringmethods_split(self, pat=None, n=-1, expand=False):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.Series.str.split
+
+    Limitations
+    -----------
+    Series elements are expected to be Unicode strings.
+    Parameter ``expand`` is supported only with default value ``False``.
+    Parameter ``pat`` of more than one character is supported only if it has no regular expression special characters.
+    Elements of the result refer to the characters of the original strings and are copied only by the methods
+    creating new strings, e.g. :ref:`Series.str.get <pandas.Series.str.get>`.
+
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/series/str/series_str_split.py
+       :language: python
+       :lines: 27-
+       :caption: Split strings around given separator
+       :name: ex_series_str_split
+
+    .. command-output:: python ./series/str/series_str_split.py
+       :cwd: ../../../examples
+
+    .. seealso::
+        :ref:`Series.str.get <pandas.Series.str.get>`
+            Extract element from each component at specified position.
+        :ref:`Series.explode <pandas.Series.explode>`
+            Transform each element of a list-like to a row.
+
+    .. todo:: Add support of parameter ``expand``
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas Series method :meth:`pandas.core.strings.StringMethods.split()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_series.TestSeries.test_series_str_split
+    """
+
+    _func_name = 'Method split().'
+    ty_checker = TypeChecker(_func_name)
+    ty_checker.check(self, StringMethodsType)
+
+    if not isinstance(self.data.data, StringArrayType):
+        ty_checker.raise_exc(self.data.dtype, 'str', 'self')
+
+    if not isinstance(pat, (Omitted, NoneType, StringLiteral, UnicodeType)) and pat is not None:
+        ty_checker.raise_exc(pat, 'str', 'pat')
+
+    if not isinstance(n, (Omitted, NoneType, Integer)) and n != -1:
+        ty_checker.raise_exc(n, 'int', 'n')
+
+    if not isinstance(expand, (Omitted, Boolean)) and expand is not False:
+        ty_checker.raise_exc(expand, 'bool', 'expand')
+
+    if isinstance(pat, UnicodeType):
+        return lambda self, pat=None, n=-1, expand=False: literally(pat)
+
+    if isinstance(pat, StringLiteral) and len(pat.literal_value) > 1:
+        if any(c in '.^$*+?{}[]\\|()' for c in pat.literal_value):
+            raise SDCLimitation('{} Unsupported parameter. Given pat is a regular expression: {}'.format(
+                _func_name, pat.literal_value))
+
+    def hpat_pandas_stringmethods_split_impl(self, pat=None, n=-1, expand=False):
+        if expand:
+            raise ValueError('Method split(). The object expand\n expected: False')
+
+        maxsplit = -1
+        if n is not None:
+            maxsplit = n if n > 0 else -1
+        result = compute_split_view(self._data._data, pat, maxsplit)
+
+        return pandas.Series(result, self._data._index, name=self._data._name)
+
+    return hpat_pandas_stringmethods_split_impl
+
+
 @sdc_overload_method(StringMethodsType, 'startswith')
 def hpat_pandas_stringmethods_startswith(self, pat, na=None):
     """
@@ -622,10 +1278,7 @@ def hpat_pandas_stringmethods_startswith(self, pat, na=None):
             msg = 'Method startswith(). The object na\n expected: None'
             raise ValueError(msg)
 
-        item_startswith = len(self._data)
-        result = numpy.empty(item_startswith, numba.types.boolean)
-        for idx, item in enumerate(self._data._data):
-            result[idx] = item.startswith(pat)
+        result = str_arr_startswith(self._data._data, str_to_utf8(pat))
 
         return pandas.Series(result, self._data._index, name=self._data._name)
 
@@ -939,6 +1592,10 @@ def hpat_pandas_stringmethods_lower(self):
     ty_checker.check(self, StringMethodsType)
 
     def hpat_pandas_stringmethods_lower_impl(self):
+        if str_arr_is_ascii(self._data._data):
+            result = str_arr_ascii_change_case(self._data._data, False)
+            return pandas.Series(result, self._data._index, name=self._data._name)
+
         mask = get_nan_mask(self._data._data)
         item_count = len(self._data)
         res_list = [''] * item_count
@@ -964,6 +1621,10 @@ def hpat_pandas_stringmethods_upper(self):
     ty_checker.check(self, StringMethodsType)
 
     def hpat_pandas_stringmethods_upper_impl(self):
+        if str_arr_is_ascii(self._data._data):
+            result = str_arr_ascii_change_case(self._data._data, True)
+            return pandas.Series(result, self._data._index, name=self._data._name)
+
         mask = get_nan_mask(self._data._data)
         item_count = len(self._data)
         result = [''] * item_count
@@ -998,9 +1659,23 @@ def strip_usecase(s, to_strip):
     return s.strip(to_strip)
 
 
-def gen_sdc_pandas_series_str_strip_impl(usecase):
-    """Generate series.str.lstrip/rstrip/strip implementations based on usecase func"""
+def gen_sdc_pandas_series_str_strip_impl(usecase, left, right):
+    """
+    Generate series.str.lstrip/rstrip/strip implementations based on usecase func,
+    bytes are stripped if all characters to strip are ASCII (whitespaces are stripped so for ASCII data only)
+    """
     def impl(self, to_strip=None):
+        if to_strip is None:
+            table = numpy.zeros(0, dtype=numpy.bool_)
+            if str_arr_is_ascii(self._data._data):
+                table = ascii_chars_table(ASCII_WHITESPACE)
+        else:
+            table = ascii_chars_table(to_strip)
+
+        if len(table) > 0:
+            result = str_arr_strip_bytes(self._data._data, table, left, right)
+            return pandas.Series(result, self._data._index, name=self._data._name)
+
         mask = get_nan_mask(self._data._data)
         item_count = len(self._data)
         res_list = [''] * item_count
@@ -1020,9 +1695,9 @@ def gen_sdc_pandas_series_str_strip_impl(usecase):
     return impl
 
 
-sdc_pandas_series_str_lstrip_impl = gen_sdc_pandas_series_str_strip_impl(lstrip_usecase)
-sdc_pandas_series_str_rstrip_impl = gen_sdc_pandas_series_str_strip_impl(rstrip_usecase)
-sdc_pandas_series_str_strip_impl = gen_sdc_pandas_series_str_strip_impl(strip_usecase)
+sdc_pandas_series_str_lstrip_impl = gen_sdc_pandas_series_str_strip_impl(lstrip_usecase, True, False)
+sdc_pandas_series_str_rstrip_impl = gen_sdc_pandas_series_str_strip_impl(rstrip_usecase, False, True)
+sdc_pandas_series_str_strip_impl = gen_sdc_pandas_series_str_strip_impl(strip_usecase, True, True)
 
 
 @sdc_overload_method(StringMethodsType, 'lstrip')
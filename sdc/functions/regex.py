@@ -0,0 +1,771 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+
+| This file contains regular expressions compiled for nopython mode
+
+    Pattern is parsed at compile time by the parser of Python :mod:`re` module and translated into
+    a program of NFA over characters, sets of characters are exactly the ones matched by :mod:`re`.
+    Characters are mapped into classes of the alphabet, so that every set of the pattern is a union of classes.
+    If the pattern has no assertions, DFAs for search and match are built by subset construction.
+
+    Strings of :class:`StringArray` are matched over raw UTF-8 bytes: DFA is used to test if the string
+    matches the pattern, NFA is simulated by Pike VM for leftmost-first matching with groups
+    (same semantics as Python backtracking engine has). Positions of groups are byte offsets in the data.
+
+"""
+
+import functools
+import re
+import sys
+
+import numpy
+
+from collections import namedtuple
+
+from sdc.datatypes.common_functions import SDCLimitation
+from sdc.str_arr_ext import (decode_utf8, get_data_ptr_ind, getitem_str_byte, getitem_str_offset)
+from sdc.utilities.utils import sdc_register_jitable
+
+if sys.version_info >= (3, 11):
+    from re import _parser as sre_parse
+else:
+    import sre_parse
+
+
+# program opcodes
+REGEX_CHARSET = 0
+REGEX_MATCH = 1
+REGEX_JUMP = 2
+REGEX_SPLIT = 3
+REGEX_SAVE = 4
+REGEX_ASSERT = 5
+
+# kinds of assertions
+REGEX_AT_BEGINNING_STRING = 0
+REGEX_AT_END_STRING = 1
+REGEX_AT_END = 2
+REGEX_AT_BEGINNING_LINE = 3
+REGEX_AT_END_LINE = 4
+REGEX_AT_BOUNDARY = 5
+REGEX_AT_NON_BOUNDARY = 6
+
+REGEX_MAX_PROGRAM_SIZE = 10000
+REGEX_MAX_DFA_STATES = 1000
+
+MAX_CODEPOINT = sys.maxunicode
+
+SDCRegex = namedtuple('SDCRegex', ['program', 'nslots', 'groups', 'group_names'])
+
+_categories_text = {
+    'CATEGORY_DIGIT': r'\d', 'CATEGORY_NOT_DIGIT': r'\D',
+    'CATEGORY_SPACE': r'\s', 'CATEGORY_NOT_SPACE': r'\S',
+    'CATEGORY_WORD': r'\w', 'CATEGORY_NOT_WORD': r'\W',
+}
+
+_charset_flags = re.IGNORECASE | re.ASCII | re.DOTALL
+
+
+def _escape_codepoint(codepoint):
+    return '\\U{:08x}'.format(codepoint)
+
+
+def _charset_text(op, av):
+    """Text of regular expression matching the same character as node of parsed pattern"""
+    if op is sre_parse.LITERAL:
+        return _escape_codepoint(av)
+    if op is sre_parse.NOT_LITERAL:
+        return '[^{}]'.format(_escape_codepoint(av))
+    if op is sre_parse.ANY:
+        return '.'
+
+    items = []
+    for item_op, item_av in av:
+        if item_op is sre_parse.NEGATE:
+            items.insert(0, '^')
+        elif item_op is sre_parse.LITERAL:
+            items.append(_escape_codepoint(item_av))
+        elif item_op is sre_parse.RANGE:
+            items.append('{}-{}'.format(_escape_codepoint(item_av[0]), _escape_codepoint(item_av[1])))
+        elif item_op is sre_parse.CATEGORY and str(item_av) in _categories_text:
+            items.append(_categories_text[str(item_av)])
+        else:
+            raise SDCLimitation('Unsupported regular expression. Given {} in set of characters'.format(item_op))
+
+    return '[{}]'.format(''.join(items))
+
+
+def _mask_to_ranges(mask):
+    diff = numpy.diff(numpy.concatenate(([0], mask.astype(numpy.int8), [0])))
+    starts = numpy.nonzero(diff == 1)[0]
+    stops = numpy.nonzero(diff == -1)[0] - 1
+
+    return tuple(zip(starts.tolist(), stops.tolist()))
+
+
+def _complement_ranges(ranges):
+    result = []
+    start = 0
+    for lo, hi in ranges:
+        if lo > start:
+            result.append((start, lo - 1))
+        start = hi + 1
+    if start <= MAX_CODEPOINT:
+        result.append((start, MAX_CODEPOINT))
+
+    return tuple(result)
+
+
+def _merge_ranges(ranges):
+    result = []
+    for lo, hi in sorted(ranges):
+        if result and lo <= result[-1][1] + 1:
+            result[-1] = (result[-1][0], max(hi, result[-1][1]))
+        else:
+            result.append((lo, hi))
+
+    return tuple(result)
+
+
+@functools.lru_cache(maxsize=None)
+def _all_characters():
+    codepoints = numpy.concatenate((numpy.arange(0xD800), numpy.arange(0xE000, MAX_CODEPOINT + 1)))
+    return codepoints.astype(numpy.uint32).tobytes().decode('utf-32-le')
+
+
+@functools.lru_cache(maxsize=None)
+def _matched_ranges(text, flags):
+    """Ranges of code points matched by regular expression matching single character"""
+    rest = re.compile(text, flags).sub('', _all_characters())
+    mask = numpy.ones(MAX_CODEPOINT + 1, dtype=numpy.bool_)
+    mask[0xD800:0xE000] = False
+    mask[numpy.frombuffer(rest.encode('utf-32-le'), dtype=numpy.uint32)] = False
+
+    return _mask_to_ranges(mask)
+
+
+def _charset_ranges(op, av, flags):
+    """Ranges of code points matched by node of parsed pattern matching single character"""
+    if not flags & re.IGNORECASE:
+        if op is sre_parse.LITERAL:
+            return ((av, av),)
+        if op is sre_parse.NOT_LITERAL:
+            return _complement_ranges(((av, av),))
+        if op is sre_parse.ANY:
+            return ((0, MAX_CODEPOINT),) if flags & re.DOTALL else ((0, 9), (11, MAX_CODEPOINT))
+
+        simple_items = (sre_parse.NEGATE, sre_parse.LITERAL, sre_parse.RANGE)
+        if all(item_op in simple_items for item_op, _ in av):
+            ranges = [(c, c) if item_op is sre_parse.LITERAL else c
+                      for item_op, c in av if item_op is not sre_parse.NEGATE]
+            ranges = _merge_ranges(ranges)
+            if any(item_op is sre_parse.NEGATE for item_op, _ in av):
+                return _complement_ranges(ranges)
+            return ranges
+
+    return _matched_ranges(_charset_text(op, av), flags & _charset_flags)
+
+
+class _RegexCompiler:
+    """Translator of parsed pattern into program of NFA"""
+
+    def __init__(self):
+        self.ops = []
+        self.args_a = []
+        self.args_b = []
+        self.charsets = []
+        self.charset_ids = {}
+
+    def emit(self, op, a=0, b=0):
+        if len(self.ops) >= REGEX_MAX_PROGRAM_SIZE:
+            raise SDCLimitation('Unsupported regular expression. Given pattern is too large')
+        self.ops.append(op)
+        self.args_a.append(a)
+        self.args_b.append(b)
+
+        return len(self.ops) - 1
+
+    def charset(self, ranges):
+        if ranges not in self.charset_ids:
+            self.charset_ids[ranges] = len(self.charsets)
+            self.charsets.append(ranges)
+
+        return self.charset_ids[ranges]
+
+    def compile_sequence(self, items, flags):
+        for op, av in items:
+            self.compile_item(op, av, flags)
+
+    def compile_item(self, op, av, flags):
+        if op in (sre_parse.LITERAL, sre_parse.NOT_LITERAL, sre_parse.ANY, sre_parse.IN):
+            self.emit(REGEX_CHARSET, self.charset(_charset_ranges(op, av, flags)))
+        elif op is sre_parse.BRANCH:
+            jumps = []
+            alternatives = av[1]
+            for alternative in alternatives[:-1]:
+                split = self.emit(REGEX_SPLIT)
+                self.args_a[split] = split + 1
+                self.compile_sequence(alternative, flags)
+                jumps.append(self.emit(REGEX_JUMP))
+                self.args_b[split] = len(self.ops)
+            self.compile_sequence(alternatives[-1], flags)
+            for jump in jumps:
+                self.args_a[jump] = len(self.ops)
+        elif op is sre_parse.SUBPATTERN:
+            group, add_flags, del_flags, items = av
+            flags = (flags | add_flags) & ~del_flags
+            if group is not None:
+                self.emit(REGEX_SAVE, 2 * group)
+            self.compile_sequence(items, flags)
+            if group is not None:
+                self.emit(REGEX_SAVE, 2 * group + 1)
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            self.compile_repeat(av, flags, greedy=op is sre_parse.MAX_REPEAT)
+        elif op is sre_parse.AT:
+            self.compile_at(str(av), flags)
+        else:
+            raise SDCLimitation('Unsupported regular expression. Given {}'.format(op))
+
+    def compile_repeat(self, av, flags, greedy):
+        min_count, max_count, items = av
+        for _ in range(min_count):
+            self.compile_sequence(items, flags)
+
+        if max_count == sre_parse.MAXREPEAT:
+            split = self.emit(REGEX_SPLIT)
+            self.compile_sequence(items, flags)
+            self.emit(REGEX_JUMP, split)
+            body, out = split + 1, len(self.ops)
+            self.args_a[split], self.args_b[split] = (body, out) if greedy else (out, body)
+            return
+
+        splits = []
+        for _ in range(max_count - min_count):
+            splits.append(self.emit(REGEX_SPLIT))
+            self.compile_sequence(items, flags)
+        for split in splits:
+            body, out = split + 1, len(self.ops)
+            self.args_a[split], self.args_b[split] = (body, out) if greedy else (out, body)
+
+    def compile_at(self, at_code, flags):
+        multiline = flags & re.MULTILINE
+        if at_code in ('AT_BOUNDARY', 'AT_NON_BOUNDARY'):
+            # assertion refers to set of word characters
+            kind = REGEX_AT_BOUNDARY if at_code == 'AT_BOUNDARY' else REGEX_AT_NON_BOUNDARY
+            word = self.charset(_matched_ranges(r'\w', flags & _charset_flags))
+            self.emit(REGEX_ASSERT, kind, word)
+            return
+
+        kinds = {
+            'AT_BEGINNING': REGEX_AT_BEGINNING_LINE if multiline else REGEX_AT_BEGINNING_STRING,
+            'AT_BEGINNING_STRING': REGEX_AT_BEGINNING_STRING,
+            'AT_END': REGEX_AT_END_LINE if multiline else REGEX_AT_END,
+            'AT_END_STRING': REGEX_AT_END_STRING,
+        }
+        if at_code not in kinds:
+            raise SDCLimitation('Unsupported regular expression. Given {}'.format(at_code))
+        self.emit(REGEX_ASSERT, kinds[at_code])
+
+    def alphabet(self):
+        """Classes of characters: class k has code points from boundaries[k - 1] to boundaries[k] - 1"""
+        points = set()
+        for ranges in self.charsets:
+            for lo, hi in ranges:
+                points.add(lo)
+                points.add(hi + 1)
+        boundaries = numpy.array(sorted(p for p in points if 0 < p <= MAX_CODEPOINT), dtype=numpy.int64)
+
+        representatives = numpy.concatenate(([0], boundaries))
+        member = numpy.zeros((max(len(self.charsets), 1), len(representatives)), dtype=numpy.bool_)
+        for charset_id, ranges in enumerate(self.charsets):
+            for lo, hi in ranges:
+                member[charset_id, (representatives >= lo) & (representatives <= hi)] = True
+
+        ascii_class = numpy.searchsorted(boundaries, numpy.arange(128), side='right').astype(numpy.int64)
+
+        return member, ascii_class, boundaries
+
+
+def _epsilon_closure(ops, args_a, args_b, pcs):
+    """Set of positions of charsets and matches of the program reachable from given positions"""
+    result = set()
+    visited = set()
+    stack = list(pcs)
+    while stack:
+        pc = stack.pop()
+        if pc in visited:
+            continue
+        visited.add(pc)
+        op = ops[pc]
+        if op == REGEX_JUMP:
+            stack.append(args_a[pc])
+        elif op == REGEX_SPLIT:
+            stack.extend((args_a[pc], args_b[pc]))
+        elif op == REGEX_SAVE:
+            stack.append(pc + 1)
+        else:
+            result.add(pc)
+
+    return frozenset(result)
+
+
+def _build_dfa(ops, args_a, args_b, member, anchored):
+    """
+    Build DFA by subset construction, transitions to -1 mean no match,
+    transitions from accepting states are not built since matching stops there.
+    Returns None if the program has assertions or DFA is too large.
+    """
+    if REGEX_ASSERT in ops:
+        return None
+
+    nclasses = member.shape[1]
+    start = _epsilon_closure(ops, args_a, args_b, [0])
+    states = {start: 0}
+    queue = [start]
+    transitions = []
+    accept = []
+    while len(transitions) < len(queue):
+        state = queue[len(transitions)]
+        row = numpy.full(nclasses, -1, dtype=numpy.int64)
+        is_accepting = any(ops[pc] == REGEX_MATCH for pc in state)
+        if not is_accepting:
+            charset_pcs = sorted(pc for pc in state if ops[pc] == REGEX_CHARSET)
+            if charset_pcs:
+                matrix = member[[args_a[pc] for pc in charset_pcs]]
+                columns, inverse = numpy.unique(matrix, axis=1, return_inverse=True)
+                inverse = inverse.reshape(-1)
+                for column_id in range(columns.shape[1]):
+                    next_pcs = [pc + 1 for pc, matched in zip(charset_pcs, columns[:, column_id]) if matched]
+                    next_state = _epsilon_closure(ops, args_a, args_b, next_pcs)
+                    if not anchored:
+                        next_state = next_state | start
+                    if not next_state:
+                        continue
+                    if next_state not in states:
+                        if len(states) >= REGEX_MAX_DFA_STATES:
+                            return None
+                        states[next_state] = len(states)
+                        queue.append(next_state)
+                    row[inverse == column_id] = states[next_state]
+            elif not anchored:
+                row[:] = 0
+        transitions.append(row)
+        accept.append(is_accepting)
+
+    return numpy.array(transitions, dtype=numpy.int64), numpy.array(accept, dtype=numpy.bool_)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_regex(pattern, flags=0):
+    """
+    Compile pattern into tuple of arrays used by jitable functions:
+    (ops, args_a, args_b, member, ascii_class, boundaries,
+    search_transitions, search_accept, match_transitions, match_accept).
+    Empty accept array means DFA is not available.
+    """
+    try:
+        compiled = re.compile(pattern, flags)
+    except re.error as e:
+        raise ValueError('Invalid regular expression {!r}: {}'.format(pattern, e))
+
+    parsed = sre_parse.parse(pattern, flags)
+    flags = compiled.flags
+
+    compiler = _RegexCompiler()
+    compiler.emit(REGEX_SAVE, 0)
+    compiler.compile_sequence(parsed, flags)
+    compiler.emit(REGEX_SAVE, 1)
+    compiler.emit(REGEX_MATCH)
+
+    member, ascii_class, boundaries = compiler.alphabet()
+    ops = numpy.array(compiler.ops, dtype=numpy.int64)
+    args_a = numpy.array(compiler.args_a, dtype=numpy.int64)
+    args_b = numpy.array(compiler.args_b, dtype=numpy.int64)
+
+    nclasses = member.shape[1]
+    no_dfa = (numpy.empty((0, nclasses), dtype=numpy.int64), numpy.empty(0, dtype=numpy.bool_))
+    search_dfa = _build_dfa(compiler.ops, compiler.args_a, compiler.args_b, member, anchored=False) or no_dfa
+    match_dfa = _build_dfa(compiler.ops, compiler.args_a, compiler.args_b, member, anchored=True) or no_dfa
+
+    program = (ops, args_a, args_b, member, ascii_class, boundaries) + search_dfa + match_dfa
+    group_names = [None] * compiled.groups
+    for name, group in compiled.groupindex.items():
+        group_names[group - 1] = name
+
+    return SDCRegex(program, 2 * (compiled.groups + 1), compiled.groups, tuple(group_names))
+
+
+def parse_regex_template(template, regex):
+    """
+    Parse replacement template of re.sub() into tuples of literal strings and group numbers,
+    group number -1 means the literal is used.
+    """
+    escapes = {'a': '\a', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t', 'v': '\v', '\\': '\\'}
+    group_names = {name: group + 1 for group, name in enumerate(regex.group_names) if name is not None}
+
+    literals = []
+    groups = []
+    literal = []
+
+    def add_group(group):
+        if not 0 <= group <= regex.groups:
+            raise ValueError('Invalid group reference {} in replacement template'.format(group))
+        literals.append(''.join(literal))
+        groups.append(-1)
+        literal.clear()
+        literals.append('')
+        groups.append(group)
+
+    i = 0
+    while i < len(template):
+        char = template[i]
+        i += 1
+        if char != '\\' or i == len(template):
+            literal.append(char)
+            continue
+
+        char = template[i]
+        i += 1
+        if char == 'g':
+            end = template.find('>', i)
+            if i == len(template) or template[i] != '<' or end < 0:
+                raise ValueError('Invalid group reference in replacement template')
+            name = template[i + 1:end]
+            i = end + 1
+            add_group(int(name) if name.isdigit() else group_names[name])
+        elif char.isdigit() and char != '0':
+            digits = char
+            if i < len(template) and template[i].isdigit():
+                digits += template[i]
+                i += 1
+            add_group(int(digits))
+        elif char in escapes:
+            literal.append(escapes[char])
+        elif char.isascii() and char.isalpha():
+            raise ValueError('Invalid escape \\{} in replacement template'.format(char))
+        else:
+            literal.append('\\' + char)
+
+    literals.append(''.join(literal))
+    groups.append(-1)
+
+    return tuple(literals), tuple(groups)
+
+
+@sdc_register_jitable
+def regex_char(str_arr, pos):
+    """Decode UTF-8 character of string array data at byte position, returns code point and its size"""
+    lead = numpy.int64(getitem_str_byte(str_arr, pos))
+    if lead < 0x80:
+        return lead, 1
+
+    byte_1 = numpy.int64(getitem_str_byte(str_arr, pos + 1)) & 0x3F
+    if lead < 0xE0:
+        return ((lead & 0x1F) << 6) | byte_1, 2
+
+    byte_2 = numpy.int64(getitem_str_byte(str_arr, pos + 2)) & 0x3F
+    if lead < 0xF0:
+        return ((lead & 0x0F) << 12) | (byte_1 << 6) | byte_2, 3
+
+    byte_3 = numpy.int64(getitem_str_byte(str_arr, pos + 3)) & 0x3F
+    return ((lead & 0x07) << 18) | (byte_1 << 12) | (byte_2 << 6) | byte_3, 4
+
+
+@sdc_register_jitable
+def regex_char_class(program, codepoint):
+    """Get class of the alphabet of the program containing code point"""
+    if codepoint < 128:
+        return program[4][codepoint]
+
+    return numpy.searchsorted(program[5], codepoint, side='right')
+
+
+@sdc_register_jitable
+def regex_is_word(program, charset, str_arr, pos):
+    """Check if character at byte position belongs to the set of word characters"""
+    codepoint, _ = regex_char(str_arr, pos)
+    return program[3][charset, regex_char_class(program, codepoint)]
+
+
+@sdc_register_jitable
+def regex_assert(program, kind, charset, str_arr, begin, end, pos):
+    """Check assertion at byte position of string from begin to end"""
+    if kind == REGEX_AT_BEGINNING_STRING:
+        return pos == begin
+    if kind == REGEX_AT_END_STRING:
+        return pos == end
+    if kind == REGEX_AT_END:
+        return pos == end or (pos == end - 1 and getitem_str_byte(str_arr, pos) == 10)
+    if kind == REGEX_AT_BEGINNING_LINE:
+        return pos == begin or getitem_str_byte(str_arr, pos - 1) == 10
+    if kind == REGEX_AT_END_LINE:
+        return pos == end or getitem_str_byte(str_arr, pos) == 10
+
+    is_word_after = pos < end and regex_is_word(program, charset, str_arr, pos)
+    is_word_before = False
+    if pos > begin:
+        prev = pos - 1
+        while prev > begin and (getitem_str_byte(str_arr, prev) & 0xC0) == 0x80:
+            prev -= 1
+        is_word_before = regex_is_word(program, charset, str_arr, prev)
+
+    if kind == REGEX_AT_BOUNDARY:
+        return is_word_before != is_word_after
+
+    return is_word_before == is_word_after
+
+
+@sdc_register_jitable
+def regex_dfa_run(transitions, accept, program, str_arr, begin, end):
+    """Run DFA over string from begin to end, returns True if accepting state is reached"""
+    state = 0
+    pos = begin
+    while not accept[state]:
+        if pos == end:
+            return False
+        codepoint, size = regex_char(str_arr, pos)
+        state = transitions[state, regex_char_class(program, codepoint)]
+        if state < 0:
+            return False
+        pos += size
+
+    return True
+
+
+@sdc_register_jitable
+def regex_workspace(program, nslots):
+    """Allocate arrays used by Pike VM, workspace can be reused for any strings matched by the program"""
+    size = len(program[0])
+    current_pcs = numpy.empty(size, dtype=numpy.int64)
+    next_pcs = numpy.empty(size, dtype=numpy.int64)
+    current_slots = numpy.empty((size, nslots), dtype=numpy.int64)
+    next_slots = numpy.empty((size, nslots), dtype=numpy.int64)
+    marks = numpy.full(size, -1, dtype=numpy.int64)
+    stack_pcs = numpy.empty(2 * size + 1, dtype=numpy.int64)
+    stack_slots = numpy.empty((2 * size + 1, nslots), dtype=numpy.int64)
+    slots = numpy.full(nslots, -1, dtype=numpy.int64)
+    generation = numpy.zeros(1, dtype=numpy.int64)
+    initial_slots = numpy.full(nslots, -1, dtype=numpy.int64)
+
+    return (current_pcs, next_pcs, current_slots, next_slots, marks, stack_pcs, stack_slots,
+            slots, generation, initial_slots)
+
+
+@sdc_register_jitable
+def regex_add_thread(program, workspace, pcs, threads_slots, count, pc, slots, mark,
+                     str_arr, begin, end, pos):
+    """
+    Add thread to the list following epsilon transitions in order of priority,
+    returns new number of threads in the list.
+    """
+    ops, args_a, args_b = program[0], program[1], program[2]
+    marks, stack_pcs, stack_slots = workspace[4], workspace[5], workspace[6]
+
+    stack_pcs[0] = pc
+    stack_slots[0, :] = slots
+    top = 1
+    while top > 0:
+        top -= 1
+        pc = stack_pcs[top]
+        if marks[pc] == mark:
+            continue
+        marks[pc] = mark
+
+        op = ops[pc]
+        if op == REGEX_JUMP:
+            stack_pcs[top] = args_a[pc]
+            top += 1
+        elif op == REGEX_SPLIT:
+            stack_pcs[top] = args_b[pc]
+            stack_pcs[top + 1] = args_a[pc]
+            stack_slots[top + 1, :] = stack_slots[top, :]
+            top += 2
+        elif op == REGEX_SAVE:
+            stack_slots[top, args_a[pc]] = pos
+            stack_pcs[top] = pc + 1
+            top += 1
+        elif op == REGEX_ASSERT:
+            if regex_assert(program, args_a[pc], args_b[pc], str_arr, begin, end, pos):
+                stack_pcs[top] = pc + 1
+                top += 1
+        else:
+            pcs[count] = pc
+            threads_slots[count, :] = stack_slots[top, :]
+            count += 1
+
+    return count
+
+
+@sdc_register_jitable
+def regex_vm_search(program, workspace, str_arr, begin, end, start, anchored, not_empty_at):
+    """
+    Find leftmost-first match in string from begin to end starting at byte position start
+    by Pike VM simulation of the program. Empty match at position not_empty_at is not allowed.
+    Returns True if match is found, byte positions of groups are written into workspace slots.
+    """
+    current_pcs, next_pcs, current_slots, next_slots = workspace[0], workspace[1], workspace[2], workspace[3]
+    slots, generation, initial_slots = workspace[7], workspace[8], workspace[9]
+    ops, args_a, member = program[0], program[1], program[3]
+
+    generation[0] += 1
+    mark = generation[0]
+    count = 0
+    matched = False
+    pos = start
+    while True:
+        if not matched and (not anchored or pos == start):
+            count = regex_add_thread(program, workspace, current_pcs, current_slots, count, 0, initial_slots,
+                                     mark, str_arr, begin, end, pos)
+        if count == 0 and (matched or anchored):
+            break
+
+        char_class = -1
+        size = 0
+        if pos < end:
+            codepoint, size = regex_char(str_arr, pos)
+            char_class = regex_char_class(program, codepoint)
+
+        generation[0] += 1
+        mark = generation[0]
+        next_count = 0
+        for thread in range(count):
+            pc = current_pcs[thread]
+            if ops[pc] == REGEX_MATCH:
+                if pos == not_empty_at and current_slots[thread, 0] == not_empty_at:
+                    continue
+                slots[:] = current_slots[thread, :]
+                matched = True
+                # threads of lower priority are cut off
+                break
+            if char_class >= 0 and member[args_a[pc], char_class]:
+                next_count = regex_add_thread(program, workspace, next_pcs, next_slots, next_count, pc + 1,
+                                              current_slots[thread, :], mark, str_arr, begin, end, pos + size)
+
+        if pos == end:
+            break
+
+        current_pcs, next_pcs = next_pcs, current_pcs
+        current_slots, next_slots = next_slots, current_slots
+        count = next_count
+        pos += size
+
+    return matched
+
+
+@sdc_register_jitable
+def regex_string_bounds(str_arr, idx):
+    return numpy.int64(getitem_str_offset(str_arr, idx)), numpy.int64(getitem_str_offset(str_arr, idx + 1))
+
+
+@sdc_register_jitable
+def regex_contains(program, workspace, str_arr, idx):
+    """Check if pattern matches anywhere in the string of string array, same as re.search()"""
+    begin, end = regex_string_bounds(str_arr, idx)
+    if len(program[7]) > 0:
+        return regex_dfa_run(program[6], program[7], program, str_arr, begin, end)
+
+    return regex_vm_search(program, workspace, str_arr, begin, end, begin, False, -1)
+
+
+@sdc_register_jitable
+def regex_match(program, workspace, str_arr, idx):
+    """Check if pattern matches at the beginning of the string of string array, same as re.match()"""
+    begin, end = regex_string_bounds(str_arr, idx)
+    if len(program[9]) > 0:
+        return regex_dfa_run(program[8], program[9], program, str_arr, begin, end)
+
+    return regex_vm_search(program, workspace, str_arr, begin, end, begin, True, -1)
+
+
+@sdc_register_jitable
+def regex_substring(str_arr, start, stop):
+    """Decode string from bytes of string array data from start to stop"""
+    return decode_utf8(get_data_ptr_ind(str_arr, start), stop - start)
+
+
+@sdc_register_jitable
+def regex_search(program, workspace, str_arr, idx):
+    """
+    Find leftmost-first match in the string of string array, same as re.search(),
+    byte positions of groups are written into workspace slots.
+    """
+    begin, end = regex_string_bounds(str_arr, idx)
+    if len(program[7]) > 0 and not regex_dfa_run(program[6], program[7], program, str_arr, begin, end):
+        return False
+
+    return regex_vm_search(program, workspace, str_arr, begin, end, begin, False, -1)
+
+
+@sdc_register_jitable
+def regex_group(workspace, str_arr, group):
+    """Get group of the last match found by regex_search(), the group should be matched"""
+    slots = workspace[7]
+    return regex_substring(str_arr, slots[2 * group], slots[2 * group + 1])
+
+
+@sdc_register_jitable
+def regex_group_matched(workspace, group):
+    return workspace[7][2 * group] >= 0
+
+
+@sdc_register_jitable
+def regex_replace(program, workspace, str_arr, idx, literals, groups, count):
+    """
+    Replace non-overlapping occurrences of pattern in the string of string array
+    by template given as literals and groups from parse_regex_template(), same as re.sub().
+    """
+    begin, end = regex_string_bounds(str_arr, idx)
+    if len(program[7]) > 0 and not regex_dfa_run(program[6], program[7], program, str_arr, begin, end):
+        return regex_substring(str_arr, begin, end)
+
+    slots = workspace[7]
+    pieces = []
+    last = begin
+    pos = begin
+    not_empty_at = -1
+    replaced = 0
+    while (count <= 0 or replaced < count) and pos <= end:
+        if not regex_vm_search(program, workspace, str_arr, begin, end, pos, False, not_empty_at):
+            break
+
+        match_start, match_end = slots[0], slots[1]
+        pieces.append(regex_substring(str_arr, last, match_start))
+        for i in range(len(literals)):
+            group = groups[i]
+            if group < 0:
+                pieces.append(literals[i])
+            elif slots[2 * group] >= 0:
+                pieces.append(regex_substring(str_arr, slots[2 * group], slots[2 * group + 1]))
+
+        last = match_end
+        pos = match_end
+        not_empty_at = match_end if match_end == match_start else -1
+        replaced += 1
+
+    pieces.append(regex_substring(str_arr, last, end))
+
+    return ''.join(pieces)
@@ -0,0 +1,272 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+
+| This file contains kernels of string methods working on buffers of :class:`StringArray`
+
+    Strings are processed as raw UTF-8 bytes of the data buffer without decoding them into unicode objects.
+    Kernels producing strings compute sizes of the result in the first pass and fill preallocated
+    string array in parallel in the second one. Lengths and positions are counted in characters
+    by skipping continuation bytes. Byte-level transformations of characters are valid for ASCII data only,
+    so that such kernels are used if :func:`str_arr_is_ascii` is True.
+
+"""
+
+import numba
+import numpy
+
+from sdc.str_arr_ext import (copy_null_bitmap, get_data_ptr_ind, getitem_str_byte, getitem_str_offset,
+                             pre_alloc_string_array, setitem_str_byte, setitem_str_offset, _memcpy)
+from sdc.functions.regex import regex_char
+from sdc.utilities.prange_utils import parallel_chunks
+from sdc.utilities.utils import sdc_register_jitable
+
+
+# Python str.isspace() is true for these ASCII characters
+ASCII_WHITESPACE = ' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+
+
+@sdc_register_jitable
+def str_arr_num_bytes(str_arr):
+    return numpy.int64(getitem_str_offset(str_arr, len(str_arr)))
+
+
+@sdc_register_jitable
+def str_arr_bounds(str_arr, idx):
+    """Byte offsets of the beginning and the end of the string of string array"""
+    return numpy.int64(getitem_str_offset(str_arr, idx)), numpy.int64(getitem_str_offset(str_arr, idx + 1))
+
+
+@sdc_register_jitable
+def str_arr_is_ascii(str_arr):
+    """Check if all characters of string array are encoded by a single byte"""
+    num_bytes = str_arr_num_bytes(str_arr)
+    chunks = parallel_chunks(num_bytes)
+    chunk_bits = numpy.zeros(len(chunks), dtype=numpy.uint8)
+    for i in numba.prange(len(chunks)):
+        chunk = chunks[i]
+        bits = 0
+        for pos in range(chunk.start, chunk.stop):
+            bits |= getitem_str_byte(str_arr, pos)
+        chunk_bits[i] = bits
+
+    for i in range(len(chunks)):
+        if chunk_bits[i] >= 0x80:
+            return False
+
+    return True
+
+
+@sdc_register_jitable
+def str_to_utf8(s):
+    """Encode string into array of UTF-8 bytes"""
+    result = numpy.empty(4 * len(s), dtype=numpy.uint8)
+    size = 0
+    for char in s:
+        codepoint = ord(char)
+        if codepoint < 0x80:
+            result[size] = codepoint
+            size += 1
+        elif codepoint < 0x800:
+            result[size] = 0xC0 | (codepoint >> 6)
+            result[size + 1] = 0x80 | (codepoint & 0x3F)
+            size += 2
+        elif codepoint < 0x10000:
+            result[size] = 0xE0 | (codepoint >> 12)
+            result[size + 1] = 0x80 | ((codepoint >> 6) & 0x3F)
+            result[size + 2] = 0x80 | (codepoint & 0x3F)
+            size += 3
+        else:
+            result[size] = 0xF0 | (codepoint >> 18)
+            result[size + 1] = 0x80 | ((codepoint >> 12) & 0x3F)
+            result[size + 2] = 0x80 | ((codepoint >> 6) & 0x3F)
+            result[size + 3] = 0x80 | (codepoint & 0x3F)
+            size += 4
+
+    return result[:size]
+
+
+@sdc_register_jitable
+def ascii_chars_table(chars):
+    """Create table of bytes marking the given characters, returns empty table if any of them is not ASCII"""
+    table = numpy.zeros(256, dtype=numpy.bool_)
+    for char in chars:
+        codepoint = ord(char)
+        if codepoint >= 0x80:
+            return numpy.zeros(0, dtype=numpy.bool_)
+        table[codepoint] = True
+
+    return table
+
+
+@sdc_register_jitable
+def utf8_num_chars(str_arr, begin, end):
+    """Count characters encoded by bytes from begin to end, i.e. bytes which are not continuation ones"""
+    count = 0
+    for pos in range(begin, end):
+        count += (getitem_str_byte(str_arr, pos) & 0xC0) != 0x80
+
+    return count
+
+
+@sdc_register_jitable
+def utf8_space_size(str_arr, pos):
+    """Size in bytes of the whitespace character (as of str.isspace()) at byte position, zero if it's not space"""
+    byte = getitem_str_byte(str_arr, pos)
+    if byte < 0x80:
+        return 1 if (byte == 0x20 or 0x09 <= byte <= 0x0D or 0x1C <= byte <= 0x1F) else 0
+
+    codepoint, size = regex_char(str_arr, pos)
+    if (codepoint == 0x85 or codepoint == 0xA0 or codepoint == 0x1680 or 0x2000 <= codepoint <= 0x200A
+            or codepoint == 0x2028 or codepoint == 0x2029 or codepoint == 0x202F or codepoint == 0x205F
+            or codepoint == 0x3000):
+        return size
+
+    return 0
+
+
+@sdc_register_jitable
+def utf8_equal(str_arr, pos, sub_bytes):
+    for i in range(len(sub_bytes)):
+        if getitem_str_byte(str_arr, pos + i) != sub_bytes[i]:
+            return False
+
+    return True
+
+
+@sdc_register_jitable
+def str_arr_len(str_arr):
+    """Lengths of strings of string array in characters"""
+    length = len(str_arr)
+    result = numpy.empty(length, dtype=numpy.int64)
+    for idx in numba.prange(length):
+        begin, end = str_arr_bounds(str_arr, idx)
+        result[idx] = utf8_num_chars(str_arr, begin, end)
+
+    return result
+
+
+@sdc_register_jitable
+def str_arr_startswith(str_arr, sub_bytes):
+    length = len(str_arr)
+    result = numpy.empty(length, dtype=numpy.bool_)
+    size = len(sub_bytes)
+    for idx in numba.prange(length):
+        begin, end = str_arr_bounds(str_arr, idx)
+        result[idx] = end - begin >= size and utf8_equal(str_arr, begin, sub_bytes)
+
+    return result
+
+
+@sdc_register_jitable
+def str_arr_endswith(str_arr, sub_bytes):
+    length = len(str_arr)
+    result = numpy.empty(length, dtype=numpy.bool_)
+    size = len(sub_bytes)
+    for idx in numba.prange(length):
+        begin, end = str_arr_bounds(str_arr, idx)
+        result[idx] = end - begin >= size and utf8_equal(str_arr, end - size, sub_bytes)
+
+    return result
+
+
+@sdc_register_jitable
+def str_arr_find(str_arr, sub_bytes):
+    """Lowest index in characters where substring is found in strings of string array, -1 if it's not found"""
+    length = len(str_arr)
+    result = numpy.empty(length, dtype=numpy.int64)
+    size = len(sub_bytes)
+    for idx in numba.prange(length):
+        begin, end = str_arr_bounds(str_arr, idx)
+        found = -1
+        if size == 0:
+            found = begin
+        else:
+            first = sub_bytes[0]
+            for pos in range(begin, end - size + 1):
+                if getitem_str_byte(str_arr, pos) == first and utf8_equal(str_arr, pos, sub_bytes):
+                    found = pos
+                    break
+
+        result[idx] = -1 if found < 0 else utf8_num_chars(str_arr, begin, found)
+
+    return result
+
+
+@sdc_register_jitable
+def str_arr_ascii_change_case(str_arr, to_upper):
+    """Convert ASCII strings of string array to uppercase or lowercase, strings keep their offsets"""
+    length = len(str_arr)
+    num_bytes = str_arr_num_bytes(str_arr)
+    result = pre_alloc_string_array(length, num_bytes)
+    for idx in numba.prange(length + 1):
+        setitem_str_offset(result, idx, getitem_str_offset(str_arr, idx))
+
+    first, last = (ord('a'), ord('z')) if to_upper else (ord('A'), ord('Z'))
+    for pos in numba.prange(num_bytes):
+        byte = getitem_str_byte(str_arr, pos)
+        if first <= byte <= last:
+            byte = numpy.uint8(byte ^ 0x20)
+        setitem_str_byte(result, pos, byte)
+
+    copy_null_bitmap(str_arr, result)
+
+    return result
+
+
+@sdc_register_jitable
+def str_arr_strip_bytes(str_arr, table, left, right):
+    """
+    Remove leading and/or trailing bytes marked in the table from strings of string array,
+    bytes of ASCII characters never occur inside multibyte characters of UTF-8
+    """
+    length = len(str_arr)
+    starts = numpy.empty(length, dtype=numpy.int64)
+    sizes = numpy.empty(length, dtype=numpy.int64)
+    for idx in numba.prange(length):
+        begin, end = str_arr_bounds(str_arr, idx)
+        if left:
+            while begin < end and table[getitem_str_byte(str_arr, begin)]:
+                begin += 1
+        if right:
+            while end > begin and table[getitem_str_byte(str_arr, end - 1)]:
+                end -= 1
+        starts[idx] = begin
+        sizes[idx] = end - begin
+
+    offsets = numpy.zeros(length + 1, dtype=numpy.int64)
+    offsets[1:] = numpy.cumsum(sizes)
+
+    result = pre_alloc_string_array(length, offsets[length])
+    for idx in numba.prange(length):
+        setitem_str_offset(result, idx, numpy.uint32(offsets[idx]))
+        _memcpy(get_data_ptr_ind(result, offsets[idx]), get_data_ptr_ind(str_arr, starts[idx]), sizes[idx], 1)
+    setitem_str_offset(result, length, numpy.uint32(offsets[length]))
+
+    copy_null_bitmap(str_arr, result)
+
+    return result
@@ -193,7 +193,8 @@ def fix_df_array_overload(column):
         return lambda column: sdc.hiframes.api.get_series_data(column)
 
     # column is array if not list
-    assert isinstance(column, (types.Array, StringArrayType, SeriesType))
+    assert (isinstance(column, (types.Array, StringArrayType, SeriesType))
+            or column == sdc.hiframes.split_impl.string_array_split_view_type)
 
     def fix_df_array_impl(column):  # pragma: no cover
         return column
@@ -47,6 +47,7 @@ from sdc.datatypes.categorical.types import CategoricalDtypeType, Categorical
 from sdc.datatypes.categorical.boxing import unbox_Categorical, box_Categorical
 from sdc.hiframes.pd_series_ext import SeriesType
 from sdc.hiframes.pd_series_type import _get_series_array_type
+from sdc.hiframes.split_impl import string_array_split_view_type, split_view_is_na, split_view_to_list
 
 from sdc.hiframes.pd_dataframe_ext import get_structure_maps
 
@@ -413,6 +414,8 @@ def _box_series_data(dtype, data_typ, val, c):
         arr = box_str_arr(string_array_type, val, c)
     elif isinstance(dtype, CategoricalDtypeType):
         arr = box_Categorical(data_typ, val, c)
+    elif data_typ == string_array_split_view_type:
+        arr = _box_split_view(data_typ, val, c)
     elif dtype == types.List(string_type):
         arr = box_list(list_string_array_type, val, c)
     else:
@@ -426,6 +429,24 @@ def _box_series_data(dtype, data_typ, val, c):
     return arr
 
 
+def _box_split_view(typ, val, c):
+    """Box split view as list of lists of strings, with NaN for the missing strings like pandas does"""
+    list_typ = types.List(types.List(string_type))
+    lists = c.context.compile_internal(c.builder, lambda arr: split_view_to_list(arr), list_typ(typ), [val])
+    size = c.context.compile_internal(c.builder, lambda arr: len(arr), types.intp(typ), [val])
+    arr = box_list(list_typ, lists, c)
+
+    with cgutils.for_range(c.builder, size) as loop:
+        is_na = c.context.compile_internal(c.builder, lambda arr, i: split_view_is_na(arr, i),
+                                           types.boolean(typ, types.intp), [val, loop.index])
+        with c.builder.if_then(is_na):
+            nan_obj = c.pyapi.float_from_double(c.context.get_constant(types.float64, np.nan))
+            # steals reference to nan_obj
+            c.pyapi.list_setitem(arr, loop.index, nan_obj)
+
+    return arr
+
+
 def _unbox_array_list_str(obj, c):
     #
     typ = list_string_array_type
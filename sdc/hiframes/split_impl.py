@@ -0,0 +1,319 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+
+| Split view of :class:`StringArray` used as data of Series returned by Series.str.split()
+
+    Split view doesn't copy characters: it keeps the parent string array alive and records byte offsets
+    of the pieces of every string in its data buffer. Pieces of the string with index ``i`` are
+    ``starts[j]:ends[j]`` for ``j`` in ``index_offsets[i]:index_offsets[i + 1]``. Strings are materialized
+    only when a new :class:`StringArray` is created, e.g. by Series.str.get(), by bytes copying.
+
+"""
+
+import numba
+import numpy
+
+from llvmlite import ir as lir
+from numba import types
+from numba.core import cgutils
+from numba.extending import intrinsic, make_attribute_wrapper, models, overload, register_model
+
+from sdc.functions.regex import regex_char
+from sdc.functions.str_arr_kernels import str_to_utf8, utf8_equal, utf8_space_size
+from sdc.str_arr_ext import (decode_utf8, get_data_ptr_ind, getitem_str_offset, pre_alloc_string_array,
+                             setitem_str_offset, str_arr_is_na, str_arr_set_na, _memcpy)
+from sdc.str_arr_type import string_array_type
+from sdc.str_ext import string_type
+from sdc.utilities.utils import sdc_register_jitable
+
+
+class StringArraySplitViewType(types.IterableType):
+    """Type of split view of string array, elements are lists of strings"""
+
+    def __init__(self):
+        super(StringArraySplitViewType, self).__init__(name='StringArraySplitViewType()')
+
+    @property
+    def dtype(self):
+        return types.List(string_type)
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def iterator_type(self):
+        return None
+
+
+string_array_split_view_type = StringArraySplitViewType()
+
+
+@register_model(StringArraySplitViewType)
+class StringArraySplitViewModel(models.StructModel):
+    def __init__(self, dmm, fe_type):
+        offsets_type = types.Array(types.int64, 1, 'C')
+        members = [
+            ('parent', string_array_type),
+            ('index_offsets', offsets_type),
+            ('starts', offsets_type),
+            ('ends', offsets_type),
+        ]
+        models.StructModel.__init__(self, dmm, fe_type, members)
+
+
+make_attribute_wrapper(StringArraySplitViewType, 'parent', '_parent')
+make_attribute_wrapper(StringArraySplitViewType, 'index_offsets', '_index_offsets')
+make_attribute_wrapper(StringArraySplitViewType, 'starts', '_starts')
+make_attribute_wrapper(StringArraySplitViewType, 'ends', '_ends')
+
+
+@intrinsic
+def init_split_view(typingctx, parent, index_offsets, starts, ends=None):
+    def codegen(context, builder, sig, args):
+        split_view = cgutils.create_struct_proxy(sig.return_type)(context, builder)
+        split_view.parent, split_view.index_offsets, split_view.starts, split_view.ends = args
+
+        if context.enable_nrt:
+            for arg_type, arg in zip(sig.args, args):
+                context.nrt.incref(builder, arg_type, arg)
+
+        return split_view._getvalue()
+
+    return string_array_split_view_type(parent, index_offsets, starts, ends), codegen
+
+
+@intrinsic
+def get_c_arr_ptr(typingctx, c_arr, ind_t=None):
+    """Pointer to the element of C array given by pointer or by ctypes attribute of an array"""
+    assert isinstance(c_arr, (types.CPointer, types.ArrayCTypes))
+
+    def codegen(context, builder, sig, args):
+        in_arr, ind = args
+        if isinstance(sig.args[0], types.ArrayCTypes):
+            in_arr = builder.extract_value(in_arr, 0)
+
+        return builder.bitcast(builder.gep(in_arr, [ind]), lir.IntType(8).as_pointer())
+
+    return types.voidptr(c_arr, ind_t), codegen
+
+
+@overload(len)
+def split_view_len_overload(arr):
+    if arr == string_array_split_view_type:
+        return lambda arr: len(arr._index_offsets) - 1
+
+    return None
+
+
+@sdc_register_jitable
+def split_view_pieces(str_arr, idx, sep_bytes, maxsplit, starts, ends, out_pos):
+    """
+    Find pieces of the string split by separator given as UTF-8 bytes, by runs of whitespaces if it is empty,
+    the same as str.split(). Pieces are written from out_pos if starts is not empty, returns number of pieces.
+    """
+    begin = numpy.int64(getitem_str_offset(str_arr, idx))
+    end = numpy.int64(getitem_str_offset(str_arr, idx + 1))
+    write = len(starts) > 0
+    size = len(sep_bytes)
+    count = 0
+    pos = begin
+    while True:
+        if size == 0:
+            while pos < end:
+                space_size = utf8_space_size(str_arr, pos)
+                if space_size == 0:
+                    break
+                pos += space_size
+            if pos == end:
+                break
+
+        piece_start = pos
+        piece_end = end
+        if maxsplit < 0 or count < maxsplit:
+            while pos < end:
+                if size == 0:
+                    space_size = utf8_space_size(str_arr, pos)
+                    if space_size > 0:
+                        piece_end = pos
+                        pos += space_size
+                        break
+                    # step over the whole character, continuation bytes can't be decoded
+                    _, char_size = regex_char(str_arr, pos)
+                    pos += char_size
+                elif pos <= end - size and utf8_equal(str_arr, pos, sep_bytes):
+                    piece_end = pos
+                    pos += size
+                    break
+                else:
+                    pos += 1
+
+        if write:
+            starts[out_pos + count] = piece_start
+            ends[out_pos + count] = piece_end
+        count += 1
+        if piece_end == end:
+            break
+
+    return count
+
+
+@sdc_register_jitable
+def compute_split_view(str_arr, sep, maxsplit):
+    """Split strings of string array by separator (whitespaces if it is None) without copying characters"""
+    sep_bytes = numpy.empty(0, dtype=numpy.uint8)
+    if sep is not None:
+        if len(sep) == 0:
+            raise ValueError('empty separator')
+        sep_bytes = str_to_utf8(sep)
+
+    length = len(str_arr)
+    no_pieces = numpy.empty(0, dtype=numpy.int64)
+    counts = numpy.empty(length, dtype=numpy.int64)
+    for idx in numba.prange(length):
+        counts[idx] = split_view_pieces(str_arr, idx, sep_bytes, maxsplit, no_pieces, no_pieces, 0)
+
+    index_offsets = numpy.zeros(length + 1, dtype=numpy.int64)
+    index_offsets[1:] = numpy.cumsum(counts)
+
+    starts = numpy.empty(index_offsets[length], dtype=numpy.int64)
+    ends = numpy.empty(index_offsets[length], dtype=numpy.int64)
+    for idx in numba.prange(length):
+        split_view_pieces(str_arr, idx, sep_bytes, maxsplit, starts, ends, index_offsets[idx])
+
+    return init_split_view(str_arr, index_offsets, starts, ends)
+
+
+@sdc_register_jitable
+def get_split_view_index(arr, item_ind, str_ind):
+    """Piece of the string of split view decoded into unicode string"""
+    piece = arr._index_offsets[item_ind] + str_ind
+    start = arr._starts[piece]
+    return decode_utf8(get_data_ptr_ind(arr._parent, start), arr._ends[piece] - start)
+
+
+@sdc_register_jitable
+def get_split_view_data_ptr(arr, data_start):
+    return get_data_ptr_ind(arr._parent, data_start)
+
+
+@sdc_register_jitable
+def split_view_is_na(arr, idx):
+    return str_arr_is_na(arr._parent, idx)
+
+
+@sdc_register_jitable
+def split_view_to_list(arr):
+    """Convert split view into list of lists of strings, used for boxing"""
+    result = []
+    for idx in range(len(arr)):
+        count = arr._index_offsets[idx + 1] - arr._index_offsets[idx]
+        result.append([get_split_view_index(arr, idx, j) for j in range(count)])
+
+    return result
+
+
+@sdc_register_jitable
+def split_view_len(arr):
+    """Number of pieces of each string of split view"""
+    return numpy.diff(arr._index_offsets)
+
+
+@sdc_register_jitable
+def copy_split_view_pieces(arr, pieces):
+    """Create string array of the given pieces of split view by copying their bytes, negative piece means NaN"""
+    length = len(pieces)
+    sizes = numpy.zeros(length, dtype=numpy.int64)
+    for i in numba.prange(length):
+        piece = pieces[i]
+        if piece >= 0:
+            sizes[i] = arr._ends[piece] - arr._starts[piece]
+
+    offsets = numpy.zeros(length + 1, dtype=numpy.int64)
+    offsets[1:] = numpy.cumsum(sizes)
+
+    result = pre_alloc_string_array(length, offsets[length])
+    for i in numba.prange(length):
+        setitem_str_offset(result, i, numpy.uint32(offsets[i]))
+        if sizes[i] > 0:
+            _memcpy(get_data_ptr_ind(result, offsets[i]), get_data_ptr_ind(arr._parent, arr._starts[pieces[i]]),
+                    sizes[i], 1)
+    setitem_str_offset(result, length, numpy.uint32(offsets[length]))
+
+    # null bits share bytes, so that they are set sequentially
+    for i in range(length):
+        if pieces[i] < 0:
+            str_arr_set_na(result, i)
+
+    return result
+
+
+@sdc_register_jitable
+def split_view_get(arr, i):
+    """Get i-th piece of each string of split view, NaN if the string is NaN or has no such piece"""
+    length = len(arr)
+    pieces = numpy.empty(length, dtype=numpy.int64)
+    for idx in numba.prange(length):
+        first = arr._index_offsets[idx]
+        count = arr._index_offsets[idx + 1] - first
+        j = i + count if i < 0 else i
+        if 0 <= j < count and not str_arr_is_na(arr._parent, idx):
+            pieces[idx] = first + j
+        else:
+            pieces[idx] = -1
+
+    return copy_split_view_pieces(arr, pieces)
+
+
+@sdc_register_jitable
+def split_view_explode(arr):
+    """
+    Transform each piece of split view into a row, returns string array of the pieces and positions of
+    original rows, strings which are NaN or have no pieces become NaN rows
+    """
+    length = len(arr)
+    counts = numpy.empty(length, dtype=numpy.int64)
+    for idx in numba.prange(length):
+        count = arr._index_offsets[idx + 1] - arr._index_offsets[idx]
+        counts[idx] = 1 if count == 0 or str_arr_is_na(arr._parent, idx) else count
+
+    row_offsets = numpy.zeros(length + 1, dtype=numpy.int64)
+    row_offsets[1:] = numpy.cumsum(counts)
+
+    num_rows = row_offsets[length]
+    pieces = numpy.empty(num_rows, dtype=numpy.int64)
+    positions = numpy.empty(num_rows, dtype=numpy.int64)
+    for idx in numba.prange(length):
+        first = arr._index_offsets[idx]
+        count = arr._index_offsets[idx + 1] - first
+        is_na = count == 0 or str_arr_is_na(arr._parent, idx)
+        for j in range(counts[idx]):
+            pieces[row_offsets[idx] + j] = -1 if is_na else first + j
+            positions[row_offsets[idx] + j] = idx
+
+    return copy_split_view_pieces(arr, pieces), positions
@@ -39,6 +39,9 @@ using parquet::arrow::FileReader;
 
 typedef std::vector<std::shared_ptr<FileReader>> FileReaderVec;
 
+// returned by string readers when total size of strings doesn't fit 32-bit offsets of string array
+#define PQ_STRING_OFFSETS_OVERFLOW -2
+
 // just include parquet reader on Windows since the GCC ABI change issue
 // doesn't exist, and VC linker removes unused lib symbols
 #if defined(_MSC_VER) || defined(BUILTIN_PARQUET_READER)
@@ -363,7 +366,7 @@ int pq_read_string(
         std::vector<uint32_t> offset_vec;
         std::vector<uint8_t> data_vec;
         std::vector<bool> null_vec;
-        int32_t last_offset = 0;
+        int64_t last_offset = 0;
         int64_t n_all_vals = 0;
         for (size_t i = 0; i < readers->size(); i++)
         {
@@ -375,6 +378,11 @@ int pq_read_string(
             }
 
             int size = offset_vec.size();
+            // offsets are 32-bit, stop instead of silent wraparound of offsets
+            if (last_offset + offset_vec[size - 1] > UINT32_MAX)
+            {
+                return PQ_STRING_OFFSETS_OVERFLOW;
+            }
             for (int64_t i = 1; i <= n_vals + 1; i++)
             {
                 offset_vec[size - i] += last_offset;
@@ -449,18 +457,23 @@ int pq_read_string_parallel(FileReaderVec* readers,
             int64_t rows_to_read = std::min(count - read_rows, file_size - start);
             if (rows_to_read > 0)
             {
-                pq_read_string_parallel_single_file(readers->at(file_ind),
-                                                    column_idx,
-                                                    NULL,
-                                                    NULL,
-                                                    NULL,
-                                                    start,
-                                                    rows_to_read,
-                                                    &offset_vec,
-                                                    &data_vec,
-                                                    &null_vec);
+                int status = pq_read_string_parallel_single_file(readers->at(file_ind),
+                                                                 column_idx,
+                                                                 NULL,
+                                                                 NULL,
+                                                                 NULL,
+                                                                 start,
+                                                                 rows_to_read,
+                                                                 &offset_vec,
+                                                                 &data_vec,
+                                                                 &null_vec);
 
                 int size = offset_vec.size();
+                // offsets are 32-bit, stop instead of silent wraparound of offsets
+                if (status == PQ_STRING_OFFSETS_OVERFLOW || last_offset + offset_vec[size - 1] > UINT32_MAX)
+                {
+                    return PQ_STRING_OFFSETS_OVERFLOW;
+                }
                 for (int64_t i = 1; i <= rows_to_read + 1; i++)
                 {
                     offset_vec[size - i] += last_offset;
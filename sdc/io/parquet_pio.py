@@ -49,6 +49,7 @@ import sdc
 from sdc.str_ext import string_type, unicode_to_char_ptr
 from sdc.str_arr_ext import StringArray, StringArrayPayloadType, construct_string_array
 from sdc.str_arr_ext import string_array_type
+from sdc.str_arr_type import max_num_total_chars
 from sdc.utilities.utils import unliteral_all
 
 
@@ -60,6 +61,10 @@ _type_to_pq_dtype_number = {'bool_': 0, 'int32': 1, 'int64': 2,
                             repr(types.NPDatetime('ns')): 3, 'int8': 6}
 
 
+# returned by string readers when total size of strings doesn't fit 32-bit offsets of string array
+_pq_string_offsets_overflow = -2
+
+
 def read_parquet():
     return 0
 
@@ -394,6 +399,14 @@ def pq_read_parallel_lower(context, builder, sig, args):
 # read strings
 
 
+def _check_pq_string_offsets_overflow(context, builder, res):
+    """Raise OverflowError if string reader stopped as offsets of string array are 32-bit"""
+    overflow_code = lir.Constant(lir.IntType(32), _pq_string_offsets_overflow)
+    with cgutils.if_unlikely(builder, builder.icmp_signed('==', res, overflow_code)):
+        errmsg = "string array supports up to {} bytes of characters".format(max_num_total_chars)
+        context.call_conv.return_user_exc(builder, OverflowError, (errmsg,))
+
+
 @lower_builtin(read_parquet_str, types.Opaque('arrow_reader'), types.intp, types.intp)
 def pq_read_string_lower(context, builder, sig, args):
 
@@ -416,6 +429,7 @@ def pq_read_string_lower(context, builder, sig, args):
                             str_arr_payload._get_ptr_by_name('offsets'),
                             str_arr_payload._get_ptr_by_name('data'),
                             str_arr_payload._get_ptr_by_name('null_bitmap')])
+    _check_pq_string_offsets_overflow(context, builder, res)
     builder.store(str_arr_payload._getvalue(), meminfo_data_ptr)
 
     string_array.meminfo = meminfo
@@ -452,6 +466,7 @@ def pq_read_string_parallel_lower(context, builder, sig, args):
                             str_arr_payload._get_ptr_by_name('null_bitmap'),
                             args[2],
                             args[3]])
+    _check_pq_string_offsets_overflow(context, builder, res)
 
     builder.store(str_arr_payload._getvalue(), meminfo_data_ptr)
 
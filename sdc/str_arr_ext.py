@@ -50,7 +50,8 @@ from numba import prange
 from sdc.str_ext import string_type
 from sdc.str_arr_type import (StringArray, string_array_type, StringArrayType,
                               StringArrayPayloadType, str_arr_payload_type, StringArrayIterator,
-                              is_str_arr_typ, offset_typ, data_ctypes_type, offset_ctypes_type)
+                              is_str_arr_typ, offset_typ, data_ctypes_type, offset_ctypes_type,
+                              max_num_total_chars)
 from sdc.utilities.sdc_typing_utils import check_is_array_of_dtype
 
 
@@ -197,6 +198,47 @@ def getitem_str_offset(typingctx, str_arr_typ, ind_t=None):
 
     return types.uint32(string_array_type, ind_t), codegen
 
+
+@intrinsic
+def getitem_str_byte(typingctx, str_arr_typ, ind_t=None):
+    def codegen(context, builder, sig, args):
+        in_str_arr, ind = args
+
+        string_array = context.make_helper(builder, string_array_type, in_str_arr)
+        return builder.load(builder.gep(string_array.data, [ind]))
+
+    return types.uint8(string_array_type, ind_t), codegen
+
+
+@intrinsic
+def setitem_str_byte(typingctx, str_arr_typ, ind_t, val_t=None):
+    def codegen(context, builder, sig, args):
+        in_str_arr, ind, val = args
+
+        string_array = context.make_helper(builder, string_array_type, in_str_arr)
+        builder.store(val, builder.gep(string_array.data, [ind]))
+        return context.get_dummy_value()
+
+    return types.void(string_array_type, ind_t, types.uint8), codegen
+
+
+@intrinsic
+def copy_null_bitmap(typingctx, str_arr_typ, out_str_arr_typ=None):
+    # precondition: output has the same number of strings as input
+    def codegen(context, builder, sig, args):
+        in_str_arr, out_str_arr = args
+
+        in_string_array = context.make_helper(builder, string_array_type, in_str_arr)
+        out_string_array = context.make_helper(builder, string_array_type, out_str_arr)
+        # n_bytes = (num_strings + 7) / 8
+        n_items_p7 = builder.add(in_string_array.num_items, lir.Constant(lir.IntType(64), 7))
+        n_bytes = builder.lshr(n_items_p7, lir.Constant(lir.IntType(64), 3))
+        cgutils.memcpy(builder, out_string_array.null_bitmap, in_string_array.null_bitmap, n_bytes)
+        return context.get_dummy_value()
+
+    return types.void(string_array_type, string_array_type), codegen
+
+
 # TODO: fix this for join
 @intrinsic
 def setitem_str_offset(typingctx, str_arr_typ, ind_t, val_t=None):
@@ -793,6 +835,13 @@ def pre_alloc_string_array(typingctx, num_strs_typ, num_total_chars_typ=None):
 
     def codegen(context, builder, sig, args):
         num_strs, num_total_chars = args
+
+        # offsets are 32-bit, check the size instead of silent wraparound of offsets
+        max_chars = context.get_constant(types.intp, max_num_total_chars)
+        with cgutils.if_unlikely(builder, builder.icmp_signed('>', num_total_chars, max_chars)):
+            errmsg = "string array supports up to {} bytes of characters".format(max_num_total_chars)
+            context.call_conv.return_user_exc(builder, OverflowError, (errmsg,))
+
         meminfo, meminfo_data_ptr = construct_string_array(context, builder)
 
         str_arr_payload = cgutils.create_struct_proxy(str_arr_payload_type)(context, builder)
@@ -1302,6 +1351,7 @@ def unbox_str_series(typ, val, c):
                              lir.IntType(32).as_pointer().as_pointer(),
                              lir.IntType(8).as_pointer().as_pointer(),
                              lir.IntType(8).as_pointer().as_pointer(),
+                             lir.IntType(64),
                              ])
     fn = c.builder.module.get_or_insert_function(fnty, name="string_array_from_sequence")
     c.builder.call(fn, [val,
@@ -1309,23 +1359,25 @@ def unbox_str_series(typ, val, c):
                         payload._get_ptr_by_name('offsets'),
                         payload._get_ptr_by_name('data'),
                         payload._get_ptr_by_name('null_bitmap'),
+                        c.context.get_constant(types.int64, max_num_total_chars),
                         ])
 
-    # the raw data is now copied to payload
-    # The native representation is a proxy to the payload, we need to
-    # get a proxy and attach the payload and meminfo
-    meminfo, meminfo_data_ptr = construct_string_array(c.context, c.builder)
-    c.builder.store(payload._getvalue(), meminfo_data_ptr)
+    # on failure (e.g. strings exceeding the offsets range) no buffers are allocated and Python error is set
+    is_error = cgutils.is_not_null(c.builder, c.pyapi.err_occurred())
+    with c.builder.if_then(c.builder.not_(is_error), likely=True):
+        # the raw data is now copied to payload
+        # The native representation is a proxy to the payload, we need to
+        # get a proxy and attach the payload and meminfo
+        meminfo, meminfo_data_ptr = construct_string_array(c.context, c.builder)
+        c.builder.store(payload._getvalue(), meminfo_data_ptr)
 
-    string_array.meminfo = meminfo
-    string_array.offsets = payload.offsets
-    string_array.data = payload.data
-    string_array.null_bitmap = payload.null_bitmap
-    string_array.num_total_chars = c.builder.zext(c.builder.load(
-        c.builder.gep(string_array.offsets, [string_array.num_items])), lir.IntType(64))
+        string_array.meminfo = meminfo
+        string_array.offsets = payload.offsets
+        string_array.data = payload.data
+        string_array.null_bitmap = payload.null_bitmap
+        string_array.num_total_chars = c.builder.zext(c.builder.load(
+            c.builder.gep(string_array.offsets, [string_array.num_items])), lir.IntType(64))
 
-    # FIXME how to check that the returned size is > 0?
-    is_error = cgutils.is_not_null(c.builder, c.pyapi.err_occurred())
     return NativeValue(string_array._getvalue(), is_error=is_error)
 
 # zero = context.get_constant(types.intp, 0)
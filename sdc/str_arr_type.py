@@ -32,6 +32,8 @@ from sdc.str_ext import string_type
 
 char_typ = types.uint8
 offset_typ = types.uint32
+# offsets are 32-bit, which limits the total size of characters in string array
+max_num_total_chars = 2 ** 32 - 1
 
 data_ctypes_type = types.ArrayCTypes(types.Array(char_typ, 1, 'C'))
 offset_ctypes_type = types.ArrayCTypes(types.Array(offset_typ, 1, 'C'))
@@ -38,6 +38,8 @@ from sdc.tests.test_strings import *
 from sdc.tests.test_groupby import *
 from sdc.tests.test_join import *
 from sdc.tests.test_rolling import *
+from sdc.tests.test_ewm import *
+from sdc.tests.test_expanding import *
 
 from sdc.tests.test_ml import *
 
@@ -0,0 +1,262 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+import unittest
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from numba.core.errors import TypingError
+from sdc.tests.test_base import TestCase
+from sdc.tests.test_utils import skip_sdc_jit
+
+
+test_ewm_data = [
+    [0., 1., np.nan, -2., 4., 4., 1.5, np.nan, np.nan, 3., -1., 2., 7.],
+    [np.nan, np.nan, 1., 1., 1., np.nan, 2., 2.],
+    [1., -1., 0., 0.1, -0.1, np.inf, 3., 2.],
+]
+
+
+class TestEWM(TestCase):
+
+    @skip_sdc_jit('Series.ewm() unsupported')
+    def test_series_ewm_mean(self):
+        def test_impl(series, com, min_periods, adjust, ignore_na):
+            return series.ewm(com=com, min_periods=min_periods, adjust=adjust, ignore_na=ignore_na).mean()
+
+        hpat_func = self.jit(test_impl)
+        for data in test_ewm_data:
+            series = pd.Series(data, name='A')
+            for com, min_periods, adjust, ignore_na in product([0., 0.5, 3.], [0, 2], [True, False], [True, False]):
+                with self.subTest(series=series, com=com, min_periods=min_periods,
+                                  adjust=adjust, ignore_na=ignore_na):
+                    jit_result = hpat_func(series, com, min_periods, adjust, ignore_na)
+                    ref_result = test_impl(series, com, min_periods, adjust, ignore_na)
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
+    @skip_sdc_jit('Series.ewm() unsupported')
+    def test_series_ewm_mean_long(self):
+        def test_impl(series, adjust, ignore_na):
+            return series.ewm(span=100, adjust=adjust, ignore_na=ignore_na).mean()
+
+        hpat_func = self.jit(test_impl)
+
+        np.random.seed(0)
+        data = np.random.ranf(10 ** 5)
+        data[np.random.ranf(10 ** 5) < 0.1] = np.nan
+        data[20000:30000] = np.nan
+        series = pd.Series(data)
+        for adjust, ignore_na in product([True, False], [True, False]):
+            with self.subTest(adjust=adjust, ignore_na=ignore_na):
+                pd.testing.assert_series_equal(hpat_func(series, adjust, ignore_na),
+                                               test_impl(series, adjust, ignore_na))
+
+    @skip_sdc_jit('Series.ewm() unsupported')
+    def test_series_ewm_moments_long(self):
+        def test_impl_var(series, other, adjust, ignore_na):
+            return series.ewm(span=100, adjust=adjust, ignore_na=ignore_na).var()
+
+        def test_impl_std(series, other, adjust, ignore_na):
+            return series.ewm(span=100, adjust=adjust, ignore_na=ignore_na).std(bias=True)
+
+        def test_impl_cov(series, other, adjust, ignore_na):
+            return series.ewm(span=100, adjust=adjust, ignore_na=ignore_na).cov(other)
+
+        def test_impl_corr(series, other, adjust, ignore_na):
+            return series.ewm(span=100, adjust=adjust, ignore_na=ignore_na).corr(other)
+
+        np.random.seed(0)
+        data = np.random.ranf(10 ** 5)
+        data[np.random.ranf(10 ** 5) < 0.1] = np.nan
+        data[20000:30000] = np.nan
+        other_data = data + np.random.ranf(10 ** 5)
+        other_data[np.random.ranf(10 ** 5) < 0.1] = np.nan
+        series = pd.Series(data)
+        other = pd.Series(other_data)
+        for test_impl in [test_impl_var, test_impl_std, test_impl_cov, test_impl_corr]:
+            hpat_func = self.jit(test_impl)
+            for adjust, ignore_na in product([True, False], [True, False]):
+                with self.subTest(test_impl=test_impl.__name__, adjust=adjust, ignore_na=ignore_na):
+                    pd.testing.assert_series_equal(hpat_func(series, other, adjust, ignore_na),
+                                                   test_impl(series, other, adjust, ignore_na))
+
+    @skip_sdc_jit('Series.ewm() unsupported')
+    def test_series_ewm_decay_params(self):
+        def test_impl_span(series, span):
+            return series.ewm(span=span).mean()
+
+        def test_impl_halflife(series, halflife):
+            return series.ewm(halflife=halflife).mean()
+
+        def test_impl_alpha(series, alpha):
+            return series.ewm(alpha=alpha).mean()
+
+        series = pd.Series(test_ewm_data[0])
+        for test_impl, params in [(test_impl_span, [1, 2.5, 10]),
+                                  (test_impl_halflife, [0.5, 1, 7]),
+                                  (test_impl_alpha, [0.1, 0.5, 1.])]:
+            hpat_func = self.jit(test_impl)
+            for param in params:
+                with self.subTest(test_impl=test_impl.__name__, param=param):
+                    pd.testing.assert_series_equal(hpat_func(series, param), test_impl(series, param))
+
+    @skip_sdc_jit('Series.ewm() unsupported')
+    def test_series_ewm_var_std(self):
+        def test_impl_var(series, com, adjust, bias):
+            return series.ewm(com=com, adjust=adjust).var(bias=bias)
+
+        def test_impl_std(series, com, adjust, bias):
+            return series.ewm(com=com, adjust=adjust).std(bias=bias)
+
+        for test_impl in [test_impl_var, test_impl_std]:
+            hpat_func = self.jit(test_impl)
+            for data, com, adjust, bias in product(test_ewm_data, [0.5, 3.], [True, False], [True, False]):
+                series = pd.Series(data)
+                with self.subTest(test_impl=test_impl.__name__, series=series, com=com, adjust=adjust, bias=bias):
+                    jit_result = hpat_func(series, com, adjust, bias)
+                    ref_result = test_impl(series, com, adjust, bias)
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
+    @skip_sdc_jit('Series.ewm() unsupported')
+    def test_series_ewm_corr_cov(self):
+        def test_impl_corr(series, other, com):
+            return series.ewm(com=com, min_periods=2).corr(other)
+
+        def test_impl_cov(series, other, com):
+            return series.ewm(com=com, min_periods=2).cov(other)
+
+        for test_impl in [test_impl_corr, test_impl_cov]:
+            hpat_func = self.jit(test_impl)
+            for main_data, other_data in product(test_ewm_data, test_ewm_data):
+                series = pd.Series(main_data[:8])
+                other = pd.Series(other_data[:8])
+                with self.subTest(test_impl=test_impl.__name__, series=series, other=other):
+                    jit_result = hpat_func(series, other, 1.5)
+                    ref_result = test_impl(series, other, 1.5)
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
+    @skip_sdc_jit('Series.ewm() unsupported')
+    def test_series_ewm_exceptions(self):
+        def test_impl(series, com, span):
+            return series.ewm(com=com, span=span).mean()
+
+        def test_impl_none(series):
+            return series.ewm().mean()
+
+        def test_impl_negative_com(series, com):
+            return series.ewm(com=com).mean()
+
+        series = pd.Series(test_ewm_data[0])
+        with self.assertRaises(ValueError) as raises:
+            self.jit(test_impl)(series, 1., 2.)
+        self.assertIn('mutually exclusive', str(raises.exception))
+
+        with self.assertRaises(ValueError) as raises:
+            self.jit(test_impl_none)(series)
+        self.assertIn('Must pass one of', str(raises.exception))
+
+        with self.assertRaises(ValueError) as raises:
+            self.jit(test_impl_negative_com)(series, -1.)
+        self.assertIn('comass must satisfy: comass >= 0', str(raises.exception))
+
+        with self.assertRaises(TypingError) as raises:
+            self.jit(test_impl_negative_com)(series, '1')
+        msg = 'Method ewm(). The object com\n given: unicode_type\n expected: float'
+        self.assertIn(msg, str(raises.exception))
+
+    @skip_sdc_jit('Series.ewm() unsupported')
+    def test_series_ewm_axis(self):
+        def test_impl(series, axis):
+            return series.ewm(com=1., axis=axis).mean()
+
+        hpat_func = self.jit(test_impl)
+
+        series = pd.Series(test_ewm_data[0])
+        for axis in [0, 'index', 'rows']:
+            with self.subTest(axis=axis):
+                pd.testing.assert_series_equal(hpat_func(series, axis), test_impl(series, 0))
+
+        for axis in [1, 'columns']:
+            with self.subTest(axis=axis):
+                with self.assertRaises(ValueError) as raises:
+                    hpat_func(series, axis)
+                self.assertIn('Method ewm(). The object axis\n expected: 0', str(raises.exception))
+
+    @skip_sdc_jit('DataFrame.ewm() unsupported')
+    def test_dataframe_ewm(self):
+        def test_impl_mean(df, com, ignore_na):
+            return df.ewm(com=com, ignore_na=ignore_na).mean()
+
+        def test_impl_std(df, com, ignore_na):
+            return df.ewm(com=com, ignore_na=ignore_na).std()
+
+        def test_impl_var(df, com, ignore_na):
+            return df.ewm(com=com, ignore_na=ignore_na).var(bias=True)
+
+        df = pd.DataFrame({
+            'A': test_ewm_data[0][:8], 'B': test_ewm_data[1], 'C': test_ewm_data[2], 'D': np.arange(8)
+        })
+        for test_impl in [test_impl_mean, test_impl_std, test_impl_var]:
+            hpat_func = self.jit(test_impl)
+            for com, ignore_na in product([0., 2.], [True, False]):
+                with self.subTest(test_impl=test_impl.__name__, com=com, ignore_na=ignore_na):
+                    pd.testing.assert_frame_equal(hpat_func(df, com, ignore_na), test_impl(df, com, ignore_na))
+
+    @skip_sdc_jit('DataFrame.ewm() unsupported')
+    def test_dataframe_ewm_corr_cov(self):
+        def test_impl_corr(df, other):
+            return df.ewm(span=3).corr(other)
+
+        def test_impl_cov(df, other):
+            return df.ewm(span=3).cov(other, bias=True)
+
+        def test_impl_cov_self(df):
+            return df.ewm(span=3).cov(pairwise=False)
+
+        df = pd.DataFrame({'A': test_ewm_data[0][:8], 'B': test_ewm_data[1], 'C': test_ewm_data[2]})
+        other = pd.DataFrame({'C': test_ewm_data[0][5:], 'D': test_ewm_data[1], 'A': test_ewm_data[0][:8]})
+        for test_impl in [test_impl_corr, test_impl_cov]:
+            with self.subTest(test_impl=test_impl.__name__):
+                pd.testing.assert_frame_equal(self.jit(test_impl)(df, other), test_impl(df, other))
+
+        pd.testing.assert_frame_equal(self.jit(test_impl_cov_self)(df), test_impl_cov_self(df))
+
+    @skip_sdc_jit('DataFrame.ewm() unsupported')
+    def test_dataframe_ewm_corr_pairwise_exception(self):
+        def test_impl(df):
+            return df.ewm(com=1).corr()
+
+        df = pd.DataFrame({'A': test_ewm_data[1], 'B': test_ewm_data[2]})
+        with self.assertRaises(ValueError) as raises:
+            self.jit(test_impl)(df)
+        msg = 'Method ewm.corr(). The object pairwise\n expected: False'
+        self.assertIn(msg, str(raises.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+import unittest
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from numba.core.errors import TypingError
+from sdc.tests.test_base import TestCase
+from sdc.tests.test_utils import skip_sdc_jit
+
+
+test_expanding_methods = ['count', 'kurt', 'max', 'mean', 'min', 'skew', 'std', 'sum', 'var']
+test_expanding_data = [
+    [0., 1., np.nan, -2., 4., 4., 1.5, np.nan, np.nan, 3., -1., 2., 7.],
+    [np.nan, np.nan, 1., 1., 1., np.nan, 2., 2.],
+    list(range(10)),
+]
+
+
+def gen_expanding_usecase(method_name):
+    func_text = 'def test_impl(obj, min_periods):\n'
+    func_text += f'  return obj.expanding(min_periods).{method_name}()\n'
+    loc_vars = {}
+    exec(func_text, {}, loc_vars)
+
+    return loc_vars['test_impl']
+
+
+class TestExpanding(TestCase):
+
+    @skip_sdc_jit('Series.expanding() unsupported')
+    def test_series_expanding(self):
+        for method_name in test_expanding_methods:
+            test_impl = gen_expanding_usecase(method_name)
+            hpat_func = self.jit(test_impl)
+            for data, min_periods in product(test_expanding_data, [0, 1, 3]):
+                series = pd.Series(data, name='A')
+                with self.subTest(method_name=method_name, series=series, min_periods=min_periods):
+                    jit_result = hpat_func(series, min_periods)
+                    ref_result = test_impl(series, min_periods)
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
+    @skip_sdc_jit('Series.expanding() unsupported')
+    def test_series_expanding_long(self):
+        np.random.seed(0)
+        data = np.random.ranf(10 ** 5)
+        data[np.random.ranf(10 ** 5) < 0.1] = np.nan
+        series = pd.Series(data)
+        for method_name in test_expanding_methods:
+            test_impl = gen_expanding_usecase(method_name)
+            hpat_func = self.jit(test_impl)
+            with self.subTest(method_name=method_name):
+                pd.testing.assert_series_equal(hpat_func(series, 10), test_impl(series, 10))
+
+    @skip_sdc_jit('Series.expanding() unsupported')
+    def test_series_expanding_moments_large_offset(self):
+        """Verifies that moments merged across chunks do not lose precision for data with large mean"""
+        np.random.seed(0)
+        data = 10 ** 9 + np.random.ranf(10 ** 4)
+        data[np.random.ranf(10 ** 4) < 0.1] = np.nan
+        series = pd.Series(data)
+        for method_name in ['kurt', 'skew', 'std', 'var']:
+            test_impl = gen_expanding_usecase(method_name)
+            hpat_func = self.jit(test_impl)
+            with self.subTest(method_name=method_name):
+                pd.testing.assert_series_equal(hpat_func(series, 10), test_impl(series, 10))
+
+    @skip_sdc_jit('Series.expanding() unsupported')
+    def test_series_expanding_ddof(self):
+        def test_impl_std(series, ddof):
+            return series.expanding().std(ddof)
+
+        def test_impl_var(series, ddof):
+            return series.expanding().var(ddof)
+
+        series = pd.Series(test_expanding_data[0])
+        for test_impl, ddof in product([test_impl_std, test_impl_var], [0, 1, 2]):
+            with self.subTest(test_impl=test_impl.__name__, ddof=ddof):
+                pd.testing.assert_series_equal(self.jit(test_impl)(series, ddof), test_impl(series, ddof))
+
+    @skip_sdc_jit('Series.expanding() unsupported')
+    def test_series_expanding_exceptions(self):
+        def test_impl(series, min_periods):
+            return series.expanding(min_periods).sum()
+
+        hpat_func = self.jit(test_impl)
+        series = pd.Series(test_expanding_data[0])
+        with self.assertRaises(ValueError) as raises:
+            hpat_func(series, -1)
+        self.assertIn('min_periods must be >= 0', str(raises.exception))
+
+        with self.assertRaises(TypingError) as raises:
+            hpat_func(series, 1.)
+        msg = 'Method expanding(). The object min_periods\n given: float64\n expected: int'
+        self.assertIn(msg, str(raises.exception))
+
+    @skip_sdc_jit('DataFrame.expanding() unsupported')
+    def test_dataframe_expanding(self):
+        df = pd.DataFrame({
+            'A': test_expanding_data[0][:8], 'B': test_expanding_data[1], 'C': test_expanding_data[2][:8]
+        })
+        for method_name in test_expanding_methods:
+            test_impl = gen_expanding_usecase(method_name)
+            hpat_func = self.jit(test_impl)
+            for min_periods in [0, 2]:
+                with self.subTest(method_name=method_name, min_periods=min_periods):
+                    pd.testing.assert_frame_equal(hpat_func(df, min_periods), test_impl(df, min_periods))
+
+
+if __name__ == "__main__":
+    unittest.main()
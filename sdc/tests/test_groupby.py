@@ -33,6 +33,7 @@ import unittest
 from itertools import product
 
 import sdc
+from sdc.datatypes.common_functions import SDCLimitation
 from sdc.tests.test_base import TestCase
 from sdc.tests.test_utils import (count_array_OneDs,
                                   count_array_REPs,
@@ -43,7 +44,7 @@ from sdc.tests.test_utils import (count_array_OneDs,
                                   skip_numba_jit,
                                   skip_sdc_jit,
                                   sdc_limitation)
-from sdc.tests.test_series import gen_frand_array
+from sdc.tests.test_series import gen_frand_array, gen_strlist
 
 
 _pivot_df1 = pd.DataFrame({"A": ["foo", "foo", "foo", "foo", "foo",
@@ -136,6 +137,20 @@ class TestGroupBy(TestCase):
         # TODO: implement index classes, as current indexes do not have names
         pd.testing.assert_frame_equal(result, result_ref, check_names=False)
 
+    def test_dataframe_groupby_count_str_with_none(self):
+        def test_impl(df):
+            return df.groupby('A').count()
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame({
+            'A': [2, 1, 2, 1, 2, 2, 1, 0, 3, 1, 3],
+            'B': ['b', None, 'a', 'a', None, 'b', '', ' ', None, None, 'c'],
+        })
+        result = hpat_func(df)
+        result_ref = test_impl(df)
+        # TODO: implement index classes, as current indexes do not have names
+        pd.testing.assert_frame_equal(result, result_ref, check_names=False)
+
     def test_dataframe_groupby_count_no_unboxing(self):
         def test_impl():
             df = pd.DataFrame({
@@ -293,6 +308,177 @@ class TestGroupBy(TestCase):
         # TODO: implement index classes, as current indexes do not have names
         pd.testing.assert_frame_equal(result, result_ref, check_names=False)
 
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_median_large_groups(self):
+        def test_impl(df):
+            return df.groupby('A').median()
+        hpat_func = self.jit(test_impl)
+
+        n = 10001
+        np.random.seed(0)
+        for m in [1, 5, n // 10]:
+            df = pd.DataFrame({
+                'A': np.random.choice(np.arange(m), n),
+                'B': np.random.randint(-100, 100, n),
+                'C': gen_frand_array(n, nancount=n // 3),
+                'D': np.sort(np.random.ranf(n)),
+            })
+            with self.subTest(n_groups=m):
+                pd.testing.assert_frame_equal(hpat_func(df), test_impl(df), check_names=False)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_quantile(self):
+        def test_impl(df, q):
+            return df.groupby('A').quantile(q)
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        for q in [0.5, 0, 1, 0.3]:
+            with self.subTest(q=q):
+                pd.testing.assert_frame_equal(hpat_func(df, q), test_impl(df, q), check_names=False)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_quantile_list(self):
+        def test_impl(df, q):
+            return df.groupby('A').quantile(q)
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        q = [0.75, 0.1, 0.5]
+        # result has no MultiIndex, its index is the level of group keys
+        result_ref = test_impl(df, q).reset_index(level=-1, drop=True)
+        pd.testing.assert_frame_equal(hpat_func(df, q), result_ref, check_names=False)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_quantile_out_of_range(self):
+        def test_impl(df):
+            return df.groupby('A').quantile(1.5)
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        with self.assertRaises(ValueError) as raises:
+            hpat_func(df)
+        self.assertIn("Parameter q must be in the range [0, 1]", str(raises.exception))
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_first_last(self):
+        n = 1000
+        np.random.seed(0)
+        df = pd.DataFrame({
+            'A': np.random.choice(np.arange(17), n),
+            'B': np.random.randint(-3, 3, n),
+            'C': gen_frand_array(n, nancount=n // 2),
+        })
+        for func_name in ['first', 'last']:
+            func_text = "def test_impl(df):\n  return df.groupby('A').{}()\n".format(func_name)
+            loc_vars = {}
+            exec(func_text, {}, loc_vars)
+            test_impl = loc_vars['test_impl']
+            hpat_func = self.jit(test_impl)
+            with self.subTest(func_name=func_name):
+                pd.testing.assert_frame_equal(hpat_func(df), test_impl(df), check_names=False)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_idxmin_idxmax(self):
+        df = pd.DataFrame({
+            'A': [2, 1, 2, 1, 2, 2, 1, 0, 3, 1, 3],
+            'B': [3, 1, 3, 0, 2, 3, 1, 5, 4, 0, 4],
+            'C': [np.nan, 2., -1.3, np.nan, 3.5, 0, 10, 0.42, -7, -2.5, 23],
+        }, index=np.arange(11)[::-1] * 2)
+        for func_name in ['idxmin', 'idxmax']:
+            func_text = "def test_impl(df):\n  return df.groupby('A').{}()\n".format(func_name)
+            loc_vars = {}
+            exec(func_text, {}, loc_vars)
+            test_impl = loc_vars['test_impl']
+            hpat_func = self.jit(test_impl)
+            with self.subTest(func_name=func_name):
+                pd.testing.assert_frame_equal(hpat_func(df), test_impl(df), check_names=False)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_first_str_unsupported(self):
+        df = pd.DataFrame({'A': [1, 2, 1, 2], 'B': [1., 2., 3., 4.], 'C': ['a', 'b', 'c', 'd']})
+        for func_name in ['first', 'last', 'idxmin', 'idxmax']:
+            func_text = "def test_impl(df):\n  return df.groupby('A').{}()\n".format(func_name)
+            loc_vars = {}
+            exec(func_text, {}, loc_vars)
+            hpat_func = self.jit(loc_vars['test_impl'])
+            with self.subTest(func_name=func_name):
+                with self.assertRaises(SDCLimitation) as raises:
+                    hpat_func(df)
+                msg = "Only numeric columns are supported, given non-numeric columns: ['C']"
+                self.assertIn(msg, str(raises.exception))
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_idxmin_all_nan(self):
+        def test_impl(df):
+            return df.groupby('A').idxmin()
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame({'A': [1, 2, 1, 2], 'B': [np.nan, 1., np.nan, 2.]})
+        with self.assertRaises(ValueError) as raises:
+            hpat_func(df)
+        self.assertIn("Encountered a group with all NA values", str(raises.exception))
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_nunique(self):
+        def test_impl(df, dropna):
+            return df.groupby('A').nunique(dropna)
+        hpat_func = self.jit(test_impl)
+
+        n = 1000
+        np.random.seed(0)
+        df = pd.DataFrame({
+            'A': np.random.choice(np.arange(17), n),
+            'B': np.random.randint(-3, 3, n),
+            'C': np.random.choice([np.nan, -1.5, 0., 2.5, np.inf], n),
+            'D': np.random.choice(['a', 'bb', 'ccc', 'dddd'], n),
+        })
+        for dropna in [True, False]:
+            with self.subTest(dropna=dropna):
+                pd.testing.assert_frame_equal(hpat_func(df, dropna), test_impl(df, dropna), check_names=False)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_size(self):
+        def test_impl(df):
+            return df.groupby('A').size()
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        pd.testing.assert_series_equal(hpat_func(df), test_impl(df), check_names=False)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_size_multiple_keys(self):
+        def test_impl(df):
+            return df.groupby(['A', 'B']).size()
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame({'A': [2, 1, 2, 1, 2, 2, 1], 'B': [0, 1, 0, 0, 1, 0, 1], 'C': np.arange(7.)})
+        # key columns are part of the result, as MultiIndex is not supported
+        result_ref = test_impl(df).reset_index(name='size')
+        pd.testing.assert_frame_equal(hpat_func(df), result_ref)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_nth(self):
+        def test_impl(df, n):
+            return df.groupby('A').nth(n)
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        for n in [0, 1, 3, -1, -2, 10]:
+            with self.subTest(n=n):
+                pd.testing.assert_frame_equal(hpat_func(df, n), test_impl(df, n), check_names=False)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_head(self):
+        def test_impl(df, n):
+            return df.groupby('A').head(n)
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data, index=np.arange(11)[::-1])
+        for n in [0, 1, 2, 5]:
+            with self.subTest(n=n):
+                pd.testing.assert_frame_equal(hpat_func(df, n), test_impl(df, n))
+
     @skip_sdc_jit('Fails with old-pipeline from the start')
     def test_dataframe_groupby_prod(self):
         def test_impl(df):
@@ -413,6 +599,337 @@ class TestGroupBy(TestCase):
         # TODO: implement index classes, as current indexes do not have names
         pd.testing.assert_frame_equal(result_jit, result_ref, check_names=False)
 
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_reductions_many_groups(self):
+        """Verifies groupby reductions when number of groups is comparable with the length of data"""
+        n = 1000
+        np.random.seed(0)
+        for m in [3, n // 4, n]:
+            df = pd.DataFrame({
+                'A': np.random.choice(np.arange(m), n),
+                'B': np.random.randint(-100, 100, n),
+                'C': gen_frand_array(n, nancount=n // 3),
+            })
+            for func_name in ['count', 'max', 'mean', 'min', 'std', 'var']:
+                func_text = "def test_impl(df):\n  return df.groupby('A').{}()\n".format(func_name)
+                loc_vars = {}
+                exec(func_text, {}, loc_vars)
+                test_impl = loc_vars['test_impl']
+                hpat_func = self.jit(test_impl)
+
+                with self.subTest(n_groups=m, func_name=func_name):
+                    result = hpat_func(df)
+                    result_ref = test_impl(df)
+                    # TODO: implement index classes, as current indexes do not have names
+                    pd.testing.assert_frame_equal(result, result_ref, check_names=False)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_by_str_many_groups(self):
+        def test_impl(df, param):
+            return df.groupby('A', sort=param).mean()
+        hpat_func = self.jit(test_impl)
+
+        n = 1000
+        np.random.seed(0)
+        for m in [10, n // 2]:
+            keys = gen_strlist(m, nchars=4)
+            df = pd.DataFrame({
+                'A': np.random.choice(keys, n),
+                'B': gen_frand_array(n, nancount=n // 3),
+            })
+            for param in [True, False]:
+                with self.subTest(n_groups=m, sort=param):
+                    result = hpat_func(df, param)
+                    result_ref = test_impl(df, param)
+                    # TODO: implement index classes, as current indexes do not have names
+                    pd.testing.assert_frame_equal(result, result_ref, check_names=False)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_multiple_keys(self):
+        n = 1000
+        np.random.seed(0)
+        df = pd.DataFrame({
+            'A': np.random.choice(np.arange(7), n),
+            'B': np.random.choice(['a', 'bb', 'ccc'], n),
+            'C': gen_frand_array(n, nancount=n // 3),
+            'D': np.random.randint(-100, 100, n),
+        })
+        for func_name in ['count', 'max', 'mean', 'median', 'min', 'var']:
+            func_text = "def test_impl(df, param):\n" \
+                        "  return df.groupby(['A', 'B'], as_index=False, sort=param).{}()\n".format(func_name)
+            loc_vars = {}
+            exec(func_text, {}, loc_vars)
+            test_impl = loc_vars['test_impl']
+            hpat_func = self.jit(test_impl)
+
+            for param in [True, False]:
+                with self.subTest(func_name=func_name, sort=param):
+                    result = hpat_func(df, param)
+                    result_ref = test_impl(df, param)
+                    pd.testing.assert_frame_equal(result, result_ref)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_multiple_keys_tuple(self):
+        def test_impl(df):
+            return df.groupby(('A', 'C'), as_index=False)['B'].mean()
+
+        def test_impl_ref(df):
+            return df.groupby(['A', 'C'], as_index=False)['B'].mean()
+
+        hpat_func = self.jit(test_impl)
+        df = pd.DataFrame({'A': [2, 1, 1, 1, 2, 2, 1], 'B': [-8, 2, 3, 1, 5, 6, 7],
+                           'C': [3.0, 5.0, np.nan, 5.0, 4.0, 4.0, 3.0]})
+        pd.testing.assert_frame_equal(hpat_func(df), test_impl_ref(df))
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_multiple_keys_as_index(self):
+        def test_impl(df):
+            return df.groupby(['A', 'C']).sum()
+
+        # there is no MultiIndex, so keys are returned as columns just as with as_index=False
+        def test_impl_ref(df):
+            return df.groupby(['A', 'C'], as_index=False).sum()
+
+        hpat_func = self.jit(test_impl)
+        df = pd.DataFrame({'A': [2, 1, 1, 1, 2, 2, 1], 'B': [-8, 2, 3, 1, 5, 6, 7],
+                           'C': [3, 5, 6, 5, 4, 4, 3]})
+        pd.testing.assert_frame_equal(hpat_func(df), test_impl_ref(df))
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_agg_str(self):
+        def test_impl(df):
+            return df.groupby('A').agg('var')
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        result = hpat_func(df)
+        result_ref = test_impl(df)
+        # TODO: implement index classes, as current indexes do not have names
+        pd.testing.assert_frame_equal(result, result_ref, check_names=False)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_agg_dict(self):
+        def test_impl(df):
+            return df.groupby('A').agg({'B': 'sum', 'C': 'max', 'D': 'median', 'E': 'count'})
+        hpat_func = self.jit(test_impl)
+
+        n = 1000
+        np.random.seed(0)
+        for m in [3, n // 4]:
+            df = pd.DataFrame({
+                'A': np.random.choice(np.arange(m), n),
+                'B': gen_frand_array(n, nancount=n // 3),
+                'C': np.random.randint(-100, 100, n),
+                'D': gen_frand_array(n),
+                'E': gen_frand_array(n, nancount=n // 5),
+            })
+            with self.subTest(n_groups=m):
+                result = hpat_func(df)
+                result_ref = test_impl(df)
+                # TODO: implement index classes, as current indexes do not have names
+                pd.testing.assert_frame_equal(result, result_ref, check_names=False)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_agg_multiple_funcs(self):
+        def test_impl_list(df):
+            return df.groupby('A').agg(['min', 'max', 'mean'])
+
+        def test_impl_dict(df):
+            return df.groupby('A').agg({'B': ['sum', 'median'], 'C': 'max'})
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        for test_impl in [test_impl_list, test_impl_dict]:
+            with self.subTest(test_impl=test_impl.__name__):
+                result = self.jit(test_impl)(df)
+                result_ref = test_impl(df)
+                # MultiIndex columns (column, function) are flattened to names 'column_function'
+                result_ref.columns = ['_'.join(column) for column in result_ref.columns]
+                # TODO: implement index classes, as current indexes do not have names
+                pd.testing.assert_frame_equal(result, result_ref, check_names=False)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_cumulative(self):
+        n = 1000
+        np.random.seed(0)
+        for func_name in ['cummax', 'cummin', 'cumprod', 'cumsum']:
+            func_text = "def test_impl(df):\n  return df.groupby('A').{}()\n".format(func_name)
+            loc_vars = {}
+            exec(func_text, {}, loc_vars)
+            test_impl = loc_vars['test_impl']
+            hpat_func = self.jit(test_impl)
+
+            for m in [3, n // 4]:
+                df = pd.DataFrame({
+                    'A': np.random.choice(np.arange(m), n),
+                    'B': np.random.randint(-3, 3, n),
+                    'C': gen_frand_array(n, nancount=n // 3),
+                })
+                with self.subTest(func_name=func_name, n_groups=m):
+                    pd.testing.assert_frame_equal(hpat_func(df), test_impl(df))
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_cumcount(self):
+        def test_impl(df, ascending):
+            return df.groupby('A').cumcount(ascending=ascending)
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        for ascending in [True, False]:
+            with self.subTest(ascending=ascending):
+                pd.testing.assert_series_equal(hpat_func(df, ascending), test_impl(df, ascending))
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_shift(self):
+        def test_impl(df, periods):
+            return df.groupby('A').shift(periods)
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        for periods in [1, 2, -1, 0]:
+            with self.subTest(periods=periods):
+                pd.testing.assert_frame_equal(hpat_func(df, periods), test_impl(df, periods))
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_diff(self):
+        def test_impl(df, periods):
+            return df.groupby('A').diff(periods)
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        for periods in [1, 2, -1]:
+            with self.subTest(periods=periods):
+                pd.testing.assert_frame_equal(hpat_func(df, periods), test_impl(df, periods))
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_rank(self):
+        def test_impl(df, method, ascending, pct):
+            return df.groupby('A').rank(method=method, ascending=ascending, pct=pct)
+        hpat_func = self.jit(test_impl)
+
+        n = 100
+        np.random.seed(0)
+        df = pd.DataFrame({
+            'A': np.random.choice(np.arange(5), n),
+            'B': np.random.randint(-3, 3, n),
+            'C': np.random.randint(-3, 3, n).astype(np.float64),
+        })
+        df.loc[np.random.choice(np.arange(n), n // 10), 'C'] = np.nan
+        for method, ascending, pct in product(['average', 'min', 'max', 'first', 'dense'],
+                                              [True, False], [True, False]):
+            with self.subTest(method=method, ascending=ascending, pct=pct):
+                result = hpat_func(df, method, ascending, pct)
+                result_ref = test_impl(df, method, ascending, pct)
+                pd.testing.assert_frame_equal(result, result_ref)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_rank_descending_extreme_values(self):
+        def test_impl(df, method):
+            return df.groupby('A').rank(method=method, ascending=False)
+        hpat_func = self.jit(test_impl)
+
+        int64_min = np.iinfo(np.int64).min
+        df = pd.DataFrame({
+            'A': [1, 1, 2, 1, 2, 2, 1, 2],
+            'B': np.array([0, 2**63, 5, 2**64 - 1, 2**63, 0, 2**63, 5], dtype=np.uint64),
+            'C': np.array([int64_min, 3, int64_min, 0, -1, int64_min, int64_min, 7], dtype=np.int64),
+        })
+        for method in ['average', 'min', 'max', 'first', 'dense']:
+            with self.subTest(method=method):
+                pd.testing.assert_frame_equal(hpat_func(df, method), test_impl(df, method))
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_transform(self):
+        n = 1000
+        np.random.seed(0)
+        df = pd.DataFrame({
+            'A': np.random.choice(np.arange(20), n),
+            'B': np.random.randint(-100, 100, n),
+            'C': gen_frand_array(n, nancount=n // 3),
+        })
+        for func_name in ['count', 'max', 'mean', 'min', 'std', 'sum', 'var']:
+            func_text = "def test_impl(df):\n  return df.groupby('A').transform('{}')\n".format(func_name)
+            loc_vars = {}
+            exec(func_text, {}, loc_vars)
+            test_impl = loc_vars['test_impl']
+            hpat_func = self.jit(test_impl)
+
+            with self.subTest(func_name=func_name):
+                pd.testing.assert_frame_equal(hpat_func(df), test_impl(df))
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_transform_unsupported(self):
+        def test_impl(df):
+            return df.groupby('A').transform('median')
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        with self.assertRaises(SDCLimitation) as raises:
+            hpat_func(df)
+        self.assertIn("Unsupported function: median", str(raises.exception))
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_rolling(self):
+        n = 1000
+        np.random.seed(0)
+        df = pd.DataFrame({
+            'A': np.random.choice(np.arange(7), n),
+            'B': np.random.randint(-3, 3, n),
+            'C': gen_frand_array(n, nancount=n // 3),
+        })
+        for func_name in ['count', 'kurt', 'max', 'mean', 'min', 'skew', 'std', 'sum', 'var']:
+            func_text = "def test_impl(df, window, min_periods):\n"
+            func_text += "  return df.groupby('A').rolling(window, min_periods).{}()\n".format(func_name)
+            loc_vars = {}
+            exec(func_text, {}, loc_vars)
+            hpat_func = self.jit(loc_vars['test_impl'])
+
+            # result is aligned with rows of df, reference is computed by rolling each group
+            def ref_impl(df, window, min_periods):
+                grouped = df.groupby('A')[['B', 'C']]
+                return grouped.transform(lambda S: getattr(S.rolling(window, min_periods), func_name)())
+
+            for window, min_periods in [(1, None), (3, None), (5, 2), (n, 1)]:
+                with self.subTest(func_name=func_name, window=window, min_periods=min_periods):
+                    pd.testing.assert_frame_equal(hpat_func(df, window, min_periods),
+                                                  ref_impl(df, window, min_periods),
+                                                  check_dtype=False)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_rolling_var_large_values(self):
+        def test_impl_var(df, window):
+            return df.groupby('A').rolling(window, 2).var()
+
+        def test_impl_std(df, window):
+            return df.groupby('A').rolling(window, 2).std()
+
+        n = 1000
+        np.random.seed(0)
+        df = pd.DataFrame({
+            'A': np.random.choice(np.arange(7), n),
+            'C': np.random.ranf(n),
+        })
+        df.loc[np.random.ranf(n) < 0.2, 'C'] = np.nan
+        # var/std don't depend on the shift of values, reference is computed on values close to zero
+        shifted_df = df.assign(C=df['C'] + 1e8)
+        for test_impl, func_name in [(test_impl_var, 'var'), (test_impl_std, 'std')]:
+            hpat_func = self.jit(test_impl)
+            for window in [5, 20]:
+                result_ref = df.groupby('A')[['C']].transform(lambda S: getattr(S.rolling(window, 2), func_name)())
+                with self.subTest(func_name=func_name, window=window):
+                    pd.testing.assert_frame_equal(hpat_func(shifted_df, window), result_ref)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_dataframe_groupby_expanding(self):
+        def test_impl(df):
+            return df.groupby('A').expanding().sum()
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        # result is aligned with rows of df and has all non-key columns
+        value_columns = [column for column in df.columns if column != 'A']
+        result_ref = df.groupby('A')[value_columns].transform(lambda S: S.expanding().sum())
+        pd.testing.assert_frame_equal(hpat_func(df), result_ref, check_dtype=False)
+
     @skip_sdc_jit
     @skip_numba_jit
     def test_agg_seq(self):
@@ -894,6 +1411,135 @@ class TestGroupBy(TestCase):
                 result_ref = test_impl(S, by_arr)
                 pd.testing.assert_series_equal(result, result_ref)
 
+    def test_series_groupby_by_array_many_groups(self):
+        def test_impl(A, data, sort):
+            return A.groupby(data, sort=sort).mean()
+        hpat_func = self.jit(test_impl)
+
+        n = 1000
+        np.random.seed(0)
+        S = pd.Series(gen_frand_array(n, nancount=n // 10))
+        for m, sort in product([5, n // 2], [True, False]):
+            by_arr = np.random.choice(np.arange(m), n).astype(np.float64)
+            by_arr[np.random.choice(np.arange(n), n // 10)] = np.nan
+            with self.subTest(n_groups=m, sort=sort):
+                result = hpat_func(S, by_arr, sort)
+                result_ref = test_impl(S, by_arr, sort)
+                pd.testing.assert_series_equal(result, result_ref)
+
+    def test_series_groupby_by_int_dense_range(self):
+        """Verifies groupby by integer keys with both small (grouped by direct indexing)
+        and large range of values (grouped with hash tables)"""
+        def test_impl(A, data, sort):
+            return A.groupby(data, sort=sort).sum()
+        hpat_func = self.jit(test_impl)
+
+        n = 10000
+        np.random.seed(0)
+        S = pd.Series(gen_frand_array(n, nancount=n // 10))
+        for (min_value, max_value), dtype, sort in product([(-7, 7), (-10 ** 6, 10 ** 6)],
+                                                           [np.int64, np.int32], [True, False]):
+            by_arr = np.random.randint(min_value, max_value, n, dtype=np.int64).astype(dtype)
+            with self.subTest(range=(min_value, max_value), dtype=dtype, sort=sort):
+                result = hpat_func(S, by_arr, sort)
+                result_ref = test_impl(S, by_arr, sort)
+                pd.testing.assert_series_equal(result, result_ref)
+
+    def test_series_groupby_by_int_overflowing_range(self):
+        """Verifies that integer keys with range too wide for counters of all chunks
+        (the size of counters overflows int64) are grouped with hash tables"""
+        def test_impl(A, data):
+            return A.groupby(data).sum()
+        hpat_func = self.jit(test_impl)
+
+        n = 1000
+        S = pd.Series(np.arange(n, dtype=np.float64))
+        by_arr = np.where(np.arange(n) % 3 == 0, 2 ** 62, 0).astype(np.int64)
+        pd.testing.assert_series_equal(hpat_func(S, by_arr), test_impl(S, by_arr))
+
+    def test_series_groupby_transformations(self):
+        n = 1000
+        np.random.seed(0)
+        S = pd.Series(gen_frand_array(n, nancount=n // 10), index=np.arange(n)[::-1], name='A')
+        by_arr = np.random.choice(np.arange(7), n)
+        test_impls = {
+            'cumsum': lambda S, by: S.groupby(by).cumsum(),
+            'cummax': lambda S, by: S.groupby(by).cummax(),
+            'cumcount': lambda S, by: S.groupby(by).cumcount(),
+            'shift': lambda S, by: S.groupby(by).shift(-2),
+            'diff': lambda S, by: S.groupby(by).diff(),
+            'rank': lambda S, by: S.groupby(by).rank(method='min'),
+            'transform': lambda S, by: S.groupby(by).transform('mean'),
+        }
+        for func_name, test_impl in test_impls.items():
+            hpat_func = self.jit(test_impl)
+            with self.subTest(func_name=func_name):
+                pd.testing.assert_series_equal(hpat_func(S, by_arr), test_impl(S, by_arr))
+
+    def test_series_groupby_quantile(self):
+        def test_impl(S, by, q):
+            return S.groupby(by).quantile(q)
+        hpat_func = self.jit(test_impl)
+
+        n = 1000
+        np.random.seed(0)
+        S = pd.Series(gen_frand_array(n, nancount=n // 10), name='A')
+        by_arr = np.random.choice(np.arange(7), n)
+        with self.subTest(q=0.25):
+            pd.testing.assert_series_equal(hpat_func(S, by_arr, 0.25), test_impl(S, by_arr, 0.25))
+
+        q = np.array([0.9, 0.25])
+        result_ref = test_impl(S, by_arr, q).reset_index(level=-1, drop=True)
+        with self.subTest(q=q):
+            pd.testing.assert_series_equal(hpat_func(S, by_arr, q), result_ref)
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_series_groupby_selections(self):
+        n = 1000
+        np.random.seed(0)
+        S = pd.Series(gen_frand_array(n, nancount=n // 10), index=np.arange(n)[::-1], name='A')
+        by_arr = np.random.choice(np.arange(7), n)
+        test_impls = {
+            'first': lambda S, by: S.groupby(by).first(),
+            'last': lambda S, by: S.groupby(by).last(),
+            'idxmin': lambda S, by: S.groupby(by).idxmin(),
+            'idxmax': lambda S, by: S.groupby(by).idxmax(),
+            'nunique': lambda S, by: S.groupby(by).nunique(),
+            'size': lambda S, by: S.groupby(by).size(),
+            'nth': lambda S, by: S.groupby(by).nth(-3),
+            'head': lambda S, by: S.groupby(by).head(3),
+        }
+        for func_name, test_impl in test_impls.items():
+            hpat_func = self.jit(test_impl)
+            with self.subTest(func_name=func_name):
+                pd.testing.assert_series_equal(hpat_func(S, by_arr), test_impl(S, by_arr))
+
+    @skip_sdc_jit('Fails with old-pipeline from the start')
+    def test_series_groupby_rolling(self):
+        def test_impl(S, by):
+            return S.groupby(by).rolling(5, 2).mean()
+        hpat_func = self.jit(test_impl)
+
+        n = 1000
+        np.random.seed(0)
+        S = pd.Series(gen_frand_array(n, nancount=n // 10), index=np.arange(n)[::-1], name='A')
+        by_arr = np.random.choice(np.arange(7), n)
+        result_ref = S.groupby(by_arr).transform(lambda x: x.rolling(5, 2).mean())
+        pd.testing.assert_series_equal(hpat_func(S, by_arr), result_ref)
+
+    def test_series_groupby_agg(self):
+        def test_impl(A, data):
+            return A.groupby(data).agg(['sum', 'mean', 'median', 'std'])
+        hpat_func = self.jit(test_impl)
+
+        n = 1000
+        np.random.seed(0)
+        S = pd.Series(gen_frand_array(n, nancount=n // 10))
+        by_arr = np.random.choice(np.arange(7), n)
+        result = hpat_func(S, by_arr)
+        result_ref = test_impl(S, by_arr)
+        pd.testing.assert_frame_equal(result, result_ref)
+
     @unittest.skip("getiter for this type is not implemented yet")
     def test_series_groupby_iterator_int(self):
         def test_impl():
@@ -25,6 +25,7 @@
 # *****************************************************************************
 
 import itertools
+import math
 import os
 import platform
 import string
@@ -36,6 +37,7 @@ import numpy as np
 import pandas as pd
 
 from numba.core.errors import TypingError
+from sdc.datatypes.common_functions import SDCLimitation
 from sdc.hiframes.rolling import supported_rolling_funcs
 from sdc.tests.test_base import TestCase
 from sdc.tests.test_series import gen_frand_array
@@ -448,16 +450,6 @@ class TestRolling(TestCase):
 
         msg_tmpl = 'Method rolling(). The object {}\n expected: {}'
 
-        with self.assertRaises(ValueError) as raises:
-            hpat_func(obj, 1, None, True, None, None, 0, None)
-        msg = msg_tmpl.format('center', 'False')
-        self.assertIn(msg, str(raises.exception))
-
-        with self.assertRaises(ValueError) as raises:
-            hpat_func(obj, 1, None, False, 'None', None, 0, None)
-        msg = msg_tmpl.format('win_type', 'None')
-        self.assertIn(msg, str(raises.exception))
-
         with self.assertRaises(ValueError) as raises:
             hpat_func(obj, 1, None, False, None, 'None', 0, None)
         msg = msg_tmpl.format('on', 'None')
@@ -502,6 +494,11 @@ class TestRolling(TestCase):
         msg = msg_tmpl.format('win_type', 'int64', 'str')
         self.assertIn(msg, str(raises.exception))
 
+        with self.assertRaises(TypingError) as raises:
+            hpat_func(obj, 1, None, False, 'None', None, 0, None)
+        msg = msg_tmpl.format('win_type', 'Literal[str](None)', "'triang', 'gaussian', 'hann'")
+        self.assertIn(msg, str(raises.exception))
+
         with self.assertRaises(TypingError) as raises:
             hpat_func(obj, 1, None, False, None, -1, 0, None)
         msg = msg_tmpl.format('on', 'int64', 'str')
@@ -1015,6 +1012,27 @@ class TestRolling(TestCase):
 
         self._test_rolling_corr_with_no_other(df)
 
+    @skip_sdc_jit('DataFrame.rolling.corr() unsupported')
+    def test_df_rolling_corr_pairwise(self):
+        def test_impl(df, window, min_periods, pairwise):
+            return df.rolling(window, min_periods).corr(pairwise=pairwise)
+
+        hpat_func = self.jit(test_impl)
+        df = pd.DataFrame({
+            'A': [0, 1, 2, 3, 4, 5, 6, 7],
+            'B': [1., -1., 0., 0.1, -0.1, 1., -1., 0.5],
+            'C': [1., np.inf, np.inf, -1., 0., np.inf, np.NINF, 2.],
+            'D': [np.nan, 1., 2., np.nan, 3., 4., 0., -1.],
+        })
+        for window in range(0, 8, 2):
+            for min_periods, pairwise in product(range(0, window, 2), [None, True]):
+                with self.subTest(window=window, min_periods=min_periods, pairwise=pairwise):
+                    jit_result = hpat_func(df, window, min_periods, pairwise)
+                    ref_result = test_impl(df, window, min_periods, pairwise)
+                    # long-format result with default index instead of MultiIndex
+                    ref_result = pd.DataFrame(ref_result.values, columns=ref_result.columns)
+                    pd.testing.assert_frame_equal(jit_result, ref_result)
+
     @skip_sdc_jit('DataFrame.rolling.corr() unsupported exceptions')
     def test_df_rolling_corr_unsupported_types(self):
         all_data = [[1., -1., 0., 0.1, -0.1], [-1., 1., 0., -0.1, 0.1]]
@@ -1034,11 +1052,6 @@ class TestRolling(TestCase):
 
         df = pd.DataFrame({'A': [1., -1., 0., 0.1, -0.1],
                            'B': [-1., 1., 0., -0.1, 0.1]})
-        for pairwise in [None, True]:
-            with self.assertRaises(ValueError) as raises:
-                hpat_func(df, None, pairwise)
-            self.assertIn(msg_tmpl.format('False'), str(raises.exception))
-
         other = pd.DataFrame({'A': [-1., 1., 0., -0.1, 0.1],
                               'C': [1., -1., 0., 0.1, -0.1]})
         with self.assertRaises(ValueError) as raises:
@@ -1133,6 +1146,27 @@ class TestRolling(TestCase):
 
         self._test_rolling_cov_with_no_other(df)
 
+    @skip_sdc_jit('DataFrame.rolling.cov() unsupported')
+    def test_df_rolling_cov_pairwise(self):
+        def test_impl(df, window, min_periods, ddof):
+            return df.rolling(window, min_periods).cov(ddof=ddof)
+
+        hpat_func = self.jit(test_impl)
+        df = pd.DataFrame({
+            'A': [0, 1, 2, 3, 4, 5, 6, 7],
+            'B': [1., -1., 0., 0.1, -0.1, 1., -1., 0.5],
+            'C': [1., np.inf, np.inf, -1., 0., np.inf, np.NINF, 2.],
+            'D': [np.nan, 1., 2., np.nan, 3., 4., 0., -1.],
+        })
+        for window in range(0, 8, 2):
+            for min_periods, ddof in product(range(0, window, 2), [0, 1]):
+                with self.subTest(window=window, min_periods=min_periods, ddof=ddof):
+                    jit_result = hpat_func(df, window, min_periods, ddof)
+                    ref_result = test_impl(df, window, min_periods, ddof)
+                    # long-format result with default index instead of MultiIndex
+                    ref_result = pd.DataFrame(ref_result.values, columns=ref_result.columns)
+                    pd.testing.assert_frame_equal(jit_result, ref_result)
+
     @skip_sdc_jit('DataFrame.rolling.cov() unsupported exceptions')
     def test_df_rolling_cov_unsupported_types(self):
         all_data = [[1., -1., 0., 0.1, -0.1], [-1., 1., 0., -0.1, 0.1]]
@@ -1152,11 +1186,6 @@ class TestRolling(TestCase):
 
         df = pd.DataFrame({'A': [1., -1., 0., 0.1, -0.1],
                            'B': [-1., 1., 0., -0.1, 0.1]})
-        for pairwise in [None, True]:
-            with self.assertRaises(ValueError) as raises:
-                hpat_func(df, None, pairwise)
-            self.assertIn(msg_tmpl.format('False'), str(raises.exception))
-
         other = pd.DataFrame({'A': [-1., 1., 0., -0.1, 0.1],
                               'C': [1., -1., 0., 0.1, -0.1]})
         with self.assertRaises(ValueError) as raises:
@@ -1333,6 +1362,18 @@ class TestRolling(TestCase):
                     ref_result = test_impl(window, min_periods)
                     pd.testing.assert_frame_equal(jit_result, ref_result)
 
+    @skip_sdc_jit('DataFrame.rolling.min() unsupported')
+    def test_df_rolling_min_max_monotonic(self):
+        df = pd.DataFrame({
+            'A': np.arange(20, dtype=np.float64),
+            'B': np.arange(20, 0, -1, dtype=np.float64),
+            'C': np.repeat([1., 3., np.nan, 2., 2.], 4),
+            'D': np.tile([0., 1., 1., 1., np.inf], 4),
+        })
+
+        self._test_rolling_min(df)
+        self._test_rolling_max(df)
+
     @unittest.expectedFailure
     @unittest.skipIf(platform.system() == 'Darwin', 'Segmentation fault on Mac')
     @skip_sdc_jit('DataFrame.rolling.min() unsupported')
@@ -1350,6 +1391,77 @@ class TestRolling(TestCase):
 
         pd.testing.assert_frame_equal(hpat_func(df), test_impl(df))
 
+    @skip_sdc_jit('DataFrame.rolling() unsupported offset window')
+    def test_df_rolling_offset_window(self):
+        def test_impl(index, window):
+            df = pd.DataFrame({
+                'A': [0., 1., np.nan, -2., 4., 4., 1.5, np.nan],
+                'B': [1., -1., 0., 0.1, -0.1, 3., 2., 3.],
+            }, index=index)
+            return df.rolling(window).mean()
+
+        hpat_func = self.jit(test_impl)
+        index = np.array([0, 1, 1, 2, 5, 6, 6, 9], dtype='datetime64[s]').astype('datetime64[ns]')
+        for window in ['1s', '2s', '5s']:
+            with self.subTest(window=window):
+                pd.testing.assert_frame_equal(hpat_func(index, window), test_impl(index, window))
+
+    @skip_sdc_jit('DataFrame.rolling() unsupported center')
+    def test_df_rolling_center(self):
+        def test_impl(df, window, min_periods):
+            return df.rolling(window, min_periods, center=True).median()
+
+        hpat_func = self.jit(test_impl)
+        df = pd.DataFrame({
+            'A': [0., 1., np.nan, -2., 4., 4., 1.5, np.nan],
+            'B': [1., -1., 0., 0.1, -0.1, 3., 2., 3.],
+        })
+        for window, min_periods in product([1, 2, 5], [None, 1]):
+            with self.subTest(window=window, min_periods=min_periods):
+                pd.testing.assert_frame_equal(hpat_func(df, window, min_periods),
+                                              test_impl(df, window, min_periods))
+
+    @skip_sdc_jit('DataFrame.rolling() unsupported fused kernel')
+    def test_df_rolling_many_columns(self):
+        method_names = ['count', 'kurt', 'max', 'mean', 'median', 'min', 'skew', 'std', 'sum', 'var']
+        np.random.seed(0)
+        data = {}
+        for i in range(40):
+            if i % 3 == 0:
+                data[f'A{i}'] = np.random.randint(-10, 10, 50)
+            else:
+                data[f'A{i}'] = np.random.ranf(50)
+                data[f'A{i}'][np.random.ranf(50) < 0.1] = np.nan
+        df = pd.DataFrame(data)
+
+        for method_name in method_names:
+            func_text = 'def test_impl(df, window, min_periods, center):\n'
+            func_text += f'  return df.rolling(window, min_periods, center).{method_name}()\n'
+            loc_vars = {}
+            exec(func_text, {}, loc_vars)
+            test_impl = loc_vars['test_impl']
+            hpat_func = self.jit(test_impl)
+
+            for window, center in product([1, 4], [False, True]):
+                with self.subTest(method_name=method_name, window=window, center=center):
+                    jit_result = hpat_func(df, window, 1, center)
+                    ref_result = test_impl(df, window, 1, center)
+                    pd.testing.assert_frame_equal(jit_result, ref_result)
+
+    @skip_sdc_jit('DataFrame.rolling() unsupported win_type')
+    def test_df_rolling_win_type(self):
+        def test_impl(df, window, std):
+            return df.rolling(window, center=True, win_type='gaussian').mean(std=std)
+
+        hpat_func = self.jit(test_impl)
+        df = pd.DataFrame({
+            'A': [0., 1., np.nan, -2., 4., 4., 1.5, np.nan],
+            'B': [1., -1., 0., 0.1, -0.1, 3., 2., 3.],
+        })
+        for window, std in product([1, 2, 5], [0.5, 2.]):
+            with self.subTest(window=window, std=std):
+                pd.testing.assert_frame_equal(hpat_func(df, window, std), test_impl(df, window, std))
+
     @skip_sdc_jit('DataFrame.rolling.quantile() unsupported')
     def test_df_rolling_quantile(self):
         all_data = [
@@ -1580,6 +1692,65 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_apply_args(series)
 
+    @skip_sdc_jit('Series.rolling.apply() unsupported')
+    def test_series_rolling_apply_raw_false(self):
+        def test_impl(series, window, min_periods):
+            def func(x):
+                return x.index[-1] + x.sum()
+
+            return series.rolling(window, min_periods).apply(func, raw=False)
+
+        hpat_func = self.jit(test_impl)
+
+        series = pd.Series([1., np.inf, np.nan, -1., 0., 4., np.NINF, 2.], index=np.arange(8)[::-1], name='A')
+        for window in range(1, len(series) + 2, 2):
+            for min_periods in range(1, window + 1, 2):
+                with self.subTest(window=window, min_periods=min_periods):
+                    jit_result = hpat_func(series, window, min_periods)
+                    ref_result = test_impl(series, window, min_periods)
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
+    @skip_sdc_jit('Series.rolling.apply() unsupported')
+    def test_series_rolling_apply_engine_kwargs(self):
+        def test_impl(series, window, min_periods):
+            def func(x):
+                if len(x) == 0:
+                    return np.nan
+                return x.mean()
+
+            return series.rolling(window, min_periods).apply(func, raw=True)
+
+        def jit_impl(series, window, min_periods, parallel):
+            def func(x):
+                if len(x) == 0:
+                    return np.nan
+                return x.mean()
+
+            return series.rolling(window, min_periods).apply(func, raw=True,
+                                                               engine_kwargs={'parallel': parallel})
+
+        hpat_func = self.jit(jit_impl)
+
+        series = pd.Series(np.arange(100.), name='A')
+        series[::7] = np.nan
+        for window, parallel in product([0, 1, 10, 200], [False, True]):
+            with self.subTest(window=window, parallel=parallel):
+                jit_result = hpat_func(series, window, 0, parallel)
+                ref_result = test_impl(series, window, 0)
+                pd.testing.assert_series_equal(jit_result, ref_result)
+
+    @skip_sdc_jit('Series.rolling.apply() unsupported exceptions')
+    def test_series_rolling_apply_engine_kwargs_unsupported_types(self):
+        def test_impl(series, engine_kwargs):
+            return series.rolling(3).apply(lambda x: x.sum(), engine_kwargs=engine_kwargs)
+
+        hpat_func = self.jit(test_impl)
+
+        with self.assertRaises(TypingError) as raises:
+            hpat_func(pd.Series([1., -1., 0., 0.1, -0.1]), 1)
+        msg = 'Method rolling.apply(). The object engine_kwargs\n given: int64\n expected: dict'
+        self.assertIn(msg, str(raises.exception))
+
     @skip_sdc_jit('Series.rolling.corr() unsupported Series index')
     def test_series_rolling_corr(self):
         all_data = [
@@ -1765,6 +1936,39 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_quantile(series)
 
+    @skip_sdc_jit('Series.rolling.quantile() unsupported Series index')
+    def test_series_rolling_quantile_large_window(self):
+        def test_impl(series, window, min_periods, quantile):
+            return series.rolling(window, min_periods).quantile(quantile)
+
+        hpat_func = self.jit(test_impl)
+
+        np.random.seed(0)
+        data = np.random.randint(-10, 10, 1000).astype(np.float64)
+        data[np.random.ranf(1000) < 0.1] = np.nan
+        series = pd.Series(data, name='A')
+        for window, quantile in product([1, 2, 101, 500, 1000, 1001], [0, 0.3, 0.5, 1]):
+            with self.subTest(window=window, quantile=quantile):
+                jit_result = hpat_func(series, window, 1, quantile)
+                ref_result = test_impl(series, window, 1, quantile)
+                pd.testing.assert_series_equal(jit_result, ref_result)
+
+    @skip_sdc_jit('Series.rolling.quantile() unsupported Series index')
+    def test_series_rolling_quantile_keeps_random_state(self):
+        """Verifies that rolling quantile does not advance random stream of the user"""
+        def test_impl(series):
+            np.random.seed(0)
+            series.rolling(100).quantile(0.3)
+            return np.random.random()
+
+        def test_impl_ref():
+            np.random.seed(0)
+            return np.random.random()
+
+        np.random.seed(0)
+        series = pd.Series(np.random.ranf(1000))
+        self.assertEqual(self.jit(test_impl)(series), self.jit(test_impl_ref)())
+
     @skip_sdc_jit('Series.rolling.quantile() unsupported exceptions')
     def test_series_rolling_quantile_exception_unsupported_types(self):
         series = pd.Series([1., -1., 0., 0.1, -0.1])
@@ -1775,6 +1979,202 @@ class TestRolling(TestCase):
         series = pd.Series([1., -1., 0., 0.1, -0.1])
         self._test_rolling_quantile_exception_unsupported_values(series)
 
+    @skip_sdc_jit('Series.rolling() unsupported offset window')
+    def test_series_rolling_offset_window(self):
+        method_names = ['count', 'kurt', 'max', 'mean', 'median', 'min', 'skew', 'std', 'sum', 'var']
+        data = [0., 1., np.nan, -2., 4., 4., 1.5, np.nan, 3., -1., 2., 7.]
+        seconds = [0, 1, 1, 2, 5, 6, 6, 6, 9, 12, 13, 14]
+        index = np.array(seconds, dtype='datetime64[s]').astype('datetime64[ns]')
+        for method_name in method_names:
+            func_text = 'def test_impl(data, index, window, min_periods):\n'
+            func_text += '  series = pd.Series(data, index, name="A")\n'
+            func_text += f'  return series.rolling(window, min_periods).{method_name}()\n'
+            loc_vars = {}
+            exec(func_text, {'pd': pd}, loc_vars)
+            test_impl = loc_vars['test_impl']
+            hpat_func = self.jit(test_impl)
+
+            for window, min_periods in product(['1s', '2s', '3500ms', '1min'], [None, 0, 2]):
+                with self.subTest(method_name=method_name, window=window, min_periods=min_periods):
+                    jit_result = hpat_func(data, index, window, min_periods)
+                    ref_result = test_impl(data, index, window, min_periods)
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
+    @skip_sdc_jit('Series.rolling() unsupported offset window')
+    def test_series_rolling_offset_window_quantile(self):
+        def test_impl(data, index, quantile):
+            series = pd.Series(data, index)
+            return series.rolling('4s').quantile(quantile)
+
+        hpat_func = self.jit(test_impl)
+
+        np.random.seed(0)
+        data = np.random.randint(-10, 10, 200).astype(np.float64)
+        data[np.random.ranf(200) < 0.1] = np.nan
+        index = np.cumsum(np.random.randint(0, 3, 200)).astype('datetime64[s]').astype('datetime64[ns]')
+        for quantile in [0, 0.25, 0.5, 1]:
+            with self.subTest(quantile=quantile):
+                pd.testing.assert_series_equal(hpat_func(data, index, quantile), test_impl(data, index, quantile))
+
+    @skip_sdc_jit('Series.rolling() unsupported offset window')
+    def test_series_rolling_offset_window_exceptions(self):
+        def test_impl(data, index, window):
+            series = pd.Series(data, index)
+            return series.rolling(window).sum()
+
+        hpat_func = self.jit(test_impl)
+        data = np.arange(4.)
+
+        with self.assertRaises(TypingError) as raises:
+            hpat_func(data, np.arange(4), '2s')
+        self.assertIn('Method rolling(). The object window', str(raises.exception))
+        self.assertIn('expected: int', str(raises.exception))
+
+        index = np.array([0, 2, 1, 3], dtype='datetime64[s]').astype('datetime64[ns]')
+        with self.assertRaises(ValueError) as raises:
+            hpat_func(data, index, '2s')
+        self.assertIn('index must be monotonic', str(raises.exception))
+
+    @skip_sdc_jit('Series.rolling() unsupported center')
+    def test_series_rolling_center(self):
+        method_names = ['count', 'kurt', 'max', 'mean', 'median', 'min', 'skew', 'std', 'sum', 'var']
+        data = [0., 1., np.nan, -2., 4., 4., 1.5, np.nan, 3., -1., 2., 7., np.inf, 5.]
+        for method_name in method_names:
+            func_text = 'def test_impl(data, window, min_periods):\n'
+            func_text += '  series = pd.Series(data, name="A")\n'
+            func_text += f'  return series.rolling(window, min_periods, center=True).{method_name}()\n'
+            loc_vars = {}
+            exec(func_text, {'pd': pd}, loc_vars)
+            test_impl = loc_vars['test_impl']
+            hpat_func = self.jit(test_impl)
+
+            for window, min_periods in product([0, 1, 2, 3, 6, 20], [None, 0, 2]):
+                if min_periods is not None and min_periods > window:
+                    continue
+                with self.subTest(method_name=method_name, window=window, min_periods=min_periods):
+                    jit_result = hpat_func(data, window, min_periods)
+                    ref_result = test_impl(data, window, min_periods)
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
+    @skip_sdc_jit('Series.rolling() unsupported center')
+    def test_series_rolling_center_quantile(self):
+        def test_impl(data, window, quantile):
+            series = pd.Series(data)
+            return series.rolling(window, center=True).quantile(quantile)
+
+        hpat_func = self.jit(test_impl)
+
+        np.random.seed(0)
+        data = np.random.randint(-10, 10, 200).astype(np.float64)
+        data[np.random.ranf(200) < 0.1] = np.nan
+        for window, quantile in product([4, 7], [0, 0.25, 0.5, 1]):
+            with self.subTest(window=window, quantile=quantile):
+                jit_result = hpat_func(data, window, quantile)
+                ref_result = test_impl(data, window, quantile)
+                pd.testing.assert_series_equal(jit_result, ref_result)
+
+    @skip_sdc_jit('Series.rolling() unsupported center')
+    def test_series_rolling_center_exceptions(self):
+        def test_impl(data, index, window):
+            series = pd.Series(data, index)
+            return series.rolling(window, center=True).sum()
+
+        def test_impl_apply(data, window):
+            return pd.Series(data).rolling(window, center=True).apply(lambda x: x.sum())
+
+        data = np.arange(4.)
+        index = np.arange(4).astype('datetime64[s]').astype('datetime64[ns]')
+        with self.assertRaises(ValueError) as raises:
+            self.jit(test_impl)(data, index, '2s')
+        self.assertIn('center is not implemented for datetimelike and offset based windows', str(raises.exception))
+
+        with self.assertRaises(ValueError) as raises:
+            self.jit(test_impl_apply)(data, 2)
+        self.assertIn('Method rolling.apply(). The object center\n expected: False', str(raises.exception))
+
+    @skip_sdc_jit('Series.rolling() unsupported win_type')
+    def test_series_rolling_win_type(self):
+        def test_impl(data, window, min_periods, center, win_type):
+            series = pd.Series(data, name='A')
+            rolling = series.rolling(window, min_periods, center, win_type)
+            return rolling.sum(), rolling.mean()
+
+        hpat_func = self.jit(test_impl)
+
+        data = [0., 1., np.nan, -2., 4., 4., 1.5, np.nan, 3., -1., 2., 7., np.inf, 5.]
+        for win_type, window, min_periods, center in product(['triang', 'hann'], [1, 2, 5, 20],
+                                                             [None, 1], [False, True]):
+            with self.subTest(win_type=win_type, window=window, min_periods=min_periods, center=center):
+                jit_results = hpat_func(data, window, min_periods, center, win_type)
+                ref_results = test_impl(data, window, min_periods, center, win_type)
+                for jit_result, ref_result in zip(jit_results, ref_results):
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
+    @skip_sdc_jit('Series.rolling() unsupported win_type')
+    def test_series_rolling_win_type_gaussian(self):
+        def test_impl(data, window, center, std):
+            series = pd.Series(data)
+            rolling = series.rolling(window, center=center, win_type='gaussian')
+            return rolling.sum(std=std), rolling.mean(std=std)
+
+        hpat_func = self.jit(test_impl)
+
+        np.random.seed(0)
+        data = np.random.ranf(100)
+        data[np.random.ranf(100) < 0.1] = np.nan
+        for window, center, std in product([3, 10], [False, True], [0.5, 3.]):
+            with self.subTest(window=window, center=center, std=std):
+                jit_results = hpat_func(data, window, center, std)
+                ref_results = test_impl(data, window, center, std)
+                for jit_result, ref_result in zip(jit_results, ref_results):
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
+    @skip_sdc_jit('Series.rolling() unsupported win_type')
+    def test_series_rolling_win_type_exceptions(self):
+        def test_impl_max(data):
+            return pd.Series(data).rolling(3, win_type='triang').max()
+
+        def test_impl_gaussian(data):
+            return pd.Series(data).rolling(3, win_type='gaussian').mean()
+
+        def test_impl_window(data):
+            return pd.Series(data).rolling(0, win_type='hann').mean()
+
+        data = np.arange(4.)
+        with self.assertRaises(SDCLimitation) as raises:
+            self.jit(test_impl_max)(data)
+        self.assertIn("Method rolling.max(). Unsupported parameter. Given 'win_type' is not None",
+                      str(raises.exception))
+
+        with self.assertRaises(TypingError) as raises:
+            self.jit(test_impl_gaussian)(data)
+        self.assertIn('Method rolling.mean(). The object std', str(raises.exception))
+        self.assertIn('expected: float', str(raises.exception))
+
+        with self.assertRaises(ValueError) as raises:
+            self.jit(test_impl_window)(data)
+        self.assertIn('window must be > 0', str(raises.exception))
+
+    @skip_sdc_jit('Series.rolling() unsupported compensated sums')
+    def test_series_rolling_outlier(self):
+        def test_impl(series, window):
+            rolling = series.rolling(window)
+            return rolling.sum(), rolling.var()
+
+        hpat_func = self.jit(test_impl)
+
+        np.random.seed(0)
+        data = 1e6 + np.random.ranf(1000)
+        data[100] = 1e15
+        window = 10
+        jit_sum, jit_var = hpat_func(pd.Series(data), window)
+
+        windows = [data[i - window + 1:i + 1] for i in range(window - 1, len(data))]
+        ref_sum = [math.fsum(w) for w in windows]
+        ref_var = [w.var(ddof=1) for w in windows]
+        np.testing.assert_allclose(jit_sum.values[window - 1:], ref_sum, rtol=1e-12)
+        np.testing.assert_allclose(jit_var.values[window - 1:], ref_var, rtol=1e-9)
+
     @skip_sdc_jit('Series.rolling.skew() unsupported Series index')
     def test_series_rolling_skew(self):
         all_data = test_global_input_data_float64
@@ -33,6 +33,7 @@ import unittest
 
 from sdc.str_arr_ext import StringArray
 from sdc.str_ext import std_str_to_unicode, unicode_to_std_str
+from sdc.datatypes.common_functions import _sdc_factorize
 from sdc.tests.test_base import TestCase
 from sdc.tests.test_utils import skip_numba_jit
 from sdc.functions import numpy_like
@@ -362,6 +363,30 @@ class TestArrays(TestCase):
 
 class TestArrayReductions(TestCase):
 
+    def test_factorize(self):
+        def ref_impl(S, sort):
+            return pd.factorize(S, sort=sort)
+
+        def sdc_impl(S, sort):
+            return _sdc_factorize(S._data, sort)
+
+        sdc_func = self.jit(sdc_impl)
+
+        n = 1001
+        np.random.seed(0)
+        float_data = np.random.choice([2., np.nan, -1., 0.5, 7.], n)
+        str_data = np.random.choice(['dog', None, 'cat', '', 'NaN'], n)
+        cases = [[2, 1, 3, 3, 1, 0], [], np.random.randint(-5, 5, n), float_data, str_data,
+                 ['b', 'a', 'b', 'c']]
+        for case in cases:
+            S = pd.Series(case, dtype=np.float64 if len(case) == 0 else None)
+            for sort in [False, True]:
+                with self.subTest(data=case, sort=sort):
+                    codes, uniques = sdc_func(S, sort)
+                    codes_ref, uniques_ref = ref_impl(S, sort)
+                    np.testing.assert_array_equal(codes, codes_ref)
+                    np.testing.assert_array_equal(uniques, np.asarray(uniques_ref))
+
     def check_reduction_basic(self, pyfunc, alt_pyfunc, all_nans=True, comparator=None):
         if not comparator:
             comparator = np.testing.assert_array_equal
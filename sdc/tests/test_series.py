@@ -30,6 +30,7 @@ import numpy as np
 import pandas as pd
 import platform
 import pyarrow.parquet as pq
+import re
 import sdc
 import string
 import unittest
@@ -303,6 +304,22 @@ def contains_usecase(series, pat, case=True, flags=0, na=None, regex=True):
     return series.str.contains(pat, case, flags, na, regex)
 
 
+def match_usecase(series, pat, case=True, flags=0):
+    return series.str.match(pat, case, flags)
+
+
+def extract_usecase(series, pat, flags=0, expand=True):
+    return series.str.extract(pat, flags, expand)
+
+
+def replace_usecase(series, pat, repl, n=-1, case=None, flags=0, regex=True):
+    return series.str.replace(pat, repl, n, case, flags, regex)
+
+
+def split_usecase(series, pat=None, n=-1):
+    return series.str.split(pat, n)
+
+
 class TestSeries(
     TestSeries_apply,
     TestSeries_map,
@@ -2683,6 +2700,49 @@ class TestSeries(
         hpat_func = self.jit(test_impl)
         pd.testing.assert_series_equal(hpat_func(), test_impl())
 
+    def test_series_factorize(self):
+        def test_impl(S, sort, na_sentinel):
+            return S.factorize(sort=sort, na_sentinel=na_sentinel)
+
+        hpat_func = self.jit(test_impl)
+
+        data_to_test = [[2, 1, 3, 3, 1, 0], [2., np.nan, -1., 2., np.nan, 0.5], [],
+                        ['dog', None, 'cat', '', 'dog', None, 'cat', 'NaN'], ['b', 'a', 'b', 'c']]
+        for data, sort, na_sentinel in product(data_to_test, [False, True], [-1, 10]):
+            with self.subTest(series_data=data, sort=sort, na_sentinel=na_sentinel):
+                S = pd.Series(data, dtype=np.float64 if not data else None)
+                codes, uniques = hpat_func(S, sort, na_sentinel)
+                codes_ref, uniques_ref = test_impl(S, sort, na_sentinel)
+                np.testing.assert_array_equal(codes, codes_ref)
+                np.testing.assert_array_equal(uniques, uniques_ref.values)
+
+    def test_series_factorize_large(self):
+        def test_impl(S):
+            return S.factorize()
+
+        hpat_func = self.jit(test_impl)
+
+        n = 1001
+        S = pd.Series(['s{}'.format(i % 17) for i in range(n)])
+        codes, uniques = hpat_func(S)
+        codes_ref, uniques_ref = test_impl(S)
+        np.testing.assert_array_equal(codes, codes_ref)
+        np.testing.assert_array_equal(uniques, uniques_ref.values)
+
+    def test_pandas_factorize(self):
+        def test_impl(values, sort):
+            return pd.factorize(values, sort=sort)
+
+        hpat_func = self.jit(test_impl)
+
+        for values, sort in product([pd.Series(['b', None, 'a', 'b']), np.array([3., 1., np.nan, 1.])],
+                                    [False, True]):
+            with self.subTest(values=values, sort=sort):
+                codes, uniques = hpat_func(values, sort)
+                codes_ref, uniques_ref = test_impl(values, sort)
+                np.testing.assert_array_equal(codes, codes_ref)
+                np.testing.assert_array_equal(uniques, np.asarray(uniques_ref))
+
     @skip_numba_jit
     def test_series_dist_input1(self):
         """Verify distribution of a Series without index"""
@@ -3053,6 +3113,14 @@ class TestSeries(
             S = pd.Series(data, index, name=name)
             pd.testing.assert_series_equal(hpat_func(S), test_impl(S))
 
+    def test_series_str_len_unicode(self):
+        def test_impl(S):
+            return S.str.len()
+        hpat_func = self.jit(test_impl)
+
+        S = pd.Series(test_global_input_data_unicode_kind4 + test_global_input_data_unicode_kind1)
+        pd.testing.assert_series_equal(hpat_func(S), test_impl(S))
+
     def test_series_str_just_default_fillchar(self):
         data = test_global_input_data_unicode_kind1
         series = pd.Series(data)
@@ -6109,7 +6177,8 @@ class TestSeries(
 
     def test_series_lower_str(self):
         all_data = [['leopard', None, 'Golden Eagle', np.nan, 'SNAKE', ''],
-                    ['Hello world!', np.nan, 'hello 123', None, 'mynameisPeter']
+                    ['Hello world!', np.nan, 'hello 123', None, 'mynameisPeter'],
+                    test_global_input_data_unicode_kind4
                     ]
 
         cfunc = self.jit(lower_usecase)
@@ -6135,6 +6204,14 @@ class TestSeries(
         for to_strip in [None, '123.', '.!? \n\t', '123.!? \n\t']:
             pd.testing.assert_series_equal(cfunc(s, to_strip), rstrip_usecase(s, to_strip))
 
+    def test_series_strip_str_unicode(self):
+        s = pd.Series(['\u3000 Ant. \xa0', None, ' éclair!\n', np.nan, '大处 。\t', ''])
+        for usecase in [strip_usecase, lstrip_usecase, rstrip_usecase]:
+            cfunc = self.jit(usecase)
+            for to_strip in [None, '.!? \n\t', '。 ', '\xa0\u3000']:
+                with self.subTest(usecase=usecase.__name__, to_strip=to_strip):
+                    pd.testing.assert_series_equal(cfunc(s, to_strip), usecase(s, to_strip))
+
     @skip_sdc_jit("Series.str.isalnum is not supported yet")
     def test_series_isalnum_str(self):
         cfunc = self.jit(isalnum_usecase)
@@ -6195,21 +6272,160 @@ class TestSeries(
         s = pd.Series(['Mouse', 'dog', 'house and parrot', '23'])
         pat = 'og'
 
-        with self.assertRaises(SDCLimitation) as raises:
-            hpat_func(s, pat, flags=1)
-        msg = "Method contains(). Unsupported parameter. Given 'flags' != 0"
-        self.assertIn(msg, str(raises.exception))
-
         with self.assertRaises(TypingError) as raises:
             hpat_func(s, pat, na=0)
         msg = 'Method contains(). The object na\n given: int64\n expected: none'
         self.assertIn(msg, str(raises.exception))
 
-        with self.assertRaises(SDCLimitation) as raises:
-            hpat_func(s, pat, regex=False)
-        msg = "Method contains(). Unsupported parameter. Given 'regex' is False"
+        with self.assertRaises(TypingError) as raises:
+            hpat_func(s, r'(a)\1')
+        msg = 'Method contains(). Unsupported regular expression'
+        self.assertIn(msg, str(raises.exception))
+
+    def test_series_contains_regex(self):
+        hpat_func = self.jit(contains_usecase)
+        s = pd.Series(['Mouse', 'dog', 'house and parrot', '23', '', 'ERROR 2020-01-02', 'éclair Ünïcödé'])
+        patterns = ['og$', '^[a-z]+$', r'\d{2,}', 'h(ou|a)se', r'\bparrot\b', 'ünï', '.', 'a*', '[^a-z ]']
+        for pat, case, regex in product(patterns, [True, False], [True, False]):
+            with self.subTest(pat=pat, case=case, regex=regex):
+                pd.testing.assert_series_equal(hpat_func(s, pat, case, regex=regex),
+                                               contains_usecase(s, pat, case, regex=regex))
+
+    def test_series_contains_flags(self):
+        hpat_func = self.jit(contains_usecase)
+        s = pd.Series(['Mouse', 'dog', 'house\nand parrot', '23'])
+        for pat, flags in product(['^and', 'MOUSE', 'e.a'], [0, re.IGNORECASE, re.MULTILINE, re.DOTALL]):
+            with self.subTest(pat=pat, flags=flags):
+                pd.testing.assert_series_equal(hpat_func(s, pat, flags=flags),
+                                               contains_usecase(s, pat, flags=flags))
+
+    def test_series_str_match(self):
+        hpat_func = self.jit(match_usecase)
+        s = pd.Series(['Mouse', 'dog', 'house and parrot', '23', '', 'ERROR 2020-01-02'], index=[3, 5, 1, 0, 2, 4])
+        patterns = ['og', 'd', '[A-Z]+', r'\d+$', 'h(ou|a)se', 'mo', '']
+        for pat, case in product(patterns, [True, False]):
+            with self.subTest(pat=pat, case=case):
+                pd.testing.assert_series_equal(hpat_func(s, pat, case), match_usecase(s, pat, case))
+
+    def test_series_str_match_literal(self):
+        def test_impl(series):
+            return series.str.match(r'(?i)[a-z]+\s')
+        hpat_func = self.jit(test_impl)
+
+        s = pd.Series(['Mouse', 'dog', 'house and parrot', 'ERROR 2020-01-02'], name='A')
+        pd.testing.assert_series_equal(hpat_func(s), test_impl(s))
+
+    def test_series_str_extract(self):
+        hpat_func = self.jit(extract_usecase)
+        s = pd.Series(['ERROR 2020-01-02', 'INFO 2020-01-03 done', 'no date', 'WARN x'], index=[3, 5, 1, 0])
+        pat = r'(?P<level>[A-Z]+) (?P<date>\d{4}-\d{2}-\d{2})?'
+        pd.testing.assert_frame_equal(hpat_func(s, pat), extract_usecase(s, pat))
+
+    def test_series_str_extract_series(self):
+        hpat_func = self.jit(extract_usecase)
+        s = pd.Series(['a1', 'b2', 'c3', '4', 'éü5'], name='A')
+        for pat in [r'[a-z](\d)', r'(?P<digit>\d)', r'([^\d]+)']:
+            with self.subTest(pat=pat):
+                pd.testing.assert_series_equal(hpat_func(s, pat, expand=False),
+                                               extract_usecase(s, pat, expand=False))
+
+    def test_series_str_extract_unsupported(self):
+        hpat_func = self.jit(extract_usecase)
+        s = pd.Series(['a1', 'b2'])
+
+        with self.assertRaises(TypingError) as raises:
+            hpat_func(s, '[a-z]')
+        msg = 'Method extract(). Pattern contains no capture groups'
+        self.assertIn(msg, str(raises.exception))
+
+        with self.assertRaises(TypingError) as raises:
+            hpat_func(s, r'([a-z])(\d)')
+        msg = 'Method extract(). Unnamed groups are not supported if result is a DataFrame'
+        self.assertIn(msg, str(raises.exception))
+
+    def test_series_str_replace(self):
+        hpat_func = self.jit(replace_usecase)
+        s = pd.Series(['Mouse', 'dog', 'house and parrot', '23', '', 'ERROR 2020-01-02'], name='A')
+        cases = [('o', '0'), ('og', 'OG'), (r'\d', '#'), (r'(\d+)-(\d+)', r'\2/\1'),
+                 (r'(?P<first>\w)(\w*)', r'\g<first>.'), ('a*', '-'), ('$', '!'), ('.', '*')]
+        for (pat, repl), n in product(cases, [-1, 0, 1]):
+            for case, regex in product([True, False], [True, False]):
+                with self.subTest(pat=pat, repl=repl, n=n, case=case, regex=regex):
+                    pd.testing.assert_series_equal(hpat_func(s, pat, repl, n, case, regex=regex),
+                                                   replace_usecase(s, pat, repl, n, case, regex=regex))
+
+    def test_series_str_replace_with_none(self):
+        def test_impl(series):
+            return series.str.replace('o+', '0')
+        hpat_func = self.jit(test_impl)
+
+        s = pd.Series(['Mouse', None, 'dooog', None, ''])
+        pd.testing.assert_series_equal(hpat_func(s), test_impl(s))
+
+    def test_series_str_split(self):
+        hpat_func = self.jit(split_usecase)
+        s = pd.Series(['a b  c', '  lead and trail  ', 'a,b,,c', ',', '', 'a::b::c::', 'é,日本,ß', 'x\u3000y'],
+                      index=[1, 3, 5, 7, 9, 11, 13, 15], name='A')
+        for pat, n in product([None, ' ', ',', '::'], [-1, 0, 1, 2]):
+            with self.subTest(pat=pat, n=n):
+                pd.testing.assert_series_equal(hpat_func(s, pat, n), split_usecase(s, pat, n))
+
+    def test_series_str_split_with_none(self):
+        def test_impl(series):
+            return series.str.split(',')
+        hpat_func = self.jit(test_impl)
+
+        s = pd.Series(['a,b', None, 'c', None, ''])
+        pd.testing.assert_series_equal(hpat_func(s), test_impl(s))
+
+    def test_series_str_split_unsupported(self):
+        hpat_func = self.jit(split_usecase)
+        s = pd.Series(['a.b', 'c'])
+
+        with self.assertRaises(TypingError) as raises:
+            hpat_func(s, r'\.+')
+        msg = 'Method split(). Unsupported parameter. Given pat is a regular expression'
         self.assertIn(msg, str(raises.exception))
 
+    def test_series_str_get(self):
+        def test_impl(series, i):
+            return series.str.split(',').str.get(i)
+        hpat_func = self.jit(test_impl)
+
+        s = pd.Series(['a,b,c', None, '', 'dd,', 'é,日本'], name='A')
+        for i in [0, 1, 2, -1, -3, 10]:
+            with self.subTest(i=i):
+                pd.testing.assert_series_equal(hpat_func(s, i), test_impl(s, i))
+
+    def test_series_str_get_str(self):
+        def test_impl(series, i):
+            return series.str.get(i)
+        hpat_func = self.jit(test_impl)
+
+        s = pd.Series(['abc', None, '', 'dd', 'é日本'])
+        for i in [0, 1, -1, 5]:
+            with self.subTest(i=i):
+                pd.testing.assert_series_equal(hpat_func(s, i), test_impl(s, i))
+
+    def test_series_str_split_len(self):
+        def test_impl(series):
+            return series.str.split().str.len()
+        hpat_func = self.jit(test_impl)
+
+        s = pd.Series(['a b c', '', ' dd ', 'é 日本'], index=['x', 'y', 'z', 'w'])
+        pd.testing.assert_series_equal(hpat_func(s), test_impl(s))
+
+    def test_series_explode(self):
+        def test_impl(series):
+            return series.str.split(',').explode()
+        hpat_func = self.jit(test_impl)
+
+        data = ['a,b,c', None, '', 'dd', 'é,日本']
+        for index in [None, [5, 4, 3, 2, 1], ['a', 'b', 'c', 'd', 'e']]:
+            with self.subTest(index=index):
+                s = pd.Series(data, index, name='A')
+                pd.testing.assert_series_equal(hpat_func(s), test_impl(s))
+
     @skip_sdc_jit('Old-style implementation returns string, but not series')
     def test_series_describe_numeric(self):
         def test_impl(A):
@@ -36,8 +36,9 @@ import pyarrow.parquet as pq
 import re
 import sdc
 import unittest
+import unittest.mock
 
-from sdc.str_arr_ext import StringArray
+from sdc.str_arr_ext import StringArray, pre_alloc_string_array
 from sdc.str_ext import std_str_to_unicode, unicode_to_std_str
 from sdc.tests.gen_test_data import ParquetGenerator
 from sdc.tests.test_base import TestCase
@@ -337,5 +338,31 @@ class TestStrings(TestCase):
         self.assertEqual(hpat_func(), test_impl())
 
 
+    def test_string_array_alloc_overflow(self):
+        def test_impl(n):
+            return len(pre_alloc_string_array(1, n))
+        hpat_func = self.jit(test_impl)
+
+        self.assertEqual(hpat_func(3), 1)
+        with self.assertRaises(OverflowError) as raises:
+            hpat_func(2 ** 32)
+        self.assertIn('string array supports up to 4294967295 bytes of characters', str(raises.exception))
+
+    def test_string_array_unbox_overflow(self):
+        def test_impl(S):
+            return len(S)
+
+        S = pd.Series(['abc', None, 'de', 'fgh'])
+        # limit of the size of strings is read when unboxing is compiled, it is lowered to overflow small data
+        with unittest.mock.patch.object(sdc.str_arr_ext, 'max_num_total_chars', 8):
+            self.assertEqual(self.jit(test_impl)(S), 4)
+
+        with unittest.mock.patch.object(sdc.str_arr_ext, 'max_num_total_chars', 7):
+            hpat_func = self.jit(test_impl)
+            with self.assertRaises(OverflowError) as raises:
+                hpat_func(S)
+        self.assertIn('string array supports up to 7 bytes of characters', str(raises.exception))
+
+
 if __name__ == "__main__":
     unittest.main()
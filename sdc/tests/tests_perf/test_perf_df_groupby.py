@@ -91,6 +91,7 @@ class TestDFGroupByMethods(TestBase):
     def setUpClass(cls):
         super().setUpClass()
         cls.total_data_length = {
+            'agg': [2 * 10 ** 5],
             'count': [2 * 10 ** 5],
             'max': [2 * 10 ** 5],
             'mean': [2 * 10 ** 5],
@@ -161,6 +162,11 @@ class TestDFGroupByMethods(TestBase):
         usecase = gen_df_groupby_usecase(name, groupby_params=groupby_params, method_params=method_params)
         self._test_case(usecase, name, usecase_name=usecase_name, input_data=input_data)
 
+    def test_df_groupby_agg_sort_false(self):
+        self._test_df_groupby_method('agg',
+                                     groupby_params={'sort': 'False'},
+                                     method_params="{'B': 'sum', 'C': 'mean', 'D': 'max', 'E': 'var'}")
+
     def test_df_groupby_count_sort_false(self):
         self._test_df_groupby_method('count', groupby_params={'sort': 'False'})
 